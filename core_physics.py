@@ -1,19 +1,33 @@
 """Core cosmological background physics for PsiTMG.
 
 This module defines a compact, vectorized cosmology engine used to evaluate
-the CPL dark-energy equation of state and the normalized Hubble expansion.
+the dark-energy equation of state and the normalized Hubble expansion.
+The equation of state is pluggable: closed-form CPL, JBP and wCDM models,
+or an arbitrary tabulated w(a), each with a compiled rho_de kernel.
+
+`CPL_legacy` names the z-form density the published fits were run with,
+(1+z)^{3(1+w0)} exp(3 wa z/(1+z)). It is what `PsiTMGCosmology` uses by
+default. Its density corresponds to w(a) = w0 + wa a, not to the nominal CPL
+w(a) = w0 + wa (1 - a) of the `CPL` model.
 """
 
 from __future__ import annotations
 
-from typing import Union
+import hashlib
+import math
+from typing import NamedTuple, Union
 
 import numpy as np
 from numpy.typing import ArrayLike, NDArray
+from scipy.interpolate import PchipInterpolator
 
 try:
     from numba import njit
+
+    NUMBA_AVAILABLE = True
 except Exception:  # pragma: no cover - fallback when numba is not installed.
+    NUMBA_AVAILABLE = False
+
     def njit(*args, **kwargs):  # type: ignore[override]
         """Fallback decorator that keeps functions usable without numba."""
 
@@ -25,6 +39,10 @@ except Exception:  # pragma: no cover - fallback when numba is not installed.
 FloatArray = NDArray[np.float64]
 ScalarOrArray = Union[float, FloatArray]
 
+DARK_ENERGY_MODELS = ("CPL", "JBP", "wCDM", "CPL_legacy")
+# Resolution of the ln(a) grid on which `TabulatedEoS` pre-integrates w(a).
+TABULATED_NODES_PER_EFOLD = 256
+
 
 @njit(cache=True)
 def _compute_ez_sq(
@@ -35,35 +53,452 @@ def _compute_ez_sq(
     w0: float,
     wa: float,
 ) -> NDArray[np.float64]:
-    """Compute E(z)^2 for an input array; JIT-compiled when numba is available."""
+    """Compute E(z)^2 for the `CPL_legacy` background; JIT-compiled when numba is available."""
     one_plus_z = 1.0 + z_arr
     de_evol = np.exp(3.0 * wa * (z_arr / one_plus_z - np.log(one_plus_z)))
     de_density = one_plus_z ** (3.0 * (1.0 + w0 + wa)) * de_evol
     return omega_r * one_plus_z**4 + omega_m * one_plus_z**3 + omega_de * de_density
 
 
+@njit(cache=True)
+def _ez_scalar(
+    z: float,
+    omega_r: float,
+    omega_m: float,
+    omega_de: float,
+    w0: float,
+    wa: float,
+) -> float:
+    """Scalar E(z) (clamped like `PsiTMGCosmology.E`) for use inside compiled loops."""
+    one_plus_z = 1.0 + z
+    de_evol = math.exp(3.0 * wa * (z / one_plus_z - math.log(one_plus_z)))
+    de_density = one_plus_z ** (3.0 * (1.0 + w0 + wa)) * de_evol
+    ez_sq = omega_r * one_plus_z**4 + omega_m * one_plus_z**3 + omega_de * de_density
+    return math.sqrt(max(ez_sq, 1.0e-10))
+
+
+@njit(cache=True)
+def _w_scalar(z: float, w0: float, wa: float) -> float:
+    """Scalar CPL w(z)."""
+    return w0 + wa * z / (1.0 + z)
+
+
+@njit(cache=True)
+def _omega_m_of_a_scalar(
+    a: float,
+    omega_r: float,
+    omega_m: float,
+    omega_de: float,
+    w0: float,
+    wa: float,
+) -> float:
+    """Scalar Omega_m(a) = Omega_m a^-3 / E(a)^2 for the CPL background."""
+    e = _ez_scalar(1.0 / a - 1.0, omega_r, omega_m, omega_de, w0, wa)
+    return omega_m * a ** (-3.0) / max(e * e, 1.0e-12)
+
+
+@njit(cache=True)
+def _dlnE_dlna_scalar(
+    a: float,
+    omega_r: float,
+    omega_m: float,
+    omega_de: float,
+    w0: float,
+    wa: float,
+) -> float:
+    """Scalar d ln(E)/d ln(a) = -1.5 [1 + w (1 - Omega_m(a))] for the CPL background."""
+    omega_m_a = _omega_m_of_a_scalar(a, omega_r, omega_m, omega_de, w0, wa)
+    return -1.5 * (1.0 + _w_scalar(1.0 / a - 1.0, w0, wa) * (1.0 - omega_m_a))
+
+
 @njit(cache=True)
 def _compute_w_cpl(z_arr: NDArray[np.float64], w0: float, wa: float) -> NDArray[np.float64]:
     """Compute CPL equation of state w(z) on an array."""
     return w0 + wa * z_arr / (1.0 + z_arr)
 
 
+def normalize_eos_model(eos_model: str) -> str:
+    """Return the canonical name (one of `DARK_ENERGY_MODELS`) of a dark-energy model, any case."""
+    lowered = str(eos_model).strip().lower()
+    for name in DARK_ENERGY_MODELS:
+        if lowered == name.lower():
+            return name
+    raise ValueError(f"Unsupported eos_model={eos_model!r}. Expected one of {DARK_ENERGY_MODELS}.")
+
+
+@njit(cache=True)
+def _de_density_cpl(a: NDArray[np.float64], w0: float, wa: float) -> NDArray[np.float64]:
+    """rho_de(a)/rho_de0 for w(a) = w0 + wa (1 - a)."""
+    return a ** (-3.0 * (1.0 + w0 + wa)) * np.exp(-3.0 * wa * (1.0 - a))
+
+
+@njit(cache=True)
+def _de_density_jbp(a: NDArray[np.float64], w0: float, wa: float) -> NDArray[np.float64]:
+    """rho_de(a)/rho_de0 for w(a) = w0 + wa a (1 - a)."""
+    return a ** (-3.0 * (1.0 + w0)) * np.exp(1.5 * wa * (a - 1.0) ** 2)
+
+
+@njit(cache=True)
+def _de_density_wcdm(a: NDArray[np.float64], w0: float, wa: float) -> NDArray[np.float64]:
+    """rho_de(a)/rho_de0 for a constant w = w0 (`wa` is ignored)."""
+    return a ** (-3.0 * (1.0 + w0))
+
+
+@njit(cache=True)
+def _de_density_cpl_legacy(a: NDArray[np.float64], w0: float, wa: float) -> NDArray[np.float64]:
+    """rho_de(a)/rho_de0 of the published z-form background, i.e. w(a) = w0 + wa a."""
+    return a ** (-3.0 * (1.0 + w0)) * np.exp(3.0 * wa * (1.0 - a))
+
+
+@njit(cache=True)
+def _w_cpl(a: NDArray[np.float64], w0: float, wa: float) -> NDArray[np.float64]:
+    return w0 + wa * (1.0 - a)
+
+
+@njit(cache=True)
+def _w_jbp(a: NDArray[np.float64], w0: float, wa: float) -> NDArray[np.float64]:
+    return w0 + wa * a * (1.0 - a)
+
+
+@njit(cache=True)
+def _w_cpl_legacy(a: NDArray[np.float64], w0: float, wa: float) -> NDArray[np.float64]:
+    return w0 + wa * a
+
+
+@njit(cache=True)
+def _w_wcdm(a: NDArray[np.float64], w0: float, wa: float) -> NDArray[np.float64]:
+    return np.full(a.shape, w0)
+
+
+# (density, w) kernels on 1-D arrays of scale factors, per closed-form model.
+_DE_KERNELS = {
+    "CPL": (_de_density_cpl, _w_cpl),
+    "JBP": (_de_density_jbp, _w_jbp),
+    "wCDM": (_de_density_wcdm, _w_wcdm),
+    "CPL_legacy": (_de_density_cpl_legacy, _w_cpl_legacy),
+}
+
+
+@njit(cache=True)
+def _tabulated_ln_density(
+    x: float,
+    x0: float,
+    dx: float,
+    ln_rho: NDArray[np.float64],
+    slope: NDArray[np.float64],
+) -> float:
+    """ln(rho_de) at x = ln(a) by cubic Hermite interpolation of the tabulated integral.
+
+    `slope` holds the exact derivative d ln(rho_de)/d ln(a) = -3 (1 + w) at the
+    nodes; outside the table w is held at its end value.
+    """
+    n = ln_rho.size
+    t = (x - x0) / dx
+    if t <= 0.0:
+        return ln_rho[0] + slope[0] * (x - x0)
+    if t >= n - 1:
+        return ln_rho[n - 1] + slope[n - 1] * (x - x0 - (n - 1) * dx)
+    j = min(int(t), n - 2)
+    u = t - j
+    u2 = u * u
+    u3 = u2 * u
+    return (
+        (2.0 * u3 - 3.0 * u2 + 1.0) * ln_rho[j]
+        + (u3 - 2.0 * u2 + u) * dx * slope[j]
+        + (3.0 * u2 - 2.0 * u3) * ln_rho[j + 1]
+        + (u3 - u2) * dx * slope[j + 1]
+    )
+
+
+@njit(cache=True)
+def _interp_uniform(x: float, x0: float, dx: float, values: NDArray[np.float64]) -> float:
+    """Linear interpolation on a uniform grid, clamped to the end values."""
+    n = values.size
+    t = (x - x0) / dx
+    if t <= 0.0:
+        return values[0]
+    if t >= n - 1:
+        return values[n - 1]
+    j = min(int(t), n - 2)
+    u = t - j
+    return (1.0 - u) * values[j] + u * values[j + 1]
+
+
+@njit(cache=True)
+def _de_density_tabulated(
+    a: NDArray[np.float64],
+    x0: float,
+    dx: float,
+    ln_rho: NDArray[np.float64],
+    slope: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """rho_de(a)/rho_de0 on an array from the pre-integrated ln(a) table."""
+    out = np.empty(a.size)
+    for i in range(a.size):
+        out[i] = math.exp(_tabulated_ln_density(math.log(a[i]), x0, dx, ln_rho, slope))
+    return out
+
+
+def _apply_kernel(kernel, a: ArrayLike, *args: object) -> ScalarOrArray:
+    """Evaluate a 1-D array kernel on any-shaped `a`; scalars give a numpy scalar."""
+    a_arr = np.asarray(a, dtype=float)
+    out = kernel(np.ascontiguousarray(a_arr.ravel()), *args)
+    return out.reshape(a_arr.shape)[()]
+
+
+def de_density_factor(a: ArrayLike, w_0: float, w_a: float, eos_model: str = "CPL") -> ScalarOrArray:
+    """Return rho_de(a)/rho_de(a=1) for a closed-form model (`w_a` is ignored for wCDM)."""
+    density, _ = _DE_KERNELS[normalize_eos_model(eos_model)]
+    return _apply_kernel(density, a, float(w_0), float(w_a))
+
+
+def w_of_a(a: ArrayLike, w_0: float, w_a: float, eos_model: str = "CPL") -> ScalarOrArray:
+    """Return the equation of state w(a) of a closed-form model."""
+    _, w_kernel = _DE_KERNELS[normalize_eos_model(eos_model)]
+    return _apply_kernel(w_kernel, a, float(w_0), float(w_a))
+
+
+class DarkEnergyEoS:
+    """Dark-energy equation of state w(a) with a compiled density kernel.
+
+    Subclasses implement `w_of_a` and `density_of_a` (rho_de(a)/rho_de(a=1))
+    on arrays, `scalar_state` for scalar ODE right-hand sides, and `key`, a
+    hashable identifier of the model used by result caches.
+    """
+
+    name = "custom"
+
+    @property
+    def key(self) -> tuple[object, ...]:
+        raise NotImplementedError
+
+    def w_of_a(self, a: ArrayLike) -> ScalarOrArray:
+        raise NotImplementedError
+
+    def density_of_a(self, a: ArrayLike) -> ScalarOrArray:
+        raise NotImplementedError
+
+    def scalar_state(self, a: float) -> tuple[float, float]:
+        """Return (rho_de(a)/rho_de0, w(a)) at a single scale factor."""
+        return float(self.density_of_a(a)), float(self.w_of_a(a))
+
+    def w(self, z: ArrayLike) -> ScalarOrArray:
+        """Return w at redshift(s) `z`."""
+        return self.w_of_a(1.0 / (1.0 + np.asarray(z, dtype=float)))
+
+    def density(self, z: ArrayLike) -> ScalarOrArray:
+        """Return rho_de(z)/rho_de0 at redshift(s) `z`."""
+        return self.density_of_a(1.0 / (1.0 + np.asarray(z, dtype=float)))
+
+
+class ParametricEoS(DarkEnergyEoS):
+    """Closed-form CPL, JBP, wCDM or CPL_legacy equation of state.
+
+    Args:
+        model: Model name (one of `DARK_ENERGY_MODELS`, any case).
+        w_0: Present-day equation of state.
+        w_a: Time-variation parameter (forced to 0 for wCDM).
+    """
+
+    def __init__(self, model: str, w_0: float, w_a: float = 0.0) -> None:
+        self.name = normalize_eos_model(model)
+        self.w_0 = float(w_0)
+        self.w_a = 0.0 if self.name == "wCDM" else float(w_a)
+        self._density, self._w = _DE_KERNELS[self.name]
+
+    def __repr__(self) -> str:
+        return f"ParametricEoS({self.name!r}, w_0={self.w_0!r}, w_a={self.w_a!r})"
+
+    @property
+    def key(self) -> tuple[object, ...]:
+        return (self.name, self.w_0, self.w_a)
+
+    def w_of_a(self, a: ArrayLike) -> ScalarOrArray:
+        return _apply_kernel(self._w, a, self.w_0, self.w_a)
+
+    def density_of_a(self, a: ArrayLike) -> ScalarOrArray:
+        return _apply_kernel(self._density, a, self.w_0, self.w_a)
+
+    def scalar_state(self, a: float) -> tuple[float, float]:
+        w_0, w_a = self.w_0, self.w_a
+        if self.name == "CPL":
+            return a ** (-3.0 * (1.0 + w_0 + w_a)) * math.exp(-3.0 * w_a * (1.0 - a)), w_0 + w_a * (1.0 - a)
+        if self.name == "JBP":
+            return a ** (-3.0 * (1.0 + w_0)) * math.exp(1.5 * w_a * (a - 1.0) ** 2), w_0 + w_a * a * (1.0 - a)
+        if self.name == "CPL_legacy":
+            return a ** (-3.0 * (1.0 + w_0)) * math.exp(3.0 * w_a * (1.0 - a)), w_0 + w_a * a
+        return a ** (-3.0 * (1.0 + w_0)), w_0
+
+
+class TabulatedEoS(DarkEnergyEoS):
+    """Equation of state tabulated as w(a), pre-integrated once on a ln(a) grid.
+
+    w is resampled (PCHIP in ln a) on a uniform ln(a) grid covering the
+    table and a = 1, and ln(rho_de) = -3 int (1 + w) d ln a is accumulated
+    with Simpson's rule on each grid interval (w at the midpoints from the
+    same PCHIP). Densities are then a compiled cubic
+    Hermite interpolation using the exact slopes -3 (1 + w); w is held
+    constant outside the table.
+
+    Args:
+        a: Strictly increasing, positive scale factors.
+        w: Equation of state at `a`.
+        nodes_per_efold: Resolution of the integration grid in ln(a).
+    """
+
+    name = "tabulated"
+
+    def __init__(
+        self,
+        a: ArrayLike,
+        w: ArrayLike,
+        nodes_per_efold: int = TABULATED_NODES_PER_EFOLD,
+    ) -> None:
+        a_tab = np.asarray(a, dtype=float)
+        w_tab = np.asarray(w, dtype=float)
+        if a_tab.ndim != 1 or a_tab.shape != w_tab.shape or a_tab.size < 2:
+            raise ValueError("a and w must be 1-D arrays of the same length (>= 2).")
+        if np.any(a_tab <= 0.0) or np.any(np.diff(a_tab) <= 0.0):
+            raise ValueError("a must be strictly increasing and positive.")
+        if not np.all(np.isfinite(w_tab)):
+            raise ValueError("w must be finite.")
+        if int(nodes_per_efold) < 1:
+            raise ValueError("nodes_per_efold must be >= 1.")
+
+        x_tab = np.log(a_tab)
+        x_lo, x_hi = min(float(x_tab[0]), 0.0), max(float(x_tab[-1]), 0.0)
+        n_nodes = max(int(math.ceil((x_hi - x_lo) * int(nodes_per_efold))), 2) + 1
+        x = np.linspace(x_lo, x_hi, n_nodes)
+        self._x0 = float(x[0])
+        self._dx = float(x[1] - x[0])
+        w_interp = PchipInterpolator(x_tab, w_tab)
+        self._w_nodes = w_interp(np.clip(x, x_tab[0], x_tab[-1]))
+        self._slope = -3.0 * (1.0 + self._w_nodes)
+        # Simpson's rule on each interval, with w sampled at the midpoints.
+        w_mid = w_interp(np.clip(0.5 * (x[:-1] + x[1:]), x_tab[0], x_tab[-1]))
+        steps = (self._dx / 6.0) * (self._slope[:-1] - 12.0 * (1.0 + w_mid) + self._slope[1:])
+        ln_rho = np.concatenate(([0.0], np.cumsum(steps)))
+        ln_rho -= _tabulated_ln_density(0.0, self._x0, self._dx, ln_rho, self._slope)
+        self._ln_rho = ln_rho
+
+        digest = hashlib.sha256(np.ascontiguousarray(x).tobytes())
+        digest.update(np.ascontiguousarray(self._w_nodes).tobytes())
+        self._key = (self.name, digest.hexdigest())
+
+    @property
+    def key(self) -> tuple[object, ...]:
+        return self._key
+
+    def w_of_a(self, a: ArrayLike) -> ScalarOrArray:
+        x = np.log(np.asarray(a, dtype=float))
+        x_nodes = self._x0 + self._dx * np.arange(self._w_nodes.size)
+        return np.interp(x, x_nodes, self._w_nodes)[()]
+
+    def density_of_a(self, a: ArrayLike) -> ScalarOrArray:
+        return _apply_kernel(_de_density_tabulated, a, self._x0, self._dx, self._ln_rho, self._slope)
+
+    def scalar_state(self, a: float) -> tuple[float, float]:
+        x = math.log(a)
+        ln_rho = _tabulated_ln_density(x, self._x0, self._dx, self._ln_rho, self._slope)
+        return math.exp(ln_rho), _interp_uniform(x, self._x0, self._dx, self._w_nodes)
+
+
+def make_eos(eos: str | DarkEnergyEoS, w_0: float = -1.0, w_a: float = 0.0) -> DarkEnergyEoS:
+    """Return `eos` itself if it is a `DarkEnergyEoS`, else the closed-form model it names."""
+    if isinstance(eos, DarkEnergyEoS):
+        return eos
+    return ParametricEoS(eos, w_0, w_a)
+
+
+def compute_radiation_density(
+    H_0: ArrayLike,
+    T_cmb: float = 2.7255,
+    N_eff: float = 3.046,
+) -> ScalarOrArray:
+    """Return Omega_r (photons + neutrinos) for scalar or array-valued H_0."""
+    # omega_gamma*h^2 = 2.469e-5 * (T_cmb / 2.7255)^4 ; includes photons + neutrinos.
+    h = np.asarray(H_0, dtype=float) / 100.0
+    omega_gamma_h2 = 2.469e-5 * (T_cmb / 2.7255) ** 4
+    omega_r_h2 = omega_gamma_h2 * (1.0 + 0.2271 * N_eff)
+    return omega_r_h2 / (h * h)
+
+
+def compute_E_batch(
+    z: ArrayLike,
+    H_0: ArrayLike,
+    Omega_m: ArrayLike,
+    w_0: ArrayLike,
+    w_a: ArrayLike,
+    Omega_r: ArrayLike | None = None,
+    T_cmb: float = 2.7255,
+    N_eff: float = 3.046,
+) -> FloatArray:
+    """Return E(z) for N parameter points at once.
+
+    Parameters are 1-D arrays of length N (scalars broadcast); the output has
+    shape (N, M) for M redshifts and matches `PsiTMGCosmology.E` row by row
+    for the default `CPL_legacy` background.
+    """
+    z_arr = np.atleast_1d(np.asarray(z, dtype=float))[np.newaxis, :]
+    h0 = np.atleast_1d(np.asarray(H_0, dtype=float))
+    om, w0, wa = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(Omega_m, dtype=float)),
+        np.atleast_1d(np.asarray(w_0, dtype=float)),
+        np.atleast_1d(np.asarray(w_a, dtype=float)),
+    )
+    if Omega_r is None:
+        omr = np.broadcast_to(compute_radiation_density(h0, T_cmb, N_eff), om.shape)
+    else:
+        omr = np.broadcast_to(np.asarray(Omega_r, dtype=float), om.shape)
+    omde = 1.0 - om - omr
+
+    one_plus_z = 1.0 + z_arr
+    de_evol = np.exp(3.0 * wa[:, np.newaxis] * (z_arr / one_plus_z - np.log(one_plus_z)))
+    de_density = one_plus_z ** (3.0 * (1.0 + w0 + wa)[:, np.newaxis]) * de_evol
+    ez_sq = (
+        omr[:, np.newaxis] * one_plus_z**4
+        + om[:, np.newaxis] * one_plus_z**3
+        + omde[:, np.newaxis] * de_density
+    )
+    return np.sqrt(np.maximum(ez_sq, 1.0e-10))
+
+
+class BackgroundCoeffs(NamedTuple):
+    """Background coefficients in the argument order of the scalar kernels.
+
+    `_ez_scalar(z, *coeffs)` and the other scalar kernels take them unpacked,
+    so hot loops avoid any attribute lookup or array boxing.
+    """
+
+    Omega_r: float
+    Omega_m: float
+    Omega_de: float
+    w_0: float
+    w_a: float
+
+
 class PsiTMGCosmology:
     """Background cosmology helper for PsiTMG analyses.
 
     The model assumes a spatially flat late-time universe with matter and
-    dynamical dark energy described by the CPL equation of state.
+    dynamical dark energy. The default `CPL_legacy` background is the one the
+    published fits use; `eos="CPL"` selects the exact CPL density instead.
 
     Args:
         H_0: Hubble constant at z=0 in km/s/Mpc.
         Omega_m: Matter density fraction at z=0.
-        w_0: CPL present-day equation-of-state parameter.
-        w_a: CPL time-variation parameter.
+        w_0: Present-day equation-of-state parameter.
+        w_a: Time-variation parameter (ignored for wCDM).
         sigma_8: RMS matter fluctuation amplitude at 8 h^-1 Mpc (z=0).
         Omega_r: Radiation density fraction at z=0. If None, computed from
             T_cmb and N_eff.
         T_cmb: CMB temperature in Kelvin (used when Omega_r is None).
         N_eff: Effective number of relativistic species (used for Omega_r).
+        eos: Dark-energy model: a name from `DARK_ENERGY_MODELS` built from
+            (w_0, w_a), or a `DarkEnergyEoS` instance such as `TabulatedEoS`
+            (w_0 and w_a are then only informative). In every case
+            E(z)^2 = Omega_r (1+z)^4 + Omega_m (1+z)^3
+            + Omega_de * eos.density(z).
     """
 
     def __init__(
@@ -76,6 +511,7 @@ class PsiTMGCosmology:
         Omega_r: float | None = None,
         T_cmb: float = 2.7255,
         N_eff: float = 3.046,
+        eos: str | DarkEnergyEoS = "CPL_legacy",
     ) -> None:
         self.H_0 = float(H_0)
         self.Omega_m = float(Omega_m)
@@ -86,30 +522,55 @@ class PsiTMGCosmology:
         self.N_eff = float(N_eff)
 
         if Omega_r is None:
-            # omega_gamma*h^2 = 2.469e-5 * (T_cmb / 2.7255)^4 ; includes photons + neutrinos.
-            h = self.H_0 / 100.0
-            omega_gamma_h2 = 2.469e-5 * (self.T_cmb / 2.7255) ** 4
-            omega_r_h2 = omega_gamma_h2 * (1.0 + 0.2271 * self.N_eff)
-            self.Omega_r = omega_r_h2 / (h * h)
+            self.Omega_r = float(compute_radiation_density(self.H_0, self.T_cmb, self.N_eff))
         else:
             self.Omega_r = float(Omega_r)
 
         self.Omega_de = 1.0 - self.Omega_m - self.Omega_r
+        self.eos = make_eos(eos, self.w_0, self.w_a)
+        self.coeffs = BackgroundCoeffs(self.Omega_r, self.Omega_m, self.Omega_de, self.w_0, self.w_a)
+
+    @property
+    def analytic_cpl(self) -> bool:
+        """True for the `CPL_legacy` background, which the compiled CPL kernels assume.
+
+        On this path `w()` keeps returning the nominal CPL w_0 + w_a z/(1+z)
+        that the published growth equations use, while `eos.w_of_a` returns
+        the w(a) = w_0 + w_a a implied by the density.
+        """
+        return isinstance(self.eos, ParametricEoS) and self.eos.name == "CPL_legacy"
+
+    def _ez_sq(self, z_arr: FloatArray) -> FloatArray:
+        if self.analytic_cpl:
+            return _compute_ez_sq(
+                z_arr,
+                self.Omega_r,
+                self.Omega_m,
+                self.Omega_de,
+                self.w_0,
+                self.w_a,
+            )
+        one_plus_z = 1.0 + z_arr
+        de_density = np.asarray(self.eos.density(z_arr), dtype=float)
+        return self.Omega_r * one_plus_z**4 + self.Omega_m * one_plus_z**3 + self.Omega_de * de_density
 
     def w(self, z: ArrayLike) -> ScalarOrArray:
-        """Return the CPL equation of state w(z), vectorized.
+        """Return the dark-energy equation of state w(z), vectorized.
 
-        The parametrization is:
+        For CPL the parametrization is:
             w(z) = w_0 + w_a * z / (1 + z)
 
         Args:
             z: Redshift values.
 
         Returns:
-            CPL equation-of-state value(s), matching the input shape.
+            Equation-of-state value(s), matching the input shape.
         """
         z_arr = np.asarray(z, dtype=float)
-        w_z = _compute_w_cpl(z_arr, self.w_0, self.w_a)
+        if self.analytic_cpl:
+            w_z = _compute_w_cpl(z_arr, self.w_0, self.w_a)
+        else:
+            w_z = np.asarray(self.eos.w(z_arr), dtype=float)
         if np.isscalar(z):
             return float(w_z)
         return w_z
@@ -117,10 +578,11 @@ class PsiTMGCosmology:
     def E(self, z: ArrayLike) -> ScalarOrArray:
         """Return normalized Hubble expansion E(z) = H(z)/H0.
 
-        Uses the exact analytic CPL dark-energy evolution already used in
-        project scripts:
+        The default `CPL_legacy` background uses the published z-form density
             de_evol = exp(3 w_a [z/(1+z) - ln(1+z)])
             rho_de(z)/rho_de0 = (1+z)^(3(1+w_0+w_a)) * de_evol
+        through a compiled kernel; other models use the density kernel of
+        `eos`. Both equal `eos.density(z)`.
 
         Under flatness (Omega_de = 1 - Omega_m - Omega_r):
             E(z)^2 = Omega_r (1+z)^4 + Omega_m (1+z)^3
@@ -133,19 +595,47 @@ class PsiTMGCosmology:
             Normalized Hubble parameter value(s), matching the input shape.
         """
         z_arr = np.asarray(z, dtype=float)
-        ez_sq = _compute_ez_sq(
-            z_arr,
-            self.Omega_r,
-            self.Omega_m,
-            self.Omega_de,
-            self.w_0,
-            self.w_a,
-        )
+        ez_sq = self._ez_sq(z_arr)
         e = np.sqrt(np.maximum(ez_sq, 1.0e-10))
         if np.isscalar(z):
             return float(e)
         return e
 
+    def E_scalar(self, z: float) -> float:
+        """Return E(z) for one Python float, without array conversion.
+
+        Same value as `E(z)`; meant for scalar ODE right-hand sides.
+        """
+        if self.analytic_cpl:
+            return _ez_scalar(z, *self.coeffs)
+        one_plus_z = 1.0 + z
+        rho_de, _ = self.eos.scalar_state(1.0 / one_plus_z)
+        ez_sq = self.Omega_r * one_plus_z**4 + self.Omega_m * one_plus_z**3 + self.Omega_de * rho_de
+        return math.sqrt(max(ez_sq, 1.0e-10))
+
+    def w_scalar(self, z: float) -> float:
+        """Return w(z) for one Python float, without array conversion."""
+        if self.analytic_cpl:
+            return _w_scalar(z, self.w_0, self.w_a)
+        return self.eos.scalar_state(1.0 / (1.0 + z))[1]
+
+    def Omega_m_of_a_scalar(self, a: float) -> float:
+        """Return Omega_m(a) = Omega_m a^-3 / E(a)^2 (E^2 floored at 1e-12)."""
+        if self.analytic_cpl:
+            return _omega_m_of_a_scalar(a, *self.coeffs)
+        e = self.E_scalar(1.0 / a - 1.0)
+        return self.Omega_m * a ** (-3.0) / max(e * e, 1.0e-12)
+
+    def dlnE_dlna_scalar(self, a: float) -> float:
+        """Return d ln(E)/d ln(a) = -1.5 [1 + w(a) (1 - Omega_m(a))] at one scale factor.
+
+        Radiation is neglected in this expression, as in the growth equation.
+        """
+        if self.analytic_cpl:
+            return _dlnE_dlna_scalar(a, *self.coeffs)
+        omega_m_a = self.Omega_m_of_a_scalar(a)
+        return -1.5 * (1.0 + self.w_scalar(1.0 / a - 1.0) * (1.0 - omega_m_a))
+
     def hubble_inverse(self, z: ArrayLike) -> ScalarOrArray:
         """Return 1 / H(z) with numerical protection against zero division.
 
@@ -160,14 +650,7 @@ class PsiTMGCosmology:
             Inverse Hubble parameter value(s), matching the input shape.
         """
         z_arr = np.asarray(z, dtype=float)
-        ez_sq = _compute_ez_sq(
-            z_arr,
-            self.Omega_r,
-            self.Omega_m,
-            self.Omega_de,
-            self.w_0,
-            self.w_a,
-        )
+        ez_sq = self._ez_sq(z_arr)
         inv_h = 1.0 / (self.H_0 * np.sqrt(np.maximum(ez_sq, 1.0e-10)))
         if np.isscalar(z):
             return float(inv_h)
@@ -0,0 +1,162 @@
+"""Binary, memory-mapped cache for text likelihood inputs.
+
+Parsing CSV/TXT inputs with `np.genfromtxt`/`np.loadtxt` is repeated by every
+process that builds a likelihood. This module stores the parsed array once as
+a raw `.npy` file plus a small JSON header, in a `.npcache/` directory next to
+the source file, and reloads it with `mmap_mode="r"` so that concurrent
+workers share the operating-system page cache instead of private copies.
+
+Cache entries are keyed by the SHA-256 of the source file and by the parser
+options. The header also records the source size and mtime so that unchanged
+files are validated without re-hashing them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+
+CACHE_DIRNAME = ".npcache"
+CACHE_FORMAT_VERSION = 1
+DISABLE_ENV = "PSITMG_NO_DATA_CACHE"
+
+logger = logging.getLogger(__name__)
+
+
+def _sha256_file(path: Path, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _reader_tag(reader: str, options: dict[str, Any]) -> str:
+    """Return a short, stable identifier for a parser and its options."""
+    payload = json.dumps({"reader": reader, "options": options}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
+
+
+def _cache_paths(source: Path, tag: str) -> tuple[Path, Path]:
+    cache_dir = source.parent / CACHE_DIRNAME
+    stem = f"{source.name}.{tag}"
+    return cache_dir / f"{stem}.npy", cache_dir / f"{stem}.json"
+
+
+def atomic_write(path: Path, writer: Callable[[Any], None]) -> None:
+    """Write through a process-unique temporary file, then rename into place."""
+    part = path.with_name(f"{path.name}.{os.getpid()}.part")
+    try:
+        with part.open("wb") as fh:
+            writer(fh)
+        os.replace(part, path)
+    finally:
+        if part.exists():
+            part.unlink()
+
+
+def _read_valid_header(header_path: Path, source: Path, stat: os.stat_result) -> dict[str, Any] | None:
+    """Return the cache header if it still describes `source`, else None."""
+    try:
+        header = json.loads(header_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if header.get("format_version") != CACHE_FORMAT_VERSION:
+        return None
+    if header.get("source_size") == stat.st_size and header.get("source_mtime_ns") == stat.st_mtime_ns:
+        return header
+    # Touched but possibly unchanged (e.g. fresh checkout): fall back to the content hash.
+    if header.get("source_sha256") == _sha256_file(source):
+        return header
+    return None
+
+
+def cached_parse(
+    path: Path | str,
+    reader: str,
+    parse: Callable[[Path], np.ndarray],
+    options: dict[str, Any] | None = None,
+    use_cache: bool | None = None,
+) -> np.ndarray:
+    """Return `parse(path)`, served from the memory-mapped cache when valid.
+
+    Args:
+        path: Source text file.
+        reader: Name of the parser, part of the cache key.
+        parse: Function returning the parsed array for a path.
+        options: Parser options, part of the cache key.
+        use_cache: Force the cache on/off. Defaults to on unless the
+            `PSITMG_NO_DATA_CACHE` environment variable is set.
+
+    Returns:
+        Parsed array; a read-only `np.memmap` when served from the cache.
+    """
+    source = Path(path)
+    if use_cache is None:
+        use_cache = not os.environ.get(DISABLE_ENV)
+    if not use_cache:
+        return parse(source)
+
+    tag = _reader_tag(reader, options or {})
+    data_path, header_path = _cache_paths(source, tag)
+    stat = source.stat()
+    if data_path.exists() and _read_valid_header(header_path, source, stat) is not None:
+        try:
+            return np.load(data_path, mmap_mode="r")
+        except (OSError, ValueError) as exc:
+            logger.warning("Unreadable dataset cache %s (%s); re-parsing.", data_path, exc)
+
+    arr = parse(source)
+    try:
+        data_path.parent.mkdir(parents=True, exist_ok=True)
+        header = {
+            "format_version": CACHE_FORMAT_VERSION,
+            "source": source.name,
+            "source_sha256": _sha256_file(source),
+            "source_size": stat.st_size,
+            "source_mtime_ns": stat.st_mtime_ns,
+            "reader": reader,
+            "options": options or {},
+            "dtype": str(arr.dtype),
+            "shape": list(arr.shape),
+        }
+        atomic_write(data_path, lambda fh: np.save(fh, arr, allow_pickle=False))
+        atomic_write(header_path, lambda fh: fh.write(json.dumps(header, indent=2).encode("utf-8")))
+    except OSError as exc:
+        logger.warning("Cannot write dataset cache for %s (%s); using parsed data.", source, exc)
+        return arr
+    return np.load(data_path, mmap_mode="r")
+
+
+def load_csv_table(path: Path | str, use_cache: bool | None = None) -> np.ndarray:
+    """Cached equivalent of `np.genfromtxt(path, delimiter=",", names=True, dtype=float)`."""
+    return cached_parse(
+        path,
+        reader="genfromtxt",
+        parse=lambda p: np.genfromtxt(p, delimiter=",", names=True, dtype=float, encoding="utf-8"),
+        options={"delimiter": ",", "names": True},
+        use_cache=use_cache,
+    )
+
+
+def load_text_array(path: Path | str, use_cache: bool | None = None, **loadtxt_kwargs: Any) -> np.ndarray:
+    """Cached equivalent of `np.loadtxt(path, dtype=float, **loadtxt_kwargs)`.
+
+    `.npy` inputs are memory-mapped directly without a cache entry.
+    """
+    source = Path(path)
+    if source.suffix.lower() == ".npy":
+        return np.load(source, mmap_mode="r")
+    return cached_parse(
+        source,
+        reader="loadtxt",
+        parse=lambda p: np.loadtxt(p, dtype=float, **loadtxt_kwargs),
+        options=loadtxt_kwargs,
+        use_cache=use_cache,
+    )
@@ -0,0 +1,414 @@
+"""Growth-history emulator for f*sigma8(z) and D(z) over the sampler prior box.
+
+The RSD likelihood needs one growth-ODE solve per parameter point. This module
+replaces it, inside a fixed (Omega_m, w_0, w_a, H_0) box, by a surrogate trained
+once on `perturbations.solve_growth_many`:
+
+1. log(f*D) and log(D) are tabulated on the `StructureFormation` ln(a) grid
+   nodes (z <= z_max) for every node of a tensor-product Chebyshev grid in
+   (Omega_m, w_0, w_a, H_0);
+2. the stacked histories are compressed by PCA (SVD);
+3. each PCA amplitude is interpolated by a Chebyshev tensor-product
+   polynomial in the rescaled parameters, and only the coefficients above
+   `coef_tol` are kept (sparse multi-index list).
+
+sigma_8 enters f*sigma8 as an exact multiplicative factor, and H_0 only
+through Omega_r. Between ln(a) nodes the emulator interpolates linearly, like
+`StructureFormation.get_fsigma8`. The emulator is serialized as a single
+`.npz` and reports its own maximum relative error against
+`StructureFormation.get_fsigma8`. Cached files are keyed on the training
+configuration and on the source of the growth solver (`solver_version`), so
+editing `perturbations` or `core_physics` retrains the emulator.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from numpy.polynomial import chebyshev
+from numpy.typing import ArrayLike, NDArray
+
+import core_physics
+import perturbations
+from core_physics import NUMBA_AVAILABLE, PsiTMGCosmology, compute_radiation_density, njit
+from dataset_cache import CACHE_DIRNAME, atomic_write
+from perturbations import StructureFormation, solve_growth_many
+from result_store import code_version
+
+FloatArray = NDArray[np.float64]
+
+EMULATOR_FORMAT_VERSION = 1
+EMULATOR_PARAM_NAMES = ("Omega_m", "w_0", "w_a", "H_0")
+# Same box as `run_mcmc.PRIOR_BOUNDS` for the background parameters.
+DEFAULT_BOUNDS = {
+    "Omega_m": (0.10, 0.50),
+    "w_0": (-2.5, -0.3),
+    "w_a": (-3.0, 3.0),
+    "H_0": (60.0, 80.0),
+}
+# The w_a direction is the least smooth one (early dark-energy domination near w_0 ~ -0.3);
+# H_0 only enters through Omega_r.
+DEFAULT_DEGREES = (16, 16, 48, 4)
+
+logger = logging.getLogger(__name__)
+
+
+def solver_version() -> str:
+    """Digest of the growth-solver sources the emulator is trained on."""
+    return code_version(perturbations, core_physics)[:16]
+
+
+def _chebyshev_nodes(n: int) -> FloatArray:
+    """Chebyshev-Gauss nodes on [-1, 1], increasing."""
+    return np.cos(np.pi * (np.arange(n) + 0.5) / n)[::-1]
+
+
+@njit(cache=True)
+def _sparse_chebyshev_numba(
+    x: FloatArray,
+    max_degree: int,
+    indices: NDArray[np.int64],
+    weights: FloatArray,
+) -> FloatArray:
+    """Sum weights[k] * prod_d T_{indices[k, d]}(x[n, d]) row by row, compiled."""
+    n_rows, n_dim = x.shape
+    n_terms, n_out = weights.shape
+    out = np.zeros((n_rows, n_out))
+    table = np.empty((n_dim, max_degree))
+    for n in range(n_rows):
+        for d in range(n_dim):
+            table[d, 0] = 1.0
+            if max_degree > 1:
+                table[d, 1] = x[n, d]
+            for k in range(2, max_degree):
+                table[d, k] = 2.0 * x[n, d] * table[d, k - 1] - table[d, k - 2]
+        for k in range(n_terms):
+            term = table[0, indices[k, 0]]
+            for d in range(1, n_dim):
+                term *= table[d, indices[k, d]]
+            for p in range(n_out):
+                out[n, p] += term * weights[k, p]
+    return out
+
+
+def _sparse_chebyshev_numpy(
+    x: FloatArray,
+    max_degree: int,
+    indices: NDArray[np.int64],
+    weights: FloatArray,
+) -> FloatArray:
+    """NumPy fallback of `_sparse_chebyshev_numba`."""
+    theta = np.arccos(x)
+    terms = np.ones((x.shape[0], indices.shape[0]))
+    for d in range(x.shape[1]):
+        terms *= np.cos(np.arange(max_degree) * theta[:, d : d + 1])[:, indices[:, d]]
+    return terms @ weights
+
+
+def _growth_lna_nodes(z_max: float, lna_min: float = -10.0, n_grid: int = 300) -> FloatArray:
+    """`StructureFormation` grid nodes covering 0 <= z <= z_max."""
+    grid = np.linspace(lna_min, 0.0, n_grid, dtype=float)
+    first = max(int(np.searchsorted(grid, -np.log1p(z_max), side="right")) - 1, 0)
+    return grid[first:]
+
+
+@dataclass
+class GrowthEmulator:
+    """Chebyshev/PCA surrogate of the linear growth history.
+
+    Use `GrowthEmulator.train(...)` to build one, `save`/`load` to serialize
+    it, and `load_or_train` to reuse a cached file when the configuration
+    matches.
+
+    Attributes:
+        lower: Lower box bounds, ordered as `EMULATOR_PARAM_NAMES`.
+        upper: Upper box bounds, ordered as `EMULATOR_PARAM_NAMES`.
+        degrees: Chebyshev nodes per parameter axis.
+        lna_nodes: ln(a) nodes of the default `StructureFormation` grid covering z <= z_max.
+        mean: PCA mean of the stacked [log(f*D), log(D)] histories.
+        basis: PCA basis, shape (n_components, 2 * n_lna).
+        indices: Kept Chebyshev multi-indices, shape (n_terms, 4).
+        weights: Chebyshev coefficients of the PCA amplitudes for the kept
+            multi-indices, shape (n_terms, n_components).
+        error_report: Validation summary from `validate`.
+        solver_version: `solver_version()` of the code that produced the
+            training set (empty for files written before it was recorded).
+    """
+
+    lower: FloatArray
+    upper: FloatArray
+    degrees: tuple[int, ...]
+    lna_nodes: FloatArray
+    mean: FloatArray
+    basis: FloatArray
+    indices: NDArray[np.int64]
+    weights: FloatArray
+    error_report: dict[str, float] = field(default_factory=dict)
+    solver_version: str = ""
+
+    @property
+    def z_max(self) -> float:
+        return float(np.expm1(-self.lna_nodes[0]))
+
+    @property
+    def n_components(self) -> int:
+        return int(self.basis.shape[0])
+
+    @property
+    def n_terms(self) -> int:
+        return int(self.indices.shape[0])
+
+    @staticmethod
+    def config_tag(
+        bounds: dict[str, tuple[float, float]] = DEFAULT_BOUNDS,
+        degrees: tuple[int, ...] = DEFAULT_DEGREES,
+        z_max: float = 3.0,
+        pca_tol: float = 1.0e-5,
+        coef_tol: float = 1.0e-5,
+    ) -> str:
+        """Return a short hash identifying a training configuration and solver version."""
+        payload = json.dumps(
+            {
+                "version": EMULATOR_FORMAT_VERSION,
+                "solver": solver_version(),
+                "bounds": [list(map(float, bounds[name])) for name in EMULATOR_PARAM_NAMES],
+                "degrees": [int(d) for d in degrees],
+                "z_max": float(z_max),
+                "pca_tol": float(pca_tol),
+                "coef_tol": float(coef_tol),
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
+
+    @classmethod
+    def train(
+        cls,
+        bounds: dict[str, tuple[float, float]] = DEFAULT_BOUNDS,
+        degrees: tuple[int, ...] = DEFAULT_DEGREES,
+        z_max: float = 3.0,
+        pca_tol: float = 1.0e-5,
+        coef_tol: float = 1.0e-5,
+        validate: bool = True,
+    ) -> "GrowthEmulator":
+        """Train the emulator on a Chebyshev tensor grid of growth solves.
+
+        Args:
+            bounds: Box for the parameters in `EMULATOR_PARAM_NAMES`.
+            degrees: Chebyshev nodes per parameter axis.
+            z_max: Highest emulated redshift.
+            pca_tol: Relative singular-value cutoff for the PCA truncation.
+            coef_tol: Chebyshev terms whose coefficient norm (over PCA
+                components, in log units) is below this value are dropped.
+            validate: Run `validate()` and store the error report.
+
+        Returns:
+            Trained emulator.
+        """
+        n_dim = len(EMULATOR_PARAM_NAMES)
+        lower = np.array([bounds[name][0] for name in EMULATOR_PARAM_NAMES], dtype=float)
+        upper = np.array([bounds[name][1] for name in EMULATOR_PARAM_NAMES], dtype=float)
+        degrees = tuple(int(d) for d in degrees)
+        if len(degrees) != n_dim or np.any(upper <= lower) or min(degrees) < 2 or z_max <= 0.0:
+            raise ValueError("Invalid emulator configuration.")
+
+        nodes = [_chebyshev_nodes(n) for n in degrees]
+        axes = [lower[d] + 0.5 * (nodes[d] + 1.0) * (upper[d] - lower[d]) for d in range(n_dim)]
+        grid = np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1).reshape(-1, n_dim)
+        lna_nodes = _growth_lna_nodes(z_max)
+
+        features = cls._training_features(grid, lna_nodes)
+        if not np.all(np.isfinite(features)):
+            raise RuntimeError("Non-physical growth solution inside the emulator box.")
+
+        mean = features.mean(axis=0)
+        _, sing, vt = np.linalg.svd(features - mean, full_matrices=False)
+        n_comp = max(1, int(np.sum(sing > pca_tol * sing[0])))
+        basis = vt[:n_comp]
+        coefficients = ((features - mean) @ basis.T).reshape(degrees + (n_comp,))
+
+        # Interpolation at Chebyshev nodes: apply the inverse Vandermonde matrix along each axis.
+        for axis, x in enumerate(nodes):
+            v_inv = np.linalg.inv(chebyshev.chebvander(x, x.size - 1))
+            coefficients = np.moveaxis(np.tensordot(v_inv, coefficients, axes=([1], [axis])), 0, axis)
+
+        keep = np.sqrt(np.sum(coefficients**2, axis=-1)) > coef_tol
+        emulator = cls(
+            lower=lower,
+            upper=upper,
+            degrees=degrees,
+            lna_nodes=lna_nodes,
+            mean=mean,
+            basis=basis,
+            indices=np.ascontiguousarray(np.argwhere(keep), dtype=np.int64),
+            weights=np.ascontiguousarray(coefficients[keep]),
+            solver_version=solver_version(),
+        )
+        if validate:
+            emulator.error_report = emulator.validate()
+        return emulator
+
+    @staticmethod
+    def _training_features(grid: FloatArray, lna_nodes: FloatArray) -> FloatArray:
+        """Stacked [log(f*D), log(D)] histories at `lna_nodes` for parameter rows."""
+        params = np.column_stack([grid[:, :3], np.ones(grid.shape[0])])
+        table = solve_growth_many(params, Omega_r=compute_radiation_density(grid[:, 3]))
+        cols = table.lna_grid.size - lna_nodes.size
+        with np.errstate(all="ignore"):
+            return np.hstack([np.log(table.fsigma8[:, cols:]), np.log(table.d[:, cols:])])
+
+    def covers(self, params: ArrayLike) -> NDArray[np.bool_]:
+        """Return True for parameter rows (ordered as `EMULATOR_PARAM_NAMES`) inside the box."""
+        arr = np.atleast_2d(np.asarray(params, dtype=float))
+        return np.all((arr >= self.lower) & (arr <= self.upper), axis=1)
+
+    def _emulate(self, params: ArrayLike, z: ArrayLike, offset: int) -> FloatArray:
+        """Emulated history (f*D for offset 0, D for offset n_lna) at z, shape (N, M).
+
+        Only the two grid columns bracketing each redshift are reconstructed;
+        they are exponentiated and interpolated linearly in ln(a), as in
+        `StructureFormation.get_fsigma8`.
+        """
+        arr = np.atleast_2d(np.asarray(params, dtype=float))
+        if arr.shape[1] != len(EMULATOR_PARAM_NAMES):
+            raise ValueError(f"params must have shape (N, 4) ordered as {EMULATOR_PARAM_NAMES}; got {arr.shape}.")
+        if np.any(arr < self.lower) or np.any(arr > self.upper):
+            raise ValueError("Parameters outside the emulator training box.")
+        lna_target = -np.log1p(np.atleast_1d(np.asarray(z, dtype=float)))
+        if np.any(lna_target > 0.0) or np.any(lna_target < self.lna_nodes[0]):
+            raise ValueError(f"Redshift must satisfy 0 <= z <= {self.z_max}.")
+
+        idx = np.clip(np.searchsorted(self.lna_nodes, lna_target, side="right"), 1, self.lna_nodes.size - 1)
+        x0 = self.lna_nodes[idx - 1]
+        weight = (lna_target - x0) / (self.lna_nodes[idx] - x0)
+        cols = offset + np.concatenate([idx - 1, idx])
+
+        x = np.clip(2.0 * (arr - self.lower) / (self.upper - self.lower) - 1.0, -1.0, 1.0)
+        kernel = _sparse_chebyshev_numba if NUMBA_AVAILABLE else _sparse_chebyshev_numpy
+        amplitudes = kernel(x, max(self.degrees), self.indices, self.weights)
+        values = np.exp(self.mean[cols] + amplitudes @ self.basis[:, cols])
+        return values[:, : idx.size] * (1.0 - weight) + values[:, idx.size :] * weight
+
+    def fsigma8(self, z: ArrayLike, params: ArrayLike, sigma_8: ArrayLike) -> FloatArray:
+        """Return f*sigma8(z), shape (N, M), for (N, 4) parameters and N sigma_8 values."""
+        sigma = np.atleast_1d(np.asarray(sigma_8, dtype=float))[:, np.newaxis]
+        return sigma * self._emulate(params, z, 0)
+
+    def growth_factor(self, z: ArrayLike, params: ArrayLike) -> FloatArray:
+        """Return D(z) normalized to D(0) = 1, shape (N, M)."""
+        return self._emulate(params, z, self.lna_nodes.size)
+
+    def validate(self, n_samples: int = 256, seed: int = 0, n_z: int = 61) -> dict[str, float]:
+        """Compare against `StructureFormation.get_fsigma8` at random box points.
+
+        Returns:
+            Max and 99th-percentile relative errors of f*sigma8 and D.
+        """
+        rng = np.random.default_rng(seed)
+        params = self.lower + (self.upper - self.lower) * rng.random((int(n_samples), self.lower.size))
+        sigma_8 = rng.uniform(0.6, 1.0, int(n_samples))
+        z = np.linspace(0.0, self.z_max, int(n_z))
+
+        cosmologies = [
+            PsiTMGCosmology(H_0=h_0, Omega_m=om, w_0=w0, w_a=wa, sigma_8=s8)
+            for (om, w0, wa, h_0), s8 in zip(params, sigma_8)
+        ]
+        structures = StructureFormation.batch(cosmologies)
+        fs8_ref = np.array([s.get_fsigma8(z) for s in structures])
+        d_ref = np.array([s.get_growth_factor(z) for s in structures])
+
+        err_fs8 = np.max(np.abs(self.fsigma8(z, params, sigma_8) / fs8_ref - 1.0), axis=1)
+        err_d = np.max(np.abs(self.growth_factor(z, params) / d_ref - 1.0), axis=1)
+        return {
+            "n_samples": float(n_samples),
+            "max_rel_error_fsigma8": float(np.max(err_fs8)),
+            "p99_rel_error_fsigma8": float(np.quantile(err_fs8, 0.99)),
+            "max_rel_error_D": float(np.max(err_d)),
+            "p99_rel_error_D": float(np.quantile(err_d, 0.99)),
+        }
+
+    def save(self, path: Path | str) -> Path:
+        """Write the emulator to a `.npz` file atomically."""
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        meta = {
+            "format_version": EMULATOR_FORMAT_VERSION,
+            "param_names": list(EMULATOR_PARAM_NAMES),
+            "degrees": list(self.degrees),
+            "error_report": self.error_report,
+            "solver_version": self.solver_version,
+        }
+        buffer = io.BytesIO()
+        np.savez(
+            buffer,
+            lower=self.lower,
+            upper=self.upper,
+            lna_nodes=self.lna_nodes,
+            mean=self.mean,
+            basis=self.basis,
+            indices=self.indices,
+            weights=self.weights,
+            meta=np.array(json.dumps(meta)),
+        )
+        atomic_write(target, lambda fh: fh.write(buffer.getvalue()))
+        return target
+
+    @classmethod
+    def load(cls, path: Path | str) -> "GrowthEmulator":
+        """Read an emulator written by `save`."""
+        with np.load(Path(path), allow_pickle=False) as data:
+            meta: dict[str, Any] = json.loads(str(data["meta"]))
+            if meta.get("format_version") != EMULATOR_FORMAT_VERSION:
+                raise ValueError(f"Unsupported growth emulator format in {path}.")
+            if tuple(meta.get("param_names", ())) != EMULATOR_PARAM_NAMES:
+                raise ValueError(f"Unexpected emulator parameters in {path}.")
+            return cls(
+                lower=np.array(data["lower"]),
+                upper=np.array(data["upper"]),
+                degrees=tuple(int(d) for d in meta["degrees"]),
+                lna_nodes=np.array(data["lna_nodes"]),
+                mean=np.array(data["mean"]),
+                basis=np.array(data["basis"]),
+                indices=np.ascontiguousarray(data["indices"], dtype=np.int64),
+                weights=np.array(data["weights"]),
+                error_report={k: float(v) for k, v in meta.get("error_report", {}).items()},
+                solver_version=str(meta.get("solver_version", "")),
+            )
+
+    @classmethod
+    def default_path(cls, root: Path | str | None = None, **config: Any) -> Path:
+        """Cache location for a configuration, next to the RSD data."""
+        base = Path(root) if root is not None else Path(__file__).resolve().parent
+        tag = cls.config_tag(**config)
+        return base / "assets/zz-data/10_structure_growth" / CACHE_DIRNAME / f"growth_emulator.{tag}.npz"
+
+    @classmethod
+    def load_or_train(cls, path: Path | str | None = None, **config: Any) -> "GrowthEmulator":
+        """Load the emulator for `config` from disk, training and saving it if missing.
+
+        A file trained with another version of the growth solver is retrained
+        and overwritten.
+        """
+        target = Path(path) if path is not None else cls.default_path(**config)
+        if target.exists():
+            try:
+                emulator = cls.load(target)
+            except (OSError, ValueError, KeyError) as exc:
+                logger.warning("Unreadable growth emulator %s (%s); retraining.", target, exc)
+            else:
+                if emulator.solver_version == solver_version():
+                    return emulator
+                logger.info("Growth emulator %s was trained with another solver version; retraining.", target)
+        emulator = cls.train(**config)
+        try:
+            emulator.save(target)
+        except OSError as exc:
+            logger.warning("Cannot write growth emulator %s (%s).", target, exc)
+        return emulator
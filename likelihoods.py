@@ -2,20 +2,36 @@
 
 from __future__ import annotations
 
+import math
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Union
 
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import ArrayLike, NDArray
 from scipy.interpolate import CubicSpline
-from scipy.linalg import block_diag, cho_factor, cho_solve
-
-from core_physics import PsiTMGCosmology
-from perturbations import StructureFormation
+from scipy.linalg import block_diag, cho_factor, cho_solve, solve_triangular
+
+from core_physics import (
+    NUMBA_AVAILABLE,
+    PsiTMGCosmology,
+    _ez_scalar,
+    compute_E_batch,
+    compute_radiation_density,
+    njit,
+)
+from dataset_cache import load_csv_table, load_text_array
+from growth_emulator import GrowthEmulator
+from perturbations import StructureFormation, solve_growth_many
 
 FloatArray = NDArray[np.float64]
 C_KM_S = 299792.458
 RD_FID_MPC = 147.09
+BATCH_PARAM_NAMES = ("H_0", "Omega_m", "w_0", "w_a", "sigma_8")
+DISTANCE_BACKENDS = ("spline", "quadrature")
+KERNEL_BACKENDS = ("numpy", "numba")
+GROWTH_BACKENDS = ("ode", "emulator")
 
 
 @dataclass(frozen=True)
@@ -28,6 +44,294 @@ class _DistanceTable:
     chi_spline: CubicSpline
     e_spline: CubicSpline
 
+    def chi(self, z: ArrayLike) -> FloatArray:
+        """Return the dimensionless comoving distance integral at z."""
+        return self.chi_spline(z)
+
+    def e(self, z: ArrayLike) -> FloatArray:
+        """Return E(z) interpolated from the table."""
+        return self.e_spline(z)
+
+    def view(self, z_max: float) -> "_DistanceTable":
+        """Return the sub-table covering [0, z_max] without copying the grids."""
+        n = int(np.searchsorted(self.z_grid, z_max, side="left")) + 1
+        if n >= self.z_grid.size:
+            return self
+        return _DistanceTable(
+            z_grid=self.z_grid[:n],
+            chi_grid=self.chi_grid[..., :n],
+            e_grid=self.e_grid[..., :n],
+            chi_spline=self.chi_spline,
+            e_spline=self.e_spline,
+        )
+
+
+@dataclass(frozen=True)
+class _QuadratureRule:
+    """Composite Gauss-Legendre rule for chi(z) at a fixed set of redshifts.
+
+    Panel edges include every target redshift, so chi(z_i) is the cumulative
+    sum of panel integrals up to z_i. This is the lower-triangular node/weight
+    matrix applied to 1/E(nodes), evaluated in O(n_nodes) without forming it.
+    """
+
+    nodes: FloatArray
+    weights: FloatArray
+    z_targets: FloatArray
+    target_panel: NDArray[np.intp]
+    z_e_points: FloatArray
+
+    @classmethod
+    def build(
+        cls,
+        z_targets: FloatArray,
+        z_e_points: FloatArray,
+        n_gauss: int = 3,
+        max_dlnz: float = 0.05,
+    ) -> "_QuadratureRule":
+        """Build panels bounded by the targets and by a ln(1+z) step `max_dlnz`."""
+        targets = np.unique(np.asarray(z_targets, dtype=float))
+        if targets.size == 0 or targets[0] < 0.0:
+            raise ValueError("Quadrature targets must be non-empty and satisfy z >= 0.")
+        z_top = float(targets[-1])
+        n_log = max(int(np.ceil(np.log1p(z_top) / max_dlnz)), 1)
+        edges = np.unique(
+            np.concatenate([[0.0], targets, np.expm1(np.linspace(0.0, np.log1p(z_top), n_log + 1))])
+        )
+        edges = edges[edges <= z_top]
+        edges[-1] = z_top
+
+        x, w = np.polynomial.legendre.leggauss(int(n_gauss))
+        half = 0.5 * np.diff(edges)
+        mid = 0.5 * (edges[:-1] + edges[1:])
+        nodes = (mid[:, np.newaxis] + half[:, np.newaxis] * x[np.newaxis, :]).ravel()
+        weights = half[:, np.newaxis] * w[np.newaxis, :]
+        target_panel = np.searchsorted(edges, targets).astype(np.intp)
+        return cls(
+            nodes=nodes,
+            weights=weights,
+            z_targets=targets,
+            target_panel=target_panel,
+            z_e_points=np.unique(np.asarray(z_e_points, dtype=float)),
+        )
+
+    def integrate(self, inv_e_nodes: FloatArray) -> FloatArray:
+        """Return chi at `z_targets` from 1/E sampled at `nodes` (last axis)."""
+        lead = inv_e_nodes.shape[:-1]
+        panels = np.sum(inv_e_nodes.reshape(lead + self.weights.shape) * self.weights, axis=-1)
+        cum = np.zeros(lead + (panels.shape[-1] + 1,), dtype=float)
+        np.cumsum(panels, axis=-1, out=cum[..., 1:])
+        return cum[..., self.target_panel]
+
+
+@dataclass(frozen=True)
+class _QuadratureTable:
+    """Distances at the fixed data redshifts, same accessors as `_DistanceTable`."""
+
+    z_targets: FloatArray
+    chi_targets: FloatArray
+    z_e_points: FloatArray
+    e_points: FloatArray
+
+    @staticmethod
+    def _lookup(z_ref: FloatArray, values: FloatArray, z: ArrayLike) -> FloatArray:
+        z_arr = np.asarray(z, dtype=float)
+        idx = np.minimum(np.searchsorted(z_ref, z_arr), z_ref.size - 1)
+        if not np.array_equal(z_ref[idx], z_arr):
+            raise ValueError("Quadrature backend only serves its precomputed data redshifts.")
+        return values[..., idx]
+
+    def chi(self, z: ArrayLike) -> FloatArray:
+        return self._lookup(self.z_targets, self.chi_targets, z)
+
+    def e(self, z: ArrayLike) -> FloatArray:
+        return self._lookup(self.z_e_points, self.e_points, z)
+
+    def view(self, z_max: float) -> "_QuadratureTable":
+        return self
+
+
+_AnyTable = Union[_DistanceTable, _QuadratureTable]
+
+
+@dataclass(frozen=True)
+class _FusedProbe:
+    """Data and quadrature layout for one fused compiled chi-square loop.
+
+    Data are sorted by redshift and `datum_panel[k]` is the panel edge at
+    which datum k sits, so the kernel can stream through panels once.
+    """
+
+    nodes: FloatArray
+    weights: FloatArray
+    datum_panel: NDArray[np.intp]
+    z: FloatArray
+    obs: FloatArray
+    inv_var: FloatArray
+
+    @classmethod
+    def build(cls, z: FloatArray, obs: FloatArray, sigma: FloatArray) -> "_FusedProbe":
+        order = np.argsort(z, kind="stable")
+        z_sorted = np.ascontiguousarray(z[order], dtype=float)
+        rule = _QuadratureRule.build(z_sorted, z_sorted[:0])
+        datum_panel = rule.target_panel[np.searchsorted(rule.z_targets, z_sorted)]
+        return cls(
+            nodes=rule.nodes,
+            weights=np.ascontiguousarray(rule.weights),
+            datum_panel=np.ascontiguousarray(datum_panel, dtype=np.intp),
+            z=z_sorted,
+            obs=np.ascontiguousarray(obs[order], dtype=float),
+            inv_var=np.ascontiguousarray(1.0 / (sigma[order] * sigma[order]), dtype=float),
+        )
+
+
+@njit(cache=True)
+def _fused_sne_chi2(
+    nodes, weights, datum_panel, z, mu_obs, inv_var,
+    h0, omega_r, omega_m, omega_de, w0, wa, out,
+):
+    """E(z), chi(z), distance modulus and diagonal SN chi2 in one pass per row."""
+    n_panels, n_gauss = weights.shape
+    n_data = z.size
+    for r in range(h0.size):
+        chi = 0.0
+        chi2 = 0.0
+        k = 0
+        for p in range(n_panels + 1):
+            while k < n_data and datum_panel[k] == p:
+                d_l = (1.0 + z[k]) * (C_KM_S / h0[r]) * chi
+                resid = mu_obs[k] - (5.0 * math.log10(max(d_l, 1.0e-12)) + 25.0)
+                chi2 += resid * resid * inv_var[k]
+                k += 1
+            if p == n_panels:
+                break
+            for j in range(n_gauss):
+                e = _ez_scalar(nodes[p * n_gauss + j], omega_r[r], omega_m[r], omega_de[r], w0[r], wa[r])
+                chi += weights[p, j] / e
+        out[r] = chi2
+
+
+@njit(cache=True)
+def _fused_bao_chi2(
+    nodes, weights, datum_panel, z, dv_obs, inv_var, scale,
+    h0, omega_r, omega_m, omega_de, w0, wa, out,
+):
+    """Fused isotropic BAO D_V chi2; `scale` is 1/r_d for ratio data, else 1."""
+    n_panels, n_gauss = weights.shape
+    n_data = z.size
+    for r in range(h0.size):
+        chi = 0.0
+        chi2 = 0.0
+        k = 0
+        for p in range(n_panels + 1):
+            while k < n_data and datum_panel[k] == p:
+                e = _ez_scalar(z[k], omega_r[r], omega_m[r], omega_de[r], w0[r], wa[r])
+                dv = (C_KM_S / h0[r]) * (z[k] * chi * chi / max(e, 1.0e-12)) ** (1.0 / 3.0)
+                resid = dv * scale - dv_obs[k]
+                chi2 += resid * resid * inv_var[k]
+                k += 1
+            if p == n_panels:
+                break
+            for j in range(n_gauss):
+                e = _ez_scalar(nodes[p * n_gauss + j], omega_r[r], omega_m[r], omega_de[r], w0[r], wa[r])
+                chi += weights[p, j] / e
+        out[r] = chi2
+
+
+@njit(cache=True)
+def _fused_cmb_chi2(
+    nodes, weights, r_obs, inv_var,
+    h0, omega_r, omega_m, omega_de, w0, wa, out,
+):
+    """Fused shift-parameter chi2: integrate to z* and form R = sqrt(Omega_m) chi."""
+    n_panels, n_gauss = weights.shape
+    for r in range(h0.size):
+        chi = 0.0
+        for p in range(n_panels):
+            for j in range(n_gauss):
+                e = _ez_scalar(nodes[p * n_gauss + j], omega_r[r], omega_m[r], omega_de[r], w0[r], wa[r])
+                chi += weights[p, j] / e
+        if omega_m[r] <= 0.0:
+            out[r] = np.inf
+        else:
+            resid = math.sqrt(omega_m[r]) * chi - r_obs
+            out[r] = resid * resid * inv_var
+
+
+@dataclass(frozen=True)
+class _BatchParams:
+    """Column view of an (N, 5) parameter block ordered as `BATCH_PARAM_NAMES`."""
+
+    H_0: FloatArray
+    Omega_m: FloatArray
+    w_0: FloatArray
+    w_a: FloatArray
+    sigma_8: FloatArray
+
+    @property
+    def size(self) -> int:
+        return int(self.H_0.size)
+
+    def take(self, mask: NDArray[np.bool_]) -> "_BatchParams":
+        """Return the subset of parameter points selected by a boolean mask."""
+        return _BatchParams(
+            H_0=self.H_0[mask],
+            Omega_m=self.Omega_m[mask],
+            w_0=self.w_0[mask],
+            w_a=self.w_a[mask],
+            sigma_8=self.sigma_8[mask],
+        )
+
+    def cosmology(self, i: int) -> PsiTMGCosmology:
+        """Build the scalar cosmology for row `i`."""
+        return PsiTMGCosmology(
+            H_0=float(self.H_0[i]),
+            Omega_m=float(self.Omega_m[i]),
+            w_0=float(self.w_0[i]),
+            w_a=float(self.w_a[i]),
+            sigma_8=float(self.sigma_8[i]),
+        )
+
+
+@dataclass(frozen=True)
+class _SNeWhitening:
+    """Pre-whitened SN data for a full covariance C = L L^T.
+
+    With W = L^-1 stored once, chi2 = |W mu_obs - W mu_model|^2 costs one
+    mat-vec per point (one GEMM for a batch). The analytic marginalization over
+    a global magnitude offset M uses the precomputed u = W 1:
+        chi2_marg = A - B^2 / C,  A = r.r, B = r.u, C = u.u
+    (the parameter-independent ln(C / 2 pi) term is dropped).
+    """
+
+    linv: FloatArray
+    y_obs: FloatArray
+    u_one: FloatArray
+    u_norm2: float
+    marginalize_offset: bool
+
+    @classmethod
+    def build(cls, cov: FloatArray, mu_obs: FloatArray, marginalize_offset: bool) -> "_SNeWhitening":
+        chol = np.linalg.cholesky(cov)
+        linv = solve_triangular(chol, np.eye(cov.shape[0]), lower=True, check_finite=False)
+        u_one = linv @ np.ones(cov.shape[0], dtype=float)
+        return cls(
+            linv=np.ascontiguousarray(linv),
+            y_obs=linv @ mu_obs,
+            u_one=u_one,
+            u_norm2=float(u_one @ u_one),
+            marginalize_offset=bool(marginalize_offset),
+        )
+
+    def chi2(self, mu_model: FloatArray) -> FloatArray:
+        """Return chi2 for one (n,) or many (N, n) distance-modulus vectors."""
+        resid = self.y_obs - mu_model @ self.linv.T
+        chi2 = np.sum(resid * resid, axis=-1)
+        if self.marginalize_offset:
+            b = resid @ self.u_one
+            chi2 = chi2 - b * b / self.u_norm2
+        return chi2
+
 
 @dataclass(frozen=True)
 class _BAOAnisoData:
@@ -51,8 +355,10 @@ class LikelihoodEvaluator:
             this module (repository root in this project layout).
         sne_path: Relative path to Pantheon+ CSV.
         sne_cov_path: Optional full Pantheon+ covariance path. When provided,
-            the SN likelihood uses analytic marginalization over a global
-            magnitude offset with this covariance.
+            the data are whitened once with the inverse Cholesky factor and
+            the SN likelihood uses this covariance.
+        sne_marginalize_offset: With `sne_cov_path`, analytically marginalize
+            over a global magnitude offset (default True).
         bao_path: Relative path to BAO CSV.
         bao_aniso_path: Optional anisotropic BAO CSV path for (D_M/r_d, D_H/r_d)
             with covariance entries.
@@ -65,7 +371,26 @@ class LikelihoodEvaluator:
         z_star_cmb: Recombination redshift for the shift parameter.
         planck_R: Planck shift-parameter central value.
         planck_R_sigma: Planck shift-parameter 1-sigma uncertainty.
-        n_steps_distance: Number of z points for distance integration grids.
+        distance_backend: "spline" (default) integrates 1/E through cubic
+            splines on the master grid; "quadrature" uses a precomputed
+            Gauss-Legendre rule at the fixed data redshifts (no spline build).
+        n_steps_distance: Number of z points per segment of the distance
+            integration grid (linear up to the highest data redshift, then
+            uniform in ln(1+z) up to `z_star_cmb`).
+        kernel_backend: "numpy" (default) or "numba". With "numba", the
+            diagonal SN, isotropic BAO and CMB probes run as fused compiled
+            loops (E(z), integration and chi2 without temporaries). Falls back
+            to the NumPy path when numba is not installed.
+        distance_cache_size: Maximum number of background parameter points
+            whose distance tables are kept in the LRU cache.
+        growth_backend: "ode" (default) solves the growth equation for the
+            RSD probe at every point; "emulator" evaluates f*sigma8 with a
+            `growth_emulator.GrowthEmulator` inside its training box and falls
+            back to the ODE outside it. An explicit `structure` argument
+            always takes precedence.
+        growth_emulator: Emulator instance or `.npz` path (relative to
+            `root`) used with `growth_backend="emulator"`. If None, the
+            default emulator is loaded from its cache or trained once.
     """
 
     def __init__(
@@ -73,6 +398,7 @@ class LikelihoodEvaluator:
         root: Path | str | None = None,
         sne_path: Path | str = "assets/zz-data/08_sound_horizon/08_pantheon_data.csv",
         sne_cov_path: Path | str | None = None,
+        sne_marginalize_offset: bool = True,
         bao_path: Path | str = "assets/zz-data/08_sound_horizon/08_bao_data.csv",
         bao_aniso_path: Path | str | None = None,
         bao_aniso_cov_path: Path | str | None = None,
@@ -84,6 +410,11 @@ class LikelihoodEvaluator:
         planck_R: float = 1.7502,
         planck_R_sigma: float = 0.0046,
         n_steps_distance: int = 1200,
+        distance_cache_size: int = 32,
+        distance_backend: str = "spline",
+        kernel_backend: str = "numpy",
+        growth_backend: str = "ode",
+        growth_emulator: GrowthEmulator | Path | str | None = None,
     ) -> None:
         self.root = Path(root) if root is not None else Path(__file__).resolve().parent
         self.sigma_sys_sne = float(sigma_sys_sne)
@@ -94,21 +425,15 @@ class LikelihoodEvaluator:
         self.n_steps_distance = int(n_steps_distance)
 
         self._z_sne, self._mu_sne, self._sigma_mu_sne = self._load_sne(self.root / sne_path)
-        self._sne_cov_chofac: tuple[NDArray[np.float64], bool] | None = None
+        self._sne_whitening: _SNeWhitening | None = None
         if sne_cov_path is not None:
-            self._configure_sne_covariance(self.root / sne_cov_path, self._z_sne.size)
+            self._configure_sne_covariance(self.root / sne_cov_path, self._z_sne.size, sne_marginalize_offset)
         self._z_bao, self._dv_bao, self._sigma_dv_bao, self._bao_is_ratio = self._load_bao(self.root / bao_path)
         self._bao_aniso: _BAOAnisoData | None = None
         if bao_aniso_path is not None:
             full_cov: FloatArray | None = None
             if bao_aniso_cov_path is not None:
-                aniso_data = np.genfromtxt(
-                    self.root / bao_aniso_path,
-                    delimiter=",",
-                    names=True,
-                    dtype=float,
-                    encoding="utf-8",
-                )
+                aniso_data = load_csv_table(self.root / bao_aniso_path)
                 n_aniso = np.atleast_1d(aniso_data).shape[0]
                 full_cov = self._load_square_matrix(self.root / bao_aniso_cov_path, 2 * n_aniso)
             self._bao_aniso = self._load_bao_aniso(self.root / bao_aniso_path, full_cov=full_cov)
@@ -117,8 +442,44 @@ class LikelihoodEvaluator:
             self._cc_data = self._load_cc(self.root / cc_path)
         self._z_rsd, self._fs8_rsd, self._sigma_rsd = self._load_rsd(self.root / rsd_path)
 
-        self._last_distance_key: tuple[float, float, float, float, float] | None = None
-        self._last_distance_table: _DistanceTable | None = None
+        if int(distance_cache_size) < 1:
+            raise ValueError("distance_cache_size must be >= 1.")
+        self.distance_cache_size = int(distance_cache_size)
+        self._distance_cache: OrderedDict[tuple[float, ...], _DistanceTable] = OrderedDict()
+        self._distance_cache_hits = 0
+        self._distance_cache_misses = 0
+        self._z_master_grid = self._build_master_z_grid()
+
+        if distance_backend not in DISTANCE_BACKENDS:
+            raise ValueError(f"distance_backend must be one of {DISTANCE_BACKENDS}, got {distance_backend!r}.")
+        self.distance_backend = str(distance_backend)
+        self._quad_rule: _QuadratureRule | None = None
+        if self.distance_backend == "quadrature":
+            self._quad_rule = self._build_quadrature_rule()
+
+        if kernel_backend not in KERNEL_BACKENDS:
+            raise ValueError(f"kernel_backend must be one of {KERNEL_BACKENDS}, got {kernel_backend!r}.")
+        self.kernel_backend = str(kernel_backend) if NUMBA_AVAILABLE else "numpy"
+        self._fused: dict[str, _FusedProbe] = {}
+        if self.kernel_backend == "numba":
+            self._fused = self._build_fused_probes()
+
+        if growth_backend not in GROWTH_BACKENDS:
+            raise ValueError(f"growth_backend must be one of {GROWTH_BACKENDS}, got {growth_backend!r}.")
+        self.growth_backend = str(growth_backend)
+        self._growth_emulator: GrowthEmulator | None = None
+        if self.growth_backend == "emulator":
+            if isinstance(growth_emulator, GrowthEmulator):
+                self._growth_emulator = growth_emulator
+            elif growth_emulator is not None:
+                self._growth_emulator = GrowthEmulator.load(self.root / growth_emulator)
+            else:
+                self._growth_emulator = GrowthEmulator.load_or_train()
+            if float(np.max(self._z_rsd)) > self._growth_emulator.z_max:
+                raise ValueError(
+                    f"RSD data extend to z={float(np.max(self._z_rsd))}, beyond the emulator z_max="
+                    f"{self._growth_emulator.z_max}."
+                )
 
     @staticmethod
     def _invalid_cosmology(cosmology: PsiTMGCosmology) -> bool:
@@ -135,7 +496,7 @@ class LikelihoodEvaluator:
 
     @staticmethod
     def _load_sne(path: Path) -> tuple[FloatArray, FloatArray, FloatArray]:
-        data = np.genfromtxt(path, delimiter=",", names=True, dtype=float, encoding="utf-8")
+        data = load_csv_table(path)
         names = set(data.dtype.names or ())
         required = {"z", "mu_obs", "sigma_mu"}
         if not required.issubset(names):
@@ -149,11 +510,8 @@ class LikelihoodEvaluator:
 
     @staticmethod
     def _load_square_matrix(path: Path, n_expected: int) -> FloatArray:
-        """Load covariance matrix from txt/csv/dat/npy formats."""
-        if path.suffix.lower() == ".npy":
-            raw = np.load(path)
-        else:
-            raw = np.loadtxt(path, dtype=float)
+        """Load covariance matrix from txt/csv/dat/npy formats (memory-mapped)."""
+        raw = load_text_array(path)
 
         arr = np.asarray(raw, dtype=float)
         if arr.ndim == 1:
@@ -177,19 +535,19 @@ class LikelihoodEvaluator:
             raise ValueError("Covariance file has unsupported dimensions.")
         return arr
 
-    def _configure_sne_covariance(self, path: Path, n_expected: int) -> None:
+    def _configure_sne_covariance(self, path: Path, n_expected: int, marginalize_offset: bool = True) -> None:
         """Configure full Pantheon+ covariance for SN likelihood evaluation."""
         cov = self._load_square_matrix(path, n_expected)
         cov = 0.5 * (cov + cov.T)
         try:
-            chofac = cho_factor(cov, lower=True, check_finite=False)
+            whitening = _SNeWhitening.build(cov, self._mu_sne, marginalize_offset)
         except np.linalg.LinAlgError as exc:
             raise ValueError(f"SNe covariance is not positive definite: {path}") from exc
-        self._sne_cov_chofac = chofac
+        self._sne_whitening = whitening
 
     @staticmethod
     def _load_bao(path: Path) -> tuple[FloatArray, FloatArray, FloatArray, bool]:
-        data = np.genfromtxt(path, delimiter=",", names=True, dtype=float, encoding="utf-8")
+        data = load_csv_table(path)
         names = set(data.dtype.names or ())
         if "z" not in names:
             raise ValueError(f"BAO file {path} missing column z.")
@@ -219,7 +577,7 @@ class LikelihoodEvaluator:
 
     @staticmethod
     def _load_rsd(path: Path) -> tuple[FloatArray, FloatArray, FloatArray]:
-        data = np.genfromtxt(path, delimiter=",", names=True, dtype=float, encoding="utf-8")
+        data = load_csv_table(path)
         names = set(data.dtype.names or ())
         if "z" not in names or "fsigma8" not in names:
             raise ValueError(f"RSD file {path} must contain z and fsigma8.")
@@ -241,7 +599,7 @@ class LikelihoodEvaluator:
     @staticmethod
     def _load_cc(path: Path) -> tuple[FloatArray, FloatArray, FloatArray]:
         """Load cosmic chronometer data columns (z, H_obs, H_err)."""
-        data = np.genfromtxt(path, delimiter=",", names=True, dtype=float, encoding="utf-8")
+        data = load_csv_table(path)
         names = set(data.dtype.names or ())
         if "z" not in names:
             raise ValueError(f"CC file {path} must contain z.")
@@ -271,7 +629,7 @@ class LikelihoodEvaluator:
     @staticmethod
     def _load_bao_aniso(path: Path, full_cov: FloatArray | None = None) -> _BAOAnisoData:
         """Load anisotropic BAO data with covariance for (D_M/r_d, D_H/r_d)."""
-        data = np.genfromtxt(path, delimiter=",", names=True, dtype=float, encoding="utf-8")
+        data = load_csv_table(path)
         names = set(data.dtype.names or ())
         required = {"z", "dm_over_rd_obs", "dh_over_rd_obs"}
         if not required.issubset(names):
@@ -350,62 +708,192 @@ class LikelihoodEvaluator:
         integ[1:] = np.cumsum(avg * dz)
         return integ
 
-    def _distance_table(self, cosmology: PsiTMGCosmology, z_max: float) -> _DistanceTable:
-        key = (
-            cosmology.H_0,
-            cosmology.Omega_m,
-            cosmology.w_0,
-            cosmology.w_a,
-            float(z_max),
+    def _data_z_max(self) -> float:
+        """Return the highest redshift among the loaded low-z distance probes."""
+        z_max = max(float(np.max(self._z_sne)), float(np.max(self._z_bao)))
+        if self._bao_aniso is not None:
+            z_max = max(z_max, float(np.max(self._bao_aniso.z)))
+        return z_max
+
+    def _build_master_z_grid(self) -> FloatArray:
+        """Build the shared two-segment redshift grid for distance tables.
+
+        The low-z segment is linear up to the highest data redshift, so SN/BAO
+        lookups keep the resolution of a dedicated table; the high-z segment is
+        uniform in ln(1+z) up to `z_star_cmb`. Every probe then reads from one
+        master table per parameter point.
+        """
+        z_low = self._data_z_max()
+        low = np.linspace(0.0, z_low, self.n_steps_distance, dtype=float)
+        if self.z_star_cmb <= z_low:
+            return low
+        high = np.expm1(
+            np.linspace(np.log1p(z_low), np.log1p(self.z_star_cmb), self.n_steps_distance, dtype=float)
+        )
+        high[-1] = self.z_star_cmb
+        return np.concatenate([low, high[1:]])
+
+    def _build_quadrature_rule(self) -> _QuadratureRule:
+        """Precompute the Gauss-Legendre rule covering every data redshift."""
+        z_e = [self._z_bao]
+        if self._bao_aniso is not None:
+            z_e.append(self._bao_aniso.z)
+        z_e_points = np.concatenate(z_e)
+        z_targets = np.concatenate([self._z_sne, z_e_points, [self.z_star_cmb]])
+        return _QuadratureRule.build(z_targets, z_e_points)
+
+    def _build_fused_probes(self) -> dict[str, _FusedProbe]:
+        """Prepare sorted data and quadrature layouts for the compiled probes."""
+        fused: dict[str, _FusedProbe] = {}
+        if self._sne_whitening is None:
+            sigma = np.sqrt(self._sigma_mu_sne * self._sigma_mu_sne + self.sigma_sys_sne * self.sigma_sys_sne)
+            fused["sne"] = _FusedProbe.build(self._z_sne, self._mu_sne, np.maximum(sigma, 1.0e-12))
+        fused["bao"] = _FusedProbe.build(self._z_bao, self._dv_bao, self._sigma_dv_bao)
+        fused["cmb"] = _FusedProbe.build(
+            np.array([self.z_star_cmb]), np.array([self.planck_R]), np.array([self.planck_R_sigma])
+        )
+        return fused
+
+    def _fused_chi2(self, probe: str, params: _BatchParams | PsiTMGCosmology) -> FloatArray:
+        """Run the compiled kernel for `probe` over one or many parameter points."""
+        if isinstance(params, PsiTMGCosmology):
+            h0, om, omr = (np.array([v], dtype=float) for v in (params.H_0, params.Omega_m, params.Omega_r))
+            w0 = np.array([params.w_0], dtype=float)
+            wa = np.array([params.w_a], dtype=float)
+        else:
+            h0, om, w0, wa = params.H_0, params.Omega_m, params.w_0, params.w_a
+            omr = np.asarray(compute_radiation_density(h0), dtype=float)
+        ode = 1.0 - om - omr
+        out = np.empty(h0.size, dtype=float)
+        f = self._fused[probe]
+        if probe == "sne":
+            _fused_sne_chi2(f.nodes, f.weights, f.datum_panel, f.z, f.obs, f.inv_var, h0, omr, om, ode, w0, wa, out)
+        elif probe == "bao":
+            scale = 1.0 / self.rd_fid_mpc if self._bao_is_ratio else 1.0
+            _fused_bao_chi2(
+                f.nodes, f.weights, f.datum_panel, f.z, f.obs, f.inv_var, scale, h0, omr, om, ode, w0, wa, out
+            )
+        else:
+            _fused_cmb_chi2(f.nodes, f.weights, float(f.obs[0]), float(f.inv_var[0]), h0, omr, om, ode, w0, wa, out)
+        return out
+
+    def _use_quadrature(self, z_max: float, backend: str | None) -> bool:
+        backend = self.distance_backend if backend is None else backend
+        return (
+            backend == "quadrature"
+            and self._quad_rule is not None
+            and z_max <= self._quad_rule.z_targets[-1]
         )
-        if self._last_distance_key == key and self._last_distance_table is not None:
-            return self._last_distance_table
 
-        z_grid = np.linspace(0.0, z_max, self.n_steps_distance, dtype=float)
-        e_grid = np.asarray(cosmology.E(z_grid), dtype=float)
-        if np.any(~np.isfinite(e_grid)) or np.any(e_grid <= 0.0):
-            raise ValueError("Invalid E(z) encountered while building distance table.")
+    def _quadrature_table(self, e_nodes: FloatArray, e_points: FloatArray) -> _QuadratureTable:
+        rule = self._quad_rule
+        assert rule is not None
+        return _QuadratureTable(
+            z_targets=rule.z_targets,
+            chi_targets=rule.integrate(1.0 / e_nodes),
+            z_e_points=rule.z_e_points,
+            e_points=e_points,
+        )
+
+    def _z_grid_for(self, z_max: float) -> FloatArray:
+        """Return the master grid, or a dedicated grid for z_max beyond it."""
+        if z_max <= self._z_master_grid[-1]:
+            return self._z_master_grid
+        return np.linspace(0.0, z_max, self.n_steps_distance, dtype=float)
+
+    @staticmethod
+    def _tabulate_distances(z_grid: FloatArray, e_grid: FloatArray) -> _DistanceTable:
+        """Integrate 1/E along the last axis of `e_grid` and wrap it in splines."""
         inv_e = 1.0 / e_grid
 
         # Build smooth inv(E) spline once, then integrate analytically through its antiderivative.
-        inv_e_spline = CubicSpline(z_grid, inv_e, bc_type="natural", extrapolate=False)
+        inv_e_spline = CubicSpline(z_grid, inv_e, axis=-1, bc_type="natural", extrapolate=False)
         anti = inv_e_spline.antiderivative()
-        chi_grid = np.asarray(anti(z_grid) - anti(0.0), dtype=float)
+        chi_grid = np.asarray(anti(z_grid) - anti(0.0)[..., np.newaxis], dtype=float)
 
-        chi_spline = CubicSpline(z_grid, chi_grid, bc_type="natural", extrapolate=False)
-        e_spline = CubicSpline(z_grid, e_grid, bc_type="natural", extrapolate=False)
-        table = _DistanceTable(
+        chi_spline = CubicSpline(z_grid, chi_grid, axis=-1, bc_type="natural", extrapolate=False)
+        e_spline = CubicSpline(z_grid, e_grid, axis=-1, bc_type="natural", extrapolate=False)
+        return _DistanceTable(
             z_grid=z_grid,
             chi_grid=chi_grid,
             e_grid=e_grid,
             chi_spline=chi_spline,
             e_spline=e_spline,
         )
-        self._last_distance_key = key
-        self._last_distance_table = table
-        return table
 
-    def _lnl_sne_from_table(self, cosmology: PsiTMGCosmology, table: _DistanceTable) -> float:
-        dc = np.asarray(table.chi_spline(self._z_sne), dtype=float)
+    def distance_cache_info(self) -> dict[str, int]:
+        """Return hit/miss counters and occupancy of the distance-table cache."""
+        return {
+            "hits": self._distance_cache_hits,
+            "misses": self._distance_cache_misses,
+            "size": len(self._distance_cache),
+            "maxsize": self.distance_cache_size,
+        }
+
+    def clear_distance_cache(self) -> None:
+        """Drop all cached distance tables and reset the counters."""
+        self._distance_cache.clear()
+        self._distance_cache_hits = 0
+        self._distance_cache_misses = 0
+
+    def _distance_table(
+        self,
+        cosmology: PsiTMGCosmology,
+        z_max: float,
+        backend: str | None = None,
+    ) -> _AnyTable:
+        use_quad = self._use_quadrature(float(z_max), backend)
+        z_grid = self._quad_rule.nodes if use_quad else self._z_grid_for(float(z_max))
+        key = (
+            cosmology.H_0,
+            cosmology.Omega_m,
+            cosmology.Omega_r,
+            cosmology.w_0,
+            cosmology.w_a,
+            cosmology.eos.key,
+            float(z_grid[-1]),
+            use_quad,
+        )
+        table = self._distance_cache.get(key)
+        if table is not None:
+            self._distance_cache.move_to_end(key)
+            self._distance_cache_hits += 1
+            return table.view(z_max)
+
+        self._distance_cache_misses += 1
+        e_grid = np.asarray(cosmology.E(z_grid), dtype=float)
+        if np.any(~np.isfinite(e_grid)) or np.any(e_grid <= 0.0):
+            raise ValueError("Invalid E(z) encountered while building distance table.")
+        if use_quad:
+            e_points = np.asarray(cosmology.E(self._quad_rule.z_e_points), dtype=float)
+            table = self._quadrature_table(e_grid, e_points)
+        else:
+            table = self._tabulate_distances(z_grid, e_grid)
+
+        self._distance_cache[key] = table
+        while len(self._distance_cache) > self.distance_cache_size:
+            self._distance_cache.popitem(last=False)
+        return table.view(z_max)
+
+    def _lnl_sne_from_table(self, cosmology: PsiTMGCosmology, table: _AnyTable) -> float:
+        dc = np.asarray(table.chi(self._z_sne), dtype=float)
         if np.any(~np.isfinite(dc)):
             raise ValueError("Invalid spline-integrated comoving distance for SNe.")
         d_m = (C_KM_S / cosmology.H_0) * dc
         d_l = (1.0 + self._z_sne) * d_m
         mu_model = 5.0 * np.log10(np.maximum(d_l, 1.0e-12)) + 25.0
-        resid = self._mu_sne - mu_model
-
-        if self._sne_cov_chofac is not None:
-            covinv_resid = cho_solve(self._sne_cov_chofac, resid, check_finite=False)
-            chi2 = float(resid @ covinv_resid)
+        if self._sne_whitening is not None:
+            chi2 = float(self._sne_whitening.chi2(mu_model))
         else:
+            resid = self._mu_sne - mu_model
             sigma = np.sqrt(self._sigma_mu_sne * self._sigma_mu_sne + self.sigma_sys_sne * self.sigma_sys_sne)
             w = 1.0 / np.maximum(sigma * sigma, 1.0e-24)
             chi2 = float(np.sum(resid * resid * w))
         return float(-0.5 * chi2)
 
-    def _lnl_bao_from_table(self, cosmology: PsiTMGCosmology, table: _DistanceTable) -> float:
-        dc = np.asarray(table.chi_spline(self._z_bao), dtype=float)
-        e = np.asarray(table.e_spline(self._z_bao), dtype=float)
+    def _lnl_bao_from_table(self, cosmology: PsiTMGCosmology, table: _AnyTable) -> float:
+        dc = np.asarray(table.chi(self._z_bao), dtype=float)
+        e = np.asarray(table.e(self._z_bao), dtype=float)
         if np.any(~np.isfinite(dc)) or np.any(~np.isfinite(e)):
             raise ValueError("Invalid spline interpolation for BAO distances.")
         # D_V = (c/H0) * (z * D_M^2 / E(z))^(1/3), with D_M=(c/H0)*integral dz/E.
@@ -416,8 +904,8 @@ class LikelihoodEvaluator:
         chi2 = np.sum(((bao_model - self._dv_bao) / self._sigma_dv_bao) ** 2)
         return float(-0.5 * chi2)
 
-    def _lnl_cmb_from_table(self, cosmology: PsiTMGCosmology, table: _DistanceTable) -> float:
-        dchi = float(np.asarray(table.chi_spline(self.z_star_cmb), dtype=float))
+    def _lnl_cmb_from_table(self, cosmology: PsiTMGCosmology, table: _AnyTable) -> float:
+        dchi = float(np.asarray(table.chi(self.z_star_cmb), dtype=float))
         if cosmology.Omega_m <= 0.0:
             raise ValueError("Omega_m must be positive for CMB shift parameter.")
         r_model = np.sqrt(cosmology.Omega_m) * dchi
@@ -427,12 +915,12 @@ class LikelihoodEvaluator:
     def _bao_dm_dh_over_rd(
         self,
         cosmology: PsiTMGCosmology,
-        table: _DistanceTable,
+        table: _AnyTable,
         z: FloatArray,
     ) -> tuple[FloatArray, FloatArray]:
         """Compute (D_M/r_d, D_H/r_d) at target redshifts."""
-        dc = np.asarray(table.chi_spline(z), dtype=float)
-        e = np.asarray(table.e_spline(z), dtype=float)
+        dc = np.asarray(table.chi(z), dtype=float)
+        e = np.asarray(table.e(z), dtype=float)
         if np.any(~np.isfinite(dc)) or np.any(~np.isfinite(e)):
             raise ValueError("Invalid interpolation for anisotropic BAO observables.")
 
@@ -445,6 +933,8 @@ class LikelihoodEvaluator:
         if self._invalid_cosmology(cosmology):
             return float(-np.inf)
         try:
+            if "sne" in self._fused and cosmology.analytic_cpl:
+                return float(-0.5 * self._fused_chi2("sne", cosmology)[0])
             z_max = float(np.max(self._z_sne))
             table = self._distance_table(cosmology, z_max)
             return self._lnl_sne_from_table(cosmology, table)
@@ -456,6 +946,8 @@ class LikelihoodEvaluator:
         if self._invalid_cosmology(cosmology):
             return float(-np.inf)
         try:
+            if "cmb" in self._fused and cosmology.analytic_cpl:
+                return float(-0.5 * self._fused_chi2("cmb", cosmology)[0])
             table = self._distance_table(cosmology, self.z_star_cmb)
             return self._lnl_cmb_from_table(cosmology, table)
         except Exception:
@@ -466,6 +958,8 @@ class LikelihoodEvaluator:
         if self._invalid_cosmology(cosmology):
             return float(-np.inf)
         try:
+            if "bao" in self._fused and cosmology.analytic_cpl:
+                return float(-0.5 * self._fused_chi2("bao", cosmology)[0])
             z_max = float(np.max(self._z_bao))
             table = self._distance_table(cosmology, z_max)
             return self._lnl_bao_from_table(cosmology, table)
@@ -492,16 +986,36 @@ class LikelihoodEvaluator:
         except Exception:
             return float(-np.inf)
 
+    def _emulator_params(self, cosmology: PsiTMGCosmology) -> FloatArray | None:
+        """Return the emulator parameter row for `cosmology`, or None if it is not covered."""
+        if self._growth_emulator is None or not cosmology.analytic_cpl:
+            return None
+        # The emulator assumes the default radiation density for each H_0.
+        if not math.isclose(cosmology.Omega_r, float(compute_radiation_density(cosmology.H_0)), rel_tol=1.0e-12):
+            return None
+        row = np.array([[cosmology.Omega_m, cosmology.w_0, cosmology.w_a, cosmology.H_0]])
+        return row if bool(self._growth_emulator.covers(row)[0]) else None
+
     def compute_lnL_RSD(
         self,
         cosmology: PsiTMGCosmology,
-        structure: StructureFormation,
+        structure: StructureFormation | None = None,
     ) -> float:
-        """Compute RSD f*sigma8 log-likelihood."""
+        """Compute RSD f*sigma8 log-likelihood.
+
+        Without `structure`, f*sigma8 comes from the growth emulator when
+        `growth_backend="emulator"` covers the point, else from a default
+        `StructureFormation(cosmology)`.
+        """
         if self._invalid_cosmology(cosmology):
             return float(-np.inf)
         try:
-            fs8_model = np.asarray(structure.get_fsigma8(self._z_rsd), dtype=float)
+            emulator_row = self._emulator_params(cosmology) if structure is None else None
+            if emulator_row is not None:
+                fs8_model = self._growth_emulator.fsigma8(self._z_rsd, emulator_row, [cosmology.sigma_8])[0]
+            else:
+                structure_model = structure if structure is not None else StructureFormation(cosmology)
+                fs8_model = np.asarray(structure_model.get_fsigma8(self._z_rsd), dtype=float)
             if np.any(~np.isfinite(fs8_model)):
                 return float(-np.inf)
             chi2 = np.sum(((self._fs8_rsd - fs8_model) / self._sigma_rsd) ** 2)
@@ -559,7 +1073,7 @@ class LikelihoodEvaluator:
         n_norm = n_s / norm
 
         z_max = float(np.max(z_s))
-        table = self._distance_table(cosmology, z_max)
+        table = self._distance_table(cosmology, z_max, backend="spline")
         chi_s = np.asarray(table.chi_spline(z_s), dtype=float)
         e_s = np.asarray(table.e_spline(z_s), dtype=float)
         dchi_dz_s = (C_KM_S / cosmology.H_0) / np.maximum(e_s, 1.0e-12)
@@ -601,6 +1115,25 @@ class LikelihoodEvaluator:
             "and survey covariance (xi_+, xi_-) to be fully implemented."
         )
 
+    def _required_z_max(
+        self,
+        use_sne: bool,
+        use_cmb: bool,
+        use_bao: bool,
+        use_bao_aniso: bool,
+    ) -> float:
+        """Return the distance-table extent needed by the enabled probes."""
+        z_max = 0.0
+        if use_sne:
+            z_max = max(z_max, float(np.max(self._z_sne)))
+        if use_bao:
+            z_max = max(z_max, float(np.max(self._z_bao)))
+        if use_bao_aniso and self._bao_aniso is not None:
+            z_max = max(z_max, float(np.max(self._bao_aniso.z)))
+        if use_cmb:
+            z_max = max(z_max, self.z_star_cmb)
+        return z_max
+
     def compute_total_lnL(
         self,
         cosmology: PsiTMGCosmology,
@@ -618,27 +1151,36 @@ class LikelihoodEvaluator:
         try:
             total = 0.0
 
-            table_lowz: _DistanceTable | None = None
-            if use_sne or use_bao:
-                z_max_lowz = 0.0
-                if use_sne:
-                    z_max_lowz = max(z_max_lowz, float(np.max(self._z_sne)))
-                if use_bao:
-                    z_max_lowz = max(z_max_lowz, float(np.max(self._z_bao)))
-                table_lowz = self._distance_table(cosmology, z_max_lowz)
-
-            table_cmb: _DistanceTable | None = None
-            if use_cmb:
-                table_cmb = self._distance_table(cosmology, self.z_star_cmb)
-
-            if use_sne and table_lowz is not None:
-                lnl = self._lnl_sne_from_table(cosmology, table_lowz)
+            # The fused kernels hard-code the CPL background.
+            fused_sne = use_sne and "sne" in self._fused and cosmology.analytic_cpl
+            fused_bao = use_bao and "bao" in self._fused and cosmology.analytic_cpl
+            fused_cmb = use_cmb and "cmb" in self._fused and cosmology.analytic_cpl
+
+            # One master table per parameter point; each probe reads a sub-view.
+            z_needed = self._required_z_max(
+                use_sne and not fused_sne,
+                use_cmb and not fused_cmb,
+                use_bao and not fused_bao,
+                use_bao_aniso,
+            )
+            table: _AnyTable | None = None
+            if z_needed > 0.0:
+                table = self._distance_table(cosmology, z_needed)
+
+            if use_sne:
+                if fused_sne:
+                    lnl = float(-0.5 * self._fused_chi2("sne", cosmology)[0])
+                else:
+                    lnl = self._lnl_sne_from_table(cosmology, table.view(float(np.max(self._z_sne))))
                 if not np.isfinite(lnl):
                     return float(-np.inf)
                 total += lnl
 
-            if use_bao and table_lowz is not None:
-                lnl = self._lnl_bao_from_table(cosmology, table_lowz)
+            if use_bao:
+                if fused_bao:
+                    lnl = float(-0.5 * self._fused_chi2("bao", cosmology)[0])
+                else:
+                    lnl = self._lnl_bao_from_table(cosmology, table.view(float(np.max(self._z_bao))))
                 if not np.isfinite(lnl):
                     return float(-np.inf)
                 total += lnl
@@ -649,15 +1191,17 @@ class LikelihoodEvaluator:
                     return float(-np.inf)
                 total += lnl
 
-            if use_cmb and table_cmb is not None:
-                lnl = self._lnl_cmb_from_table(cosmology, table_cmb)
+            if use_cmb:
+                if fused_cmb:
+                    lnl = float(-0.5 * self._fused_chi2("cmb", cosmology)[0])
+                else:
+                    lnl = self._lnl_cmb_from_table(cosmology, table)
                 if not np.isfinite(lnl):
                     return float(-np.inf)
                 total += lnl
 
             if use_rsd:
-                structure_model = structure if structure is not None else StructureFormation(cosmology)
-                lnl = self.compute_lnL_RSD(cosmology, structure_model)
+                lnl = self.compute_lnL_RSD(cosmology, structure)
                 if not np.isfinite(lnl):
                     return float(-np.inf)
                 total += lnl
@@ -671,3 +1215,205 @@ class LikelihoodEvaluator:
             return float(total)
         except Exception:
             return float(-np.inf)
+
+    # ------------------------------------------------------------------
+    # Batched (vectorized-over-parameters) evaluation
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _split_theta(theta: NDArray[np.float64]) -> _BatchParams:
+        """Validate an (N, 5) parameter block and split it into columns."""
+        arr = np.asarray(theta, dtype=float)
+        if arr.ndim == 1:
+            arr = arr[np.newaxis, :]
+        if arr.ndim != 2 or arr.shape[1] != len(BATCH_PARAM_NAMES):
+            raise ValueError(
+                f"theta must have shape (N, {len(BATCH_PARAM_NAMES)}) ordered as "
+                f"{BATCH_PARAM_NAMES}; got {arr.shape}."
+            )
+        return _BatchParams(*(np.ascontiguousarray(arr[:, j]) for j in range(arr.shape[1])))
+
+    @staticmethod
+    def _invalid_batch(params: _BatchParams) -> NDArray[np.bool_]:
+        """Vectorized counterpart of `_invalid_cosmology`."""
+        with np.errstate(invalid="ignore"):
+            bad = ~np.isfinite(params.H_0) | (params.H_0 <= 0.0)
+            bad |= ~np.isfinite(params.Omega_m) | (params.Omega_m < 0.0) | (params.Omega_m > 1.0)
+            bad |= ~np.isfinite(params.w_0) | ~np.isfinite(params.w_a)
+            bad |= ~np.isfinite(params.sigma_8) | (params.sigma_8 <= 0.0)
+        return bad
+
+    def _distance_table_batch(
+        self,
+        params: _BatchParams,
+        z_max: float,
+    ) -> tuple[_AnyTable, NDArray[np.bool_]]:
+        """Build distance tables for all parameter points as (N, n_z) arrays.
+
+        The grid and spline layout match the scalar `_distance_table`, so each
+        row reproduces the per-point result. Rows with invalid E(z) are flagged
+        in the returned mask and replaced by a harmless placeholder.
+        """
+        use_quad = self._use_quadrature(float(z_max), None)
+        z_grid = self._quad_rule.nodes if use_quad else self._z_grid_for(float(z_max))
+        e_grid = compute_E_batch(z_grid, params.H_0, params.Omega_m, params.w_0, params.w_a)
+        bad = ~np.all(np.isfinite(e_grid) & (e_grid > 0.0), axis=1)
+        if np.any(bad):
+            e_grid[bad] = 1.0
+        if use_quad:
+            e_points = compute_E_batch(
+                self._quad_rule.z_e_points, params.H_0, params.Omega_m, params.w_0, params.w_a
+            )
+            return self._quadrature_table(e_grid, e_points), bad
+        return self._tabulate_distances(z_grid, e_grid).view(z_max), bad
+
+    def _chi2_sne_batch(self, params: _BatchParams, table: _AnyTable) -> FloatArray:
+        dc = np.asarray(table.chi(self._z_sne), dtype=float)
+        d_m = (C_KM_S / params.H_0)[:, np.newaxis] * dc
+        d_l = (1.0 + self._z_sne)[np.newaxis, :] * d_m
+        mu_model = 5.0 * np.log10(np.maximum(d_l, 1.0e-12)) + 25.0
+
+        if self._sne_whitening is not None:
+            return self._sne_whitening.chi2(mu_model)
+        resid = self._mu_sne[np.newaxis, :] - mu_model
+        sigma = np.sqrt(self._sigma_mu_sne * self._sigma_mu_sne + self.sigma_sys_sne * self.sigma_sys_sne)
+        w = 1.0 / np.maximum(sigma * sigma, 1.0e-24)
+        return (resid * resid) @ w
+
+    def _chi2_bao_batch(self, params: _BatchParams, table: _AnyTable) -> FloatArray:
+        dc = np.asarray(table.chi(self._z_bao), dtype=float)
+        e = np.asarray(table.e(self._z_bao), dtype=float)
+        dv_model = (C_KM_S / params.H_0)[:, np.newaxis] * (
+            self._z_bao[np.newaxis, :] * dc * dc / np.maximum(e, 1.0e-12)
+        ) ** (1.0 / 3.0)
+        bao_model = dv_model / self.rd_fid_mpc if self._bao_is_ratio else dv_model
+        return np.sum(((bao_model - self._dv_bao) / self._sigma_dv_bao) ** 2, axis=1)
+
+    def _chi2_bao_aniso_batch(self, params: _BatchParams, table: _AnyTable) -> FloatArray:
+        aniso = self._bao_aniso
+        assert aniso is not None
+        dc = np.asarray(table.chi(aniso.z), dtype=float)
+        e = np.asarray(table.e(aniso.z), dtype=float)
+        h0 = params.H_0[:, np.newaxis]
+        th = np.empty((params.size, aniso.obs_vec.size), dtype=float)
+        th[:, 0::2] = (C_KM_S / h0) * dc / self.rd_fid_mpc
+        th[:, 1::2] = C_KM_S / np.maximum(h0 * e, 1.0e-12) / self.rd_fid_mpc
+        resid = th - aniso.obs_vec[np.newaxis, :]
+        covinv_resid = cho_solve(aniso.cov_chofac, resid.T, check_finite=False)
+        return np.sum(resid * covinv_resid.T, axis=1)
+
+    def _chi2_cmb_batch(self, params: _BatchParams, table: _AnyTable) -> FloatArray:
+        dchi = np.asarray(table.chi(self.z_star_cmb), dtype=float)
+        r_model = np.sqrt(params.Omega_m) * dchi
+        chi2 = ((r_model - self.planck_R) / self.planck_R_sigma) ** 2
+        # Omega_m = 0 is rejected by the scalar CMB path as well.
+        return np.where(params.Omega_m > 0.0, chi2, np.inf)
+
+    def _chi2_cc_batch(self, params: _BatchParams) -> FloatArray:
+        assert self._cc_data is not None
+        z, h_obs, h_err = self._cc_data
+        e = compute_E_batch(z, params.H_0, params.Omega_m, params.w_0, params.w_a)
+        h_model = params.H_0[:, np.newaxis] * e
+        return np.sum(((h_obs - h_model) / h_err) ** 2, axis=1)
+
+    def _lnL_rsd_batch(self, params: _BatchParams) -> FloatArray:
+        """Vectorized counterpart of `compute_lnL_RSD` without an explicit `structure`."""
+        fs8_model = np.full((params.size, self._z_rsd.size), np.nan)
+        valid = np.ones(params.size, dtype=bool)
+        solve = valid.copy()
+        if self._growth_emulator is not None:
+            rows = np.column_stack([params.Omega_m, params.w_0, params.w_a, params.H_0])
+            solve = ~self._growth_emulator.covers(rows)
+            if not np.all(solve):
+                fs8_model[~solve] = self._growth_emulator.fsigma8(self._z_rsd, rows[~solve], params.sigma_8[~solve])
+        if np.any(solve):
+            sub = params.take(solve)
+            table = solve_growth_many(
+                np.column_stack([sub.Omega_m, sub.w_0, sub.w_a, sub.sigma_8]),
+                Omega_r=compute_radiation_density(sub.H_0),
+            )
+            fs8_model[solve] = table.fsigma8_at(self._z_rsd)
+            valid[solve] = table.valid
+        chi2 = np.sum(((self._fs8_rsd - fs8_model) / self._sigma_rsd) ** 2, axis=1)
+        return np.where(valid & np.isfinite(chi2), -0.5 * chi2, -np.inf)
+
+    def compute_total_lnL_batch(
+        self,
+        theta: NDArray[np.float64],
+        use_sne: bool = True,
+        use_cmb: bool = True,
+        use_bao: bool = True,
+        use_bao_aniso: bool = False,
+        use_cc: bool = False,
+        use_rsd: bool = True,
+    ) -> FloatArray:
+        """Compute total log-likelihoods for N parameter points in one array pass.
+
+        This is the vectorized counterpart of `compute_total_lnL`, suitable for
+        `emcee.EnsembleSampler(..., vectorize=True)`. E(z), distance tables and
+        the SN/BAO/CMB/CC residuals are evaluated as 2-D arrays over all points.
+        Growth histories for the RSD probe are integrated together with
+        `perturbations.solve_growth_many`, or emulated with
+        `growth_backend="emulator"`.
+
+        Args:
+            theta: Array of shape (N, 5) with columns ordered as
+                `BATCH_PARAM_NAMES` = (H_0, Omega_m, w_0, w_a, sigma_8).
+            use_sne, use_cmb, use_bao, use_bao_aniso, use_cc, use_rsd:
+                Probe-selection flags, as in `compute_total_lnL`.
+
+        Returns:
+            Array of N log-likelihoods; invalid points map to -inf.
+        """
+        params = self._split_theta(theta)
+        out = np.full(params.size, -np.inf, dtype=float)
+        if use_bao_aniso and self._bao_aniso is None:
+            return out
+        if use_cc and self._cc_data is None:
+            return out
+
+        valid = ~self._invalid_batch(params)
+        if not np.any(valid):
+            return out
+        sub = params.take(valid)
+        chi2 = np.zeros(sub.size, dtype=float)
+        bad = np.zeros(sub.size, dtype=bool)
+
+        with np.errstate(all="ignore"):
+            fused = [
+                probe
+                for probe, used in (("sne", use_sne), ("bao", use_bao), ("cmb", use_cmb))
+                if used and probe in self._fused
+            ]
+            for probe in fused:
+                chi2 += self._fused_chi2(probe, sub)
+
+            z_needed = self._required_z_max(
+                use_sne and "sne" not in fused,
+                use_cmb and "cmb" not in fused,
+                use_bao and "bao" not in fused,
+                use_bao_aniso,
+            )
+            if z_needed > 0.0:
+                table, bad_table = self._distance_table_batch(sub, z_needed)
+                bad |= bad_table
+                if use_sne and "sne" not in fused:
+                    chi2 += self._chi2_sne_batch(sub, table)
+                if use_bao and "bao" not in fused:
+                    chi2 += self._chi2_bao_batch(sub, table)
+                if use_bao_aniso:
+                    chi2 += self._chi2_bao_aniso_batch(sub, table)
+                if use_cmb and "cmb" not in fused:
+                    chi2 += self._chi2_cmb_batch(sub, table)
+
+            if use_cc:
+                chi2 += self._chi2_cc_batch(sub)
+
+            lnl = -0.5 * chi2
+            if use_rsd:
+                keep = ~bad & np.isfinite(lnl)
+                if np.any(keep):
+                    lnl[keep] += self._lnL_rsd_batch(sub.take(keep))
+
+        lnl[bad | ~np.isfinite(lnl)] = -np.inf
+        out[valid] = lnl
+        return out
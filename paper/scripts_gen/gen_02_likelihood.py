@@ -17,11 +17,26 @@ FIGURES_DIR = ROOT / "paper" / "figures"
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+import core_physics
+import likelihoods
+import perturbations
 from core_physics import PsiTMGCosmology
 from likelihoods import LikelihoodEvaluator
 from perturbations import StructureFormation
+from result_store import ResultStore
 from scripts._common.release_v400 import PLANCK18_H0, PLANCK18_H0_ERR, PTMG_SIGMA8
 
+# Optimizer results depend on the likelihood code and on the default data sets.
+LIKELIHOOD_SOURCES = (
+    core_physics,
+    likelihoods,
+    perturbations,
+    Path(__file__),
+    ROOT / "assets/zz-data/08_sound_horizon/08_pantheon_data.csv",
+    ROOT / "assets/zz-data/08_sound_horizon/08_bao_data.csv",
+    ROOT / "assets/zz-data/10_structure_growth/10_rsd_data.csv",
+)
+
 
 def _nll_total(
     theta: np.ndarray,
@@ -126,6 +141,7 @@ def main() -> int:
 
     h0_grid = np.arange(args.h0_min, args.h0_max + 0.5 * args.h0_step, args.h0_step, dtype=float)
     like = LikelihoodEvaluator()
+    store = ResultStore()
 
     # Compute a global best-fit NLL (unconstrained H0) for Delta chi2 reference.
     global_bounds = [
@@ -135,31 +151,42 @@ def main() -> int:
         (args.wa_min, args.wa_max),
     ]
     global_start = np.array([74.2, args.omega_m_init, args.w0_init, args.wa_init], dtype=float)
-    global_res = minimize(
-        fun=_nll_global,
-        x0=global_start,
-        args=(args.sigma8, like),
-        method="L-BFGS-B",
-        bounds=global_bounds,
-        options={"maxiter": 300, "ftol": 1e-9},
+
+    def global_fit() -> dict[str, np.ndarray]:
+        res = minimize(
+            fun=_nll_global,
+            x0=global_start,
+            args=(args.sigma8, like),
+            method="L-BFGS-B",
+            bounds=global_bounds,
+            options={"maxiter": 300, "ftol": 1e-9},
+        )
+        return {"x": np.asarray(res.x, dtype=float), "fun": np.asarray(res.fun, dtype=float)}
+
+    global_res = store.get_or_compute(
+        "gen02_global_fit",
+        {"sigma8": args.sigma8, "x0": global_start, "bounds": global_bounds},
+        global_fit,
+        code=LIKELIHOOD_SOURCES,
     )
-    nll_global = float(global_res.fun)
+    global_x = np.asarray(global_res["x"], dtype=float)
+    nll_global = float(global_res["fun"])
 
     rows: list[dict[str, float]] = []
     # Warm start profile optimization with the global solution projected to free params.
-    theta0 = np.array([global_res.x[1], global_res.x[2], global_res.x[3]], dtype=float)
+    theta0 = np.array([global_x[1], global_x[2], global_x[3]], dtype=float)
     bounds = [
         (args.omega_m_min, args.omega_m_max),
         (args.w0_min, args.w0_max),
         (args.wa_min, args.wa_max),
     ]
 
-    for h0 in h0_grid:
+    def profile_point(h0: float, theta_start: np.ndarray) -> dict[str, np.ndarray]:
         if args.optimizer == "L-BFGS-B":
             res = minimize(
                 fun=_nll_total,
-                x0=theta0,
-                args=(float(h0), args.sigma8, like),
+                x0=theta_start,
+                args=(h0, args.sigma8, like),
                 method="L-BFGS-B",
                 bounds=bounds,
                 options={"maxiter": 250, "ftol": 1e-9},
@@ -168,8 +195,8 @@ def main() -> int:
             # Nelder-Mead with soft box clipping through objective start point control.
             res = minimize(
                 fun=_nll_total,
-                x0=theta0,
-                args=(float(h0), args.sigma8, like),
+                x0=theta_start,
+                args=(h0, args.sigma8, like),
                 method="Nelder-Mead",
                 options={"maxiter": 500, "xatol": 1e-4, "fatol": 1e-4},
             )
@@ -179,7 +206,24 @@ def main() -> int:
         theta[0] = np.clip(theta[0], bounds[0][0], bounds[0][1])
         theta[1] = np.clip(theta[1], bounds[1][0], bounds[1][1])
         theta[2] = np.clip(theta[2], bounds[2][0], bounds[2][1])
-        nll_prof = float(_nll_total(theta, float(h0), args.sigma8, like))
+        return {"theta": theta, "nll": np.asarray(_nll_total(theta, h0, args.sigma8, like), dtype=float)}
+
+    for h0 in h0_grid:
+        # Warm starts chain the profile points, so the start vector is part of the key.
+        point = store.get_or_compute(
+            "gen02_profile_point",
+            {
+                "h0": float(h0),
+                "sigma8": args.sigma8,
+                "x0": theta0,
+                "bounds": bounds,
+                "optimizer": args.optimizer,
+            },
+            lambda: profile_point(float(h0), theta0),
+            code=LIKELIHOOD_SOURCES,
+        )
+        theta = np.asarray(point["theta"], dtype=float)
+        nll_prof = float(point["nll"])
         delta_chi2 = 2.0 * (nll_prof - nll_global)
         rows.append(
             {
@@ -261,10 +305,10 @@ def main() -> int:
         "h0_step": float(args.h0_step),
         "nll_global": nll_global,
         "global_best": {
-            "H0": float(global_res.x[0]),
-            "Omega_m": float(global_res.x[1]),
-            "w0": float(global_res.x[2]),
-            "wa": float(global_res.x[3]),
+            "H0": float(global_x[0]),
+            "Omega_m": float(global_x[1]),
+            "w0": float(global_x[2]),
+            "wa": float(global_x[3]),
         },
         "outputs": {
             "csv": str(args.out_csv),
@@ -273,7 +317,7 @@ def main() -> int:
     }
     args.out_json.write_text(json.dumps(summary, indent=2), encoding="utf-8")
 
-    print(f"Global best-fit: H0={global_res.x[0]:.4f}, Omega_m={global_res.x[1]:.5f}, w0={global_res.x[2]:.5f}, wa={global_res.x[3]:.5f}")
+    print(f"Global best-fit: H0={global_x[0]:.4f}, Omega_m={global_x[1]:.5f}, w0={global_x[2]:.5f}, wa={global_x[3]:.5f}")
     print(f"Global NLL: {nll_global:.6f}")
     print(f"Wrote CSV: {args.out_csv}")
     print(f"Wrote plot: {args.out_plot}")
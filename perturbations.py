@@ -6,22 +6,538 @@ This module isolates matter-perturbation evolution and provides a fast
 
 from __future__ import annotations
 
+import hashlib
+import math
+from collections import OrderedDict
 from dataclasses import dataclass
+from typing import Callable, Hashable
 
 import numpy as np
 from numpy.typing import ArrayLike, NDArray
 from scipy.integrate import solve_ivp
 
-from core_physics import PsiTMGCosmology
+from core_physics import (
+    DARK_ENERGY_MODELS,
+    NUMBA_AVAILABLE,
+    DarkEnergyEoS,
+    PsiTMGCosmology,
+    _ez_scalar,
+    compute_radiation_density,
+    make_eos,
+    njit,
+)
 
 FloatArray = NDArray[np.float64]
 
+# "RK4" selects the compiled fixed-step integrator; any other value is passed to `solve_ivp`.
+FIXED_STEP_METHOD = "RK4"
+GROWTH_BATCH_BACKENDS = ("numba", "numpy")
+
+
+@njit(cache=True)
+def _growth_derivs(
+    lna: float,
+    delta: float,
+    u: float,
+    omega_r: float,
+    omega_m: float,
+    omega_de: float,
+    w0: float,
+    wa: float,
+) -> tuple[float, float]:
+    """Scalar growth RHS in ln(a); same equations as `StructureFormation._growth_rhs`."""
+    a = math.exp(lna)
+    z = 1.0 / a - 1.0
+    e = _ez_scalar(z, omega_r, omega_m, omega_de, w0, wa)
+    w_z = w0 + wa * z / (1.0 + z)
+    return _growth_derivs_background(a, delta, u, omega_m, e, w_z)
+
+
+@njit(cache=True)
+def _growth_derivs_background(
+    a: float,
+    delta: float,
+    u: float,
+    omega_m: float,
+    e: float,
+    w_z: float,
+) -> tuple[float, float]:
+    """Growth RHS in ln(a) given the background E and w at scale factor `a`."""
+    omega_m_a = omega_m * a ** (-3.0) / max(e * e, 1.0e-12)
+    dlnE_dlna = -1.5 * (1.0 + w_z * (1.0 - omega_m_a))
+    return u, -(2.0 + dlnE_dlna) * u + 1.5 * omega_m_a * delta
+
+
+@njit(cache=True)
+def _integrate_growth_rk4(
+    lna_grid: NDArray[np.float64],
+    n_substeps: int,
+    omega_r: float,
+    omega_m: float,
+    omega_de: float,
+    w0: float,
+    wa: float,
+    delta_out: NDArray[np.float64],
+    u_out: NDArray[np.float64],
+) -> None:
+    """Classical RK4 with `n_substeps` equal steps per grid interval.
+
+    Starts from the matter-era growing mode delta = d delta/d ln(a) = a and
+    writes the solution at every grid node into `delta_out` and `u_out`.
+    """
+    delta = math.exp(lna_grid[0])
+    u = delta
+    delta_out[0] = delta
+    u_out[0] = u
+    for j in range(lna_grid.size - 1):
+        h = (lna_grid[j + 1] - lna_grid[j]) / n_substeps
+        x = lna_grid[j]
+        for _ in range(n_substeps):
+            k1d, k1u = _growth_derivs(x, delta, u, omega_r, omega_m, omega_de, w0, wa)
+            k2d, k2u = _growth_derivs(
+                x + 0.5 * h, delta + 0.5 * h * k1d, u + 0.5 * h * k1u, omega_r, omega_m, omega_de, w0, wa
+            )
+            k3d, k3u = _growth_derivs(
+                x + 0.5 * h, delta + 0.5 * h * k2d, u + 0.5 * h * k2u, omega_r, omega_m, omega_de, w0, wa
+            )
+            k4d, k4u = _growth_derivs(x + h, delta + h * k3d, u + h * k3u, omega_r, omega_m, omega_de, w0, wa)
+            delta += h * (k1d + 2.0 * k2d + 2.0 * k3d + k4d) / 6.0
+            u += h * (k1u + 2.0 * k2u + 2.0 * k3u + k4u) / 6.0
+            x += h
+        delta_out[j + 1] = delta
+        u_out[j + 1] = u
+
+
+@njit(cache=True)
+def _integrate_growth_rk4_tabulated(
+    lna_grid: NDArray[np.float64],
+    n_substeps: int,
+    omega_m: float,
+    e_stages: NDArray[np.float64],
+    w_stages: NDArray[np.float64],
+    delta_out: NDArray[np.float64],
+    u_out: NDArray[np.float64],
+) -> None:
+    """`_integrate_growth_rk4` for any background, read from E and w tables.
+
+    The tables are sampled at the RK4 stage points `_rk4_stage_lna`: node m
+    of interval j sits at index 2 * n_substeps * j + m, every half step.
+    """
+    delta = math.exp(lna_grid[0])
+    u = delta
+    delta_out[0] = delta
+    u_out[0] = u
+    n2 = 2 * n_substeps
+    for j in range(lna_grid.size - 1):
+        h = (lna_grid[j + 1] - lna_grid[j]) / n_substeps
+        x = lna_grid[j]
+        for s in range(n_substeps):
+            i = n2 * j + 2 * s
+            a0 = math.exp(x)
+            a1 = math.exp(x + 0.5 * h)
+            a2 = math.exp(x + h)
+            k1d, k1u = _growth_derivs_background(a0, delta, u, omega_m, e_stages[i], w_stages[i])
+            k2d, k2u = _growth_derivs_background(
+                a1, delta + 0.5 * h * k1d, u + 0.5 * h * k1u, omega_m, e_stages[i + 1], w_stages[i + 1]
+            )
+            k3d, k3u = _growth_derivs_background(
+                a1, delta + 0.5 * h * k2d, u + 0.5 * h * k2u, omega_m, e_stages[i + 1], w_stages[i + 1]
+            )
+            k4d, k4u = _growth_derivs_background(
+                a2, delta + h * k3d, u + h * k3u, omega_m, e_stages[i + 2], w_stages[i + 2]
+            )
+            delta += h * (k1d + 2.0 * k2d + 2.0 * k3d + k4d) / 6.0
+            u += h * (k1u + 2.0 * k2u + 2.0 * k3u + k4u) / 6.0
+            x += h
+        delta_out[j + 1] = delta
+        u_out[j + 1] = u
+
+
+def _rk4_stage_lna(lna_grid: FloatArray, n_substeps: int) -> FloatArray:
+    """ln(a) of every RK4 stage point (half-step spacing) of `_integrate_growth_rk4_tabulated`."""
+    h = np.diff(lna_grid) / n_substeps
+    stages = lna_grid[:-1, np.newaxis] + 0.5 * h[:, np.newaxis] * np.arange(2 * n_substeps)
+    return np.append(stages.ravel(), lna_grid[-1])
+
+
+@njit(cache=True)
+def _integrate_growth_rk4_many(
+    lna_grid: NDArray[np.float64],
+    n_substeps: int,
+    omega_r: NDArray[np.float64],
+    omega_m: NDArray[np.float64],
+    omega_de: NDArray[np.float64],
+    w0: NDArray[np.float64],
+    wa: NDArray[np.float64],
+    delta_out: NDArray[np.float64],
+    u_out: NDArray[np.float64],
+) -> None:
+    """Run `_integrate_growth_rk4` for every row of (N, n_grid) output arrays."""
+    for i in range(omega_m.size):
+        _integrate_growth_rk4(
+            lna_grid, n_substeps, omega_r[i], omega_m[i], omega_de[i], w0[i], wa[i], delta_out[i], u_out[i]
+        )
+
+
+def _growth_derivs_vec(
+    lna: float,
+    y: FloatArray,
+    omega_r: FloatArray,
+    omega_m: FloatArray,
+    omega_de: FloatArray,
+    w0: FloatArray,
+    wa: FloatArray,
+) -> FloatArray:
+    """Array counterpart of `_growth_derivs` for an (N, 2) state [delta, u]."""
+    a = math.exp(lna)
+    z = 1.0 / a - 1.0
+    one_plus_z = 1.0 + z
+    de_evol = np.exp(3.0 * wa * (z / one_plus_z - math.log(one_plus_z)))
+    de_density = one_plus_z ** (3.0 * (1.0 + w0 + wa)) * de_evol
+    ez_sq = omega_r * one_plus_z**4 + omega_m * one_plus_z**3 + omega_de * de_density
+    e2 = np.maximum(np.maximum(ez_sq, 1.0e-10), 1.0e-12)
+    omega_m_a = omega_m * a ** (-3.0) / e2
+    dlnE_dlna = -1.5 * (1.0 + (w0 + wa * z / one_plus_z) * (1.0 - omega_m_a))
+    dy = np.empty_like(y)
+    dy[:, 0] = y[:, 1]
+    dy[:, 1] = -(2.0 + dlnE_dlna) * y[:, 1] + 1.5 * omega_m_a * y[:, 0]
+    return dy
+
+
+def _integrate_growth_rk4_vectorized(
+    lna_grid: FloatArray,
+    n_substeps: int,
+    omega_r: FloatArray,
+    omega_m: FloatArray,
+    omega_de: FloatArray,
+    w0: FloatArray,
+    wa: FloatArray,
+    delta_out: FloatArray,
+    u_out: FloatArray,
+) -> None:
+    """NumPy RK4 stepping all N systems together; same scheme as the compiled kernel."""
+    coeffs = (omega_r, omega_m, omega_de, w0, wa)
+    y = np.empty((omega_m.size, 2), dtype=float)
+    y[:] = math.exp(lna_grid[0])
+    delta_out[:, 0] = y[:, 0]
+    u_out[:, 0] = y[:, 1]
+    for j in range(lna_grid.size - 1):
+        h = (lna_grid[j + 1] - lna_grid[j]) / n_substeps
+        x = float(lna_grid[j])
+        for _ in range(n_substeps):
+            k1 = _growth_derivs_vec(x, y, *coeffs)
+            k2 = _growth_derivs_vec(x + 0.5 * h, y + 0.5 * h * k1, *coeffs)
+            k3 = _growth_derivs_vec(x + 0.5 * h, y + 0.5 * h * k2, *coeffs)
+            k4 = _growth_derivs_vec(x + h, y + h * k3, *coeffs)
+            y = y + h * (k1 + 2.0 * k2 + 2.0 * k3 + k4) / 6.0
+            x += h
+        delta_out[:, j + 1] = y[:, 0]
+        u_out[:, j + 1] = y[:, 1]
+
+
+@dataclass(frozen=True)
+class GrowthTable:
+    """Growth histories of N cosmologies sampled on a shared ln(a) grid.
+
+    Attributes:
+        lna_grid: Shared grid, shape (n_grid,).
+        d: Growth factor D normalized to D(a=1) = 1, shape (N, n_grid).
+        f: Growth rate d ln(D) / d ln(a), shape (N, n_grid).
+        fsigma8: f * sigma8(a), shape (N, n_grid).
+        valid: Rows with a physical solution; other rows are NaN.
+    """
+
+    lna_grid: FloatArray
+    d: FloatArray
+    f: FloatArray
+    fsigma8: FloatArray
+    valid: NDArray[np.bool_]
+
+    def fsigma8_at(self, z: ArrayLike) -> FloatArray:
+        """Interpolate f*sigma8 at redshifts `z` for all rows; shape (N, M)."""
+        z_arr = np.atleast_1d(np.asarray(z, dtype=float))
+        if np.any(z_arr < 0.0):
+            raise ValueError("Redshift must satisfy z >= 0.")
+        lna_target = np.clip(np.log(1.0 / (1.0 + z_arr)), self.lna_grid[0], self.lna_grid[-1])
+        idx = np.clip(np.searchsorted(self.lna_grid, lna_target, side="right"), 1, self.lna_grid.size - 1)
+        x0 = self.lna_grid[idx - 1]
+        weight = (lna_target - x0) / (self.lna_grid[idx] - x0)
+        return self.fsigma8[:, idx - 1] * (1.0 - weight) + self.fsigma8[:, idx] * weight
+
+
+def solve_growth_many(
+    params: ArrayLike,
+    Omega_r: ArrayLike | None = None,
+    H_0: ArrayLike = 70.0,
+    lna_min: float = -10.0,
+    n_grid: int = 300,
+    n_substeps: int = 1,
+    backend: str | None = None,
+) -> GrowthTable:
+    """Integrate the growth ODE for N cosmologies at once with RK4.
+
+    Uses the same equations, initial conditions and ln(a) grid as
+    `StructureFormation(method="RK4")`, so each row reproduces the scalar
+    solver for the same parameters.
+
+    Args:
+        params: Array of shape (N, 4) with columns (Omega_m, w_0, w_a, sigma_8).
+        Omega_r: Radiation density per row (or scalar). If None, computed
+            from `H_0` like `PsiTMGCosmology`.
+        H_0: Hubble constant(s) used only when `Omega_r` is None.
+        lna_min: Initial ln(a) for integration.
+        n_grid: Number of points of the shared ln(a) grid.
+        n_substeps: RK4 steps per grid interval.
+        backend: "numba" (compiled per-row loop) or "numpy" (all rows stepped
+            together as an (N, 2) state). Defaults to numba when available.
+
+    Returns:
+        `GrowthTable` holding (N, n_grid) D, f and f*sigma8 arrays.
+    """
+    arr = np.asarray(params, dtype=float)
+    if arr.ndim == 1:
+        arr = arr[np.newaxis, :]
+    if arr.ndim != 2 or arr.shape[1] != 4:
+        raise ValueError(f"params must have shape (N, 4) as (Omega_m, w_0, w_a, sigma_8); got {arr.shape}.")
+    if int(n_grid) < 2 or int(n_substeps) < 1:
+        raise ValueError("n_grid must be >= 2 and n_substeps >= 1.")
+    if backend is None:
+        backend = "numba" if NUMBA_AVAILABLE else "numpy"
+    if backend not in GROWTH_BATCH_BACKENDS:
+        raise ValueError(f"backend must be one of {GROWTH_BATCH_BACKENDS}; got {backend!r}.")
+
+    n = arr.shape[0]
+    omega_m, w0, wa, sigma_8 = (np.ascontiguousarray(arr[:, j]) for j in range(4))
+    if Omega_r is None:
+        Omega_r = compute_radiation_density(H_0)
+    omega_r = np.ascontiguousarray(np.broadcast_to(np.asarray(Omega_r, dtype=float), (n,)))
+    omega_de = 1.0 - omega_m - omega_r
+
+    lna_grid = np.linspace(float(lna_min), 0.0, int(n_grid), dtype=float)
+    delta = np.empty((n, lna_grid.size), dtype=float)
+    ddelta_dlna = np.empty_like(delta)
+    kernel = _integrate_growth_rk4_many if backend == "numba" else _integrate_growth_rk4_vectorized
+    with np.errstate(all="ignore"):
+        kernel(lna_grid, int(n_substeps), omega_r, omega_m, omega_de, w0, wa, delta, ddelta_dlna)
+
+        delta_0 = delta[:, -1]
+        valid = np.isfinite(delta_0) & (delta_0 > 0.0)
+        d = delta / np.where(valid, delta_0, np.nan)[:, np.newaxis]
+        f = ddelta_dlna / np.maximum(delta, 1.0e-12)
+        fsigma8 = f * sigma_8[:, np.newaxis] * d
+    f[~valid] = np.nan
+    return GrowthTable(lna_grid=lna_grid, d=d, f=f, fsigma8=fsigma8, valid=valid)
+
+
+@dataclass(frozen=True)
+class GrowthSolution:
+    """Growing-mode solution of `GrowthEngine` on the requested scale factors.
+
+    Attributes:
+        a: Scale-factor grid (the `a_eval` passed to the solver).
+        delta: Growth factor, starting from delta = a at a[0].
+        ddelta_da: d(delta)/da.
+    """
+
+    a: FloatArray
+    delta: FloatArray
+    ddelta_da: FloatArray
+
+    @property
+    def growth_rate(self) -> FloatArray:
+        """f(a) = d ln(delta) / d ln(a)."""
+        return self.a * self.ddelta_da / self.delta
+
+    def normalized(self) -> "GrowthSolution":
+        """Return the solution rescaled to delta = 1 at the last grid point."""
+        delta_end = float(self.delta[-1])
+        if not delta_end > 0.0:
+            raise RuntimeError("Non-physical growth solution: delta(a_end) <= 0")
+        return GrowthSolution(a=self.a, delta=self.delta / delta_end, ddelta_da=self.ddelta_da / delta_end)
+
+
+MuFunction = Callable[[float, "float | None"], float]
+
+
+def _growth_rhs_in_a(
+    omega_m: float,
+    omega_de: float,
+    omega_r: float,
+    eos: DarkEnergyEoS,
+    mu: MuFunction | None,
+    k: float | None,
+) -> Callable[[float, FloatArray], list[float]]:
+    """Build the scalar right-hand side of the growth ODE in the scale factor."""
+    de_state = eos.scalar_state
+
+    def rhs(a: float, y: FloatArray) -> list[float]:
+        delta, ddelta_da = y
+        rho_de, w = de_state(a)
+        e2 = omega_r * a**-4 + omega_m * a**-3 + omega_de * rho_de
+        if e2 <= 0.0:
+            return [ddelta_da, 0.0]
+        e2_prime = -4.0 * omega_r * a**-5 - 3.0 * omega_m * a**-4 - 3.0 * omega_de * rho_de * (1.0 + w) / a
+        friction = 3.0 / a + 0.5 * e2_prime / e2
+        source = 1.5 * omega_m / (a**5 * e2)
+        if mu is not None:
+            source *= mu(a, k)
+        return [ddelta_da, -friction * ddelta_da + source * delta]
+
+    return rhs
+
+
+class GrowthEngine:
+    """Shared, memoized solver of the linear growth equation in the scale factor.
+
+    Solves, from the growing mode delta = a, d(delta)/da = 1 at a_eval[0],
+
+        delta'' + (3/a + d ln H/da) delta' = 1.5 Omega_m(a) mu(a, k) delta / a^2
+
+    for flat dark-energy backgrounds (`DARK_ENERGY_MODELS` or any
+    `DarkEnergyEoS`) with optional radiation. `mu(a, k)` is the modified-gravity hook (GR when None). This is
+    the generic counterpart of the compiled ln(a) integrator used by
+    `StructureFormation`; the chapter scripts route their growth solves here.
+
+    Solutions are kept in an LRU cache keyed on the parameters, the
+    evaluation grid and the solver settings. A solve with a custom `mu` is
+    cached only when a hashable `mu_key` identifies it.
+
+    Args:
+        cache_size: Maximum number of cached solutions.
+    """
+
+    def __init__(self, cache_size: int = 128) -> None:
+        if int(cache_size) < 1:
+            raise ValueError("cache_size must be >= 1.")
+        self.cache_size = int(cache_size)
+        self._cache: OrderedDict[tuple[Hashable, ...], GrowthSolution] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def cache_info(self) -> dict[str, int]:
+        """Return cache hit/miss counters and current size."""
+        return {"hits": self._hits, "misses": self._misses, "size": len(self._cache), "max_size": self.cache_size}
+
+    def clear_cache(self) -> None:
+        """Drop all cached solutions and reset counters."""
+        self._cache.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def solve(
+        self,
+        a_eval: ArrayLike,
+        omega_m: float,
+        w_0: float = -1.0,
+        w_a: float = 0.0,
+        eos_model: str | DarkEnergyEoS = "CPL",
+        omega_de: float | None = None,
+        omega_r: float = 0.0,
+        mu: MuFunction | None = None,
+        k: float | None = None,
+        mu_key: Hashable | None = None,
+        method: str = "RK45",
+        rtol: float = 1.0e-8,
+        atol: float = 1.0e-10,
+    ) -> GrowthSolution:
+        """Integrate the growth equation and sample it on `a_eval`.
+
+        Args:
+            a_eval: Increasing scale factors; integration starts at a_eval[0].
+            omega_m: Matter density fraction at a = 1.
+            w_0: Present-day dark-energy equation of state.
+            w_a: Time variation of w (ignored for wCDM).
+            eos_model: One of `DARK_ENERGY_MODELS`, or a `DarkEnergyEoS`
+                (then `w_0` and `w_a` are ignored).
+            omega_de: Dark-energy fraction; defaults to 1 - omega_m - omega_r.
+            omega_r: Radiation density fraction at a = 1.
+            mu: Modified-gravity factor mu(a, k) multiplying the source term.
+            k: Wavenumber passed to `mu`.
+            mu_key: Hashable identifier of `mu` (and its parameters) that
+                enables caching of modified-gravity solves.
+            method: `solve_ivp` integration method.
+            rtol: Relative tolerance.
+            atol: Absolute tolerance.
+
+        Returns:
+            `GrowthSolution` with read-only arrays (shared with the cache).
+        """
+        a_arr = np.array(a_eval, dtype=float, ndmin=1)
+        if a_arr.size < 2 or a_arr[0] <= 0.0 or np.any(np.diff(a_arr) <= 0.0):
+            raise ValueError("a_eval must be strictly increasing, positive and have at least 2 points.")
+        if not isinstance(eos_model, DarkEnergyEoS) and eos_model not in DARK_ENERGY_MODELS:
+            raise ValueError(f"eos_model must be one of {DARK_ENERGY_MODELS}; got {eos_model!r}.")
+        omega_de_val = 1.0 - float(omega_m) - float(omega_r) if omega_de is None else float(omega_de)
+        eos = make_eos(eos_model, float(w_0), float(w_a))
+
+        key: tuple[Hashable, ...] | None = None
+        if mu is None or mu_key is not None:
+            key = (
+                hashlib.sha1(a_arr.tobytes()).digest(),
+                a_arr.size,
+                float(omega_m),
+                eos.key,
+                omega_de_val,
+                float(omega_r),
+                None if mu is None else mu_key,
+                None if k is None else float(k),
+                method,
+                float(rtol),
+                float(atol),
+            )
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return cached
+            self._misses += 1
+
+        rhs = _growth_rhs_in_a(float(omega_m), omega_de_val, float(omega_r), eos, mu, k)
+        sol = solve_ivp(
+            rhs,
+            (float(a_arr[0]), float(a_arr[-1])),
+            np.array([a_arr[0], 1.0]),
+            t_eval=a_arr,
+            method=method,
+            rtol=rtol,
+            atol=atol,
+        )
+        if not sol.success:
+            raise RuntimeError(f"Growth ODE failed: {sol.message}")
+
+        delta, ddelta_da = sol.y
+        for arr in (a_arr, delta, ddelta_da):
+            arr.flags.writeable = False
+        solution = GrowthSolution(a=a_arr, delta=delta, ddelta_da=ddelta_da)
+        if key is not None:
+            self._cache[key] = solution
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return solution
+
+
+_DEFAULT_GROWTH_ENGINE = GrowthEngine()
+
+
+def solve_growth(a_eval: ArrayLike, omega_m: float, **kwargs: object) -> GrowthSolution:
+    """Solve the growth equation with the shared module-level `GrowthEngine`.
+
+    Keyword arguments are those of `GrowthEngine.solve`.
+    """
+    return _DEFAULT_GROWTH_ENGINE.solve(a_eval, omega_m, **kwargs)
+
+
+def growth_engine() -> GrowthEngine:
+    """Return the shared module-level `GrowthEngine` (for cache inspection)."""
+    return _DEFAULT_GROWTH_ENGINE
+
 
 @dataclass(frozen=True)
 class _GrowthCache:
     """Cached growth quantities sampled on a fixed ln(a) grid."""
 
     lna_grid: FloatArray
+    d_grid: FloatArray
     f_grid: FloatArray
     fsigma8_grid: FloatArray
 
@@ -48,10 +564,14 @@ class StructureFormation:
         cosmology: Cosmology background engine.
         lna_min: Initial ln(a) for integration (default: -10).
         n_grid: Number of sampling points for cached interpolation.
-        method: `solve_ivp` method. Recommended: "LSODA" or "Radau".
+        method: "RK4" (default) for the compiled fixed-step integrator on the
+            ln(a) grid, or a `solve_ivp` method such as "LSODA" or "Radau".
         rtol: Relative tolerance for ODE integration (default: 1e-5).
-        atol: Absolute tolerance for ODE integration.
+            Ignored by "RK4".
+        atol: Absolute tolerance for ODE integration. Ignored by "RK4".
         c2_s: Dark-energy rest-frame sound speed squared (default: 1.0).
+        n_substeps: RK4 steps per grid interval (default: 1, which gives
+            f*sigma8 to ~1e-7 relative on the default grid).
     """
 
     def __init__(
@@ -59,10 +579,11 @@ class StructureFormation:
         cosmology: PsiTMGCosmology,
         lna_min: float = -10.0,
         n_grid: int = 300,
-        method: str = "LSODA",
+        method: str = FIXED_STEP_METHOD,
         rtol: float = 1.0e-5,
         atol: float = 1.0e-8,
         c2_s: float = 1.0,
+        n_substeps: int = 1,
     ) -> None:
         self.cosmology = cosmology
         self.lna_min = float(lna_min)
@@ -71,10 +592,56 @@ class StructureFormation:
         self.rtol = float(rtol)
         self.atol = float(atol)
         self.c2_s = float(c2_s)
+        self.n_substeps = int(n_substeps)
         if not np.isfinite(self.c2_s) or self.c2_s <= 0.0:
             raise ValueError("c2_s must be a strictly positive finite number.")
+        if self.n_substeps < 1:
+            raise ValueError("n_substeps must be >= 1.")
         self._cache: _GrowthCache | None = None
 
+    @classmethod
+    def batch(
+        cls,
+        cosmologies: "list[PsiTMGCosmology] | tuple[PsiTMGCosmology, ...]",
+        lna_min: float = -10.0,
+        n_grid: int = 300,
+        n_substeps: int = 1,
+        backend: str | None = None,
+    ) -> list["StructureFormation"]:
+        """Build one `StructureFormation` per cosmology from a single batched solve.
+
+        The growth caches are filled by `solve_growth_many`, so subsequent
+        `get_fsigma8` / `get_growth_factor` calls only interpolate. Rows
+        without a physical solution return NaN, as in the scalar path.
+        Cosmologies with a non-CPL `eos` are solved lazily, one at a time.
+        """
+        cosmologies = list(cosmologies)
+        batched = [c for c in cosmologies if c.analytic_cpl]
+        params = np.array([[c.Omega_m, c.w_0, c.w_a, c.sigma_8] for c in batched], dtype=float)
+        omega_r = np.array([c.Omega_r for c in batched], dtype=float)
+        table = solve_growth_many(
+            params.reshape(-1, 4),
+            Omega_r=omega_r,
+            lna_min=lna_min,
+            n_grid=n_grid,
+            n_substeps=n_substeps,
+            backend=backend,
+        )
+        structures = []
+        row = 0
+        for cosmology in cosmologies:
+            structure = cls(cosmology, lna_min=lna_min, n_grid=n_grid, n_substeps=n_substeps)
+            if cosmology.analytic_cpl:
+                structure._cache = _GrowthCache(
+                    lna_grid=table.lna_grid,
+                    d_grid=table.d[row],
+                    f_grid=table.f[row],
+                    fsigma8_grid=table.fsigma8[row],
+                )
+                row += 1
+            structures.append(structure)
+        return structures
+
     def check_phantom_stability(
         self,
         z_max: float = 10.0,
@@ -155,29 +722,54 @@ class StructureFormation:
 
     def _omega_m_of_a(self, a: float) -> float:
         """Return Omega_m(a) from the background model."""
-        z = 1.0 / a - 1.0
-        e = float(np.asarray(self.cosmology.E(z), dtype=float))
-        e2 = max(e * e, 1.0e-12)
-        return self.cosmology.Omega_m * a ** (-3.0) / e2
+        return self.cosmology.Omega_m_of_a_scalar(a)
 
     def _dlnE_dlna(self, a: float, omega_m_a: float) -> float:
-        """Return d ln(E) / d ln(a) for matter + CPL dark energy."""
-        z = 1.0 / a - 1.0
-        w_a = float(np.asarray(self.cosmology.w(z), dtype=float))
-        return -1.5 * (1.0 + w_a * (1.0 - omega_m_a))
+        """Return d ln(E) / d ln(a) for matter + dark energy."""
+        return -1.5 * (1.0 + self.cosmology.w_scalar(1.0 / a - 1.0) * (1.0 - omega_m_a))
 
     def _growth_rhs(self, lna: float, y: FloatArray) -> FloatArray:
         """RHS for growth system in ln(a)."""
-        a = float(np.exp(lna))
+        a = math.exp(lna)
         delta, ddelta_dlna = float(y[0]), float(y[1])
         omega_m_a = self._omega_m_of_a(a)
         dlnE_dlna = self._dlnE_dlna(a, omega_m_a)
         d2delta_dlna2 = -(2.0 + dlnE_dlna) * ddelta_dlna + 1.5 * omega_m_a * delta
         return np.array([ddelta_dlna, d2delta_dlna2], dtype=float)
 
-    def _build_cache(self) -> _GrowthCache:
-        """Solve growth ODE once and cache fsigma8 on a fixed grid."""
-        lna_grid = np.linspace(self.lna_min, 0.0, self.n_grid, dtype=float)
+    def _solve_fixed_step(self, lna_grid: FloatArray) -> tuple[FloatArray, FloatArray]:
+        """Integrate the growth system with the compiled RK4 kernel."""
+        cosmo = self.cosmology
+        delta = np.empty_like(lna_grid)
+        ddelta_dlna = np.empty_like(lna_grid)
+        if not cosmo.analytic_cpl:
+            # Other dark-energy models: one vectorized E(z), w(z) evaluation at the RK4 stages.
+            z_stages = np.exp(-_rk4_stage_lna(lna_grid, self.n_substeps)) - 1.0
+            _integrate_growth_rk4_tabulated(
+                lna_grid,
+                self.n_substeps,
+                cosmo.Omega_m,
+                np.asarray(cosmo.E(z_stages), dtype=float),
+                np.asarray(cosmo.w(z_stages), dtype=float),
+                delta,
+                ddelta_dlna,
+            )
+            return delta, ddelta_dlna
+        _integrate_growth_rk4(
+            lna_grid,
+            self.n_substeps,
+            cosmo.Omega_r,
+            cosmo.Omega_m,
+            cosmo.Omega_de,
+            cosmo.w_0,
+            cosmo.w_a,
+            delta,
+            ddelta_dlna,
+        )
+        return delta, ddelta_dlna
+
+    def _solve_ivp(self, lna_grid: FloatArray) -> tuple[FloatArray, FloatArray]:
+        """Integrate the growth system with adaptive `solve_ivp`."""
         a_ini = float(np.exp(self.lna_min))
         y0 = np.array([a_ini, a_ini], dtype=float)
 
@@ -196,12 +788,18 @@ class StructureFormation:
             raise RuntimeError("Growth ODE integration crashed.") from exc
         if not sol.success:
             raise RuntimeError(f"Growth ODE failed: {sol.message}")
+        return np.asarray(sol.y[0], dtype=float), np.asarray(sol.y[1], dtype=float)
 
-        delta = np.asarray(sol.y[0], dtype=float)
-        ddelta_dlna = np.asarray(sol.y[1], dtype=float)
+    def _build_cache(self) -> _GrowthCache:
+        """Solve growth ODE once and cache D, f and fsigma8 on a fixed grid."""
+        lna_grid = np.linspace(self.lna_min, 0.0, self.n_grid, dtype=float)
+        if self.method.upper() == FIXED_STEP_METHOD:
+            delta, ddelta_dlna = self._solve_fixed_step(lna_grid)
+        else:
+            delta, ddelta_dlna = self._solve_ivp(lna_grid)
 
         delta_0 = float(delta[-1])
-        if delta_0 <= 0.0:
+        if not np.isfinite(delta_0) or delta_0 <= 0.0:
             raise RuntimeError("Non-physical growth solution: delta(a=1) <= 0")
 
         delta_norm = delta / delta_0
@@ -209,7 +807,7 @@ class StructureFormation:
         f_grid = ddelta_dlna / np.maximum(delta, 1.0e-12)
         fsigma8_grid = f_grid * self.cosmology.sigma_8 * delta_norm
 
-        return _GrowthCache(lna_grid=lna_grid, f_grid=f_grid, fsigma8_grid=fsigma8_grid)
+        return _GrowthCache(lna_grid=lna_grid, d_grid=delta_norm, f_grid=f_grid, fsigma8_grid=fsigma8_grid)
 
     def _ensure_cache(self) -> _GrowthCache:
         """Build growth cache lazily."""
@@ -247,6 +845,31 @@ class StructureFormation:
                 return float("nan")
             return np.full_like(z_arr, np.nan, dtype=float)
 
+    def get_growth_factor(self, z: ArrayLike) -> float | FloatArray:
+        """Return the linear growth factor D(z), normalized to D(0) = 1.
+
+        Args:
+            z: Redshift value(s), must satisfy z >= 0.
+
+        Returns:
+            Scalar or array of D(z) values, matching the input shape.
+        """
+        z_arr = np.asarray(z, dtype=float)
+        if np.any(z_arr < 0.0):
+            raise ValueError("Redshift must satisfy z >= 0.")
+
+        try:
+            cache = self._ensure_cache()
+            lna_target = np.log(1.0 / (1.0 + z_arr))
+            d = np.interp(lna_target, cache.lna_grid, cache.d_grid)
+            if np.isscalar(z):
+                return float(d)
+            return d
+        except Exception:
+            if np.isscalar(z):
+                return float("nan")
+            return np.full_like(z_arr, np.nan, dtype=float)
+
     def compute_isw_source_term(self, z_array: ArrayLike) -> float | FloatArray:
         """Return late-time ISW source proxy profile: d ln(D/a) / d ln(a) = f(z) - 1.
 
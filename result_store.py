@@ -0,0 +1,310 @@
+"""Persistent, content-addressed store for expensive per-cosmology results.
+
+Report generators re-integrate the same best-fit cosmologies on every run:
+growth histories, distance and sound-horizon tables, profile-likelihood
+optimizations, synthetic chains. This module memoizes such results on disk,
+under `<repo>/.npcache/result_store/<namespace>/`, so that repeated runs reload
+them instead of recomputing.
+
+Every entry is addressed by two digests:
+
+- a parameter digest, the SHA-256 of the canonical JSON form of the inputs
+  (floats are serialized exactly, arrays by content);
+- a code-version digest, the SHA-256 of the source files (or data files) the
+  result depends on, so that editing a solver invalidates its results.
+
+A single array is stored as `.npy`, a mapping of arrays as `.npz`. Writes go
+through `dataset_cache.atomic_write` under the shared `mcgt.locking.file_lock`,
+reads refresh the entry mtime, and the least-recently used entries are evicted
+once the store exceeds its quota.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import logging
+import os
+from collections.abc import Callable, Iterable, Mapping
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Union
+
+import numpy as np
+
+from dataset_cache import CACHE_DIRNAME, atomic_write
+from mcgt.locking import file_lock
+
+STORE_DIRNAME = "result_store"
+STORE_FORMAT_VERSION = 1
+DISABLE_ENV = "PSITMG_NO_RESULT_STORE"
+DEFAULT_QUOTA_BYTES = int(1 * 1024**3)
+ENTRY_SUFFIXES = (".npy", ".npz")
+
+StoredValue = Union[np.ndarray, dict[str, np.ndarray]]
+CodeSource = Union[ModuleType, Path, str]
+
+logger = logging.getLogger(__name__)
+
+_SOURCE_DIGESTS: dict[str, tuple[int, int, str]] = {}
+
+
+def _canonical(value: Any) -> Any:
+    """Return a JSON-serializable form of `value` that is stable across runs."""
+    if isinstance(value, Mapping):
+        return {str(k): _canonical(v) for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, np.ndarray):
+        arr = np.ascontiguousarray(value)
+        return {
+            "__ndarray__": hashlib.sha256(arr.tobytes()).hexdigest(),
+            "dtype": arr.dtype.str,
+            "shape": list(arr.shape),
+        }
+    if isinstance(value, np.generic):
+        return _canonical(value.item())
+    if isinstance(value, float):
+        # `float.hex` is exact and keeps NaN/inf distinct from strings.
+        return {"__float__": value.hex()}
+    if isinstance(value, Path):
+        return str(value)
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    raise TypeError(f"Unsupported parameter type for the result store: {type(value).__name__}")
+
+
+def params_digest(params: Mapping[str, Any]) -> str:
+    """SHA-256 of the canonical JSON form of `params`."""
+    payload = json.dumps(_canonical(params), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _source_path(source: CodeSource) -> Path:
+    if isinstance(source, ModuleType):
+        filename = getattr(source, "__file__", None)
+        if filename is None:
+            raise ValueError(f"Module {source.__name__!r} has no source file.")
+        return Path(filename).resolve()
+    return Path(source).resolve()
+
+
+def _file_digest(path: Path) -> str:
+    """SHA-256 of a file, memoized in-process on (size, mtime)."""
+    stat = path.stat()
+    key = str(path)
+    cached = _SOURCE_DIGESTS.get(key)
+    if cached is not None and cached[:2] == (stat.st_size, stat.st_mtime_ns):
+        return cached[2]
+    digest = hashlib.sha256()
+    with path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(chunk)
+    _SOURCE_DIGESTS[key] = (stat.st_size, stat.st_mtime_ns, digest.hexdigest())
+    return digest.hexdigest()
+
+
+def code_version(*sources: CodeSource) -> str:
+    """Digest of the modules or files a result depends on.
+
+    Args:
+        sources: Imported modules, or paths to source/data files. Their
+            contents (not their names) enter the digest.
+
+    Returns:
+        Hex digest; constant for an empty argument list.
+    """
+    digest = hashlib.sha256(f"result-store-v{STORE_FORMAT_VERSION}".encode("utf-8"))
+    for source in sources:
+        digest.update(_file_digest(_source_path(source)).encode("ascii"))
+    return digest.hexdigest()
+
+
+def _as_stored(value: StoredValue) -> StoredValue:
+    if isinstance(value, Mapping):
+        return {str(k): np.asarray(v) for k, v in value.items()}
+    return np.asarray(value)
+
+
+class ResultStore:
+    """On-disk memoization keyed by (namespace, parameters, code version).
+
+    Args:
+        root: Store directory. Defaults to `.npcache/result_store` at the
+            repository root.
+        quota_bytes: Total size above which least-recently used entries are
+            evicted.
+        enabled: Force the store on/off. Defaults to on unless the
+            `PSITMG_NO_RESULT_STORE` environment variable is set.
+    """
+
+    def __init__(
+        self,
+        root: Path | str | None = None,
+        quota_bytes: int = DEFAULT_QUOTA_BYTES,
+        enabled: bool | None = None,
+    ) -> None:
+        if root is None:
+            root = Path(__file__).resolve().parent / CACHE_DIRNAME / STORE_DIRNAME
+        self.root = Path(root)
+        self.quota_bytes = int(quota_bytes)
+        self.enabled = (not os.environ.get(DISABLE_ENV)) if enabled is None else bool(enabled)
+        self._hits = 0
+        self._misses = 0
+
+    def _stem(self, namespace: str, params: Mapping[str, Any], code: Iterable[CodeSource]) -> tuple[Path, str, str]:
+        if not namespace or any(sep in namespace for sep in ("/", "\\", "..")):
+            raise ValueError(f"Invalid result-store namespace: {namespace!r}")
+        return self.root / namespace, params_digest(params)[:32], code_version(*code)[:16]
+
+    def entry_path(self, namespace: str, params: Mapping[str, Any], code: Iterable[CodeSource] = ()) -> Path | None:
+        """Path of the stored entry for these inputs, or None when absent."""
+        directory, p_hash, c_hash = self._stem(namespace, params, code)
+        for suffix in ENTRY_SUFFIXES:
+            path = directory / f"{p_hash}.{c_hash}{suffix}"
+            if path.exists():
+                return path
+        return None
+
+    def get(self, namespace: str, params: Mapping[str, Any], code: Iterable[CodeSource] = ()) -> StoredValue | None:
+        """Return the stored value for these inputs, or None on a miss."""
+        if not self.enabled:
+            return None
+        path = self.entry_path(namespace, params, code)
+        if path is None:
+            self._misses += 1
+            return None
+        try:
+            if path.suffix == ".npy":
+                value: StoredValue = np.load(path, allow_pickle=False)
+            else:
+                with np.load(path, allow_pickle=False) as npz:
+                    value = {name: npz[name] for name in npz.files}
+            os.utime(path)
+        except (OSError, ValueError) as exc:
+            logger.warning("Unreadable result-store entry %s (%s); recomputing.", path, exc)
+            path.unlink(missing_ok=True)
+            self._misses += 1
+            return None
+        self._hits += 1
+        return value
+
+    def put(
+        self,
+        namespace: str,
+        params: Mapping[str, Any],
+        value: StoredValue,
+        code: Iterable[CodeSource] = (),
+    ) -> Path | None:
+        """Store `value` for these inputs and return the entry path.
+
+        Entries for the same parameters under an older code version are
+        removed, then the store is trimmed to its quota. Write failures are
+        logged and return None.
+        """
+        if not self.enabled:
+            return None
+        code = tuple(code)
+        directory, p_hash, c_hash = self._stem(namespace, params, code)
+        stored = _as_stored(value)
+        suffix = ".npz" if isinstance(stored, dict) else ".npy"
+        target = directory / f"{p_hash}.{c_hash}{suffix}"
+
+        buffer = io.BytesIO()
+        if isinstance(stored, dict):
+            np.savez(buffer, **stored)
+        else:
+            np.save(buffer, stored, allow_pickle=False)
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            with file_lock(str(self.root / "store")):
+                for stale in directory.glob(f"{p_hash}.*"):
+                    if stale.suffix in ENTRY_SUFFIXES and stale.name != target.name:
+                        stale.unlink(missing_ok=True)
+                atomic_write(target, lambda fh: fh.write(buffer.getvalue()))
+                self._evict(keep=target)
+        except (OSError, TimeoutError) as exc:
+            logger.warning("Cannot write result-store entry %s (%s).", target, exc)
+            return None
+        return target
+
+    def get_or_compute(
+        self,
+        namespace: str,
+        params: Mapping[str, Any],
+        compute: Callable[[], StoredValue],
+        code: Iterable[CodeSource] = (),
+    ) -> StoredValue:
+        """Return the stored value, computing and storing it on a miss.
+
+        Args:
+            namespace: Result family, one sub-directory of the store.
+            params: Every input that determines the result.
+            compute: Zero-argument callable producing an array or a mapping
+                of arrays.
+            code: Modules or files whose contents the result depends on.
+
+        Returns:
+            The array (or dict of arrays) as produced by `compute`, or as
+            reloaded from disk.
+        """
+        code = tuple(code)
+        value = self.get(namespace, params, code)
+        if value is not None:
+            return value
+        value = _as_stored(compute())
+        self.put(namespace, params, value, code)
+        return value
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        entries = []
+        if not self.root.is_dir():
+            return entries
+        for path in self.root.glob("*/*"):
+            if path.suffix not in ENTRY_SUFFIXES:
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict(self, keep: Path | None = None) -> int:
+        """Remove least-recently used entries until the store fits its quota."""
+        entries = sorted(self._entries(), key=lambda item: item[0])
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in entries:
+            if total <= self.quota_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self, namespace: str | None = None) -> int:
+        """Delete all entries (or those of one namespace); return the count."""
+        removed = 0
+        for _, _, path in self._entries():
+            if namespace is None or path.parent.name == namespace:
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def cache_info(self) -> dict[str, int]:
+        """Return in-process hit/miss counters and the on-disk footprint."""
+        entries = self._entries()
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+            "quota_bytes": self.quota_bytes,
+        }
@@ -7,14 +7,25 @@ Release: v4.0.0
 from __future__ import annotations
 
 import argparse
+import contextlib
 import importlib.util
+import json
 import math
+import multiprocessing
+import os
+import time
+from collections import OrderedDict
 from pathlib import Path
+from typing import Iterator
 
 import emcee
 import numpy as np
 
+from dataset_cache import atomic_write, load_text_array
+from scripts._common.mcmc_diagnostics import split_rhat
+
 MODEL_CHOICES = ("cpl", "jbp", "wcdm")
+POOL_CHOICES = ("serial", "process", "mpi-local")
 PARAM_NAMES_CPL = ("Omega_m", "H_0", "w_0", "w_a", "S_8")
 PARAM_NAMES_WCDM = ("Omega_m", "H_0", "w_0", "S_8")
 
@@ -23,6 +34,11 @@ N_WALKERS = 100
 N_STEPS_DEFAULT = 5000
 N_STEPS_TEST = 500
 SEED = 42
+CHECKPOINT_EVERY_DEFAULT = 100
+MONITOR_EVERY_DEFAULT = 100
+TAU_FACTOR = 50.0
+TAU_RTOL = 0.01
+BURNIN_TAU_FACTOR = 2.0
 
 # Expected best-fit center for initialization
 THETA_BESTFIT_CPL = np.array([0.243, 72.97, -0.69, -2.81, 0.718], dtype=float)
@@ -44,6 +60,7 @@ TRI_PROBE_SIGMA_SYS = 0.1
 TRI_PROBE_N_STEPS_INT = 2500
 _TRI_PROBE_RUNTIME: dict[str, object] | None = None
 _RSD_RUNTIME: dict[str, object] | None = None
+_PIPELINES: dict[str, "TriProbePipeline"] = {}
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -82,6 +99,55 @@ def build_parser() -> argparse.ArgumentParser:
         default="cpl",
         help="Cosmological EoS model: 'cpl', 'jbp' (free w_a) or 'wcdm' (w_a fixed to 0).",
     )
+    parser.add_argument(
+        "--pool",
+        type=str,
+        choices=POOL_CHOICES,
+        default="serial",
+        help="Walker evaluation backend: 'serial', 'process' (multiprocessing) "
+        "or 'mpi-local' (mpi4py.futures workers spawned on this node).",
+    )
+    parser.add_argument(
+        "--n-procs",
+        type=int,
+        default=None,
+        help="Number of worker processes for --pool process/mpi-local (default: all cores).",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue from the last stored state of the HDF5 chain instead of resetting it; "
+        "--n-steps is then the total target length.",
+    )
+    parser.add_argument(
+        "--checkpoint-every",
+        type=int,
+        default=CHECKPOINT_EVERY_DEFAULT,
+        metavar="N",
+        help="Flush the chain to disk every N steps (HDF5 fsync or atomic CSV rewrite; 0 disables). "
+        f"Default: {CHECKPOINT_EVERY_DEFAULT}.",
+    )
+    parser.add_argument(
+        "--monitor-every",
+        type=int,
+        default=MONITOR_EVERY_DEFAULT,
+        metavar="K",
+        help="Estimate tau and split-Rhat every K steps and log them to <output>.convergence.csv "
+        f"(0 disables). Default: {MONITOR_EVERY_DEFAULT}.",
+    )
+    parser.add_argument(
+        "--auto-stop",
+        action="store_true",
+        help=f"Stop before --n-steps once N > {TAU_FACTOR:g} tau and tau changed by less than "
+        f"{100 * TAU_RTOL:g}%% since the previous check.",
+    )
+    parser.add_argument(
+        "--benchmark",
+        type=int,
+        default=0,
+        metavar="N_CALLS",
+        help="Time N_CALLS likelihood calls (two-pass vs single-pass) at the best-fit point and exit.",
+    )
     return parser
 
 
@@ -126,12 +192,12 @@ def _load_tri_probe_runtime() -> dict[str, object]:
 
     params_template = module.load_config(root / TRI_PROBE_CONFIG)
 
-    sn_raw = np.loadtxt(
+    sn_raw = load_text_array(
         root / "assets/zz-data/08_sound_horizon/08_pantheon_data.csv",
         delimiter=",",
         skiprows=1,
     )
-    bao_raw = np.loadtxt(
+    bao_raw = load_text_array(
         root / "assets/zz-data/08_sound_horizon/08_bao_data.csv",
         delimiter=",",
         skiprows=1,
@@ -141,6 +207,7 @@ def _load_tri_probe_runtime() -> dict[str, object]:
 
     _TRI_PROBE_RUNTIME = {
         "log_posterior": module.log_posterior,
+        "chi2_components": module.chi2_components,
         "chi2_sn": module.chi2_sn,
         "chi2_bao": module.chi2_bao,
         "chi2_cmb": module.chi2_cmb,
@@ -168,10 +235,48 @@ def _load_rsd_runtime() -> dict[str, object]:
     _RSD_RUNTIME = {
         "get_chi2_rsd": module.get_chi2_rsd,
         "load_rsd_data": module.load_rsd_data,
+        "fsigma8_theory": module.fsigma8_theory,
+        "rsd_data": module.load_rsd_data(root / module.DEFAULT_DATA),
+        "rsd_data_path": root / module.DEFAULT_DATA,
     }
     return _RSD_RUNTIME
 
 
+def _init_worker() -> None:
+    """Pool initializer: load likelihood runtimes once per worker process.
+
+    Data then live in module globals of each worker, so emcee only pickles
+    the walker positions and the small (model, priors, names) arguments.
+    """
+    _load_tri_probe_runtime()
+    _load_rsd_runtime()
+
+
+@contextlib.contextmanager
+def make_pool(kind: str, n_procs: int | None = None) -> Iterator[object | None]:
+    """Yield an emcee-compatible pool (an object with `map`), or None for serial runs."""
+    if kind == "serial":
+        yield None
+        return
+
+    n_workers = int(n_procs) if n_procs else (os.cpu_count() or 1)
+    if n_workers < 1:
+        raise ValueError(f"n_procs doit etre >= 1 (got {n_procs}).")
+
+    if kind == "process":
+        with multiprocessing.Pool(processes=n_workers, initializer=_init_worker) as pool:
+            yield pool
+    elif kind == "mpi-local":
+        try:
+            from mpi4py.futures import MPIPoolExecutor
+        except ImportError as exc:
+            raise RuntimeError("--pool mpi-local requiert mpi4py (mpi4py.futures).") from exc
+        with MPIPoolExecutor(max_workers=n_workers, initializer=_init_worker) as pool:
+            yield pool
+    else:  # pragma: no cover
+        raise ValueError(f"Unknown pool '{kind}'.")
+
+
 def normalize_model_name(model: str) -> str:
     lowered = model.strip().lower()
     if lowered == "cpl":
@@ -196,72 +301,148 @@ def _unpack_theta(theta: np.ndarray, model: str) -> tuple[float, float, float, f
     return float(omega_m), float(h_0), float(w_0), float(w_a), float(s_8)
 
 
-def evaluate_chi2_components(theta: np.ndarray, eos_model: str = "cpl") -> dict[str, float]:
-    """Return chi2 contributions per probe and total for a given parameter vector."""
-    omega_m, h_0, w_0, w_a, s_8 = _unpack_theta(theta, eos_model)
-    eos_model = normalize_model_name(eos_model)
+class TriProbePipeline:
+    """Single-pass SN+BAO+CMB+RSD likelihood with a per-probe chi2 breakdown.
 
-    runtime = _load_tri_probe_runtime()
-    rsd_runtime = _load_rsd_runtime()
-    params = dict(runtime["params_template"])
-    params["H0"] = float(h_0)
-    params["h"] = float(h_0) / 100.0
-    params["omega_b"] = params["ombh2"] / (params["h"] * params["h"])
-
-    chi2_sn = float(
-        runtime["chi2_sn"](
-            *runtime["sn_data"],
-            params,
-            omega_m,
-            w_0,
-            w_a,
-            TRI_PROBE_SIGMA_SYS,
-            TRI_PROBE_N_STEPS_INT,
-            eos_model,
-        )
-    )
-    chi2_bao = float(
-        runtime["chi2_bao"](
-            *runtime["bao_data"],
-            params,
-            omega_m,
-            w_0,
-            w_a,
-            TRI_PROBE_N_STEPS_INT,
-            eos_model,
-        )
-    )
-    chi2_cmb = float(
-        runtime["chi2_cmb"](
-            params,
-            omega_m,
-            w_0,
-            w_a,
-            TRI_PROBE_N_STEPS_INT,
-            eos_model,
-        )
-    )
+    Each probe is evaluated exactly once per parameter vector, and the
+    breakdown is memoized (LRU) so that the final report and repeated
+    evaluations of the same point do not recompute the background integrals.
 
-    sigma_8_0 = s_8 / math.sqrt(omega_m / 0.3)
-    chi2_rsd = float(
-        rsd_runtime["get_chi2_rsd"](
-            omega_m,
-            w_0,
-            w_a,
-            sigma_8_0,
-            h_0=h_0,
-            eos_model=eos_model,
+    Args:
+        eos_model: Dark-energy model name (CPL, JBP or wCDM, any case).
+        cache_size: Number of breakdowns kept in the LRU cache.
+    """
+
+    def __init__(self, eos_model: str = "cpl", cache_size: int = 256) -> None:
+        self.model = str(eos_model)
+        self.eos_model = normalize_model_name(eos_model)
+        self.cache_size = int(cache_size)
+        self.runtime = _load_tri_probe_runtime()
+        self.rsd_runtime = _load_rsd_runtime()
+        self._cache: OrderedDict[tuple[bytes, bool], dict[str, float]] = OrderedDict()
+        self.last_breakdown: dict[str, float] | None = None
+        self.n_evaluations = 0
+
+    def _params(self, h_0: float) -> dict[str, float | str]:
+        params = dict(self.runtime["params_template"])
+        params["H0"] = float(h_0)
+        params["h"] = float(h_0) / 100.0
+        params["omega_b"] = params["ombh2"] / (params["h"] * params["h"])
+        return params
+
+    def _chi2_rsd(self, omega_m: float, h_0: float, w_0: float, w_a: float, s_8: float) -> float:
+        z, fs8_obs, fs8_err = self.rsd_runtime["rsd_data"]
+        sigma_8_0 = s_8 / math.sqrt(omega_m / 0.3)
+        fs8_th = self.rsd_runtime["fsigma8_theory"](
+            z, omega_m, h_0, w_0, w_a, sigma_8_0, eos_model=self.eos_model
         )
-    )
+        return float(np.sum(((fs8_obs - fs8_th) / fs8_err) ** 2))
+
+    def _compute(self, theta: np.ndarray, enforce_support: bool) -> dict[str, float]:
+        omega_m, h_0, w_0, w_a, s_8 = _unpack_theta(theta, self.model)
+        params = self._params(h_0)
+        runtime = self.runtime
+
+        if enforce_support:
+            components = runtime["chi2_components"](
+                params,
+                omega_m,
+                w_0,
+                w_a,
+                runtime["sn_data"],
+                runtime["bao_data"],
+                TRI_PROBE_SIGMA_SYS,
+                TRI_PROBE_N_STEPS_INT,
+                self.eos_model,
+            )
+            if components is None:
+                return {
+                    "chi2_sn": math.inf,
+                    "chi2_bao": math.inf,
+                    "chi2_cmb": math.inf,
+                    "chi2_rsd": math.inf,
+                    "chi2_total": math.inf,
+                }
+            chi2_sn, chi2_bao, chi2_cmb = (float(value) for value in components)
+        else:
+            chi2_sn = float(
+                runtime["chi2_sn"](
+                    *runtime["sn_data"],
+                    params,
+                    omega_m,
+                    w_0,
+                    w_a,
+                    TRI_PROBE_SIGMA_SYS,
+                    TRI_PROBE_N_STEPS_INT,
+                    self.eos_model,
+                )
+            )
+            chi2_bao = float(
+                runtime["chi2_bao"](
+                    *runtime["bao_data"],
+                    params,
+                    omega_m,
+                    w_0,
+                    w_a,
+                    TRI_PROBE_N_STEPS_INT,
+                    self.eos_model,
+                )
+            )
+            chi2_cmb = float(
+                runtime["chi2_cmb"](params, omega_m, w_0, w_a, TRI_PROBE_N_STEPS_INT, self.eos_model)
+            )
+
+        chi2_rsd = self._chi2_rsd(omega_m, h_0, w_0, w_a, s_8)
+        return {
+            "chi2_sn": chi2_sn,
+            "chi2_bao": chi2_bao,
+            "chi2_cmb": chi2_cmb,
+            "chi2_rsd": chi2_rsd,
+            "chi2_total": chi2_sn + chi2_bao + chi2_cmb + chi2_rsd,
+        }
+
+    def breakdown(self, theta: np.ndarray, enforce_support: bool = True) -> dict[str, float]:
+        """Return the per-probe chi2 breakdown for `theta` (cached).
+
+        With `enforce_support=True`, points outside the chapter-09 physical
+        support return infinite chi2 values without evaluating any probe.
+        """
+        key = (np.asarray(theta, dtype=float).tobytes(), bool(enforce_support))
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.last_breakdown = cached
+            return dict(cached)
+
+        result = self._compute(np.asarray(theta, dtype=float), enforce_support)
+        self.n_evaluations += 1
+        self._cache[key] = result
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        self.last_breakdown = result
+        return dict(result)
+
+    def loglike(self, theta: np.ndarray) -> float:
+        """Return -chi2_total/2, or -inf outside the support or for non-finite chi2."""
+        chi2_total = self.breakdown(theta)["chi2_total"]
+        if not np.isfinite(chi2_total):
+            return -math.inf
+        return -0.5 * chi2_total
 
-    chi2_total = chi2_sn + chi2_bao + chi2_cmb + chi2_rsd
-    return {
-        "chi2_sn": chi2_sn,
-        "chi2_bao": chi2_bao,
-        "chi2_cmb": chi2_cmb,
-        "chi2_rsd": chi2_rsd,
-        "chi2_total": chi2_total,
-    }
+
+def get_pipeline(eos_model: str = "cpl") -> TriProbePipeline:
+    """Return the per-process pipeline for `eos_model`, building it once."""
+    key = str(eos_model).strip().lower()
+    pipeline = _PIPELINES.get(key)
+    if pipeline is None:
+        pipeline = TriProbePipeline(eos_model)
+        _PIPELINES[key] = pipeline
+    return pipeline
+
+
+def evaluate_chi2_components(theta: np.ndarray, eos_model: str = "cpl") -> dict[str, float]:
+    """Return chi2 contributions per probe and total for a given parameter vector."""
+    return get_pipeline(eos_model).breakdown(theta, enforce_support=False)
 
 
 def calculate_information_criteria(
@@ -283,7 +464,7 @@ def count_data_points() -> dict[str, int]:
     n_sn = int(len(runtime["sn_data"][0]))
     n_bao = int(len(runtime["bao_data"][0]))
     n_cmb = 1
-    rsd_z, _, _ = rsd_runtime["load_rsd_data"]()
+    rsd_z, _, _ = rsd_runtime["rsd_data"]
     n_rsd = int(len(rsd_z))
     n_total = n_sn + n_bao + n_cmb + n_rsd
 
@@ -296,11 +477,22 @@ def count_data_points() -> dict[str, int]:
     }
 
 
-def summarize_bestfit_from_chain(sampler: emcee.EnsembleSampler) -> tuple[np.ndarray, int]:
-    """Return parameter medians from flattened post-burn-in chain."""
+def summarize_bestfit_from_chain(
+    sampler: emcee.EnsembleSampler,
+    tau: np.ndarray | None = None,
+) -> tuple[np.ndarray, int]:
+    """Return parameter medians from flattened post-burn-in chain.
+
+    Burn-in is `BURNIN_TAU_FACTOR * max(tau)` when an autocorrelation time
+    estimate is given, and 30% of the chain otherwise.
+    """
     chain = sampler.get_chain()
     n_steps = chain.shape[0]
-    burnin = min(max(1, int(0.30 * n_steps)), max(1, n_steps - 1))
+    if tau is not None and np.all(np.isfinite(tau)):
+        burnin = int(math.ceil(BURNIN_TAU_FACTOR * float(np.max(tau))))
+    else:
+        burnin = int(0.30 * n_steps)
+    burnin = min(max(1, burnin), max(1, n_steps - 1))
 
     samples = sampler.get_chain(discard=burnin, flat=True)
     if samples.size == 0:
@@ -311,12 +503,86 @@ def summarize_bestfit_from_chain(sampler: emcee.EnsembleSampler) -> tuple[np.nda
     return theta_median, burnin
 
 
+class ConvergenceMonitor:
+    """Online convergence check for an emcee run.
+
+    Each `update` estimates the integrated autocorrelation time tau per
+    parameter (emcee, `tol=0`) and the split-Rhat on the second half of the
+    chain, appends them to a CSV log, and reports convergence when the chain
+    is longer than `tau_factor * max(tau)` and tau moved by less than
+    `tau_rtol` (relative) since the previous update.
+
+    Args:
+        param_names: Parameter names, used for the CSV columns.
+        log_path: CSV log path; None keeps the history in memory only.
+        tau_factor: Required chain length in units of tau.
+        tau_rtol: Relative tau stability threshold between two updates.
+        append: Append to an existing log (resumed runs) instead of replacing it.
+    """
+
+    def __init__(
+        self,
+        param_names: tuple[str, ...],
+        log_path: Path | None = None,
+        tau_factor: float = TAU_FACTOR,
+        tau_rtol: float = TAU_RTOL,
+        append: bool = False,
+    ) -> None:
+        self.param_names = tuple(param_names)
+        self.log_path = log_path
+        self.tau_factor = float(tau_factor)
+        self.tau_rtol = float(tau_rtol)
+        self.tau: np.ndarray | None = None
+        self.history: list[dict[str, float]] = []
+        if log_path is not None and not (append and log_path.exists()):
+            header = (
+                ["iteration"]
+                + [f"tau_{name}" for name in self.param_names]
+                + ["tau_max"]
+                + [f"rhat_{name}" for name in self.param_names]
+                + ["rhat_max", "converged"]
+            )
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            log_path.write_text(",".join(header) + "\n", encoding="utf-8")
+
+    def update(self, sampler: emcee.EnsembleSampler) -> bool:
+        """Record diagnostics for the current chain and return the convergence flag."""
+        chain = sampler.get_chain()
+        n_steps = chain.shape[0]
+        tau = np.asarray(emcee.autocorr.integrated_time(chain, tol=0), dtype=float)
+        rhat = split_rhat(chain[n_steps // 2 :])
+
+        converged = bool(np.all(np.isfinite(tau)) and n_steps > self.tau_factor * float(np.max(tau)))
+        if self.tau is not None:
+            converged &= bool(np.all(np.abs(self.tau - tau) < self.tau_rtol * tau))
+        self.tau = tau
+
+        row = {"iteration": float(n_steps), "tau_max": float(np.max(tau)), "rhat_max": float(np.max(rhat))}
+        row.update({f"tau_{name}": float(value) for name, value in zip(self.param_names, tau)})
+        row.update({f"rhat_{name}": float(value) for name, value in zip(self.param_names, rhat)})
+        row["converged"] = float(converged)
+        self.history.append(row)
+
+        if self.log_path is not None:
+            values = (
+                [str(n_steps)]
+                + [f"{value:.6g}" for value in tau]
+                + [f"{np.max(tau):.6g}"]
+                + [f"{value:.6g}" for value in rhat]
+                + [f"{np.max(rhat):.6g}", str(int(converged))]
+            )
+            with self.log_path.open("a", encoding="utf-8") as fh:
+                fh.write(",".join(values) + "\n")
+                fh.flush()
+        return converged
+
+
 def _print_bestfit_report(
     theta: np.ndarray,
     burnin: int,
     param_names: tuple[str, ...],
     model: str,
-) -> None:
+) -> dict[str, object]:
     chi2 = evaluate_chi2_components(theta, eos_model=model)
     counts = count_data_points()
     aic, bic = calculate_information_criteria(
@@ -345,6 +611,7 @@ def _print_bestfit_report(
     print(f"{'n (donnees totales)':<24} {counts['n_total']}")
     print(f"{'AIC':<24} {aic:.6f}")
     print(f"{'BIC':<24} {bic:.6f}")
+    return {"chi2": chi2, "counts": counts, "aic": aic, "bic": bic}
 
 
 def log_prior(
@@ -362,36 +629,80 @@ def log_prior(
 
 def pipeline_loglike_from_theta(theta: np.ndarray, eos_model: str = "cpl") -> float:
     """
-    Real ΨTMG tri-probe likelihood (SN+BAO+CMB) from chapter 09 pipeline.
+    Real ΨTMG likelihood (SN+BAO+CMB+RSD), evaluated in a single pass.
 
     Source:
-      scripts/09_dark_energy_cpl/09_mcmc_sampler.py::log_posterior
+      scripts/09_dark_energy_cpl/09_mcmc_sampler.py::chi2_components
+      scripts/10_structure_growth/10_rsd_likelihood.py::fsigma8_theory
     """
-    omega_m, h_0, w_0, w_a, _s_8 = _unpack_theta(theta, eos_model)
-    eos_model = normalize_model_name(eos_model)
+    return get_pipeline(eos_model).loglike(theta)
 
-    runtime = _load_tri_probe_runtime()
-    params = dict(runtime["params_template"])
-    params["H0"] = float(h_0)
-    params["h"] = float(h_0) / 100.0
-    params["omega_b"] = params["ombh2"] / (params["h"] * params["h"])
-
-    logp, _, _, _ = runtime["log_posterior"](
-        params,
-        omega_m,
-        w_0,
-        w_a,
-        runtime["sn_data"],
-        runtime["bao_data"],
-        TRI_PROBE_SIGMA_SYS,
-        TRI_PROBE_N_STEPS_INT,
-        eos_model,
-    )
-    if not np.isfinite(logp):
-        return -math.inf
 
-    chi2_total_combine = evaluate_chi2_components(theta, eos_model=eos_model)["chi2_total"]
-    return -0.5 * chi2_total_combine
+def benchmark_pipeline(
+    theta: np.ndarray,
+    eos_model: str = "cpl",
+    n_calls: int = 20,
+) -> dict[str, float]:
+    """Time the former two-pass likelihood against the single-pass pipeline.
+
+    The cache is bypassed so that both paths evaluate every probe each call.
+    Returns mean wall times per call in milliseconds and the speed-up factors,
+    for the full likelihood and for the SN+BAO+CMB part alone.
+    """
+    theta = np.asarray(theta, dtype=float)
+    eos = normalize_model_name(eos_model)
+    pipeline = TriProbePipeline(eos_model, cache_size=0)
+    runtime = pipeline.runtime
+    rsd_runtime = pipeline.rsd_runtime
+    omega_m, h_0, w_0, w_a, s_8 = _unpack_theta(theta, eos_model)
+
+    tri_probe_args = (runtime["sn_data"], runtime["bao_data"], TRI_PROBE_SIGMA_SYS, TRI_PROBE_N_STEPS_INT, eos)
+
+    def tri_probe_two_pass() -> float:
+        params = pipeline._params(h_0)
+        logp, _, _, _ = runtime["log_posterior"](params, omega_m, w_0, w_a, *tri_probe_args)
+        if not np.isfinite(logp):
+            return math.inf
+        chi2_sn = runtime["chi2_sn"](
+            *runtime["sn_data"], params, omega_m, w_0, w_a, TRI_PROBE_SIGMA_SYS, TRI_PROBE_N_STEPS_INT, eos
+        )
+        chi2_bao = runtime["chi2_bao"](*runtime["bao_data"], params, omega_m, w_0, w_a, TRI_PROBE_N_STEPS_INT, eos)
+        chi2_cmb = runtime["chi2_cmb"](params, omega_m, w_0, w_a, TRI_PROBE_N_STEPS_INT, eos)
+        return chi2_sn + chi2_bao + chi2_cmb
+
+    def tri_probe_single_pass() -> float:
+        components = runtime["chi2_components"](pipeline._params(h_0), omega_m, w_0, w_a, *tri_probe_args)
+        return math.inf if components is None else sum(components)
+
+    def two_pass() -> float:
+        chi2_rsd = rsd_runtime["get_chi2_rsd"](
+            omega_m, w_0, w_a, s_8 / math.sqrt(omega_m / 0.3),
+            h_0=h_0,
+            data_path=rsd_runtime["rsd_data_path"],
+            eos_model=eos,
+        )
+        return -0.5 * (tri_probe_two_pass() + chi2_rsd)
+
+    def time_per_call(func) -> tuple[float, float]:
+        value = func()
+        start = time.perf_counter()
+        for _ in range(n_calls):
+            func()
+        return 1.0e3 * (time.perf_counter() - start) / n_calls, float(value)
+
+    two_pass_ms, two_pass_value = time_per_call(two_pass)
+    single_pass_ms, single_pass_value = time_per_call(lambda: pipeline.loglike(theta))
+    tri_two_pass_ms, _ = time_per_call(tri_probe_two_pass)
+    tri_single_pass_ms, _ = time_per_call(tri_probe_single_pass)
+    return {
+        "two_pass_ms": two_pass_ms,
+        "single_pass_ms": single_pass_ms,
+        "speedup": two_pass_ms / single_pass_ms,
+        "tri_probe_two_pass_ms": tri_two_pass_ms,
+        "tri_probe_single_pass_ms": tri_single_pass_ms,
+        "tri_probe_speedup": tri_two_pass_ms / tri_single_pass_ms,
+        "loglike_abs_diff": abs(two_pass_value - single_pass_value),
+    }
 
 
 def log_likelihood(theta: np.ndarray, eos_model: str = "cpl") -> float:
@@ -436,17 +747,28 @@ def make_backend(
     n_walkers: int,
     chain_name: str,
     n_dim: int,
+    resume: bool = False,
 ) -> emcee.backends.Backend:
+    """Return the chain backend, reset unless `resume` finds a compatible stored chain."""
     output_file.parent.mkdir(parents=True, exist_ok=True)
     if output_file.suffix.lower() != ".h5":
+        if resume:
+            print("[warn] --resume requiert une sortie .h5; demarrage d'une nouvelle chaine.")
         return emcee.backends.Backend()
     try:
         backend = emcee.backends.HDFBackend(str(output_file), name=chain_name)
-        backend.reset(n_walkers, n_dim)
-        return backend
+        resumable = resume and output_file.exists() and backend.initialized and backend.iteration > 0
+        if not resumable:
+            backend.reset(n_walkers, n_dim)
     except Exception as exc:  # pragma: no cover
         print(f"[warn] HDF5 backend unavailable ({exc}). Falling back to memory backend.")
         return emcee.backends.Backend()
+    if resumable and backend.shape != (n_walkers, n_dim):
+        raise ValueError(
+            f"Chaine stockee de forme {backend.shape} incompatible avec "
+            f"(n_walkers, ndim)=({n_walkers}, {n_dim})."
+        )
+    return backend
 
 
 def save_csv_fallback(
@@ -459,10 +781,37 @@ def save_csv_fallback(
     out_csv = output_h5.with_suffix(".csv")
     header = ",".join(param_names + ("log_prob",))
     data = np.column_stack([chain, logp])
-    np.savetxt(out_csv, data, delimiter=",", header=header, comments="")
+    atomic_write(out_csv, lambda fh: np.savetxt(fh, data, delimiter=",", header=header, comments=""))
     return out_csv
 
 
+def checkpoint(
+    sampler: emcee.EnsembleSampler,
+    backend: emcee.backends.Backend,
+    output: Path,
+    param_names: tuple[str, ...],
+) -> None:
+    """Make the chain sampled so far durable on disk.
+
+    The HDF5 backend already writes every step; this flushes and fsyncs the
+    file. The memory backend is exported by atomically rewriting the CSV.
+    """
+    if isinstance(backend, emcee.backends.HDFBackend):
+        with backend.open("a") as f:
+            f.flush()
+        with open(backend.filename, "rb+") as fh:
+            os.fsync(fh.fileno())
+    else:
+        save_csv_fallback(sampler, output, param_names)
+
+
+def write_run_summary(path: Path, summary: dict[str, object]) -> Path:
+    """Atomically write the run summary as JSON."""
+    payload = json.dumps(summary, indent=2, sort_keys=True).encode("utf-8")
+    atomic_write(path, lambda fh: fh.write(payload))
+    return path
+
+
 def run_sampler(args: argparse.Namespace) -> None:
     model_spec = get_model_spec(args.model)
     param_names = model_spec["param_names"]
@@ -486,30 +835,80 @@ def run_sampler(args: argparse.Namespace) -> None:
         param_names=param_names,
         prior_bounds=prior_bounds,
     )
-    backend = make_backend(args.output, n_walkers, args.chain_name, n_dim)
-
-    sampler = emcee.EnsembleSampler(
-        nwalkers=n_walkers,
-        ndim=n_dim,
-        log_prob_fn=log_probability,
-        backend=backend,
-        args=(args.model, prior_bounds, param_names),
+    backend = make_backend(
+        args.output,
+        n_walkers,
+        args.chain_name,
+        n_dim,
+        resume=getattr(args, "resume", False),
     )
+    checkpoint_every = max(0, int(getattr(args, "checkpoint_every", 0) or 0))
+    monitor_every = max(0, int(getattr(args, "monitor_every", 0) or 0))
+    auto_stop = bool(getattr(args, "auto_stop", False))
+    converged = False
+
+    pool_kind = getattr(args, "pool", "serial")
+    with make_pool(pool_kind, getattr(args, "n_procs", None)) as pool:
+        sampler = emcee.EnsembleSampler(
+            nwalkers=n_walkers,
+            ndim=n_dim,
+            log_prob_fn=log_probability,
+            backend=backend,
+            args=(args.model, prior_bounds, param_names),
+            pool=pool,
+        )
 
-    try:
-        from tqdm.auto import tqdm
+        start_iteration = int(sampler.iteration)
+        remaining = max(0, n_steps - start_iteration)
+        initial_state = backend.get_last_sample() if start_iteration > 0 else p0
+        if start_iteration > 0:
+            print(f"Reprise depuis l'iteration {start_iteration} ({remaining} steps restants).")
+        monitor = (
+            ConvergenceMonitor(
+                param_names,
+                log_path=args.output.with_suffix(".convergence.csv"),
+                append=start_iteration > 0,
+            )
+            if monitor_every
+            else None
+        )
 
-        state = p0
-        with tqdm(total=n_steps, desc="MCMC", unit="step") as pbar:
-            for state in sampler.sample(state, iterations=n_steps, progress=False):
-                pbar.update(1)
-    except Exception:
-        sampler.run_mcmc(p0, n_steps, progress=True)
+        try:
+            from tqdm.auto import tqdm
+        except ImportError:
+            tqdm = None
+
+        pbar = tqdm(total=n_steps, initial=start_iteration, desc="MCMC", unit="step") if tqdm else None
+        try:
+            for step, _ in enumerate(
+                sampler.sample(initial_state, iterations=remaining, progress=pbar is None), start=1
+            ):
+                if pbar is not None:
+                    pbar.update(1)
+                if checkpoint_every and step % checkpoint_every == 0:
+                    checkpoint(sampler, backend, args.output, param_names)
+                if monitor is not None and sampler.iteration % monitor_every == 0:
+                    converged = monitor.update(sampler)
+                    if pbar is not None:
+                        pbar.set_postfix(tau=f"{np.max(monitor.tau):.1f}")
+                    if converged and auto_stop:
+                        break
+        finally:
+            if pbar is not None:
+                pbar.close()
+            # Also reached on interruption, so that a later --resume starts from the last step.
+            if sampler.iteration > 0:
+                checkpoint(sampler, backend, args.output, param_names)
 
     print("\nSampling termine.")
     print(f"Modele EoS: {eos_model}")
-    print(f"Walkers: {n_walkers} | Steps par walker: {n_steps}")
+    print(f"Pool: {pool_kind}")
+    print(f"Walkers: {n_walkers} | Steps par walker: {sampler.iteration}")
     print(f"Taux d'acceptation moyen: {np.mean(sampler.acceptance_fraction):.3f}")
+    if monitor is not None and monitor.tau is not None:
+        status = "atteinte" if converged else "non atteinte"
+        print(f"Convergence ({TAU_FACTOR:g} tau): {status} | tau max = {np.max(monitor.tau):.1f}")
+        print(f"Journal de convergence: {monitor.log_path}")
 
     if isinstance(backend, emcee.backends.HDFBackend):
         print(f"Chaines sauvegardees dans: {args.output}")
@@ -518,13 +917,45 @@ def run_sampler(args: argparse.Namespace) -> None:
         out_csv = save_csv_fallback(sampler, args.output, param_names)
         print(f"Backend memoire utilise. Export CSV: {out_csv}")
 
-    theta_median, burnin = summarize_bestfit_from_chain(sampler)
-    _print_bestfit_report(theta_median, burnin, param_names, args.model)
+    tau = monitor.tau if monitor is not None else None
+    theta_median, burnin = summarize_bestfit_from_chain(sampler, tau=tau)
+    report = _print_bestfit_report(theta_median, burnin, param_names, args.model)
+
+    summary_path = write_run_summary(
+        args.output.with_suffix(".summary.json"),
+        {
+            "model": eos_model,
+            "chain_file": str(args.output),
+            "chain_name": args.chain_name,
+            "n_walkers": n_walkers,
+            "n_steps": int(sampler.iteration),
+            "resumed_from": start_iteration,
+            "acceptance_fraction": float(np.mean(sampler.acceptance_fraction)),
+            "burnin": int(burnin),
+            "converged": converged,
+            "tau": None if tau is None else {name: float(value) for name, value in zip(param_names, tau)},
+            "theta_median": {name: float(value) for name, value in zip(param_names, theta_median)},
+            **report,
+        },
+    )
+    print(f"\nResume ecrit dans: {summary_path}")
 
 
 def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
+    if args.benchmark > 0:
+        theta = get_model_spec(args.model)["theta_bestfit"]
+        timing = benchmark_pipeline(theta, eos_model=args.model, n_calls=args.benchmark)
+        print(f"Modele: {normalize_model_name(args.model)} | appels: {args.benchmark}")
+        print(f"Two-pass    : {timing['two_pass_ms']:.3f} ms/appel")
+        print(f"Single-pass : {timing['single_pass_ms']:.3f} ms/appel")
+        print(f"Speed-up    : x{timing['speedup']:.2f} (|d lnL| = {timing['loglike_abs_diff']:.3e})")
+        print(
+            f"SN+BAO+CMB  : {timing['tri_probe_two_pass_ms']:.3f} -> "
+            f"{timing['tri_probe_single_pass_ms']:.3f} ms/appel (x{timing['tri_probe_speedup']:.2f})"
+        )
+        return
     run_sampler(args)
 
 
@@ -207,6 +207,14 @@ def parse_args():
     p.add_argument("--n-k", type=int, metavar="NK", help="Override # points k")
     p.add_argument("--n-a", type=int, metavar="NA", help="Override # points a")
     p.add_argument("--dry-run", action="store_true", help="Valide config et grille")
+    p.add_argument(
+        "--stacked",
+        action="store_true",
+        help="Intègre les modes k comme un seul système (Jacobien analytique)",
+    )
+    p.add_argument(
+        "--n-workers", type=int, metavar="N", help="Processus pour la grille en k"
+    )
     p.add_argument(
         "--log-level",
         default="INFO",
@@ -271,7 +279,9 @@ def main():
     # Exécution solveur
     logger.info("Exécution du solveur MCGT…")
     cs2_mat = compute_cs2(k_grid, a_vals, p)
-    phi_mat = compute_delta_phi(k_grid, a_vals, p)
+    phi_mat = compute_delta_phi(
+        k_grid, a_vals, p, stacked=args.stacked, n_workers=args.n_workers
+    )
 
     # Export brut unifié
     brut_path = Path(args.export_raw)
@@ -299,6 +299,14 @@ def parse_args():
     p.add_argument(
         "--dry-run", action="store_true", help="Construire les grilles et quitter"
     )
+    p.add_argument(
+        "--stacked",
+        action="store_true",
+        help="Intégrer les modes k comme un seul système (Jacobien analytique)",
+    )
+    p.add_argument(
+        "--n-workers", type=int, help="Nombre de processus pour la grille en k"
+    )
     p.add_argument(
         "--log-level",
         default="INFO",
@@ -378,7 +386,9 @@ def main():
         cs2_mat = compute_cs2(
             k_grid, a_vals, params
         )  # attente : shape (len(k), len(a))
-        phi_mat = compute_delta_phi(k_grid, a_vals, params)  # même shape
+        phi_mat = compute_delta_phi(
+            k_grid, a_vals, params, stacked=args.stacked, n_workers=args.n_workers
+        )  # même shape
     except Exception as e:
         logger.exception("Erreur lors de l'exécution du solveur : %s", e)
         sys.exit(1)
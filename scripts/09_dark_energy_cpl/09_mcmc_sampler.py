@@ -8,50 +8,27 @@ import configparser
 import json
 import logging
 import math
+import sys
 from pathlib import Path
 
 import numpy as np
 
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core_physics import de_density_factor, w_of_a
+from core_physics import normalize_eos_model as _normalize_eos_model
+
 C_KM_S = 299792.458
 PLANCK_R = 1.7502
 PLANCK_R_SIGMA = 0.0046
 
 
-def _normalize_eos_model(eos_model: str) -> str:
-    model = eos_model.strip()
-    if model.lower() == "cpl":
-        return "CPL"
-    if model.lower() == "jbp":
-        return "JBP"
-    if model.lower() == "wcdm":
-        return "wCDM"
-    raise ValueError(f"Unsupported eos_model={eos_model!r}. Expected CPL, JBP, or wCDM.")
-
-
 def _effective_wa(wa: float, eos_model: str) -> float:
     return 0.0 if _normalize_eos_model(eos_model) == "wCDM" else wa
 
 
-def w_of_a(a: np.ndarray, w0: float, wa: float, eos_model: str = "CPL") -> np.ndarray:
-    model = _normalize_eos_model(eos_model)
-    wa_eff = _effective_wa(wa, model)
-    if model == "CPL":
-        return w0 + wa_eff * (1.0 - a)
-    if model == "JBP":
-        return w0 + wa_eff * a * (1.0 - a)
-    return np.full_like(a, w0, dtype=float)
-
-
-def de_density_factor(a: np.ndarray, w0: float, wa: float, eos_model: str = "CPL") -> np.ndarray:
-    model = _normalize_eos_model(eos_model)
-    wa_eff = _effective_wa(wa, model)
-    if model == "CPL":
-        return a ** (-3.0 * (1.0 + w0 + wa_eff)) * np.exp(-3.0 * wa_eff * (1.0 - a))
-    if model == "JBP":
-        return a ** (-3.0 * (1.0 + w0)) * np.exp(1.5 * wa_eff * (a - 1.0) ** 2)
-    return a ** (-3.0 * (1.0 + w0))
-
-
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run tri-probe MCMC (SN+BAO+CMB).")
     parser.add_argument(
@@ -288,7 +265,7 @@ def log_likelihood_cmb(
     return -0.5 * chi2
 
 
-def log_posterior(
+def chi2_components(
     params: dict[str, float | str],
     omega_m: float,
     w0: float,
@@ -298,21 +275,40 @@ def log_posterior(
     sigma_sys: float,
     n_steps: int,
     eos_model: str = "CPL",
-) -> tuple[float, float, float, float]:
+) -> tuple[float, float, float] | None:
+    """Return (chi2_SN, chi2_BAO, chi2_CMB), or None outside the physical support."""
     omega_b = params["omega_b"]
     eos_model = _normalize_eos_model(eos_model)
     wa_eff = _effective_wa(wa, eos_model)
     if not (omega_b < omega_m < 0.6):
-        return -math.inf, math.inf, math.inf, math.inf
+        return None
     if not (-2.5 < w0 < 0.5):
-        return -math.inf, math.inf, math.inf, math.inf
+        return None
     if eos_model != "wCDM" and not (-3.0 < wa_eff < 3.0):
-        return -math.inf, math.inf, math.inf, math.inf
+        return None
 
     chi2_sn_val = chi2_sn(*sn_data, params, omega_m, w0, wa_eff, sigma_sys, n_steps, eos_model=eos_model)
     chi2_bao_val = chi2_bao(*bao_data, params, omega_m, w0, wa_eff, n_steps, eos_model=eos_model)
     chi2_cmb_val = chi2_cmb(params, omega_m, w0, wa_eff, n_steps, eos_model=eos_model)
+    return chi2_sn_val, chi2_bao_val, chi2_cmb_val
+
+
+def log_posterior(
+    params: dict[str, float | str],
+    omega_m: float,
+    w0: float,
+    wa: float,
+    sn_data: tuple[np.ndarray, np.ndarray, np.ndarray],
+    bao_data: tuple[np.ndarray, np.ndarray, np.ndarray],
+    sigma_sys: float,
+    n_steps: int,
+    eos_model: str = "CPL",
+) -> tuple[float, float, float, float]:
+    components = chi2_components(params, omega_m, w0, wa, sn_data, bao_data, sigma_sys, n_steps, eos_model)
+    if components is None:
+        return -math.inf, math.inf, math.inf, math.inf
 
+    chi2_sn_val, chi2_bao_val, chi2_cmb_val = components
     chi2_total = chi2_sn_val + chi2_bao_val + chi2_cmb_val
     return -0.5 * chi2_total, chi2_total, chi2_sn_val, chi2_bao_val
 
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+bench_phi_gr.py
+===============
+
+Micro-benchmark de la phase GR (SPA) sur la grille 09_phases_imrphenom :
+boucle historique sur les ordres PN (v**k recalculé par ordre) contre
+`mcgt.phase.phi_gr_batch` (Horner en v, couples de masses empilés),
+en float64 / float32 et noyaux NumPy / numba.
+
+Usage (exemple) :
+python scripts/09_dark_energy_cpl/bench_phi_gr.py --n-pairs 1 256 --repeat 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from mcgt.phase import _CPN, PhaseParams, _have_numba, phi_gr, phi_gr_batch
+
+
+def phi_gr_legacy(freqs: np.ndarray, m1: float, m2: float) -> np.ndarray:
+    """Implémentation historique de phi_gr (une puissance v**k par ordre PN)."""
+    M_s = (m1 + m2) * 4.925490947e-6
+    eta = m1 * m2 / (m1 + m2) ** 2
+    v = (np.pi * M_s * freqs) ** (1 / 3)
+    series = np.zeros_like(freqs)
+    for k, c_k in _CPN.items():
+        series += c_k * v**k
+    prefac = 3 / (128 * eta) * v ** (-5)
+    return -np.pi / 4 + prefac * series
+
+
+def best_time(fn, repeat: int) -> float:
+    fn()  # chauffe (chargement du cache numba, allocations)
+    timings = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - t0)
+    return min(timings)
+
+
+def parse_args(argv=None):
+    p = argparse.ArgumentParser(description="Benchmark phi_gr : boucle PN vs Horner (N, F).")
+    p.add_argument(
+        "--grid",
+        type=Path,
+        default=PROJECT_ROOT / "assets/zz-data/09_dark_energy_cpl/09_phases_imrphenom.csv",
+        help="CSV contenant la colonne f_Hz",
+    )
+    p.add_argument("--n-pairs", type=int, nargs="+", default=[1, 256], help="nombres de couples (m1, m2)")
+    p.add_argument("--repeat", type=int, default=20, help="répétitions (meilleur temps retenu)")
+    p.add_argument("--seed", type=int, default=0)
+    return p.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    freqs = np.asarray(pd.read_csv(args.grid)["f_Hz"], dtype=float)
+    rng = np.random.default_rng(args.seed)
+    backends = ["numpy"] + (["numba"] if _have_numba else [])
+    print(f"Grille : {freqs.size} fréquences ({freqs[0]:.1f}..{freqs[-1]:.1f} Hz)")
+
+    for n in args.n_pairs:
+        m1 = rng.uniform(5.0, 60.0, n)
+        m2 = rng.uniform(5.0, 60.0, n)
+        legacy = np.stack([phi_gr_legacy(freqs, a, b) for a, b in zip(m1, m2)])
+        t_ref = best_time(lambda: [phi_gr_legacy(freqs, a, b) for a, b in zip(m1, m2)], args.repeat)
+        print(f"\nN={n:<5d} boucle PN historique      : {1e6 * t_ref:10.1f} µs")
+        pairs = [PhaseParams(m1=a, m2=b, q0star=0.0, alpha=0.0) for a, b in zip(m1, m2)]
+        t_row = best_time(lambda: [phi_gr(freqs, p) for p in pairs], args.repeat)
+        print(f"N={n:<5d} phi_gr ligne à ligne      : {1e6 * t_row:10.1f} µs  (x{t_ref / t_row:5.1f})")
+        for backend in backends:
+            for dtype in (np.float64, np.float32):
+                out = phi_gr_batch(freqs, m1, m2, dtype=dtype, kernel_backend=backend)
+                err = float(np.max(np.abs(out - legacy) / np.maximum(np.abs(legacy), 1.0)))
+                t = best_time(
+                    lambda: phi_gr_batch(freqs, m1, m2, dtype=dtype, kernel_backend=backend),
+                    args.repeat,
+                )
+                print(
+                    f"N={n:<5d} {backend:5s} {np.dtype(dtype).name:7s} : "
+                    f"{1e6 * t:10.1f} µs  (x{t_ref / t:5.1f}, err. rel. max {err:.1e})"
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -40,15 +40,22 @@ except Exception:
 
 # Importer les backends locaux (doivent exister dans le dépôt)
 try:
-    from mcgt.backends.ref_phase import compute_phi_ref, ref_cache_info
+    from mcgt.backends.ref_phase import (
+        compute_phi_ref,
+        ref_cache_info,
+        scale_cache_info,
+    )
 except Exception:
     compute_phi_ref = None
     ref_cache_info = None
+    scale_cache_info = None
 
 try:
-    from mcgt.phase import phi_mcgt
+    from mcgt.phase import phi_mcgt, phi_mcgt_batch, phi_ref_batch
 except Exception:
     phi_mcgt = None
+    phi_mcgt_batch = None
+    phi_ref_batch = None
 
 # ---------------------------------------------------------------------
 # Constantes (cohérentes avec le GUIDE Chap.9/10)
@@ -144,13 +151,56 @@ def metrics_from_absdphi(absdphi: np.ndarray) -> Dict[str, Any]:
     return {"mean": mean, "p95": p95, "max": mx, "n": n}
 
 
+def compute_rebranch_k_batch(
+    phi_mcgt: np.ndarray,
+    phi_ref: np.ndarray,
+    f_hz: np.ndarray,
+    window: Tuple[float, float] = WINDOW_DEFAULT,
+) -> np.ndarray:
+    """Version (N, F) de compute_rebranch_k ; NaN pour les lignes sans point valide."""
+    fmin, fmax = window
+    mask = (
+        ((f_hz >= fmin) & (f_hz <= fmax))[None, :]
+        & np.isfinite(phi_mcgt)
+        & np.isfinite(phi_ref)
+    )
+    cycles = np.where(mask, (phi_mcgt - phi_ref) / (2.0 * np.pi), np.nan)
+    k = np.full(cycles.shape[0], np.nan)
+    valid = mask.any(axis=1)
+    if np.any(valid):
+        k[valid] = np.round(np.nanmedian(cycles[valid], axis=1))
+    return k
+
+
+def metrics_from_absdphi_batch(absdphi: np.ndarray) -> Dict[str, np.ndarray]:
+    """Version (N, F) de metrics_from_absdphi : les NaN marquent les points exclus."""
+    arr = np.asarray(absdphi, dtype=float)
+    n = np.isfinite(arr).sum(axis=1)
+    out = {key: np.full(arr.shape[0], np.nan) for key in ("mean", "p95", "max")}
+    rows = n > 0
+    if np.any(rows):
+        sub = arr[rows]
+        out["mean"][rows] = np.nanmean(sub, axis=1)
+        out["p95"][rows] = np.nanpercentile(sub, 95, axis=1, method=PCTL_METHOD)
+        out["max"][rows] = np.nanmax(sub, axis=1)
+    out["n"] = n
+    return out
+
+
 # ---------------------------------------------------------------------
 # Évaluation d'un sample (unité de travail)
 # ---------------------------------------------------------------------
 def evaluate_sample(
-    row: pd.Series, f_hz: np.ndarray, window: Tuple[float, float]
+    row: pd.Series,
+    f_hz: np.ndarray,
+    window: Tuple[float, float],
+    ref_kwargs: Dict[str, Any] | None = None,
 ) -> Dict[str, Any]:
-    """Évalue les métriques pour un sample. Aligne les phases à f_min."""
+    """
+    Évalue les métriques pour un sample. Aligne les phases à f_min.
+
+    ref_kwargs : mots-clés transmis à compute_phi_ref (ex. scale_aware).
+    """
     t0 = time.time()
     result = {}
     sid = int(row["id"])
@@ -171,7 +221,9 @@ def evaluate_sample(
         if compute_phi_ref is None:
             raise RuntimeError(ERR_CODES["REF_MISSING"])
         
-        phi_ref_raw = compute_phi_ref(f_hz, float(row["m1"]), float(row["m2"]))
+        phi_ref_raw = compute_phi_ref(
+            f_hz, float(row["m1"]), float(row["m2"]), **(ref_kwargs or {})
+        )
         
         # --- FIX ALIGNEMENT : On force la référence à commencer à 0.0 ---
         phi_ref = phi_ref_raw - phi_ref_raw[0]
@@ -224,6 +276,74 @@ def evaluate_sample(
         })
         return result
 
+def evaluate_batch(
+    rows: pd.DataFrame,
+    f_hz: np.ndarray,
+    window: Tuple[float, float],
+    ref_kwargs: Dict[str, Any] | None = None,
+) -> list[Dict[str, Any]]:
+    """
+    Évalue un bloc d'échantillons en une passe (N, F) : phase de référence une
+    fois par couple (m1, m2), puis alignement, rebranching et métriques
+    vectorisés. Mêmes résultats que evaluate_sample ligne à ligne ; en cas
+    d'échec du bloc, repli sur evaluate_sample pour isoler l'erreur.
+    """
+    if phi_mcgt_batch is None or phi_ref_batch is None or compute_phi_ref is None:
+        return [evaluate_sample(row, f_hz, window, ref_kwargs) for _, row in rows.iterrows()]
+
+    t0 = time.time()
+    try:
+        ref_raw = phi_ref_batch(
+            f_hz, rows["m1"].to_numpy(), rows["m2"].to_numpy(), **(ref_kwargs or {})
+        )
+        phi_ref = ref_raw - ref_raw[:, :1]
+        phi_m = phi_mcgt_batch(f_hz, rows, phi_ref=ref_raw)
+    except Exception:
+        return [evaluate_sample(row, f_hz, window, ref_kwargs) for _, row in rows.iterrows()]
+
+    k = compute_rebranch_k_batch(phi_m, phi_ref, f_hz, window=window)
+    in_window = ((f_hz >= window[0]) & (f_hz <= window[1]))[None, :]
+    absd = np.abs(delta_phi_principal(phi_m, phi_ref, np.nan_to_num(k)[:, None]))
+    met = metrics_from_absdphi_batch(np.where(in_window, absd, np.nan))
+    wall = float(time.time() - t0) / max(len(rows), 1)
+
+    results = []
+    for i, (_, row) in enumerate(rows.iterrows()):
+        result = {
+            "id": int(row["id"]),
+            "m1": float(row["m1"]),
+            "m2": float(row["m2"]),
+            "q0star": float(row["q0star"]),
+            "alpha": float(row["alpha"]),
+            "phi0": float(row.get("phi0", 0.0)),
+            "tc": float(row.get("tc", 0.0)),
+            "dist": float(row.get("dist", 1000.0)),
+            "incl": float(row.get("incl", 0.0)),
+        }
+        if not np.isfinite(k[i]):
+            result.update({
+                "status": "failed",
+                "error_code": ERR_CODES["NAN_IN_WINDOW"],
+                "wall_time_s": wall,
+                "score": float("nan"),
+            })
+        else:
+            result.update({
+                "k": int(k[i]),
+                "mean_20_300": float(met["mean"][i]),
+                "p95_20_300": float(met["p95"][i]),
+                "max_20_300": float(met["max"][i]),
+                "n_20_300": int(met["n"][i]),
+                "status": "ok",
+                "error_code": "",
+                "wall_time_s": wall,
+                "model": row.get("model", "default"),
+                "score": float(met["p95"][i]),
+            })
+        results.append(result)
+    return results
+
+
 # ---------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------
@@ -250,7 +370,7 @@ def parse_args(argv=None):
         help="JSON top-K (sortie)",
     )
     p.add_argument(
-        "--batch", type=int, default=256, help="taille de batch pour logging"
+        "--batch", type=int, default=256, help="taille des blocs évalués en (N, F)"
     )
     p.add_argument("--n-workers", type=int, default=8, help="n_workers joblib")
     p.add_argument("--K", type=int, default=50, help="Top-K à sauver dans out-best")
@@ -270,6 +390,12 @@ def parse_args(argv=None):
         action="store_true",
         help="Autorise l'écrasement des fichiers de sortie",
     )
+    p.add_argument(
+        "--ref-scale-tol",
+        type=float,
+        default=None,
+        help="active le cache φ_ref à l'échelle (Mf, η) avec cette tolérance [rad]",
+    )
     p.add_argument("--log-level", default="INFO", help="Niveau de log")
     return p.parse_args(argv)
 
@@ -292,6 +418,12 @@ def main(argv=None):
             "Forward phi_mcgt introuvable. Assurez-vous que mcgt.phase.phi_mcgt est importable."
         )
 
+    # Cache à l'échelle : demandé explicitement à chaque appel, workers compris
+    ref_kwargs: Dict[str, Any] = {}
+    if args.ref_scale_tol is not None:
+        ref_kwargs = {"scale_aware": True, "scale_tol": float(args.ref_scale_tol)}
+        logging.info("Cache φ_ref à l'échelle actif (tol=%.3g rad)", args.ref_scale_tol)
+
     # charger grille f_Hz
     df_ref = pd.read_csv(args.ref_grid)
     if "f_Hz" not in df_ref.columns:
@@ -313,10 +445,10 @@ def main(argv=None):
     n_samples = len(samples)
     logging.info("Nombre d'échantillons à évaluer : %d", n_samples)
 
-    # prepare parallel evaluation
+    # évaluation par blocs (N, F), blocs répartis sur les workers
     window = WINDOW_DEFAULT
-    work = []
-    # joblib Parallel with chunksize automatic
+    batch = max(int(args.batch), 1)
+    chunks = [samples.iloc[i : i + batch] for i in range(0, n_samples, batch)]
     logging.info(
         "Démarrage évaluation : batch=%d n_workers=%d",
         args.batch,
@@ -324,20 +456,23 @@ def main(argv=None):
     )
     try:
         if Parallel is not None and args.n_workers > 1:
-            results = Parallel(n_jobs=args.n_workers, backend="loky")(
-                delayed(evaluate_sample)(row, f_hz, window)
-                for _, row in samples.iterrows()
+            blocks = Parallel(n_jobs=args.n_workers, backend="loky")(
+                delayed(evaluate_batch)(chunk, f_hz, window, ref_kwargs) for chunk in chunks
             )
         else:
             if Parallel is None:
                 logging.warning(
                     "joblib indisponible: fallback en mode séquentiel (n_workers=1)."
                 )
-            results = [evaluate_sample(row, f_hz, window) for _, row in samples.iterrows()]
+            blocks = [evaluate_batch(chunk, f_hz, window, ref_kwargs) for chunk in chunks]
+        results = [res for block in blocks for res in block]
     except KeyboardInterrupt:
         logging.error("Interruption clavier reçue ; arrêt.")
         raise
 
+    if scale_cache_info is not None and scale_cache_info():
+        logging.info("Cache φ_ref à l'échelle (processus principal) : %s", scale_cache_info())
+
     # construire DataFrame résultats
     df_out = pd.DataFrame(results)
     # colonne ordering
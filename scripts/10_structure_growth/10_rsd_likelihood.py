@@ -6,64 +6,27 @@ from __future__ import annotations
 import argparse
 import configparser
 import math
+import sys
 from pathlib import Path
 
 import numpy as np
-from scipy.integrate import solve_ivp
 
-DEFAULT_DATA = Path("assets/zz-data/10_structure_growth/10_rsd_data.csv")
-DEFAULT_CONFIG = Path("config/mcgt-global-config.ini")
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
 
+from core_physics import de_density_factor, w_of_a
+from core_physics import normalize_eos_model as _normalize_eos_model
+from perturbations import solve_growth
 
-def _normalize_eos_model(eos_model: str) -> str:
-    model = eos_model.strip()
-    if model.lower() == "cpl":
-        return "CPL"
-    if model.lower() == "jbp":
-        return "JBP"
-    if model.lower() == "wcdm":
-        return "wCDM"
-    raise ValueError(f"Unsupported eos_model={eos_model!r}. Expected CPL, JBP, or wCDM.")
+DEFAULT_DATA = Path("assets/zz-data/10_structure_growth/10_rsd_data.csv")
+DEFAULT_CONFIG = Path("config/mcgt-global-config.ini")
 
 
 def _effective_wa(w_a: float, eos_model: str) -> float:
     return 0.0 if _normalize_eos_model(eos_model) == "wCDM" else w_a
 
 
-def w_of_a(
-    a: np.ndarray | float,
-    w_0: float,
-    w_a: float,
-    eos_model: str = "CPL",
-) -> np.ndarray | float:
-    """Dark-energy equation of state w(a) for the supported background models."""
-    a_arr = np.asarray(a, dtype=float)
-    model = _normalize_eos_model(eos_model)
-    w_a_eff = _effective_wa(w_a, model)
-    if model == "CPL":
-        return w_0 + w_a_eff * (1.0 - a_arr)
-    if model == "JBP":
-        return w_0 + w_a_eff * a_arr * (1.0 - a_arr)
-    return np.full_like(a_arr, w_0, dtype=float)
-
-
-def de_density_factor(
-    a: np.ndarray | float,
-    w_0: float,
-    w_a: float,
-    eos_model: str = "CPL",
-) -> np.ndarray | float:
-    """rho_de(a) / rho_de(a=1) for the supported dark-energy models."""
-    a_arr = np.asarray(a, dtype=float)
-    model = _normalize_eos_model(eos_model)
-    w_a_eff = _effective_wa(w_a, model)
-    if model == "CPL":
-        return a_arr ** (-3.0 * (1.0 + w_0 + w_a_eff)) * np.exp(-3.0 * w_a_eff * (1.0 - a_arr))
-    if model == "JBP":
-        return a_arr ** (-3.0 * (1.0 + w_0)) * np.exp(1.5 * w_a_eff * (a_arr - 1.0) ** 2)
-    return a_arr ** (-3.0 * (1.0 + w_0))
-
-
 def e2_cpl(
     a: np.ndarray | float,
     omega_m: float,
@@ -78,39 +41,6 @@ def e2_cpl(
     return omega_m * a_arr ** -3 + omega_de * de
 
 
-def dlnh_da(a: float, omega_m: float, w_0: float, w_a: float, eos_model: str = "CPL") -> float:
-    """Derivative d ln(H)/da."""
-    e2 = float(e2_cpl(a, omega_m, w_0, w_a, eos_model=eos_model))
-    if e2 <= 0:
-        return 0.0
-    omega_de = 1.0 - omega_m
-    de = float(de_density_factor(a, w_0, w_a, eos_model=eos_model))
-    dln_de_da = -3.0 * (1.0 + float(w_of_a(a, w_0, w_a, eos_model=eos_model))) / a
-    de_prime = omega_de * de * dln_de_da
-    e2_prime = -3.0 * omega_m * a ** -4 + de_prime
-    return 0.5 * e2_prime / e2
-
-
-def _growth_ode(
-    a: float,
-    y: np.ndarray,
-    omega_m: float,
-    w_0: float,
-    w_a: float,
-    eos_model: str = "CPL",
-) -> np.ndarray:
-    """Linear growth ODE in scale factor a for y=[delta, d(delta)/da]."""
-    delta, ddelta_da = y
-    e2 = float(e2_cpl(a, omega_m, w_0, w_a, eos_model=eos_model))
-    if e2 <= 0:
-        return np.array([ddelta_da, 0.0], dtype=float)
-
-    source = 1.5 * omega_m / (a ** 5 * e2)
-    friction = 3.0 / a + dlnh_da(a, omega_m, w_0, w_a, eos_model=eos_model)
-    d2delta_da2 = -friction * ddelta_da + source * delta
-    return np.array([ddelta_da, d2delta_da2], dtype=float)
-
-
 def solve_growth_delta(
     omega_m: float,
     h_0: float,
@@ -121,37 +51,24 @@ def solve_growth_delta(
     n_grid: int = 4000,
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
-    Solve linear matter growth for delta(a).
+    Solve linear matter growth for delta(a) with the shared `perturbations` growth engine.
 
     h_0 is kept explicit for API consistency with cosmological parameter sets.
     """
     _ = h_0
     a_grid = np.geomspace(a_min, 1.0, n_grid)
-
-    y0 = np.array([a_min, 1.0], dtype=float)
-    sol = solve_ivp(
-        fun=lambda a, y: _growth_ode(a, y, omega_m, w_0, w_a, eos_model=eos_model),
-        t_span=(a_min, 1.0),
-        y0=y0,
-        t_eval=a_grid,
-        method="RK45",
+    # Normalize growth to delta(a=1)=1 for stable sigma8(z) scaling.
+    growth = solve_growth(
+        a_grid,
+        omega_m,
+        w_0=w_0,
+        w_a=w_a,
+        eos_model=_normalize_eos_model(eos_model),
+        omega_de=1.0 - omega_m,
         rtol=1e-7,
         atol=1e-9,
-    )
-    if not sol.success:
-        raise RuntimeError(f"Growth ODE failed: {sol.message}")
-
-    delta = sol.y[0]
-    ddelta_da = sol.y[1]
-
-    # Normalize growth to delta(a=1)=1 for stable sigma8(z) scaling.
-    delta0 = float(delta[-1])
-    if delta0 <= 0:
-        raise RuntimeError("Non-physical growth solution: delta(a=1) <= 0")
-
-    delta_norm = delta / delta0
-    ddelta_da_norm = ddelta_da / delta0
-    return a_grid, delta_norm, ddelta_da_norm
+    ).normalized()
+    return a_grid, growth.delta, growth.ddelta_da
 
 
 def growth_rate_f(a: np.ndarray, delta: np.ndarray, ddelta_da: np.ndarray) -> np.ndarray:
@@ -5,10 +5,16 @@ from __future__ import annotations
 
 import argparse
 import configparser
+import sys
 from pathlib import Path
 
 import numpy as np
-from scipy.integrate import solve_ivp
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import perturbations
 
 
 DEFAULT_A_INIT = 1.0e-3
@@ -61,18 +67,6 @@ def load_cosmology(config_path: Path) -> dict[str, float]:
     return {"omega_m0": omega_m0, "omega_de0": omega_de0, "alpha": pert.getfloat("alpha")}
 
 
-def e2_lcdm(a: float, omega_m0: float, omega_de0: float) -> float:
-    return omega_m0 * a ** -3 + omega_de0
-
-
-def dlnh_da(a: float, omega_m0: float, omega_de0: float) -> float:
-    return 0.5 * (-3.0 * omega_m0 * a ** -4) / e2_lcdm(a, omega_m0, omega_de0)
-
-
-def omega_m_of_a(a: float, omega_m0: float, omega_de0: float) -> float:
-    return omega_m0 * a ** -3 / e2_lcdm(a, omega_m0, omega_de0)
-
-
 def q0star_of_k(k_mode: float, q0star_safe: float, q0star_max: float, k_c: float) -> float:
     return q0star_safe + (q0star_max - q0star_safe) / (1.0 + (k_mode / k_c) ** 2)
 
@@ -82,24 +76,22 @@ def g_eff(a: float, q0star: float, alpha: float) -> float:
     return float(np.exp(2.0 * alpha * q0star * a ** (-alpha_eff)))
 
 
-def solve_growth(a_eval: np.ndarray, omega_m0: float, omega_de0: float, mu_fn) -> np.ndarray:
-    def rhs(a: float, y: np.ndarray) -> np.ndarray:
-        growth, growth_prime = y
-        friction = 3.0 / a + dlnh_da(a, omega_m0, omega_de0)
-        source = 1.5 * omega_m_of_a(a, omega_m0, omega_de0) / (a * a)
-        return np.array([growth_prime, -friction * growth_prime + source * mu_fn(a) * growth])
+def mu_k_dependent(a: float, k: float, alpha: float, q0star_safe: float, q0star_max: float, k_c: float) -> float:
+    """Scale-dependent mu(a, k) hook for the shared growth engine."""
+    return g_eff(a, q0star_of_k(k, q0star_safe, q0star_max, k_c), alpha)
+
 
-    sol = solve_ivp(
-        rhs,
-        (float(a_eval[0]), float(a_eval[-1])),
-        np.array([a_eval[0], 1.0]),
-        t_eval=a_eval,
+def solve_growth(a_eval: np.ndarray, omega_m0: float, omega_de0: float, mu_fn=None) -> np.ndarray:
+    """Growing-mode D(a) from the shared `perturbations` growth engine (GR when `mu_fn` is None)."""
+    mu = None if mu_fn is None else (lambda a, _k: mu_fn(a))
+    return perturbations.solve_growth(
+        a_eval,
+        omega_m0,
+        omega_de=omega_de0,
+        mu=mu,
         rtol=1.0e-8,
         atol=1.0e-10,
-    )
-    if not sol.success:
-        raise RuntimeError(sol.message)
-    return sol.y[0]
+    ).delta
 
 
 def estimate_s8(s8_ref: float, d_gr_today: float, d_model_today: float) -> float:
@@ -113,23 +105,25 @@ def main() -> int:
     a_out = np.linspace(args.a_min, args.a_max, args.n_a)
     a_grid = np.concatenate(([args.a_init], a_out)) if args.a_init < args.a_min else a_out
 
-    d_gr = solve_growth(a_grid, cfg["omega_m0"], cfg["omega_de0"], lambda a: 1.0)[-len(a_out) :]
+    d_gr = solve_growth(a_grid, cfg["omega_m0"], cfg["omega_de0"], None)[-len(a_out) :]
 
     q_lss = q0star_of_k(args.k_lss, args.q0star_safe, args.q0star_max, args.k_c)
     q_gw = q0star_of_k(args.k_gw, args.q0star_safe, args.q0star_max, args.k_c)
 
-    d_lss = solve_growth(
-        a_grid,
-        cfg["omega_m0"],
-        cfg["omega_de0"],
-        lambda a: g_eff(a, q_lss, alpha),
-    )[-len(a_out) :]
-    d_gw = solve_growth(
-        a_grid,
-        cfg["omega_m0"],
-        cfg["omega_de0"],
-        lambda a: g_eff(a, q_gw, alpha),
-    )[-len(a_out) :]
+    mu_key = ("k_dependent", alpha, args.q0star_safe, args.q0star_max, args.k_c)
+    d_lss, d_gw = (
+        perturbations.solve_growth(
+            a_grid,
+            cfg["omega_m0"],
+            omega_de=cfg["omega_de0"],
+            mu=lambda a, k: mu_k_dependent(a, k, alpha, args.q0star_safe, args.q0star_max, args.k_c),
+            k=k_mode,
+            mu_key=mu_key,
+            rtol=1.0e-8,
+            atol=1.0e-10,
+        ).delta[-len(a_out) :]
+        for k_mode in (args.k_lss, args.k_gw)
+    )
 
     s8_lss = estimate_s8(args.s8_ref, d_gr[-1], d_lss[-1])
     s8_gw = estimate_s8(args.s8_ref, d_gr[-1], d_gw[-1])
@@ -5,10 +5,16 @@ from __future__ import annotations
 
 import argparse
 import configparser
+import sys
 from pathlib import Path
 
 import numpy as np
-from scipy.integrate import solve_ivp
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import perturbations
 
 
 DEFAULT_A_INIT = 1.0e-3
@@ -77,18 +83,6 @@ def load_cosmology(config_path: Path) -> dict[str, float]:
     }
 
 
-def e2_lcdm(a: float, omega_m0: float, omega_de0: float) -> float:
-    return omega_m0 * a ** -3 + omega_de0
-
-
-def dlnh_da(a: float, omega_m0: float, omega_de0: float) -> float:
-    return 0.5 * (-3.0 * omega_m0 * a ** -4) / e2_lcdm(a, omega_m0, omega_de0)
-
-
-def omega_m_of_a(a: float, omega_m0: float, omega_de0: float) -> float:
-    return omega_m0 * a ** -3 / e2_lcdm(a, omega_m0, omega_de0)
-
-
 def logistic_step(a: float, a_trigger: float, delta_a: float) -> float:
     x = np.clip((a - a_trigger) / delta_a, -60.0, 60.0)
     return 1.0 / (1.0 + np.exp(-x))
@@ -114,24 +108,17 @@ def g_eff(a: float, q0star: float, alpha: float) -> float:
     return float(np.exp(2.0 * beta_eff))
 
 
-def solve_growth(a_eval: np.ndarray, omega_m0: float, omega_de0: float, mu_fn) -> np.ndarray:
-    def rhs(a: float, y: np.ndarray) -> np.ndarray:
-        growth, growth_prime = y
-        friction = 3.0 / a + dlnh_da(a, omega_m0, omega_de0)
-        source = 1.5 * omega_m_of_a(a, omega_m0, omega_de0) / (a * a)
-        return np.array([growth_prime, -friction * growth_prime + source * mu_fn(a) * growth])
-
-    sol = solve_ivp(
-        rhs,
-        (float(a_eval[0]), float(a_eval[-1])),
-        np.array([a_eval[0], 1.0]),
-        t_eval=a_eval,
+def solve_growth(a_eval: np.ndarray, omega_m0: float, omega_de0: float, mu_fn=None) -> np.ndarray:
+    """Growing-mode D(a) from the shared `perturbations` growth engine (GR when `mu_fn` is None)."""
+    mu = None if mu_fn is None else (lambda a, _k: mu_fn(a))
+    return perturbations.solve_growth(
+        a_eval,
+        omega_m0,
+        omega_de=omega_de0,
+        mu=mu,
         rtol=1.0e-8,
         atol=1.0e-10,
-    )
-    if not sol.success:
-        raise RuntimeError(sol.message)
-    return sol.y[0]
+    ).delta
 
 
 def estimate_s8(s8_ref: float, d_gr_today: float, d_model_today: float) -> float:
@@ -237,7 +224,7 @@ def main() -> int:
     a_out = np.linspace(args.a_min, args.a_max, args.n_a)
     a_grid = np.concatenate(([args.a_init], a_out)) if args.a_init < args.a_min else a_out
 
-    d_gr = solve_growth(a_grid, config["omega_m0"], config["omega_de0"], lambda a: 1.0)[-len(a_out) :]
+    d_gr = solve_growth(a_grid, config["omega_m0"], config["omega_de0"], None)[-len(a_out) :]
 
     d_safe = solve_growth(
         a_grid,
@@ -14,10 +14,17 @@ import configparser
 import json
 import logging
 import math
+import sys
 from pathlib import Path
 
 import numpy as np
 
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import perturbations
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -38,7 +45,7 @@ def parse_args() -> argparse.Namespace:
         "--growth-steps",
         type=int,
         default=2000,
-        help="Number of steps for growth ODE integration",
+        help="Number of scale-factor points of the growth solution",
     )
     parser.add_argument(
         "--w0",
@@ -157,29 +164,6 @@ def transfer_eisenstein_hu(k: np.ndarray, omega_m: float, omega_b: float, h: flo
     return L0 / (L0 + C0 * q * q)
 
 
-def e2_cpl(a: float, omega_m: float, omega_de: float, w0: float, wa: float) -> float:
-    if a <= 0:
-        return math.inf
-    de_factor = a ** (-3.0 * (1.0 + w0 + wa)) * math.exp(-3.0 * wa * (1.0 - a))
-    return omega_m * a ** -3 + omega_de * de_factor
-
-
-def dlnE_da(a: float, omega_m: float, omega_de: float, w0: float, wa: float) -> float:
-    e2 = e2_cpl(a, omega_m, omega_de, w0, wa)
-    if e2 <= 0:
-        return 0.0
-    de_factor = a ** (-3.0 * (1.0 + w0 + wa)) * math.exp(-3.0 * wa * (1.0 - a))
-    dlnf_da = -3.0 * (1.0 + w0 + wa) / a + 3.0 * wa
-    de_prime = omega_de * de_factor * dlnf_da
-    e2_prime = -3.0 * omega_m * a ** -4 + de_prime
-    return 0.5 * e2_prime / e2
-
-
-def omega_m_a(a: float, omega_m: float, omega_de: float, w0: float, wa: float) -> float:
-    e2 = e2_cpl(a, omega_m, omega_de, w0, wa)
-    return omega_m * a ** -3 / e2
-
-
 def integrate_growth(
     omega_m: float,
     omega_de: float,
@@ -189,35 +173,18 @@ def integrate_growth(
     a_init: float = 1e-3,
     a_final: float = 1.0,
 ) -> tuple[np.ndarray, np.ndarray]:
+    """CPL growth factor D(a) on `n_steps` linear a points from the shared growth engine."""
     a_grid = np.linspace(a_init, a_final, n_steps)
-    D = np.zeros_like(a_grid)
-    dD = np.zeros_like(a_grid)
-
-    D[0] = a_init
-    dD[0] = 1.0
-
-    for i in range(1, n_steps):
-        a = a_grid[i - 1]
-        h = a_grid[i] - a_grid[i - 1]
-
-        def rhs(a_val: float, y: np.ndarray) -> np.ndarray:
-            D_val, dD_val = y
-            term = (3.0 / a_val) + dlnE_da(a_val, omega_m, omega_de, w0, wa)
-            om_a = omega_m_a(a_val, omega_m, omega_de, w0, wa)
-            ddD = -term * dD_val + 1.5 * om_a * D_val / (a_val * a_val)
-            return np.array([dD_val, ddD])
-
-        y = np.array([D[i - 1], dD[i - 1]])
-        k1 = rhs(a, y)
-        k2 = rhs(a + 0.5 * h, y + 0.5 * h * k1)
-        k3 = rhs(a + 0.5 * h, y + 0.5 * h * k2)
-        k4 = rhs(a + h, y + h * k3)
-        y_next = y + (h / 6.0) * (k1 + 2.0 * k2 + 2.0 * k3 + k4)
-
-        D[i] = y_next[0]
-        dD[i] = y_next[1]
-
-    return a_grid, D
+    growth = perturbations.solve_growth(
+        a_grid,
+        omega_m,
+        w_0=w0,
+        w_a=wa,
+        omega_de=omega_de,
+        rtol=1.0e-10,
+        atol=1.0e-13,
+    )
+    return a_grid, growth.delta
 
 
 def sigma8_from_pk(k: np.ndarray, pk: np.ndarray, h: float) -> float:
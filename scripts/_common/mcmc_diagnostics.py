@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""Shared MCMC convergence diagnostics (dependency-light, no plotting imports)."""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def split_rhat(chains: np.ndarray) -> np.ndarray:
+    n_steps, n_walkers, ndim = chains.shape
+    if n_steps < 4:
+        return np.full(ndim, np.nan)
+    half = n_steps // 2
+    split = np.concatenate([chains[:half], chains[half : 2 * half]], axis=1)  # (half, 2w, d)
+    n = split.shape[0]
+    m = split.shape[1]
+    means = split.mean(axis=0)
+    vars_ = split.var(axis=0, ddof=1)
+    mean_global = means.mean(axis=0)
+    B = n * ((means - mean_global) ** 2).sum(axis=0) / max(m - 1, 1)
+    W = vars_.mean(axis=0)
+    var_hat = ((n - 1) / n) * W + B / n
+    return np.sqrt(var_hat / W)
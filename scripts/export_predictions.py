@@ -10,6 +10,8 @@ from pathlib import Path
 
 import emcee
 import numpy as np
+import perturbations
+from result_store import ResultStore
 from scripts._common.release_v400 import (
     LCDM_OMEGA_M,
     PLANCK18_H0,
@@ -33,6 +35,9 @@ DEFAULT_Z_NORM = 1000.0
 DEFAULT_LCDM_OMEGA_M = LCDM_OMEGA_M
 DEFAULT_LCDM_H0 = PLANCK18_H0
 
+# Chain medians and growth histories are memoized across invocations.
+RESULT_STORE = ResultStore()
+
 # Fallback baseline if the chain is unavailable.
 FALLBACK_BESTFIT = {
     "omega_m": PTMG_OMEGA_M,
@@ -125,18 +130,34 @@ def _estimate_burnin(reader: emcee.backends.HDFBackend, burnin_frac: float = 0.3
         return burnin_fallback
 
 
+def _chain_medians(chain_path: Path, chain_name: str) -> np.ndarray:
+    reader = emcee.backends.HDFBackend(str(chain_path), name=chain_name)
+    burnin = _estimate_burnin(reader)
+    samples = reader.get_chain(discard=burnin, flat=True)
+    if samples.size == 0:
+        samples = reader.get_chain(flat=True)
+    return np.median(samples, axis=0)
+
+
 def load_bestfit_params(chain_path: Path, chain_name: str) -> tuple[dict[str, float], str]:
     """Load best-fit medians from chain; fallback to fixed values if unavailable."""
     if not chain_path.exists():
         return dict(FALLBACK_BESTFIT), "fallback_constants"
 
     try:
-        reader = emcee.backends.HDFBackend(str(chain_path), name=chain_name)
-        burnin = _estimate_burnin(reader)
-        samples = reader.get_chain(discard=burnin, flat=True)
-        if samples.size == 0:
-            samples = reader.get_chain(flat=True)
-        med = np.median(samples, axis=0)
+        # The chain is identified by its size and mtime: rewriting it invalidates the entry.
+        stat = chain_path.stat()
+        med = RESULT_STORE.get_or_compute(
+            "export_chain_medians",
+            {
+                "chain": str(chain_path.resolve()),
+                "name": chain_name,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+            },
+            lambda: _chain_medians(chain_path, chain_name),
+            code=(__file__,),
+        )
         ndim = int(med.shape[0])
 
         if ndim == 5:
@@ -257,23 +278,37 @@ def compute_k_lss_step_outputs(
     growth_mod,
     k_growth_mod,
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
-    a_grid_bg, delta_lcdm, ddelta_lcdm = growth_mod.solve_growth_delta(
-        omega_m=omega_m,
-        h_0=h_0,
-        w_0=-1.0,
-        w_a=0.0,
-        eos_model="CPL",
-    )
-    a_grid = a_grid_bg
-    mu_fn = lambda a: k_growth_mod.g_eff(a, q0star, alpha)
-    delta_model = k_growth_mod.solve_growth(
-        a_grid,
-        omega_m,
-        1.0 - omega_m,
-        mu_fn,
+    def solve() -> dict[str, np.ndarray]:
+        a_grid_bg, delta_lcdm, ddelta_lcdm = growth_mod.solve_growth_delta(
+            omega_m=omega_m,
+            h_0=h_0,
+            w_0=-1.0,
+            w_a=0.0,
+            eos_model="CPL",
+        )
+        mu_fn = lambda a: k_growth_mod.g_eff(a, q0star, alpha)
+        delta_model = k_growth_mod.solve_growth(
+            a_grid_bg,
+            omega_m,
+            1.0 - omega_m,
+            mu_fn,
+        )
+        ddelta_model = np.gradient(delta_model, a_grid_bg, edge_order=2)
+        return {
+            "a": a_grid_bg,
+            "delta_model": delta_model,
+            "ddelta_model": ddelta_model,
+            "delta_lcdm": delta_lcdm,
+            "ddelta_lcdm": ddelta_lcdm,
+        }
+
+    out = RESULT_STORE.get_or_compute(
+        "export_k_lss_step_growth",
+        {"omega_m": omega_m, "h_0": h_0, "alpha": alpha, "q0star": q0star},
+        solve,
+        code=(perturbations, growth_mod.__file__, k_growth_mod.__file__),
     )
-    ddelta_model = np.gradient(delta_model, a_grid, edge_order=2)
-    return a_grid, delta_model, ddelta_model, delta_lcdm, ddelta_lcdm
+    return out["a"], out["delta_model"], out["ddelta_model"], out["delta_lcdm"], out["ddelta_lcdm"]
 
 
 def normalize_growth_at_redshift(
@@ -27,7 +27,6 @@ if local_tex not in texinputs.split(":"):
 import matplotlib
 import numpy as np
 import pandas as pd
-from scipy.integrate import solve_ivp
 
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt
@@ -37,6 +36,8 @@ C_KM_S = 299792.458
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+import perturbations
+from result_store import ResultStore
 from scripts._common.style import apply_manuscript_defaults
 from scripts._common.release_v400 import PTMG_H0, PTMG_OMEGA_M, PTMG_W0, PTMG_WA
 
@@ -53,6 +54,9 @@ CH08_FIG_DIR = ROOT / "assets" / "zz-figures" / "08_sound_horizon"
 PHASE3_LOG = ROOT / "phase3_lss_geometry_report.txt"
 PHASE3_JSON = ROOT / "phase3_lss_geometry_report.json"
 
+# Growth histories and acoustic tables are memoized across report runs.
+RESULT_STORE = ResultStore()
+
 apply_manuscript_defaults(usetex=True)
 
 plt.rcParams.update(
@@ -188,23 +192,6 @@ def e2_cpl(z: np.ndarray | float, cosmo: Cosmology, *, w0: float | None = None,
     )
 
 
-def _dlnh_da(a: float, cosmo: Cosmology) -> float:
-    z = 1.0 / a - 1.0
-    delta = max(1.0e-5 * a, 1.0e-7)
-    a_lo = max(a - delta, 1.0e-6)
-    a_hi = min(a + delta, 1.0)
-    z_lo = 1.0 / a_lo - 1.0
-    z_hi = 1.0 / a_hi - 1.0
-    ln_h_lo = 0.5 * np.log(e2_cpl(z_lo, cosmo))
-    ln_h_hi = 0.5 * np.log(e2_cpl(z_hi, cosmo))
-    return float((ln_h_hi - ln_h_lo) / (a_hi - a_lo))
-
-
-def omega_m_of_a(a: float, cosmo: Cosmology) -> float:
-    z = 1.0 / a - 1.0
-    return float(cosmo.omega_m * (1.0 + z) ** 3 / e2_cpl(z, cosmo))
-
-
 def solve_ch06_growth(cosmo: Cosmology, s8_branch: dict[str, float]) -> dict[str, float]:
     CH06_DATA_DIR.mkdir(parents=True, exist_ok=True)
     CH06_FIG_DIR.mkdir(parents=True, exist_ok=True)
@@ -224,34 +211,48 @@ def solve_ch06_growth(cosmo: Cosmology, s8_branch: dict[str, float]) -> dict[str
         late = late_amp * a ** late_power
         return 1.0 + early - late
 
-    def growth_rhs(a: float, y: np.ndarray, modified: bool) -> np.ndarray:
-        growth, growth_prime = y
-        friction = 3.0 / a + _dlnh_da(a, cosmo)
-        source = 1.5 * omega_m_of_a(a, cosmo) / (a * a)
-        mu = mu_eff(a) if modified else 1.0
-        return np.array([growth_prime, -friction * growth_prime + source * mu * growth])
-
-    def integrate(modified: bool) -> np.ndarray:
-        sol = solve_ivp(
-            lambda a, y: growth_rhs(a, y, modified),
-            (float(a_grid[0]), float(a_grid[-1])),
-            np.array([a_grid[0], 1.0]),
-            t_eval=a_grid,
+    def integrate(modified: bool) -> perturbations.GrowthSolution:
+        return perturbations.solve_growth(
+            a_grid,
+            cosmo.omega_m,
+            w_0=cosmo.w0,
+            w_a=cosmo.wa,
+            omega_de=cosmo.omega_de,
+            omega_r=cosmo.omega_r,
+            mu=(lambda a, _k: mu_eff(a)) if modified else None,
             rtol=1.0e-9,
             atol=1.0e-11,
-            method="RK45",
         )
-        if not sol.success:
-            raise RuntimeError(sol.message)
-        return sol.y
 
-    lcdm = integrate(False)
-    psitmg_raw = integrate(True)
+    def integrate_both() -> dict[str, np.ndarray]:
+        lcdm, modified = integrate(False), integrate(True)
+        return {
+            "delta_lcdm": lcdm.delta,
+            "ddelta_lcdm": lcdm.ddelta_da,
+            "delta_psitmg": modified.delta,
+            "ddelta_psitmg": modified.ddelta_da,
+        }
+
+    kernel = {
+        "a_turn": a_turn,
+        "early_amp": early_amp,
+        "early_power": early_power,
+        "late_amp": late_amp,
+        "late_power": late_power,
+    }
+    stored = RESULT_STORE.get_or_compute(
+        "phase3_ch06_growth",
+        {"cosmology": vars(cosmo), "a_grid": a_grid, "kernel": kernel},
+        integrate_both,
+        code=(perturbations, __file__),
+    )
+    lcdm = perturbations.GrowthSolution(a_grid, stored["delta_lcdm"], stored["ddelta_lcdm"])
+    psitmg_raw = perturbations.GrowthSolution(a_grid, stored["delta_psitmg"], stored["ddelta_psitmg"])
 
-    d_lcdm = lcdm[0]
-    d_psitmg_raw = psitmg_raw[0]
-    f_lcdm = a_grid * lcdm[1] / d_lcdm
-    f_psitmg = a_grid * psitmg_raw[1] / d_psitmg_raw
+    d_lcdm = lcdm.delta
+    d_psitmg_raw = psitmg_raw.delta
+    f_lcdm = lcdm.growth_rate
+    f_psitmg = psitmg_raw.growth_rate
 
     final_ratio_raw = float(d_psitmg_raw[-1] / d_lcdm[-1])
     target_ratio = float(s8_branch["s8_lss"] / s8_branch["s8_gw"])
@@ -499,16 +500,36 @@ def solve_ch08_sound_horizon(cosmo: Cosmology) -> dict[str, float]:
         )
 
     z_grid = np.linspace(900.0, 1400.0, 240)
-    rs_lcdm = sound_horizon_at_z(cosmo, z_grid, z_max)
-    rs_psitmg = sound_horizon_at_z(cosmo, z_grid, z_max, preboost=preboost)
+
+    def acoustic_tables() -> dict[str, np.ndarray]:
+        return {
+            "rs_lcdm": sound_horizon_at_z(cosmo, z_grid, z_max),
+            "rs_psitmg": sound_horizon_at_z(cosmo, z_grid, z_max, preboost=preboost),
+            "dm_lcdm": comoving_distance_to_rec(cosmo, z_rec),
+            "dm_psitmg_raw": comoving_distance_to_rec(cosmo, z_rec, preboost=preboost),
+        }
+
+    tables = RESULT_STORE.get_or_compute(
+        "phase3_ch08_acoustic",
+        {
+            "cosmology": vars(cosmo),
+            "z_grid": z_grid,
+            "z_max": z_max,
+            "preboost": {"amp": boost_amp, "z_pivot": z_pivot, "width": width},
+        },
+        acoustic_tables,
+        code=(__file__,),
+    )
+    rs_lcdm = tables["rs_lcdm"]
+    rs_psitmg = tables["rs_psitmg"]
 
     delta_rs = rs_lcdm - rs_psitmg
     rs_rec_lcdm = float(np.interp(z_rec, z_grid, rs_lcdm))
     rs_rec_psitmg = float(np.interp(z_rec, z_grid, rs_psitmg))
     delta_rs_rec = rs_rec_lcdm - rs_rec_psitmg
 
-    dm_lcdm = comoving_distance_to_rec(cosmo, z_rec)
-    dm_psitmg_raw = comoving_distance_to_rec(cosmo, z_rec, preboost=preboost)
+    dm_lcdm = float(tables["dm_lcdm"])
+    dm_psitmg_raw = float(tables["dm_psitmg_raw"])
     theta100_raw = 100.0 * rs_rec_psitmg / dm_psitmg_raw
     theta100_target = 1.041
     dm_anchor = 100.0 * rs_rec_psitmg / theta100_target
@@ -27,7 +27,6 @@ if local_tex not in texinputs.split(":"):
 import matplotlib
 import numpy as np
 import pandas as pd
-from scipy.integrate import solve_ivp
 
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt
@@ -36,6 +35,7 @@ import matplotlib.pyplot as plt
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+import perturbations
 from scripts._common.style import apply_manuscript_defaults
 
 PHASE3_JSON = ROOT / "phase3_lss_geometry_report.json"
@@ -118,41 +118,22 @@ def load_cosmology() -> dict[str, float]:
     }
 
 
-def e2_lcdm(a: float, omega_m0: float, omega_de0: float) -> float:
-    return omega_m0 * a ** -3 + omega_de0
-
-
-def dlnh_da(a: float, omega_m0: float, omega_de0: float) -> float:
-    return 0.5 * (-3.0 * omega_m0 * a ** -4) / e2_lcdm(a, omega_m0, omega_de0)
-
-
-def omega_m_of_a(a: float, omega_m0: float, omega_de0: float) -> float:
-    return omega_m0 * a ** -3 / e2_lcdm(a, omega_m0, omega_de0)
-
-
 def g_eff(a: float, q0star: float, alpha: float) -> float:
     alpha_eff = max(alpha, 0.0)
     return float(np.exp(2.0 * alpha * q0star * a ** (-alpha_eff)))
 
 
-def solve_growth(a_eval: np.ndarray, omega_m0: float, omega_de0: float, mu_fn) -> np.ndarray:
-    def rhs(a: float, y: np.ndarray) -> np.ndarray:
-        growth, growth_prime = y
-        friction = 3.0 / a + dlnh_da(a, omega_m0, omega_de0)
-        source = 1.5 * omega_m_of_a(a, omega_m0, omega_de0) / (a * a)
-        return np.array([growth_prime, -friction * growth_prime + source * mu_fn(a) * growth])
-
-    sol = solve_ivp(
-        rhs,
-        (float(a_eval[0]), float(a_eval[-1])),
-        np.array([a_eval[0], 1.0]),
-        t_eval=a_eval,
+def solve_growth(a_eval: np.ndarray, omega_m0: float, omega_de0: float, mu_fn=None) -> np.ndarray:
+    """Growing-mode D(a) from the shared `perturbations` growth engine (GR when `mu_fn` is None)."""
+    mu = None if mu_fn is None else (lambda a, _k: mu_fn(a))
+    return perturbations.solve_growth(
+        a_eval,
+        omega_m0,
+        omega_de=omega_de0,
+        mu=mu,
         rtol=1.0e-9,
         atol=1.0e-11,
-    )
-    if not sol.success:
-        raise RuntimeError(sol.message)
-    return sol.y[0]
+    ).delta
 
 
 def estimate_s8(d_gr_today: float, d_model_today: float) -> float:
@@ -263,7 +244,7 @@ def make_step_solution(cosmology: dict[str, float]) -> dict[str, float]:
     a_out = np.linspace(0.01, 1.0, 400)
     a_grid = np.concatenate(([1.0e-3], a_out))
 
-    d_gr = solve_growth(a_grid, cosmology["omega_m0"], cosmology["omega_de0"], lambda a: 1.0)[-len(a_out) :]
+    d_gr = solve_growth(a_grid, cosmology["omega_m0"], cosmology["omega_de0"], None)[-len(a_out) :]
     d_lss = solve_growth(a_grid, cosmology["omega_m0"], cosmology["omega_de0"], lambda a: g_eff(a, Q0STAR_LSS, alpha))[-len(a_out) :]
     d_gw = solve_growth(a_grid, cosmology["omega_m0"], cosmology["omega_de0"], lambda a: g_eff(a, Q0STAR_SAFE, alpha))[-len(a_out) :]
 
@@ -18,6 +18,7 @@ from mcgt.scalar_perturbations import (
     evaluate_sentinel,
     p_phi_of_a,
     rho_phi_of_a,
+    screen_sentinel_batch,
 )
 
 
@@ -128,8 +129,8 @@ def sentinel_proxy_audit(n_samples: int = 10_000, seed: int = 33) -> dict[str, o
     delta_phi_validated = 0
     delta_phi_failures = 0
 
-    for i in range(n_samples):
-        params = replace(
+    samples = [
+        replace(
             base,
             phi0_init=float(rng.uniform(0.1, 2.0)),
             phi_inf=float(rng.uniform(0.2, 3.0)),
@@ -138,7 +139,12 @@ def sentinel_proxy_audit(n_samples: int = 10_000, seed: int = 33) -> dict[str, o
             cs2_param=float(rng.uniform(0.0, 2.0)),
             k0=float(10 ** rng.uniform(-3.0, 0.0)),
         )
+        for _ in range(n_samples)
+    ]
+    # Fast Sentinel checks (rho > 0, causal c_s^2) for the whole sample at once.
+    screened = screen_sentinel_batch(k_vals, a_vals, samples)
 
+    for i, params in enumerate(samples):
         rho = rho_phi_of_a(a_vals, params)
         dp_da = np.gradient(p_phi_of_a(a_vals, params), a_vals)
         drho_da = np.gradient(rho, a_vals)
@@ -158,29 +164,22 @@ def sentinel_proxy_audit(n_samples: int = 10_000, seed: int = 33) -> dict[str, o
         if rho_viol:
             rho_nonpositive += 1
 
-        sentinel_fast = evaluate_sentinel(
-            k_vals,
-            a_vals,
-            params,
-            check_delta_phi=False,
-        )
-        unstable = not sentinel_fast.accepted
+        fast_accepted = bool(screened[i])
+        unstable = not fast_accepted
         if unstable:
             unstable_available += 1
 
-        sentinel = evaluate_sentinel(
-            k_vals,
-            a_vals,
-            params,
-            check_delta_phi=(i < min(128, n_samples)),
-        )
-        if not sentinel.accepted:
-            strict_rejections += 1
         if i < min(128, n_samples):
+            sentinel = evaluate_sentinel(k_vals, a_vals, params, check_delta_phi=True)
+            accepted = sentinel.accepted
             delta_phi_validated += 1
             if not sentinel.linear_stability_ok:
                 delta_phi_failures += 1
-        if unstable and sentinel_fast.accepted:
+        else:
+            accepted = fast_accepted
+        if not accepted:
+            strict_rejections += 1
+        if unstable and fast_accepted:
             strict_false_positives += 1
 
         clipped_cs2 = compute_cs2(k_vals, a_vals, params)
@@ -1,32 +1,35 @@
 # mcgt/backends/ref_phase.py
 # -----------------------------------------------------------------------------
 # Wrapper pour calculer la phase de référence φ_ref(f | m1, m2) en domaine
-# fréquentiel. Priorité PyCBC (get_fd_waveform, IMRPhenomD), fallback LALSuite.
+# fréquentiel. Priorité PyCBC (get_fd_waveform, IMRPhenomD), fallback LALSuite,
+# puis surrogate d'ordre réduit (mcgt.backends.surrogate_phase) s'il a été
+# construit et couvre (m1, m2) : ses valeurs approchées ne sont jamais écrites
+# dans les caches.
 #
 # Caching :
 # - Cache mémoire LRU (taille limitée)
-# - Cache disque atomique (.npz) avec verrouillage fichier
+# - Store disque partitionné (ShardedPhaseStore) : enregistrements float64 de
+#   largeur fixe en ajout seul, index par shard, lecture sans verrou ; les
+#   anciens .npz (un fichier par paire) sont migrés à la première lecture
 
 from __future__ import annotations
 
+import contextlib
 import hashlib
 import logging
 import os
+import shutil
 import time
 from collections import OrderedDict
 
 import numpy as np
+from scipy.interpolate import CubicSpline
 
-# Tentatives d'import robustes pour PyCBC / LALSuite et filelock
+from mcgt.locking import file_lock
+
+# Tentatives d'import robustes pour PyCBC / LALSuite
 _have_pyc = False
 _have_lal = False
-_have_filelock = False
-try:
-    from filelock import FileLock
-
-    _have_filelock = True
-except Exception:
-    FileLock = None
 
 try:
     from pycbc.waveform import get_fd_waveform
@@ -58,9 +61,8 @@ CACHE_DIR_DEFAULT = os.path.join("assets", "zz-data", "10_global_scan", ".cache_
 CACHE_MAX_ENTRIES_MEM = 128
 CACHE_DISK_QUOTA_BYTES = int(2 * 1024**3)  # 2 Go
 CACHE_FILE_SUFFIX = ".npz"
-CACHE_LOCK_SUFFIX = ".lock"
 CACHE_PART_SUFFIX = ".part"
-LOCK_TIMEOUT = 120.0
+MTSUN_S = 4.925490947e-6  # G M☉ / c³ [s]
 
 # LRU mémoire simple
 _memcache = OrderedDict()
@@ -83,90 +85,289 @@ def _cache_key(approximant: str, m1: float, m2: float, fhash: str) -> str:
     return safe + CACHE_FILE_SUFFIX
 
 
-def _atomic_write_npz(path: str, data: dict):
+# ------------------------- Store disque partitionné ------------------------- #
+STORE_DIRNAME = "store"
+STORE_N_SHARDS = 16
+STORE_TOUCH_INTERVAL = 600.0  # s : rafraîchissement LRU au plus une fois par intervalle
+STORE_COMPACT_FILL = 0.8  # fraction du quota conservée après compaction
+STORE_INDEX_DTYPE = np.dtype([("key", "V20"), ("slot", "<i8"), ("stamp", "<f8")])
+
+
+class _Shard:
     """
-    Écrire atomiquement un .npz via .part -> replace. Évite les corruptions
-    en cas d'accès concurrents.
+    Un shard : enregistrements float64 de largeur fixe en ajout seul.
+
+    Fichiers (génération g, remplacée à chaque compaction) :
+    - shard-XX.g.dat : lignes de `width` float64 (lues par np.memmap) ;
+    - shard-XX.g.idx : journal d'index (clé SHA1, slot, horodatage LRU) ;
+      le dernier enregistrement d'une clé fait foi ;
+    - shard-XX.gen : numéro de génération courant (remplacé atomiquement).
+
+    Les données sont écrites avant l'index : toute entrée visible dans
+    l'index est complète. Les lecteurs ne prennent aucun verrou ; ils
+    relisent seulement la fin du journal d'index quand une clé manque.
     """
-    part = path + CACHE_PART_SUFFIX
-    parent = os.path.dirname(part)
-    if parent:
-        os.makedirs(parent, exist_ok=True)
-    try:
-        with open(part, "wb") as fh:
-            np.savez_compressed(fh, **data)  # pas d’ajout d’extension en file-like
-        os.replace(part, path)
-    finally:
-        # si le .part demeure pour une raison quelconque
-        try:
-            if os.path.exists(part):
-                os.remove(part)
-        except Exception:
-            pass
 
+    def __init__(self, directory: str, number: int, width: int):
+        self.directory = directory
+        self.stem = os.path.join(directory, f"shard-{number:02d}")
+        self.width = int(width)
+        self.row_bytes = 8 * self.width
+        self._reset(None)
 
-def _evict_cache_if_needed(cache_dir: str, quota_bytes: int = CACHE_DISK_QUOTA_BYTES):
-    """Supprime les fichiers les plus anciens jusqu'à respecter le quota."""
-    try:
-        files = []
-        total = 0
-        for fn in os.listdir(cache_dir):
-            if fn.endswith(CACHE_FILE_SUFFIX):
-                p = os.path.join(cache_dir, fn)
-                try:
-                    st = os.stat(p)
-                except FileNotFoundError:
-                    continue
-                files.append((st.st_mtime, p, st.st_size))
-                total += st.st_size
-        if total <= quota_bytes:
+    def _reset(self, gen: int | None):
+        self.gen = gen
+        self._index: dict[bytes, tuple[int, float]] = {}
+        self._idx_pos = 0
+        self._rows: np.ndarray | None = None
+
+    def _paths(self, gen: int) -> tuple[str, str]:
+        return f"{self.stem}.{gen}.dat", f"{self.stem}.{gen}.idx"
+
+    def _current_gen(self) -> int:
+        try:
+            with open(self.stem + ".gen", encoding="ascii") as fh:
+                return int(fh.read().strip() or 0)
+        except FileNotFoundError:
+            return 0
+
+    def refresh(self):
+        """Lit la génération courante et la fin du journal d'index."""
+        gen = self._current_gen()
+        if gen != self.gen:
+            self._reset(gen)
+        dat_path, idx_path = self._paths(gen)
+        try:
+            with open(idx_path, "rb") as fh:
+                fh.seek(self._idx_pos)
+                raw = fh.read()
+        except FileNotFoundError:
             return
-        files.sort(key=lambda x: x[0])  # plus ancien d'abord
-        logger.info("Cache disque: dépassement quota (%d bytes). Eviction…", total)
-        for _, p, size in files:
+        n = len(raw) // STORE_INDEX_DTYPE.itemsize * STORE_INDEX_DTYPE.itemsize
+        if not n:
+            return
+        # Les données précèdent l'index : un slot hors de la taille courante
+        # vient d'un enregistrement corrompu (journal désaligné) et est ignoré.
+        try:
+            n_rows = os.stat(dat_path).st_size // self.row_bytes
+        except FileNotFoundError:
+            n_rows = 0
+        for key, slot, stamp in np.frombuffer(raw[:n], dtype=STORE_INDEX_DTYPE).tolist():
+            if 0 <= slot < n_rows and np.isfinite(stamp):
+                self._index[key] = (slot, stamp)
+        self._idx_pos += n
+
+    def _row(self, slot: int) -> np.ndarray:
+        if self._rows is None or slot >= self._rows.shape[0]:
+            # seules les lignes complètes : un écrivain peut être en cours d'ajout
+            dat_path, _ = self._paths(self.gen)
+            n_rows = os.stat(dat_path).st_size // self.row_bytes
+            if slot >= n_rows:
+                raise IndexError(slot)
+            self._rows = np.memmap(dat_path, dtype=np.float64, mode="r", shape=(n_rows, self.width))
+        return np.array(self._rows[slot], dtype=np.float64)
+
+    def get(self, key: bytes) -> np.ndarray | None:
+        for attempt in range(2):
+            entry = self._index.get(key)
+            if entry is None:
+                self.refresh()
+                entry = self._index.get(key)
+                if entry is None:
+                    return None
             try:
-                os.remove(p)
-                total -= size
-                if total <= quota_bytes:
-                    break
-            except Exception as e:
-                logger.warning("Impossible de supprimer %s : %s", p, e)
-    except Exception as e:
-        logger.warning("Échec de l'éviction du cache: %s", e)
-
-
-def _acquire_lock(path: str, timeout: float = LOCK_TIMEOUT):
-    """Retourne un context manager de verrou. FileLock si dispo, sinon fallback simple."""
-    lock_path = path + CACHE_LOCK_SUFFIX
-    if _have_filelock and FileLock is not None:
-        return FileLock(lock_path, timeout=timeout)
-
-    # Fallback minimaliste (répertoire .dirlock)
-    class _SimpleLock:
-        def __init__(self, p, timeout):
-            self.lockdir = p + ".dirlock"
-            self.timeout = timeout
-
-        def __enter__(self):
-            t0 = time.time()
-            while True:
-                try:
-                    os.mkdir(self.lockdir)
-                    return self
-                except FileExistsError:
-                    if (time.time() - t0) > self.timeout:
-                        raise TimeoutError(
-                            f"Timeout acquiring simple lock: {self.lockdir}"
-                        )
-                    time.sleep(0.1)
-
-        def __exit__(self, exc_type, exc, tb):
+                phi = self._row(entry[0])
+            except (FileNotFoundError, ValueError, IndexError):
+                # génération compactée entre-temps : on relit l'index
+                self._reset(None)
+                continue
+            if time.time() - entry[1] > STORE_TOUCH_INTERVAL:
+                self._touch(key, entry[0])
+            return phi
+        return None
+
+    def _touch(self, key: bytes, slot: int):
+        """Horodatage LRU : ajout d'un enregistrement d'index, sans verrou."""
+        rec = np.array([(key, slot, time.time())], dtype=STORE_INDEX_DTYPE)
+        _, idx_path = self._paths(self.gen)
+        try:
+            fd = os.open(idx_path, os.O_WRONLY | os.O_APPEND)
+        except OSError:
+            return
+        try:
+            os.write(fd, rec.tobytes())
+        finally:
+            os.close(fd)
+        self._index[key] = (slot, float(rec["stamp"][0]))
+
+    def append(self, keys: list[bytes], rows: np.ndarray, quota_bytes: int) -> bool:
+        """Ajoute des lignes (verrou détenu par l'appelant) ; True si compaction."""
+        self.refresh()
+        dat_path, idx_path = self._paths(self.gen)
+        with open(dat_path, "ab") as fh:
+            size = fh.tell()
+            if size % self.row_bytes:  # ligne partielle d'un écrivain interrompu
+                size -= size % self.row_bytes
+                fh.truncate(size)
+            fh.write(np.ascontiguousarray(rows, dtype=np.float64).tobytes())
+            fh.flush()
+            os.fsync(fh.fileno())
+        first = size // self.row_bytes
+        recs = np.empty(len(keys), dtype=STORE_INDEX_DTYPE)
+        recs["key"] = keys
+        recs["slot"] = np.arange(first, first + len(keys))
+        recs["stamp"] = time.time()
+        fd = os.open(idx_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            idx_size = os.fstat(fd).st_size
+            if idx_size % STORE_INDEX_DTYPE.itemsize:  # enregistrement d'index tronqué
+                os.ftruncate(fd, idx_size - idx_size % STORE_INDEX_DTYPE.itemsize)
+            os.write(fd, recs.tobytes())
+        finally:
+            os.close(fd)
+        self.refresh()
+        if size + rows.nbytes > quota_bytes:
+            self.compact(int(STORE_COMPACT_FILL * quota_bytes))
+            return True
+        return False
+
+    def compact(self, keep_bytes: int):
+        """Réécrit le shard en gardant les entrées les plus récemment utilisées."""
+        self.refresh()
+        live = sorted(self._index.items(), key=lambda kv: kv[1][1], reverse=True)
+        live = live[: max(keep_bytes // self.row_bytes, 0)]
+        new_gen = self.gen + 1
+        dat_path, idx_path = self._paths(new_gen)
+        rows = np.empty((len(live), self.width))
+        if live:
+            old_rows = np.memmap(self._paths(self.gen)[0], dtype=np.float64, mode="r")
+            old_rows = old_rows.reshape(-1, self.width)
+            rows[:] = old_rows[[slot for _, (slot, _) in live]]
+            del old_rows
+        recs = np.empty(len(live), dtype=STORE_INDEX_DTYPE)
+        recs["key"] = [key for key, _ in live]
+        recs["slot"] = np.arange(len(live))
+        recs["stamp"] = [stamp for _, (_, stamp) in live]
+        # fichiers durables avant de publier la nouvelle génération
+        for path, payload in ((dat_path, rows.tobytes()), (idx_path, recs.tobytes())):
+            with open(path, "wb") as fh:
+                fh.write(payload)
+                fh.flush()
+                os.fsync(fh.fileno())
+        part = f"{self.stem}.gen{CACHE_PART_SUFFIX}"
+        with open(part, "w", encoding="ascii") as fh:
+            fh.write(str(new_gen))
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(part, self.stem + ".gen")
+        for path in self._paths(self.gen):
             try:
-                os.rmdir(self.lockdir)
-            except Exception:
+                os.remove(path)  # les lecteurs qui l'ont ouvert gardent l'inode
+            except FileNotFoundError:
                 pass
+        self._reset(None)
+        self.refresh()
+
+    def stats(self) -> tuple[int, int]:
+        self.refresh()
+        try:
+            size = os.stat(self._paths(self.gen)[0]).st_size
+        except FileNotFoundError:
+            size = 0
+        return len(self._index), size
 
-    return _SimpleLock(lock_path, timeout)
+
+class ShardedPhaseStore:
+    """
+    Cache disque de phases φ_ref pour une grille de fréquences donnée.
+
+    Les clés sont réparties sur `n_shards` fichiers en ajout seul (voir
+    _Shard) : recherche O(1) par dictionnaire, insertion par lots sous un
+    verrou par shard, lecture concurrente sans verrou, et éviction LRU par
+    compaction d'un shard dès qu'il dépasse quota_bytes / n_shards — sans
+    parcourir le répertoire.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        width: int,
+        *,
+        n_shards: int = STORE_N_SHARDS,
+        quota_bytes: int = CACHE_DISK_QUOTA_BYTES,
+    ):
+        self.directory = directory
+        self.width = int(width)
+        self.quota_bytes = int(quota_bytes)
+        self._shards = [_Shard(directory, i, width) for i in range(int(n_shards))]
+        self.hits = 0
+        self.misses = 0
+        self.puts = 0
+        self.compactions = 0
+
+    @staticmethod
+    def digest(key: str) -> bytes:
+        return hashlib.sha1(key.encode("utf-8")).digest()
+
+    def _shard(self, digest: bytes) -> _Shard:
+        return self._shards[int.from_bytes(digest[:4], "little") % len(self._shards)]
+
+    def get(self, key: str) -> np.ndarray | None:
+        digest = self.digest(key)
+        phi = self._shard(digest).get(digest)
+        if phi is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return phi
+
+    def put_many(self, keys: list[str], rows: np.ndarray):
+        """Insertion par lots : un verrou et deux écritures par shard touché."""
+        rows = np.asarray(rows, dtype=np.float64).reshape(len(keys), self.width)
+        groups: dict[int, list[int]] = {}
+        digests = [self.digest(k) for k in keys]
+        for i, d in enumerate(digests):
+            groups.setdefault(self._shards.index(self._shard(d)), []).append(i)
+        shard_quota = self.quota_bytes // len(self._shards)
+        os.makedirs(self.directory, exist_ok=True)
+        for number, members in groups.items():
+            shard = self._shards[number]
+            with file_lock(shard.stem):
+                if shard.append([digests[i] for i in members], rows[members], shard_quota):
+                    self.compactions += 1
+        self.puts += len(keys)
+
+    def put(self, key: str, phi: np.ndarray):
+        self.put_many([key], np.asarray(phi, dtype=np.float64)[None, :])
+
+    def info(self) -> dict:
+        entries = 0
+        size = 0
+        for shard in self._shards:
+            n, b = shard.stats()
+            entries += n
+            size += b
+        return {
+            "directory": self.directory,
+            "entries": entries,
+            "bytes": size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "puts": self.puts,
+            "compactions": self.compactions,
+        }
+
+
+_stores: dict[tuple[str, int], ShardedPhaseStore] = {}
+
+
+def _phase_store(cache_dir: str, fhash: str, width: int) -> ShardedPhaseStore:
+    """Store partagé (par processus) pour une grille de fréquences."""
+    directory = os.path.join(cache_dir, STORE_DIRNAME, fhash[:16])
+    store = _stores.get((directory, width))
+    if store is None:
+        store = _stores[(directory, width)] = ShardedPhaseStore(directory, width)
+    return store
 
 
 # ------------------------- Backends de calcul ------------------------- #
@@ -264,6 +465,224 @@ def _phi_ref_via_lalsim(
     except Exception as e:
         raise RuntimeError(f"REF_COMPUTE_FAIL (LALSuite) : {e}")
 
+
+def _phi_ref_exact(
+    f_Hz: np.ndarray, m1: float, m2: float, approximant: str = "IMRPhenomD"
+) -> np.ndarray:
+    """PyCBC puis LALSuite ; RuntimeError("REF_COMPUTE_FAIL") si tous échouent."""
+    last_exc = None
+    if _have_pyc:
+        try:
+            return _phi_ref_via_pyc(f_Hz, m1, m2, approximant=approximant)
+        except Exception as e:
+            last_exc = e
+            logger.warning("PyCBC a échoué (m1=%s, m2=%s) : %s", m1, m2, e)
+    if _have_lal:
+        try:
+            return _phi_ref_via_lalsim(f_Hz, m1, m2, approximant=approximant)
+        except Exception as e:
+            last_exc = e
+            logger.warning("LALSuite a échoué (m1=%s, m2=%s) : %s", m1, m2, e)
+    raise RuntimeError(f"REF_COMPUTE_FAIL: backends disponibles ont échoué: {last_exc}")
+
+
+def _phi_ref_via_surrogate(
+    f_Hz: np.ndarray, m1: float, m2: float, approximant: str = "IMRPhenomD"
+) -> np.ndarray | None:
+    """Évaluation par le surrogate par défaut ; None s'il est absent ou hors domaine."""
+    try:
+        from mcgt.backends.surrogate_phase import default_surrogate
+
+        surrogate = default_surrogate()
+    except Exception as e:
+        logger.warning("Surrogate φ_ref indisponible : %s", e)
+        return None
+    if surrogate is None or surrogate.approximant != approximant:
+        return None
+    if not surrogate.covers(m1, m2, f_Hz):
+        return None
+    return np.asarray(surrogate(f_Hz, float(m1), float(m2)), dtype=np.float64)
+
+
+# ------------------------- Cache à l'échelle (Mf, η) ------------------------- #
+class ScaleAwareRefCache:
+    """
+    Réutilise φ_ref sur toute la boîte de masses via l'invariance d'échelle.
+
+    Pour un approximant sans spin, φ_ref(f | m1, m2) ne dépend que de
+    (M_tot·f, η), à une constante et une phase linéaire près (fixées par
+    f_ref = f_min et l'alignement du pic, eux-mêmes invariants en M·f pour
+    la partie linéaire). Le cache stocke donc, par nœud ln η, une table
+    η·φ(ln Mf) calculée une fois à la masse totale m_total_ref, sur toute la
+    plage de Mf de la boîte m_bounds, et la projette sur toute grille
+    physique (spline cubique en ln Mf, interpolation linéaire entre les deux
+    nœuds η encadrants ; le facteur η retire la dépendance en 1/η du terme
+    newtonien, qui domine l'erreur d'interpolation).
+
+    Précision : chaque cellule η est validée à sa première requête (voir
+    _validate) ; si l'écart dépasse `tol` [rad], elle est coupée en deux (au
+    plus `max_refine` fois). La validation vaut pour la bande de fréquences
+    de cette requête (une seule bande par scan en pratique). Les phases
+    renvoyées sont alignées à 0 sur f_Hz[0] (la constante n'est pas
+    invariante d'échelle).
+
+    Compteurs : hits (requête servie sans calcul exact), misses, builds
+    (tables calculées), validations, refinements.
+    """
+
+    def __init__(
+        self,
+        approximant: str = "IMRPhenomD",
+        *,
+        tol: float = 1e-2,
+        ln_eta_step: float = 0.1,
+        nodes_per_decade: int = 256,
+        m_total_ref: float = 60.0,
+        m_bounds: tuple[float, float] = (5.0, 80.0),
+        max_refine: int = 6,
+        exact=None,
+    ):
+        if tol <= 0.0 or ln_eta_step <= 0.0 or nodes_per_decade < 8:
+            raise ValueError("Exige tol > 0, ln_eta_step > 0 et nodes_per_decade ≥ 8.")
+        self.approximant = approximant
+        self.tol = float(tol)
+        self.ln_eta_step = float(ln_eta_step)
+        self.nodes_per_decade = int(nodes_per_decade)
+        self.m_total_ref = float(m_total_ref)
+        self.m_bounds = (float(m_bounds[0]), float(m_bounds[1]))
+        self.max_refine = int(max_refine)
+        self._exact = exact if exact is not None else _phi_ref_exact
+        self._tables: dict[float, tuple[float, float, CubicSpline]] = {}
+        self._split: set[tuple[float, float]] = set()
+        self._validated: set[tuple[float, float]] = set()
+        self.hits = 0
+        self.misses = 0
+        self.builds = 0
+        self.validations = 0
+        self.refinements = 0
+
+    def info(self) -> dict:
+        n = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / n if n else 0.0,
+            "builds": self.builds,
+            "validations": self.validations,
+            "refinements": self.refinements,
+            "n_eta_nodes": len(self._tables),
+            "tol": self.tol,
+        }
+
+    def _exact_phase(self, f_Hz, m1, m2) -> np.ndarray:
+        return np.asarray(self._exact(f_Hz, m1, m2, approximant=self.approximant), dtype=np.float64)
+
+    def _table(self, ln_eta: float, ln_mf_lo: float, ln_mf_hi: float) -> CubicSpline:
+        """Table φ(ln Mf) au nœud ln η, (re)calculée si elle ne couvre pas [lo, hi]."""
+        hit = self._tables.get(ln_eta)
+        if hit is not None and hit[0] <= ln_mf_lo and hit[1] >= ln_mf_hi:
+            return hit[2]
+        # plage : toute la boîte de masses pour cette bande de fréquences
+        # (une table par nœud), élargie si une requête en sort
+        ln_span = np.log(self.m_bounds[1] / self.m_bounds[0])
+        ln_mf_lo = ln_mf_lo - ln_span - 0.05
+        ln_mf_hi = ln_mf_hi + ln_span + 0.05
+        if hit is not None:
+            ln_mf_lo = min(ln_mf_lo, hit[0])
+            ln_mf_hi = max(ln_mf_hi, hit[1])
+        n = max(int(np.ceil((ln_mf_hi - ln_mf_lo) / np.log(10.0) * self.nodes_per_decade)), 8) + 1
+        ln_mf = np.linspace(ln_mf_lo, ln_mf_hi, n)
+        eta = np.exp(ln_eta)
+        root = np.sqrt(max(1.0 - 4.0 * eta, 0.0))
+        m1 = 0.5 * self.m_total_ref * (1.0 + root)
+        m2 = 0.5 * self.m_total_ref * (1.0 - root)
+        phi = self._exact_phase(np.exp(ln_mf) / (self.m_total_ref * MTSUN_S), m1, m2)
+        spline = CubicSpline(ln_mf, eta * (phi - phi[0]))
+        self._tables[ln_eta] = (ln_mf_lo, ln_mf_hi, spline)
+        self.builds += 1
+        return spline
+
+    def _cell(self, ln_eta: float) -> tuple[float, float]:
+        """Cellule [bas, haut] en ln η contenant ln_eta, après raffinements."""
+        top = np.log(0.25)
+        k = int(np.floor((top - ln_eta) / self.ln_eta_step))
+        hi = top - k * self.ln_eta_step
+        lo = hi - self.ln_eta_step
+        while (lo, hi) in self._split:
+            mid = 0.5 * (lo + hi)
+            lo, hi = (mid, hi) if ln_eta >= mid else (lo, mid)
+        return lo, hi
+
+    def _interp(self, cell, ln_eta, ln_mf) -> np.ndarray:
+        lo, hi = cell
+        w = (ln_eta - lo) / (hi - lo)
+        span = (float(ln_mf[0]), float(ln_mf[-1]))
+        eta_phi = (1.0 - w) * self._table(lo, *span)(ln_mf) + w * self._table(hi, *span)(ln_mf)
+        phi = eta_phi / np.exp(ln_eta)
+        return phi - phi[0]
+
+    def _validate(self, ln_eta: float, f_Hz: np.ndarray) -> tuple[float, float]:
+        """
+        Cellule validée contenant ln_eta : l'interpolation au milieu de la
+        cellule (poids w = 1/2, écart maximal) est comparée à la table exacte
+        du milieu, sur la bande f_Hz ramenée à la plus petite masse totale de
+        la boîte (phase la plus grande). Au-delà de tol, la cellule est
+        coupée et la table du milieu devient un nœud.
+        """
+        ln_mf = np.log(2.0 * self.m_bounds[0] * MTSUN_S * f_Hz)
+        cell = self._cell(ln_eta)
+        while cell not in self._validated:
+            self.validations += 1
+            mid = 0.5 * (cell[0] + cell[1])
+            ref = self._table(mid, float(ln_mf[0]), float(ln_mf[-1]))(ln_mf) / np.exp(mid)
+            err = float(np.max(np.abs(self._interp(cell, mid, ln_mf) - (ref - ref[0]))))
+            if err <= self.tol:
+                self._validated.add(cell)
+            elif cell[1] - cell[0] <= self.ln_eta_step / 2**self.max_refine:
+                logger.warning("Cache d'échelle : tolérance %.3g non atteinte (écart %.3g rad).", self.tol, err)
+                self._validated.add(cell)
+            else:
+                self._split.add(cell)
+                self.refinements += 1
+                cell = self._cell(ln_eta)
+        return cell
+
+    def phase(self, f_Hz: np.ndarray, m1: float, m2: float) -> np.ndarray:
+        """φ_ref(f_Hz | m1, m2) alignée à 0 sur f_Hz[0]."""
+        f_Hz = np.asarray(f_Hz, dtype=np.float64)
+        m_tot = float(m1) + float(m2)
+        ln_eta = float(np.log(float(m1) * float(m2) / m_tot**2))
+        builds = self.builds
+        cell = self._validate(ln_eta, f_Hz)
+        phi = self._interp(cell, ln_eta, np.log(m_tot * MTSUN_S * f_Hz))
+        if self.builds == builds:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return phi
+
+
+_scale_cache: ScaleAwareRefCache | None = None
+
+
+def configure_scale_cache(enabled: bool = True, **kwargs) -> ScaleAwareRefCache | None:
+    """
+    Installe (ou retire) le cache à l'échelle du processus.
+
+    Les mots-clés sont transmis à ScaleAwareRefCache (tol, ln_eta_step,
+    nodes_per_decade, ...). Renvoie le cache actif. Seuls les appels
+    compute_phi_ref(..., scale_aware=True) l'utilisent.
+    """
+    global _scale_cache
+    _scale_cache = ScaleAwareRefCache(**kwargs) if enabled else None
+    return _scale_cache
+
+
+def scale_cache_info() -> dict:
+    """Compteurs du cache à l'échelle ({} s'il est inactif)."""
+    return {} if _scale_cache is None else _scale_cache.info()
+
+
 # ------------------------- Interface publique ------------------------- #
 def compute_phi_ref(
     f_Hz: np.ndarray,
@@ -273,6 +692,8 @@ def compute_phi_ref(
     approximant: str = "IMRPhenomD",
     cache_dir: str | None = None,
     force_recompute: bool = False,
+    scale_aware: bool = False,
+    scale_tol: float | None = None,
 ) -> np.ndarray:
     """
     Calculer (ou récupérer depuis cache) la phase de référence φ_ref(f) pour (m1,m2).
@@ -289,10 +710,22 @@ def compute_phi_ref(
         Dossier de cache (par défaut assets/zz-data/10_global_scan/.cache_ref).
     force_recompute : bool
         Ignore le cache si True.
+    scale_aware : bool
+        True : approximation par le cache à l'échelle (Mf, η) en mémoire,
+        phase alignée à 0 sur f_Hz[0] (et non la convention absolue du
+        chemin exact) ; incompatible avec cache_dir et force_recompute.
+        Toujours à demander explicitement, appel par appel.
+    scale_tol : float | None
+        Tolérance [rad] du cache à l'échelle (scale_aware=True) ; un cache
+        de cette tolérance est créé au besoin, sinon celui installé par
+        configure_scale_cache() (ou la tolérance par défaut) est utilisé.
 
     Retour
     ------
-    np.ndarray (float64), même shape que f_Hz, phase en radians.
+    np.ndarray (float64), même shape que f_Hz, phase en radians. Sans
+    PyCBC/LALSuite (ou si ceux-ci échouent), le surrogate par défaut est
+    utilisé lorsqu'il couvre (m1, m2) : phase alignée à 0 sur sa première
+    fréquence d'entraînement, non mise en cache.
 
     Exceptions
     ----------
@@ -304,6 +737,22 @@ def compute_phi_ref(
     if not np.all(np.isfinite(f_Hz)):
         raise ValueError("f_Hz contient des valeurs non finies.")
 
+    if scale_aware:
+        if cache_dir is not None or force_recompute:
+            raise ValueError(
+                "scale_aware=True : cache en mémoire, sans cache_dir ni force_recompute."
+            )
+        if _have_pyc or _have_lal:
+            cache = _scale_cache
+            if (
+                cache is None
+                or cache.approximant != approximant
+                or (scale_tol is not None and cache.tol != float(scale_tol))
+            ):
+                kwargs = {} if scale_tol is None else {"tol": float(scale_tol)}
+                cache = configure_scale_cache(approximant=approximant, **kwargs)
+            return cache.phase(f_Hz, float(m1), float(m2))
+
     if cache_dir is None:
         cache_dir = CACHE_DIR_DEFAULT
     _ensure_cache_dir(cache_dir)
@@ -319,79 +768,62 @@ def compute_phi_ref(
         _memcache[mem_key] = phi
         return np.array(phi, dtype=np.float64)
 
-    # 2) cache disque
-    if not force_recompute and os.path.exists(cache_path):
-        try:
-            with _acquire_lock(cache_path):
-                data = np.load(cache_path)
-                if "phi_on_grid" in data:
-                    phi = np.array(data["phi_on_grid"], dtype=np.float64)
-                    _memcache[mem_key] = phi
-                    while len(_memcache) > CACHE_MAX_ENTRIES_MEM:
-                        _memcache.popitem(last=False)
-                    return phi
-        except Exception as e:
-            logger.warning(
-                "Cache disque illisible (%s), on recalcule : %s", cache_path, e
-            )
-
-    # 3) calcul (avec verrou pour éviter courses multiples)
-    with _acquire_lock(cache_path):
-        # re-check (un autre worker a pu écrire)
-        if not force_recompute and os.path.exists(cache_path):
+    # 2) store disque (lecture sans verrou) ; migration des anciens .npz
+    store = _phase_store(cache_dir, fhash, f_Hz.size)
+    store_key = f"{approximant}_m1-{float(m1):.6f}_m2-{float(m2):.6f}"
+    if not force_recompute:
+        phi = store.get(store_key)
+        if phi is None and os.path.exists(cache_path):
             try:
-                data = np.load(cache_path)
-                if "phi_on_grid" in data:
+                with np.load(cache_path) as data:
                     phi = np.array(data["phi_on_grid"], dtype=np.float64)
-                    _memcache[mem_key] = phi
-                    while len(_memcache) > CACHE_MAX_ENTRIES_MEM:
-                        _memcache.popitem(last=False)
-                    return phi
-            except Exception:
-                logger.warning("Lecture cache échouée après lock; recalcul.")
-
-        last_exc = None
-        phi_on_grid = None
-
-        if _have_pyc:
-            try:
-                phi_on_grid = _phi_ref_via_pyc(f_Hz, m1, m2, approximant=approximant)
+                store.put(store_key, phi)
             except Exception as e:
-                last_exc = e
-                logger.warning("PyCBC a échoué (m1=%s, m2=%s) : %s", m1, m2, e)
-
-        if phi_on_grid is None and _have_lal:
-            try:
-                phi_on_grid = _phi_ref_via_lalsim(f_Hz, m1, m2, approximant=approximant)
-            except Exception as e:
-                last_exc = e
-                logger.warning("LALSuite a échoué (m1=%s, m2=%s) : %s", m1, m2, e)
-
-        if phi_on_grid is None:
-            if not (_have_pyc or _have_lal):
-                raise RuntimeError(
-                    "REF_BACKEND_MISSING: aucun backend (PyCBC/LALSuite) disponible"
+                logger.warning(
+                    "Cache disque illisible (%s), on recalcule : %s", cache_path, e
                 )
-            raise RuntimeError(
-                f"REF_COMPUTE_FAIL: backends disponibles ont échoué: {last_exc}"
-            )
+                phi = None
+            else:
+                # un autre worker a pu migrer (et supprimer) le même fichier
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(cache_path)
+        if phi is not None:
+            _memcache[mem_key] = phi
+            while len(_memcache) > CACHE_MAX_ENTRIES_MEM:
+                _memcache.popitem(last=False)
+            return np.array(phi, dtype=np.float64)
+
+    # 3) sans backend exact : surrogate (pas d'écriture cache)
+    if not (_have_pyc or _have_lal):
+        phi = _phi_ref_via_surrogate(f_Hz, m1, m2, approximant=approximant)
+        if phi is not None:
+            return phi
+        raise RuntimeError(
+            "REF_BACKEND_MISSING: aucun backend (PyCBC/LALSuite/surrogate) disponible"
+        )
 
-        # Écriture cache disque + LRU mémoire
-        try:
-            _atomic_write_npz(
-                cache_path, {"phi_on_grid": np.asarray(phi_on_grid, dtype=np.float64)}
-            )
-            _evict_cache_if_needed(
-                cache_dir=cache_dir, quota_bytes=CACHE_DISK_QUOTA_BYTES
-            )
-        except Exception as e:
-            logger.warning("Écriture cache disque impossible (%s) : %s", cache_path, e)
+    # 4) calcul ; deux workers peuvent calculer la même paire, la dernière
+    #    entrée de l'index fait foi (les deux valeurs sont identiques)
+    try:
+        phi_on_grid = _phi_ref_exact(f_Hz, m1, m2, approximant=approximant)
+    except RuntimeError:
+        phi = _phi_ref_via_surrogate(f_Hz, m1, m2, approximant=approximant)
+        if phi is not None:
+            return phi
+        raise
+    phi_on_grid = np.asarray(phi_on_grid, dtype=np.float64)
+
+    # Écriture store disque + LRU mémoire
+    try:
+        store.put(store_key, phi_on_grid)
+    except Exception as e:
+        logger.warning("Écriture cache disque impossible (%s) : %s", store.directory, e)
 
-        _memcache[mem_key] = np.asarray(phi_on_grid, dtype=np.float64)
-        while len(_memcache) > CACHE_MAX_ENTRIES_MEM:
-            _memcache.popitem(last=False)
+    _memcache[mem_key] = phi_on_grid
+    while len(_memcache) > CACHE_MAX_ENTRIES_MEM:
+        _memcache.popitem(last=False)
 
-        return np.array(phi_on_grid, dtype=np.float64)
+    return np.array(phi_on_grid, dtype=np.float64)
 
 
 # ------------------------- API utilitaires ------------------------- #
@@ -399,6 +831,8 @@ def clear_ref_cache(cache_dir: str | None = None):
     """Purge tout le cache disque (attention : irréversible)."""
     if cache_dir is None:
         cache_dir = CACHE_DIR_DEFAULT
+    for key in [k for k in _stores if k[0].startswith(os.path.join(cache_dir, ""))]:
+        del _stores[key]
     if not os.path.isdir(cache_dir):
         return
     for fn in os.listdir(cache_dir):
@@ -406,15 +840,17 @@ def clear_ref_cache(cache_dir: str | None = None):
         try:
             if os.path.isfile(p):
                 os.remove(p)
+            elif fn == STORE_DIRNAME:
+                shutil.rmtree(p)
         except Exception as e:
             logger.warning("clear_ref_cache: impossible de supprimer %s : %s", p, e)
 
 
 def ref_cache_info(cache_dir: str | None = None) -> dict:
-    """Retourne des informations sommaires sur le cache disque (taille, n fichiers)."""
+    """Retourne des informations sommaires sur le cache disque (taille, entrées)."""
     if cache_dir is None:
         cache_dir = CACHE_DIR_DEFAULT
-    info = {"cache_dir": cache_dir, "n_files": 0, "total_bytes": 0, "entries": []}
+    info = {"cache_dir": cache_dir, "n_files": 0, "total_bytes": 0, "entries": [], "stores": []}
     if not os.path.isdir(cache_dir):
         return info
     for fn in os.listdir(cache_dir):
@@ -429,6 +865,20 @@ def ref_cache_info(cache_dir: str | None = None) -> dict:
                 )
             except Exception:
                 continue
+    # Un sous-répertoire par grille : quelques dizaines de fichiers au plus
+    root = os.path.join(cache_dir, STORE_DIRNAME)
+    live = {directory: store for (directory, _), store in _stores.items()}
+    for name in sorted(os.listdir(root)) if os.path.isdir(root) else []:
+        directory = os.path.join(root, name)
+        if directory in live:
+            stats = live[directory].info()
+        else:
+            stats = {"directory": directory, "bytes": 0}
+            for entry in os.scandir(directory):
+                if entry.name.endswith(".dat"):
+                    stats["bytes"] += entry.stat().st_size
+        info["total_bytes"] += stats["bytes"]
+        info["stores"].append(stats)
     return info
 
 
@@ -0,0 +1,384 @@
+# mcgt/backends/surrogate_phase.py
+# -----------------------------------------------------------------------------
+# Surrogate d'ordre réduit de la phase de référence φ_ref(f | m1, m2).
+#
+# Construit une fois à partir d'un générateur exact (compute_phi_ref : PyCBC /
+# LALSuite), puis évalué sans dépendance externe :
+# - base SVD tronquée des phases d'entraînement (sur la grille f_Hz source),
+#   alignées à 0 sur la première fréquence : la constante issue de
+#   np.unwrap(np.angle(...)) est arbitraire modulo 2π et sautillerait d'un
+#   couple de masses à l'autre ;
+# - coefficients de projection interpolés (Chebyshev tensoriel) sur la boîte
+#   de masses composantes, en coordonnées (ln m1, ln m2) : les nœuds et le
+#   domaine couvert (covers) restent dans [m_min, m_max]², là où le budget
+#   d'erreur est mesuré. La phase est symétrique en (m1, m2) : seuls les
+#   nœuds m1 ≥ m2 sont calculés ;
+# - budget d'erreur (troncature SVD, validation hors nœuds, ancre CSV) stocké
+#   avec le surrogate.
+#
+# Stockage : un .npz (allow_pickle=False), chemin par défaut ci-dessous ou
+# variable d'environnement MCGT_REF_SURROGATE.
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+from collections.abc import Callable
+
+import numpy as np
+from numpy.polynomial import chebyshev as cheb
+from scipy.interpolate import CubicSpline
+
+logger = logging.getLogger("mcgt.surrogate_phase")
+
+SURROGATE_PATH_DEFAULT = os.path.join(
+    "assets", "zz-data", "10_global_scan", "ref_phase_surrogate.npz"
+)
+SURROGATE_ENV = "MCGT_REF_SURROGATE"
+SURROGATE_FORMAT_VERSION = 2
+GRID_CACHE_MAX = 8
+
+__all__ = [
+    "PhaseSurrogate",
+    "build_surrogate",
+    "load_surrogate",
+    "default_surrogate",
+]
+
+
+# ------------------------- Coordonnées de masse ------------------------- #
+def _unit_coords(m, ln_m_bounds: tuple[float, float]) -> np.ndarray:
+    """ln m ramené sur [-1, 1] (bornes de la boîte ln m_min, ln m_max)."""
+    lo, hi = ln_m_bounds
+    return (2.0 * np.log(np.asarray(m, dtype=float)) - (lo + hi)) / (hi - lo)
+
+
+def _lobatto(n: int) -> np.ndarray:
+    """Nœuds de Chebyshev–Gauss–Lobatto sur [-1, 1] (croissants)."""
+    return -np.cos(np.pi * np.arange(n) / (n - 1))
+
+
+def _hash_grid(f_Hz: np.ndarray) -> str:
+    return hashlib.sha1(np.asarray(f_Hz, dtype=np.float64).tobytes()).hexdigest()
+
+
+# ------------------------- Surrogate ------------------------- #
+class PhaseSurrogate:
+    """
+    φ_ref(f | m1, m2) ≈ moyenne(f) + Σ_r c_r(m1, m2) · base_r(f).
+
+    Phase alignée à 0 sur la première fréquence d'entraînement (les
+    consommateurs, phi_mcgt et les scans du chapitre 10, ré-alignent à f_min).
+    Les c_r sont des interpolants de Chebyshev en (ln m1, ln m2) sur le carré
+    [ln m_min, ln m_max]² ; une évaluation coûte deux vecteurs de Chebyshev,
+    une contraction et un produit (r × F).
+    """
+
+    def __init__(
+        self,
+        f_Hz: np.ndarray,
+        mean: np.ndarray,
+        basis: np.ndarray,
+        coeffs: np.ndarray,
+        ln_m_bounds: tuple[float, float],
+        *,
+        approximant: str = "IMRPhenomD",
+        error_budget: dict | None = None,
+    ):
+        self.f_Hz = np.asarray(f_Hz, dtype=np.float64)
+        self.mean = np.asarray(mean, dtype=np.float64)
+        self.basis = np.asarray(basis, dtype=np.float64)
+        self.coeffs = np.asarray(coeffs, dtype=np.float64)  # (r, n_m1, n_m2)
+        self.ln_m_bounds = (float(ln_m_bounds[0]), float(ln_m_bounds[1]))
+        self.approximant = str(approximant)
+        self.error_budget = dict(error_budget or {})
+        self._fhash = _hash_grid(self.f_Hz)
+        r, n_x, n_y = self.coeffs.shape
+        self._kx = np.arange(n_x, dtype=np.float64)
+        self._ky = np.arange(n_y, dtype=np.float64)
+        self._coeffs_x = np.ascontiguousarray(self.coeffs.transpose(1, 2, 0).reshape(n_x, n_y * r))
+        self._grids: OrderedDict[str, tuple[np.ndarray, np.ndarray]] = OrderedDict()
+
+    @property
+    def n_basis(self) -> int:
+        return int(self.basis.shape[0])
+
+    # --- domaine ---
+    @property
+    def m_bounds(self) -> tuple[float, float]:
+        return float(np.exp(self.ln_m_bounds[0])), float(np.exp(self.ln_m_bounds[1]))
+
+    def covers(self, m1, m2, f_Hz: np.ndarray | None = None) -> bool:
+        """True si m1 et m2 sont dans [m_min, m_max] et f_Hz dans la bande d'entraînement."""
+        x = np.concatenate([np.atleast_1d(_unit_coords(m, self.ln_m_bounds)) for m in (m1, m2)])
+        ok = bool(np.all(np.abs(x) <= 1.0 + 1e-12))
+        if f_Hz is not None:
+            ok &= self._in_band(f_Hz)
+        return ok
+
+    def _in_band(self, f_Hz: np.ndarray) -> bool:
+        f = np.asarray(f_Hz, dtype=np.float64)
+        return bool(f[0] >= self.f_Hz[0] * (1 - 1e-12) and f[-1] <= self.f_Hz[-1] * (1 + 1e-12))
+
+    def projection(self, m1, m2) -> np.ndarray:
+        """Coefficients c_r(m1, m2), forme (N, r)."""
+        # T_k(x) = cos(k arccos x) sur [-1, 1]
+        theta_x = np.arccos(np.clip(_unit_coords(np.atleast_1d(m1), self.ln_m_bounds), -1.0, 1.0))
+        theta_y = np.arccos(np.clip(_unit_coords(np.atleast_1d(m2), self.ln_m_bounds), -1.0, 1.0))
+        tx = np.cos(theta_x[:, None] * self._kx)
+        ty = np.cos(theta_y[:, None] * self._ky)
+        # (N, n_m1) @ (n_m1, n_m2·r) puis contraction sur n_m2
+        part = (tx @ self._coeffs_x).reshape(tx.shape[0], ty.shape[1], -1)
+        return np.einsum("nj,njr->nr", ty, part)
+
+    def _on_grid(self, f_Hz: np.ndarray | None) -> tuple[np.ndarray, np.ndarray]:
+        """(moyenne, base) sur la grille demandée ; spline en ln f, mise en cache."""
+        if f_Hz is None:
+            return self.mean, self.basis
+        f = np.asarray(f_Hz, dtype=np.float64)
+        key = _hash_grid(f)
+        if key == self._fhash:
+            return self.mean, self.basis
+        hit = self._grids.get(key)
+        if hit is not None:
+            self._grids.move_to_end(key)
+            return hit
+        if not self._in_band(f):
+            raise ValueError("f_Hz sort de la bande de fréquences du surrogate.")
+        spline = CubicSpline(np.log(self.f_Hz), np.vstack([self.mean, self.basis]), axis=1)
+        table = spline(np.log(f))
+        hit = (table[0], np.ascontiguousarray(table[1:]))
+        self._grids[key] = hit
+        while len(self._grids) > GRID_CACHE_MAX:
+            self._grids.popitem(last=False)
+        return hit
+
+    def evaluate_batch(self, m1, m2, f_Hz: np.ndarray | None = None) -> np.ndarray:
+        """φ_ref pour N couples (m1, m2), forme (N, F)."""
+        mean, basis = self._on_grid(f_Hz)
+        return mean + self.projection(m1, m2) @ basis
+
+    def __call__(self, f_Hz: np.ndarray | None, m1: float, m2: float) -> np.ndarray:
+        """φ_ref(f | m1, m2) sur f_Hz (None : grille d'entraînement)."""
+        return self.evaluate_batch(m1, m2, f_Hz)[0]
+
+    # --- persistance ---
+    def save(self, path: str) -> None:
+        parent = os.path.dirname(path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        part = path + ".part"
+        with open(part, "wb") as fh:
+            np.savez(
+                fh,
+                format_version=np.int64(SURROGATE_FORMAT_VERSION),
+                f_Hz=self.f_Hz,
+                mean=self.mean,
+                basis=self.basis,
+                coeffs=self.coeffs,
+                ln_m_bounds=np.asarray(self.ln_m_bounds),
+                approximant=np.asarray(self.approximant),
+                error_budget=np.asarray(json.dumps(self.error_budget, sort_keys=True)),
+            )
+        os.replace(part, path)
+
+    @classmethod
+    def load(cls, path: str) -> "PhaseSurrogate":
+        with np.load(path, allow_pickle=False) as data:
+            version = int(data["format_version"])
+            if version != SURROGATE_FORMAT_VERSION:
+                raise ValueError(f"Format de surrogate non supporté : {version}")
+            return cls(
+                data["f_Hz"],
+                data["mean"],
+                data["basis"],
+                data["coeffs"],
+                tuple(data["ln_m_bounds"]),
+                approximant=str(data["approximant"]),
+                error_budget=json.loads(str(data["error_budget"])),
+            )
+
+
+# ------------------------- Construction ------------------------- #
+def build_surrogate(
+    f_Hz: np.ndarray,
+    m_bounds: tuple[float, float] = (5.0, 80.0),
+    *,
+    generator: Callable[[np.ndarray, float, float], np.ndarray] | None = None,
+    n_nodes: int = 14,
+    svd_tol: float = 1e-4,
+    n_validation: int = 64,
+    seed: int = 0,
+    anchor: tuple[float, float, np.ndarray] | None = None,
+    approximant: str = "IMRPhenomD",
+) -> PhaseSurrogate:
+    """
+    Construit le surrogate sur la boîte de masses composantes m_bounds.
+
+    Parameters
+    ----------
+    f_Hz : ndarray
+        Grille d'entraînement (typiquement celle de 09_phases_imrphenom.csv).
+    m_bounds : (m_min, m_max)
+        Bornes des masses composantes [M_sun] : domaine des nœuds et de covers().
+    generator : callable(f_Hz, m1, m2) | None
+        Phase exacte ; défaut : compute_phi_ref (PyCBC / LALSuite requis).
+    n_nodes : int
+        Nœuds de Chebyshev–Lobatto par axe ln m (n_nodes (n_nodes + 1) / 2
+        appels au générateur grâce à la symétrie m1 ↔ m2).
+    svd_tol : float
+        Erreur de projection maximale admise sur l'entraînement [rad].
+    n_validation : int
+        Tirages hors nœuds pour le budget d'erreur.
+    anchor : (m1, m2, phi) | None
+        Phase de référence indépendante (ex. colonne phi_ref du CSV
+        chapitre 9) ajoutée au budget d'erreur.
+    """
+    if generator is None:
+        from mcgt.backends.ref_phase import compute_phi_ref
+
+        def generator(f, m1, m2):
+            # phases exactes uniquement (jamais le cache à l'échelle approché)
+            return compute_phi_ref(f, m1, m2, approximant=approximant, scale_aware=False)
+
+    f_Hz = np.asarray(f_Hz, dtype=np.float64)
+    if f_Hz.ndim != 1 or f_Hz.size < 4 or not np.all(np.diff(f_Hz) > 0):
+        raise ValueError("f_Hz doit être 1D, ≥4 points et strictement croissant.")
+    m_min, m_max = float(m_bounds[0]), float(m_bounds[1])
+    if not (0.0 < m_min < m_max):
+        raise ValueError("Exige 0 < m_min < m_max.")
+    if n_nodes < 2:
+        raise ValueError("Exige n_nodes ≥ 2.")
+    n = int(n_nodes)
+
+    # 1) phases d'entraînement sur les nœuds (ln m1, ln m2), m1 ≥ m2 puis miroir
+    ln_m_bounds = (float(np.log(m_min)), float(np.log(m_max)))
+    x_nodes = _lobatto(n)
+    lo, hi = ln_m_bounds
+    m_nodes = np.exp(0.5 * (lo + hi) + 0.5 * (hi - lo) * x_nodes)
+    pairs = [(i, j) for i in range(n) for j in range(i + 1)]
+    phases = np.stack(
+        [np.asarray(generator(f_Hz, float(m_nodes[i]), float(m_nodes[j])), dtype=np.float64) for i, j in pairs]
+    )
+    phases -= phases[:, :1]
+    train = np.empty((n, n, f_Hz.size))
+    for (i, j), phi in zip(pairs, phases):
+        train[i, j] = train[j, i] = phi
+    train = train.reshape(n * n, -1)
+
+    # 2) base SVD tronquée au plus petit rang respectant svd_tol
+    mean = train.mean(axis=0)
+    centred = train - mean
+    _, sing, vt = np.linalg.svd(centred, full_matrices=False)
+    rank = vt.shape[0]
+    for r in range(1, vt.shape[0] + 1):
+        resid = centred - (centred @ vt[:r].T) @ vt[:r]
+        if float(np.max(np.abs(resid))) <= svd_tol:
+            rank = r
+            break
+    basis = vt[:rank]
+    proj = (centred @ basis.T).reshape(n, n, rank)
+    svd_max = float(np.max(np.abs(centred - (centred @ basis.T) @ basis)))
+
+    # 3) interpolation de Chebyshev des coefficients : V_x C V_yᵀ = proj
+    vander = cheb.chebvander(x_nodes, n - 1)
+    tmp = np.linalg.solve(vander, proj.reshape(n, -1)).reshape(n, n, rank)
+    coeffs = np.linalg.solve(vander, tmp.transpose(1, 0, 2).reshape(n, -1))
+    coeffs = coeffs.reshape(n, n, rank).transpose(2, 1, 0)
+
+    surrogate = PhaseSurrogate(f_Hz, mean, basis, coeffs, ln_m_bounds, approximant=approximant)
+
+    # 4) budget d'erreur
+    budget = {
+        "n_train": len(pairs),
+        "n_basis": int(rank),
+        "svd_max_rad": svd_max,
+        "m_bounds": [m_min, m_max],
+    }
+    if n_validation > 0:
+        rng = np.random.default_rng(seed)
+        v_m1, v_m2 = np.exp(rng.uniform(*ln_m_bounds, (2, n_validation)))
+        exact = np.stack([generator(f_Hz, float(a), float(b)) for a, b in zip(v_m1, v_m2)])
+        exact -= exact[:, :1]
+        err = np.max(np.abs(surrogate.evaluate_batch(v_m1, v_m2) - exact), axis=1)
+        budget.update(
+            {
+                "n_validation": int(n_validation),
+                "validation_max_rad": float(np.max(err)),
+                "validation_p95_rad": float(np.percentile(err, 95)),
+            }
+        )
+    if anchor is not None:
+        a_m1, a_m2, a_phi = anchor
+        a_phi = np.asarray(a_phi, dtype=np.float64)
+        budget["anchor_max_rad"] = float(np.max(np.abs(surrogate(f_Hz, a_m1, a_m2) - (a_phi - a_phi[0]))))
+    surrogate.error_budget = budget
+    logger.info("Surrogate φ_ref construit : %s", budget)
+    return surrogate
+
+
+# ------------------------- Surrogate par défaut ------------------------- #
+_default: dict[str, PhaseSurrogate | None] = {}
+
+
+def load_surrogate(path: str) -> PhaseSurrogate:
+    """Charge un surrogate sauvegardé par PhaseSurrogate.save."""
+    return PhaseSurrogate.load(path)
+
+
+def default_surrogate() -> PhaseSurrogate | None:
+    """Surrogate au chemin par défaut (ou MCGT_REF_SURROGATE), None si absent."""
+    path = os.environ.get(SURROGATE_ENV) or SURROGATE_PATH_DEFAULT
+    if path not in _default:
+        surrogate = None
+        if os.path.exists(path):
+            try:
+                surrogate = load_surrogate(path)
+            except Exception as e:
+                logger.warning("Surrogate illisible (%s) : %s", path, e)
+        _default[path] = surrogate
+    return _default[path]
+
+
+# ------------------------- CLI de construction ------------------------- #
+if __name__ == "__main__":
+    import argparse
+
+    import pandas as pd
+
+    parser = argparse.ArgumentParser(
+        description="Construit le surrogate φ_ref (nécessite PyCBC ou LALSuite)."
+    )
+    parser.add_argument(
+        "--grid",
+        default=os.path.join("assets", "zz-data", "09_dark_energy_cpl", "09_phases_imrphenom.csv"),
+        help="CSV f_Hz[, phi_ref] : grille d'entraînement et ancre éventuelle",
+    )
+    parser.add_argument("--anchor-m1", type=float, default=30.0)
+    parser.add_argument("--anchor-m2", type=float, default=30.0)
+    parser.add_argument("--m-min", type=float, default=5.0)
+    parser.add_argument("--m-max", type=float, default=80.0)
+    parser.add_argument("--n-nodes", type=int, default=14)
+    parser.add_argument("--svd-tol", type=float, default=1e-4)
+    parser.add_argument("--n-validation", type=int, default=64)
+    parser.add_argument("--out", default=SURROGATE_PATH_DEFAULT)
+    args = parser.parse_args()
+
+    grid = pd.read_csv(args.grid)
+    f_grid = np.asarray(grid["f_Hz"], dtype=np.float64)
+    anchor = None
+    if "phi_ref" in grid.columns:
+        anchor = (args.anchor_m1, args.anchor_m2, np.asarray(grid["phi_ref"], dtype=np.float64))
+    sur = build_surrogate(
+        f_grid,
+        (args.m_min, args.m_max),
+        n_nodes=args.n_nodes,
+        svd_tol=args.svd_tol,
+        n_validation=args.n_validation,
+        anchor=anchor,
+    )
+    sur.save(args.out)
+    print(json.dumps(sur.error_budget, indent=2, sort_keys=True))
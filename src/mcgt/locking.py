@@ -0,0 +1,61 @@
+# mcgt/locking.py
+# -----------------------------------------------------------------------------
+# Verrou inter-processus sur fichier, partagé par les caches disque du projet
+# (store φ_ref de mcgt.backends.ref_phase, result_store à la racine du dépôt).
+# filelock.FileLock s'il est installé, sinon un verrou par création de
+# répertoire (os.mkdir est atomique sur les systèmes de fichiers locaux).
+
+from __future__ import annotations
+
+import os
+import time
+
+try:
+    from filelock import FileLock
+
+    _have_filelock = True
+except Exception:
+    FileLock = None
+    _have_filelock = False
+
+LOCK_SUFFIX = ".lock"
+LOCK_TIMEOUT = 120.0
+
+__all__ = ["LOCK_SUFFIX", "LOCK_TIMEOUT", "file_lock"]
+
+
+class _DirLock:
+    """Verrou minimal : existence du répertoire `<path>.dirlock`."""
+
+    def __init__(self, path: str, timeout: float):
+        self.lockdir = path + ".dirlock"
+        self.timeout = timeout
+
+    def __enter__(self):
+        t0 = time.time()
+        while True:
+            try:
+                os.mkdir(self.lockdir)
+                return self
+            except FileExistsError:
+                if (time.time() - t0) > self.timeout:
+                    raise TimeoutError(f"Timeout acquiring simple lock: {self.lockdir}")
+                time.sleep(0.1)
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            os.rmdir(self.lockdir)
+        except Exception:
+            pass
+
+
+def file_lock(path: str, timeout: float = LOCK_TIMEOUT):
+    """
+    Retourne un context manager verrouillant `path` (fichier `path + LOCK_SUFFIX`).
+
+    Lève TimeoutError si le verrou n'est pas obtenu en `timeout` secondes.
+    """
+    lock_path = str(path) + LOCK_SUFFIX
+    if _have_filelock and FileLock is not None:
+        return FileLock(lock_path, timeout=timeout)
+    return _DirLock(lock_path, timeout)
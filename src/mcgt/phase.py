@@ -12,25 +12,49 @@ Fonctions exposées
 - build_loglin_grid()    : grille log–uniforme entre fmin et fmax
 - check_log_spacing()    : validation de l’espacement log uniforme
 - phi_gr()               : phase GR (SPA) jusqu’à 3.5-PN (approximation)
+- phi_gr_batch()         : phase GR (N, F) pour N couples de masses (Horner en v)
 - corr_phase()           : correcteur analytique δφ(f) = ∫δt(f) df
-- solve_mcgt()           : phase MCGT = φ_GR − δφ
+- phi_mcgt()             : phase MCGT = φ_ref − δφ, alignée à f_min
+- phi_ref_batch()        : phases de référence (N, F), une par couple (m1, m2) unique
+- phi_mcgt_batch()       : phases MCGT alignées (N, F) pour une table de paramètres
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Any
 
 import numpy as np
 
 from mcgt.constants import G_SI
 
+# numba optionnel : noyau compilé de la phase GR
+try:
+    from numba import njit
+
+    _have_numba = True
+except Exception:
+    _have_numba = False
+
+    def njit(*args, **kwargs):
+        """Décorateur de repli : les fonctions restent utilisables sans numba."""
+
+        def _decorator(func):
+            return func
+
+        return _decorator
+
 __all__ = [
     "PhaseParams",
     "build_loglin_grid",
     "check_log_spacing",
     "phi_gr",
+    "phi_gr_batch",
     "corr_phase",
-    "solve_mcgt",
+    "corr_phase_batch",
+    "phi_mcgt",
+    "phi_ref_batch",
+    "phi_mcgt_batch",
 ]
 
 
@@ -93,6 +117,13 @@ _CPN = {
 }
 
 
+# Même série, coefficients denses par puissance de v (c_1 = 0) pour Horner
+_CPN_DENSE = np.array([_CPN.get(k, 0.0) for k in range(8)])
+
+_MSUN_S = 4.925490947e-6  # G M☉ / c³ [s]
+PHASE_KERNEL_BACKENDS = ("numpy", "numba")
+
+
 def _symmetric_eta(m1: float, m2: float) -> float:
     """Rapport de masse symétrique η = m1 m2 / (m1+m2)^2 (∈ (0,0.25])."""
     return m1 * m2 / (m1 + m2) ** 2
@@ -122,17 +153,115 @@ def phi_gr(freqs: np.ndarray, p: PhaseParams) -> np.ndarray:
         raise ValueError("La grille freqs doit être 1D et strictement croissante.")
 
     # Conversion masse solaire → secondes (G = c = 1)
-    M_s = (p.m1 + p.m2) * 4.925490947e-6  # masse totale (s)
+    M_s = (p.m1 + p.m2) * _MSUN_S  # masse totale (s)
     eta = _symmetric_eta(p.m1, p.m2)
-    v = (np.pi * M_s * freqs) ** (1 / 3)  # vitesse PN
+    v = np.cbrt(np.pi * M_s * freqs)  # vitesse PN
+
+    # Série PN (Horner), multipliée par v⁻⁵
+    series = _pn_series_over_v5(v, _CPN_DENSE)
+    series *= 3 / (128 * eta)
+    series += 2 * np.pi * p.tc * freqs
+    series -= p.phi0 + np.pi / 4
+    return series
+
+
+def _pn_series_over_v5(v: np.ndarray, coeffs: np.ndarray) -> np.ndarray:
+    """Σ c_k v^k évaluée en Horner puis divisée par v⁵ (nouveau tableau)."""
+    series = np.full_like(v, coeffs[7])
+    for c_k in coeffs[6::-1]:
+        series *= v
+        series += c_k
+    v2 = v * v
+    series /= v2 * v2 * v
+    return series
+
+
+@njit(cache=True)
+def _phi_gr_kernel(cbrt_f, two_pi_f, v_scale, prefac, tc, offset, coeffs, out):
+    """Boucle compilée (N, F) : série PN en Horner, v⁻⁵ par produits."""
+    n_rows, n_freq = out.shape
+    for i in range(n_rows):
+        for j in range(n_freq):
+            v = v_scale[i] * cbrt_f[j]
+            series = coeffs[7]
+            for k in range(6, -1, -1):
+                series = series * v + coeffs[k]
+            v2 = v * v
+            out[i, j] = two_pi_f[j] * tc[i] - offset[i] + prefac[i] * series / (v2 * v2 * v)
+    return out
+
+
+def phi_gr_batch(
+    freqs: np.ndarray,
+    m1,
+    m2,
+    *,
+    tc=0.0,
+    phi0=0.0,
+    dtype=np.float64,
+    kernel_backend: str | None = None,
+) -> np.ndarray:
+    """
+    Phase GR (SPA) de `phi_gr` pour N couples de masses, forme (N, F).
 
-    # Série PN
-    series = np.zeros_like(freqs)
-    for k, c_k in _CPN.items():
-        series += c_k * v**k
-    prefac = 3 / (128 * eta) * v ** (-5)
+    La série PN est évaluée en Horner sur v (une seule matrice v de forme
+    (N, F), sans recalcul de v**k par ordre) et v⁻⁵ par produits.
 
-    return 2 * np.pi * freqs * p.tc - p.phi0 - np.pi / 4 + prefac * series
+    Parameters
+    ----------
+    freqs : np.ndarray
+        Grille 1-D de fréquences (Hz), strictement croissante.
+    m1, m2, tc, phi0 : float ou array-like
+        Masses [M☉], temps de coalescence [s] et phase initiale [rad] ;
+        diffusés sur une dimension N commune.
+    dtype : np.float64 (défaut) ou np.float32
+        float32 : mode exploratoire (erreur relative ~1e-6, mémoire divisée
+        par deux).
+    kernel_backend : "numpy", "numba" ou None
+        None : noyau compilé si numba est disponible, sinon NumPy.
+
+    Returns
+    -------
+    np.ndarray
+        Phases φ_GR(f) en radians, forme (N, F).
+    """
+    dtype = np.dtype(dtype)
+    if dtype not in (np.dtype(np.float64), np.dtype(np.float32)):
+        raise ValueError("dtype doit être float64 ou float32.")
+    if kernel_backend is None:
+        kernel_backend = "numba" if _have_numba else "numpy"
+    if kernel_backend not in PHASE_KERNEL_BACKENDS:
+        raise ValueError(f"kernel_backend inconnu : {kernel_backend!r} (attendu : {PHASE_KERNEL_BACKENDS}).")
+
+    freqs = np.asarray(freqs, dtype=float)
+    if freqs.ndim != 1 or not np.all(np.diff(freqs) > 0):
+        raise ValueError("La grille freqs doit être 1D et strictement croissante.")
+
+    m1, m2, tc, phi0 = (
+        np.array(x, dtype=float).reshape(-1) for x in np.broadcast_arrays(m1, m2, tc, phi0)
+    )
+    # Conversion masse solaire → secondes (G = c = 1) ; v = (π M f)^(1/3)
+    # factorisé en (π M)^(1/3) · f^(1/3) : racines cubiques sur N + F points.
+    m_tot = m1 + m2
+    eta = m1 * m2 / m_tot**2
+    v_scale = np.cbrt(np.pi * m_tot * _MSUN_S).astype(dtype, copy=False)
+    prefac = (3 / (128 * eta)).astype(dtype, copy=False)
+    offset = (phi0 + np.pi / 4).astype(dtype, copy=False)
+    tc = tc.astype(dtype, copy=False)
+    cbrt_f = np.cbrt(freqs).astype(dtype, copy=False)
+    two_pi_f = (2 * np.pi * freqs).astype(dtype, copy=False)
+    coeffs = _CPN_DENSE.astype(dtype, copy=False)
+
+    if kernel_backend == "numba" and _have_numba:
+        out = np.empty((v_scale.size, freqs.size), dtype=dtype)
+        return _phi_gr_kernel(cbrt_f, two_pi_f, v_scale, prefac, tc, offset, coeffs, out)
+
+    v = v_scale[:, None] * cbrt_f  # vitesse PN, (N, F)
+    series = _pn_series_over_v5(v, coeffs)
+    series *= prefac[:, None]
+    series += two_pi_f * tc[:, None]
+    series -= offset[:, None]
+    return series
 
 
 # ----------------------------------------------------------------------#
@@ -185,3 +314,102 @@ def phi_mcgt(
 
     # 4. Alignement final
     return phi_raw - phi_raw[0]
+
+
+# ----------------------------------------------------------------------#
+# 6. Version vectorisée : N échantillons × F fréquences
+# ----------------------------------------------------------------------#
+def corr_phase_batch(
+    freqs: np.ndarray, fmin: float, q0star: np.ndarray, alpha: np.ndarray
+) -> np.ndarray:
+    """
+    δφ(f) de `corr_phase` pour N couples (q0★, α) à la fois, forme (N, F).
+
+    Les lignes avec α ≈ 1 (même critère `np.isclose`) prennent la branche
+    logarithmique ; les autres la loi de puissance, calculée par diffusion.
+    Chaque ligne est identique au bit près à `corr_phase`.
+    """
+    freqs = np.asarray(freqs, dtype=float)
+    q0star = np.asarray(q0star, dtype=float).reshape(-1, 1)
+    alpha = np.asarray(alpha, dtype=float).reshape(-1, 1)
+    log_rows = np.isclose(alpha[:, 0], 1.0)
+
+    out = np.empty((alpha.shape[0], freqs.size), dtype=float)
+    pw = ~log_rows
+    if np.any(pw):
+        beta = 1 - alpha[pw]
+        out[pw] = (2 * np.pi * q0star[pw] / beta) * (freqs**beta - fmin**beta)
+    if np.any(log_rows):
+        out[log_rows] = 2 * np.pi * q0star[log_rows] * np.log(freqs / fmin)
+    return out
+
+
+def _param_column(params_table: Any, name: str) -> np.ndarray:
+    """Colonne `name` d'une table (dict, DataFrame, tableau structuré) en float 1-D."""
+    try:
+        column = params_table[name]
+    except (KeyError, ValueError, IndexError) as exc:
+        raise KeyError(f"Colonne '{name}' absente de params_table.") from exc
+    return np.asarray(column, dtype=float).reshape(-1)
+
+
+def phi_ref_batch(
+    freqs: np.ndarray, m1: np.ndarray, m2: np.ndarray, **kwargs
+) -> np.ndarray:
+    """
+    Phases de référence φ_ref(f) pour N couples (m1, m2), forme (N, F).
+
+    `compute_phi_ref` n'est appelé qu'une fois par couple (m1, m2) distinct ;
+    les lignes sont ensuite obtenues par indexation. Les mots-clés sont
+    transmis à `compute_phi_ref`.
+    """
+    from mcgt.backends.ref_phase import compute_phi_ref
+
+    freqs = np.asarray(freqs, dtype=float)
+    masses = np.column_stack(
+        [np.asarray(m1, dtype=float).reshape(-1), np.asarray(m2, dtype=float).reshape(-1)]
+    )
+    if masses.shape[0] == 0:
+        return np.empty((0, freqs.size), dtype=float)
+    pairs, inverse = np.unique(masses, axis=0, return_inverse=True)
+    table = np.stack(
+        [compute_phi_ref(freqs, float(a), float(b), **kwargs) for a, b in pairs]
+    )
+    return table[inverse.reshape(-1)]
+
+
+def phi_mcgt_batch(
+    freqs: np.ndarray,
+    params_table: Any,
+    fmin: float | None = None,
+    *,
+    phi_ref: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Phase MCGT alignée pour N échantillons : tableau float64 (N, F).
+
+    Équivaut ligne à ligne à `phi_mcgt(freqs, row, fmin)`, sans boucle
+    Python sur les échantillons :
+    φ = φ_ref − δφ, puis alignement φ ← φ − φ[:, 0].
+
+    Parameters
+    ----------
+    freqs : np.ndarray
+        Grille 1-D de fréquences (Hz), strictement croissante.
+    params_table : mapping, DataFrame ou tableau structuré
+        Colonnes m1, m2, q0star, alpha (longueur N).
+    fmin : float | None
+        Fréquence de référence de δφ (défaut : freqs[0]).
+    phi_ref : np.ndarray | None
+        Phases de référence (N, F) déjà calculées (sinon `phi_ref_batch`).
+    """
+    freqs = np.asarray(freqs, dtype=float)
+    m1, m2, q0star, alpha = (
+        _param_column(params_table, name) for name in ("m1", "m2", "q0star", "alpha")
+    )
+    f0 = float(freqs[0] if fmin is None else fmin)
+
+    if phi_ref is None:
+        phi_ref = phi_ref_batch(freqs, m1, m2)
+    phi_raw = np.asarray(phi_ref, dtype=float) - corr_phase_batch(freqs, f0, q0star, alpha)
+    return phi_raw - phi_raw[:, :1]
@@ -19,11 +19,29 @@ Remarques :
 from __future__ import annotations
 
 import pathlib
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from collections.abc import Sequence
+from dataclasses import dataclass, fields
 
 import numpy as np
-from scipy import integrate
-from scipy.interpolate import PchipInterpolator
+from scipy import integrate, sparse
+from scipy.interpolate import CubicSpline, PchipInterpolator
+
+# numba optionnel : noyaux compilés pour le second membre Klein–Gordon
+try:
+    from numba import njit
+
+    _have_numba = True
+except Exception:
+    _have_numba = False
+
+    def njit(*args, **kwargs):
+        """Décorateur de repli : les fonctions restent utilisables sans numba."""
+
+        def _decorator(func):
+            return func
+
+        return _decorator
 
 __all__ = [
     "PertParams",
@@ -35,6 +53,8 @@ __all__ = [
     "p_phi_of_a",
     "compute_cs2",
     "evaluate_sentinel",
+    "screen_sentinel",
+    "screen_sentinel_batch",
     "compute_delta_phi",
     "_default_params",
 ]
@@ -192,6 +212,98 @@ def compute_cs2(k_vals: np.ndarray, a_vals: np.ndarray, p: PertParams) -> np.nda
     return cs2
 
 
+def _filter_extremes(k_vals: np.ndarray, k0) -> np.ndarray:
+    """(max, min) sur la grille en k du filtre exp(-(k/k0)²), forme (n_jeux, 2)."""
+    filt = np.exp(-((k_vals[np.newaxis, :] / np.reshape(k0, (-1, 1))) ** 2))
+    return np.stack([filt.max(axis=1), filt.min(axis=1)], axis=1)
+
+
+def _causality_ok(
+    k_vals: np.ndarray, raw_cs2_a: np.ndarray, k0, cs2_param
+) -> np.ndarray:
+    """Vérifie 0 ≤ c_s²(k,a) ≤ 1 (et finitude) sur la grille (k, a) en O(n_a) par jeu.
+
+    Le filtre exp(-(k/k0)²) ne dépend que de k : pour chaque a, les extrêmes
+    de c_s²(k, a) sur la grille sont atteints aux valeurs max/min du filtre
+    (l'arrondi IEEE est monotone), ce qui équivaut au contrôle complet
+    (n_k, n_a). `raw_cs2_a` est de forme (n_a,) ou (n_jeux, n_a), `k0` et
+    `cs2_param` scalaires ou de forme (n_jeux,).
+    """
+    raw = np.atleast_2d(raw_cs2_a)
+    if k_vals.size == 0:
+        return np.ones(raw.shape[0], dtype=bool)
+    filt_ext = _filter_extremes(k_vals, k0)
+    vals = filt_ext[:, :, np.newaxis] * raw[:, np.newaxis, :] * np.reshape(cs2_param, (-1, 1, 1))
+    return np.all(np.isfinite(vals) & (vals >= 0.0) & (vals <= 1.0), axis=(1, 2))
+
+
+def _stack_params(params: Sequence[PertParams]) -> PertParams:
+    """Empile des `PertParams` en un seul jeu à champs de forme (n_jeux, 1)."""
+    cols = {}
+    for f in fields(PertParams):
+        vals = [getattr(q, f.name) for q in params]
+        cols[f.name] = None if any(v is None for v in vals) else np.asarray(vals, dtype=float)[:, np.newaxis]
+    return PertParams(**cols)
+
+
+def screen_sentinel_batch(
+    k_vals: np.ndarray, a_vals: np.ndarray, params: Sequence[PertParams]
+) -> np.ndarray:
+    """Pré-filtre Sentinel vectorisé (positivité + causalité) pour un lot de paramètres.
+
+    Retourne un tableau booléen (n_jeux,) égal à
+    `evaluate_sentinel(k_vals, a_vals, p, check_delta_phi=False).accepted`
+    pour chaque jeu, sans interpolation ni grille (k, a) :
+    - le fond (φ₀, φ₀′, H) est évalué une fois pour ρ et p, sur tout le lot ;
+    - la causalité n'est testée que pour les jeux à ρ > 0 (court-circuit),
+      via les extrêmes du filtre gaussien en k (coût O(n_a) par jeu).
+
+    Les décisions coïncident avec le Sentinel complet, sauf cas dégénérés où
+    c_s² n'est que du bruit d'arrondi (ρ constant à la précision machine).
+    """
+    k_vals = np.asarray(k_vals, dtype=float)
+    a_vals = np.asarray(a_vals, dtype=float)
+    if len(params) == 0:
+        return np.zeros(0, dtype=bool)
+    ps = _stack_params(params)
+
+    φ0 = phi0_of_a(a_vals, ps)
+    dφ_dt = dphi0_da(a_vals, ps) * a_vals * H_of_a(a_vals, ps)
+    kinetic = 0.5 * dφ_dt**2
+    V = 0.5 * ps.m_phi**2 * φ0**2
+    rho = kinetic + V
+    accepted = np.all(np.isfinite(rho) & (rho > 0.0), axis=1)
+
+    idx = np.flatnonzero(accepted)
+    if idx.size:
+        dp_da = np.gradient((kinetic - V)[idx], a_vals, axis=1)
+        drho_da = np.gradient(rho[idx], a_vals, axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            raw = np.where(drho_da != 0.0, dp_da / drho_da, 0.0)
+        k0, cs2_param = ps.k0[idx, 0], ps.cs2_param[idx, 0]
+
+        # L'interpolant PCHIP de `_raw_cs2_of_a` reproduit exactement les nœuds
+        # intérieurs, et le dernier à quelques ulps près : on ne le reconstruit
+        # (à partir des trois derniers points) que si la décision en dépend.
+        if k_vals.size:
+            fc = _filter_extremes(k_vals, k0) * cs2_param[:, np.newaxis]
+            last = fc * raw[:, -1:]
+            with np.errstate(invalid="ignore"):
+                tol = 1.0e-9 * np.abs(fc) * np.max(np.abs(raw[:, -3:]), axis=1, keepdims=True)
+            near = np.any((np.abs(last) <= tol) | (np.abs(last - 1.0) <= tol), axis=1)
+            if np.any(near):
+                raw[near, -1] = PchipInterpolator(
+                    a_vals[-3:], raw[near][:, -3:], axis=1, extrapolate=True
+                )(a_vals[-1])
+        accepted[idx] = _causality_ok(k_vals, raw, k0, cs2_param)
+    return accepted
+
+
+def screen_sentinel(k_vals: np.ndarray, a_vals: np.ndarray, p: PertParams) -> bool:
+    """Pré-filtre Sentinel rapide pour un seul jeu (voir `screen_sentinel_batch`)."""
+    return bool(screen_sentinel_batch(k_vals, a_vals, [p])[0])
+
+
 def evaluate_sentinel(
     k_vals: np.ndarray,
     a_vals: np.ndarray,
@@ -218,13 +330,7 @@ def evaluate_sentinel(
         reasons.append("rho_nonpositive_or_nonfinite")
 
     raw_cs2_a = _raw_cs2_of_a(a_vals, p)
-    K, _ = np.meshgrid(k_vals, a_vals, indexing="ij")
-    raw_cs2 = np.exp(-((K / p.k0) ** 2)) * raw_cs2_a[np.newaxis, :] * p.cs2_param
-    causality_ok = bool(
-        np.all(np.isfinite(raw_cs2))
-        and np.all(raw_cs2 >= 0.0)
-        and np.all(raw_cs2 <= 1.0)
-    )
+    causality_ok = bool(_causality_ok(k_vals, raw_cs2_a, p.k0, p.cs2_param)[0])
     if not causality_ok:
         reasons.append("cs2_out_of_bounds_or_nonfinite")
 
@@ -278,15 +384,201 @@ def _kg_eq(a: float, y: np.ndarray, k: float, p: PertParams) -> np.ndarray:
     return np.array([y[1], drag + stiff + source], dtype=float)
 
 
+def _kg_jac(a: float, y: np.ndarray, k: float, p: PertParams) -> np.ndarray:
+    """Jacobien analytique 2×2 de `_kg_eq` (la source ne dépend pas de δφ)."""
+    H = float(H_of_a(a, p))
+    return np.array(
+        [[0.0, 1.0], [-((k**2) / a**2 + p.m_eff_const**2) / (a * H) ** 2, -2.0 / a]],
+        dtype=float,
+    )
+
+
+# Nœuds par e-fold des tables de fond (erreur relative des splines < 1e-8).
+BACKGROUND_NODES_PER_EFOLD = 512
+
+
+def _background_table(
+    a_min: float, a_max: float, p: PertParams
+) -> tuple[float, float, np.ndarray]:
+    """Splines cubiques de H, φ₀ et φ₀′ en x = ln a, calculées une fois par jeu de paramètres.
+
+    Retour : (x0, 1/dx, coeffs) avec coeffs de forme (3, 4, n_intervalles),
+    coefficients polynomiaux locaux (convention `CubicSpline.c`) sur une grille
+    uniforme en ln a, évaluables en O(1) dans le noyau compilé.
+    """
+    x_lo, x_hi = np.log(a_min), np.log(a_max)
+    n_nodes = max(16, int(np.ceil(BACKGROUND_NODES_PER_EFOLD * (x_hi - x_lo))) + 1)
+    x = np.linspace(x_lo, x_hi, n_nodes)
+    a = np.exp(x)
+    coeffs = np.stack(
+        [
+            CubicSpline(x, H_of_a(a, p)).c,
+            CubicSpline(x, phi0_of_a(a, p)).c,
+            CubicSpline(x, dphi0_da(a, p)).c,
+        ]
+    )
+    return float(x_lo), float((n_nodes - 1) / (x_hi - x_lo)), np.ascontiguousarray(coeffs)
+
+
+@njit(cache=True)
+def _background_at(a, x0, inv_dx, coeffs):
+    """(H, φ₀, φ₀′)(a) depuis les tables de `_background_table`."""
+    n = coeffs.shape[2]
+    u = (np.log(a) - x0) * inv_dx
+    i = min(max(int(u), 0), n - 1)
+    t = (u - i) / inv_dx
+    out = np.empty(3)
+    for j in range(3):
+        c = coeffs[j]
+        out[j] = ((c[0, i] * t + c[1, i]) * t + c[2, i]) * t + c[3, i]
+    return out[0], out[1], out[2]
+
+
+@njit(cache=True)
+def _kg_rhs_compiled(a, y, k, consts, x0, inv_dx, coeffs):
+    """Second membre compilé de `_kg_eq`.
+
+    consts = (m_eff_const², m_phi², Φ₀ exp(-(k/k_split)²), a_eq).
+    """
+    H, phi0, dphi0 = _background_at(a, x0, inv_dx, coeffs)
+    inv_aH2 = 1.0 / (a * H) ** 2
+    Phi = consts[2] / (1.0 + (a / consts[3]) ** 3)
+    source = (4.0 * dphi0 * a * H - 2.0 * consts[1] * phi0) * Phi * inv_aH2
+    out = np.empty(2)
+    out[0] = y[1]
+    out[1] = -2.0 * y[1] / a - (k * k / (a * a) + consts[0]) * inv_aH2 * y[0] + source
+    return out
+
+
+@njit(cache=True)
+def _kg_jac_compiled(a, y, k, consts, x0, inv_dx, coeffs):
+    """Jacobien analytique compilé, compagnon de `_kg_rhs_compiled`."""
+    H, _phi0, _dphi0 = _background_at(a, x0, inv_dx, coeffs)
+    jac = np.zeros((2, 2))
+    jac[0, 1] = 1.0
+    jac[1, 0] = -(k * k / (a * a) + consts[0]) / (a * H) ** 2
+    jac[1, 1] = -2.0 / a
+    return jac
+
+
+def _kg_eq_stacked(a: float, y: np.ndarray, k_vals: np.ndarray, p: PertParams) -> np.ndarray:
+    """Second membre de `_kg_eq` pour n_k modes empilés, y = [δφ_0..δφ_{n-1}, δφ'_0..δφ'_{n-1}].
+
+    Le fond (H, φ₀, φ₀′) n'est évalué qu'une fois par appel pour tous les modes.
+    """
+    n = k_vals.size
+    H = float(H_of_a(a, p))
+    inv_aH2 = 1.0 / (a * H) ** 2
+    φ0 = float(phi0_of_a(a, p))
+    φ0_p = float(dphi0_da(a, p))
+    V_p = p.m_phi**2 * φ0
+    Phi = p.Phi0 * np.exp(-((k_vals / p.k_split) ** 2)) / (1.0 + (a / p.a_eq) ** 3)
+
+    delta, ddelta = y[:n], y[n:]
+    out = np.empty_like(y)
+    out[:n] = ddelta
+    out[n:] = (
+        -2.0 * ddelta / a
+        - (k_vals**2 / a**2 + p.m_eff_const**2) * inv_aH2 * delta
+        + (4.0 * φ0_p * a * H - 2.0 * V_p) * Phi * inv_aH2
+    )
+    return out
+
+
+def _kg_jac_stacked(a: float, y: np.ndarray, k_vals: np.ndarray, p: PertParams) -> sparse.csc_matrix:
+    """Jacobien analytique (creux, diagonal par blocs 2×2) de `_kg_eq_stacked`."""
+    n = k_vals.size
+    H = float(H_of_a(a, p))
+    stiff = -(k_vals**2 / a**2 + p.m_eff_const**2) / (a * H) ** 2
+    eye = sparse.identity(n, format="csc")
+    return sparse.bmat(
+        [[None, eye], [sparse.diags(stiff, format="csc"), (-2.0 / a) * eye]],
+        format="csc",
+    )
+
+
+def _initial_amplitudes(k_vals: np.ndarray, a_min: float, p: PertParams) -> np.ndarray:
+    """Amplitudes initiales δφ(k, a_min), avec gel progressif des modes sous-horizon."""
+    H_a_min = float(H_of_a(a_min, p))
+    freeze = np.exp(-((k_vals / a_min) / H_a_min) / p.freeze_scale)
+    return freeze * p.delta_phi_param * p.phi0_init * np.exp(-((k_vals / p.k_split) ** 2))
+
+
+def _solve_delta_phi_block(
+    k_vals: np.ndarray, a_vals: np.ndarray, p: PertParams, stacked: bool = False
+) -> np.ndarray:
+    """δφ(k, a) brut (n_k, n_a) sur un bloc de modes, mode par mode ou empilé."""
+    a_min, a_max = float(a_vals[0]), float(a_vals[-1])
+    init_amp = _initial_amplitudes(k_vals, a_min, p)
+    out = np.zeros((k_vals.size, a_vals.size), dtype=float)
+    if k_vals.size == 0:
+        return out
+
+    if stacked:
+        sol = integrate.solve_ivp(
+            _kg_eq_stacked,
+            (a_min, a_max),
+            np.concatenate([init_amp, np.zeros_like(init_amp)]),
+            t_eval=a_vals,
+            method="Radau",
+            jac=_kg_jac_stacked,
+            args=(k_vals, p),
+            rtol=1e-6,
+            atol=1e-9,
+        )
+        if not sol.success:
+            raise RuntimeError(
+                f"Échec d'intégration Radau (système empilé, n_k={k_vals.size}) : {sol.message}"
+            )
+        return np.nan_to_num(sol.y[: k_vals.size], copy=False)
+
+    if _have_numba:
+        table = _background_table(a_min, a_max, p)
+        phi_k = p.Phi0 * np.exp(-((k_vals / p.k_split) ** 2))
+    for i, k in enumerate(k_vals):
+        if _have_numba:
+            consts = np.array([p.m_eff_const**2, p.m_phi**2, phi_k[i], p.a_eq])
+            rhs, jac, args = _kg_rhs_compiled, _kg_jac_compiled, (float(k), consts, *table)
+        else:
+            rhs, jac, args = _kg_eq, _kg_jac, (float(k), p)
+        sol = integrate.solve_ivp(
+            rhs,
+            (a_min, a_max),
+            np.array([init_amp[i], 0.0]),
+            t_eval=a_vals,
+            method="Radau",
+            jac=jac,
+            args=args,
+            rtol=1e-6,
+            atol=1e-9,
+        )
+        if not sol.success:
+            raise RuntimeError(f"Échec d'intégration Radau pour k={k} : {sol.message}")
+        out[i] = np.nan_to_num(sol.y[0], copy=False)
+    return out
+
+
 # -----------------------------------------------------------------------------#
 # 5) δφ/φ(k,a)
 # -----------------------------------------------------------------------------#
 def compute_delta_phi(
-    k_vals: np.ndarray, a_vals: np.ndarray, p: PertParams
+    k_vals: np.ndarray,
+    a_vals: np.ndarray,
+    p: PertParams,
+    *,
+    stacked: bool = False,
+    n_workers: int | None = None,
 ) -> np.ndarray:
     """
     Intègre δφ/φ(k,a) sur la grille (n_k, n_a) via solve_ivp (Radau).
 
+    Les modes k sont indépendants :
+    - `stacked=True` intègre un bloc de modes comme un seul système
+      diagonal par blocs, avec Jacobien analytique creux (fond évalué une
+      seule fois par pas pour tous les modes) ;
+    - `n_workers > 1` découpe la grille en k en blocs contigus résolus dans
+      un pool de processus (chaque bloc empilé ou mode par mode).
+
     Retour :
       sol_mat[i, j] = (δφ/φ)(k_i, a_j)
 
@@ -299,35 +591,26 @@ def compute_delta_phi(
         raise ValueError("k_vals et a_vals doivent être 1D.")
     if not (np.all(np.diff(k_vals) > 0) and np.all(np.diff(a_vals) > 0)):
         raise ValueError("k_vals et a_vals doivent être strictement croissants.")
-
-    a_min, a_max = float(a_vals.min()), float(a_vals.max())
-    H_a_min = float(H_of_a(a_min, p))
+    if n_workers is not None and n_workers < 1:
+        raise ValueError(f"n_workers doit être >= 1 (reçu {n_workers}).")
 
     φ0_grid = phi0_of_a(a_vals, p)
-    sol_mat = np.zeros((k_vals.size, a_vals.size), dtype=float)
-
-    for i, k in enumerate(k_vals):
-        # gel progressif continu (suppression des modes profonds sous-horizon)
-        freeze = np.exp(-((k / a_min) / H_a_min) / p.freeze_scale)
-
-        init_amp = (
-            freeze * p.delta_phi_param * p.phi0_init * np.exp(-((k / p.k_split) ** 2))
-        )
-
-        sol = integrate.solve_ivp(
-            lambda aa, yy: _kg_eq(float(aa), yy, float(k), p),
-            (a_min, a_max),
-            (float(init_amp), 0.0),
-            t_eval=a_vals,
-            method="Radau",
-            rtol=1e-6,
-            atol=1e-9,
-        )
-        if not sol.success:
-            raise RuntimeError(f"Échec d'intégration Radau pour k={k} : {sol.message}")
-
-        sol_mat[i] = np.nan_to_num(sol.y[0], copy=False) / φ0_grid
+    n_blocks = min(int(n_workers or 1), max(k_vals.size, 1))
+    if n_blocks == 1:
+        raw = _solve_delta_phi_block(k_vals, a_vals, p, stacked)
+    else:
+        blocks = np.array_split(k_vals, n_blocks)
+        with ProcessPoolExecutor(max_workers=n_blocks) as pool:
+            parts = pool.map(
+                _solve_delta_phi_block,
+                blocks,
+                [a_vals] * n_blocks,
+                [p] * n_blocks,
+                [stacked] * n_blocks,
+            )
+            raw = np.concatenate(list(parts), axis=0)
 
+    sol_mat = raw / φ0_grid
     if not np.all(np.isfinite(sol_mat)):
         raise RuntimeError("δφ/φ contient NaN ou inf.")
     return sol_mat
@@ -3,7 +3,7 @@ from __future__ import annotations
 import numpy as np
 import pytest
 
-from core_physics import PsiTMGCosmology
+from core_physics import PsiTMGCosmology, TabulatedEoS, de_density_factor, make_eos, w_of_a
 
 
 def test_hubble_z0() -> None:
@@ -33,3 +33,87 @@ def test_ez_positivity() -> None:
     assert np.all(np.isfinite(e2))
     assert np.all(e2 >= 1.0e-10)
 
+
+
+def test_closed_form_eos_kernels() -> None:
+    """Compiled rho_de(a) kernels must match the closed-form densities."""
+    a = np.linspace(0.05, 1.0, 40)
+    w0, wa = -1.1, 0.7
+    expected = {
+        "CPL": a ** (-3.0 * (1.0 + w0 + wa)) * np.exp(-3.0 * wa * (1.0 - a)),
+        "JBP": a ** (-3.0 * (1.0 + w0)) * np.exp(1.5 * wa * (a - 1.0) ** 2),
+        "wCDM": a ** (-3.0 * (1.0 + w0)),
+        "CPL_legacy": a ** (-3.0 * (1.0 + w0)) * np.exp(3.0 * wa * (1.0 - a)),
+    }
+    for model, density in expected.items():
+        np.testing.assert_allclose(de_density_factor(a, w0, wa, model.lower()), density, rtol=1e-14)
+        eos = make_eos(model, w0, wa)
+        rho, w = eos.scalar_state(0.4)
+        assert rho == pytest.approx(float(de_density_factor(0.4, w0, wa, model)), rel=1e-14)
+        assert w == pytest.approx(float(w_of_a(0.4, w0, wa, model)), rel=1e-14)
+    with pytest.raises(ValueError):
+        make_eos("quintom", w0, wa)
+
+
+def test_tabulated_eos_matches_jbp() -> None:
+    """A tabulated w(a) must reproduce the closed-form density and expansion."""
+    w0, wa = -1.1, 0.7
+    a_tab = np.geomspace(1.0e-4, 1.0, 400)
+    tab = TabulatedEoS(a_tab, w_of_a(a_tab, w0, wa, "JBP"))
+    a = np.geomspace(1.0e-3, 1.0, 200)
+    np.testing.assert_allclose(tab.density_of_a(a), de_density_factor(a, w0, wa, "JBP"), rtol=1e-6)
+    assert float(tab.density_of_a(1.0)) == pytest.approx(1.0, abs=1e-12)
+
+    jbp = PsiTMGCosmology(H_0=70.0, Omega_m=0.3, w_0=w0, w_a=wa, sigma_8=0.8, eos="JBP")
+    tabulated = PsiTMGCosmology(H_0=70.0, Omega_m=0.3, w_0=w0, w_a=wa, sigma_8=0.8, eos=tab)
+    assert not jbp.analytic_cpl and not tabulated.analytic_cpl
+    z = np.linspace(0.0, 3.0, 50)
+    np.testing.assert_allclose(tabulated.E(z), jbp.E(z), rtol=1e-6)
+    np.testing.assert_allclose(tabulated.w(z), jbp.w(z), atol=1e-5)
+
+
+@pytest.mark.parametrize("model", ["CPL_legacy", "CPL", "JBP", "wCDM"])
+def test_expansion_uses_eos_density(model: str) -> None:
+    """E(z)^2 must be built from `eos.density_of_a`, and a tabulated w(a) must reproduce it."""
+    w0, wa = -0.9, 0.5
+    cosmo = PsiTMGCosmology(H_0=70.0, Omega_m=0.3, w_0=w0, w_a=wa, sigma_8=0.8, eos=model)
+    assert cosmo.analytic_cpl == (model == "CPL_legacy")
+    z = np.array([0.0, 0.5, 1.0, 2.0, 10.0])
+    a = 1.0 / (1.0 + z)
+    budget = cosmo.Omega_m * (1.0 + z) ** 3 + cosmo.Omega_r * (1.0 + z) ** 4 + cosmo.Omega_de * cosmo.eos.density_of_a(a)
+    np.testing.assert_allclose(np.asarray(cosmo.E(z)) ** 2, budget, rtol=1e-13)
+
+    a_tab = np.geomspace(1.0e-4, 1.0, 400)
+    tab = TabulatedEoS(a_tab, cosmo.eos.w_of_a(a_tab))
+    tabulated = PsiTMGCosmology(H_0=70.0, Omega_m=0.3, w_0=w0, w_a=wa, sigma_8=0.8, eos=tab)
+    np.testing.assert_allclose(tab.density_of_a(a), cosmo.eos.density_of_a(a), rtol=1e-6)
+    np.testing.assert_allclose(tabulated.E(z), cosmo.E(z), rtol=1e-6)
+
+
+def test_default_background_is_the_legacy_z_form() -> None:
+    """The default background keeps the published density; `eos="CPL"` is the exact CPL one."""
+    w0, wa = -0.9, 0.5
+    legacy = PsiTMGCosmology(H_0=70.0, Omega_m=0.3, w_0=w0, w_a=wa, sigma_8=0.8)
+    assert legacy.eos.name == "CPL_legacy"
+    z = np.array([0.5, 1.0, 2.0])
+    np.testing.assert_allclose(legacy.eos.density(z), (1.0 + z) ** (3.0 * (1.0 + w0)) * np.exp(3.0 * wa * z / (1.0 + z)), rtol=1e-14)
+    np.testing.assert_allclose(legacy.eos.w(z), w0 + wa / (1.0 + z), rtol=1e-14)
+
+    cpl = PsiTMGCosmology(H_0=70.0, Omega_m=0.3, w_0=w0, w_a=wa, sigma_8=0.8, eos="CPL")
+    np.testing.assert_allclose(cpl.eos.density(z), [1.26, 1.64, 2.66], atol=5e-3)
+    np.testing.assert_allclose(cpl.w(z), legacy.w(z), rtol=1e-14)
+
+
+@pytest.mark.parametrize("eos", ["CPL_legacy", "CPL", "JBP"])
+def test_scalar_entry_points_match_array_methods(eos: str) -> None:
+    """E_scalar/w_scalar/Omega_m_of_a_scalar/dlnE_dlna_scalar must equal the array path."""
+    cosmo = PsiTMGCosmology(H_0=74.185, Omega_m=0.226, w_0=-1.477, w_a=0.446, sigma_8=0.862, eos=eos)
+    assert tuple(cosmo.coeffs) == (cosmo.Omega_r, cosmo.Omega_m, cosmo.Omega_de, cosmo.w_0, cosmo.w_a)
+    for z in (0.0, 0.37, 2.5, 1100.0):
+        a = 1.0 / (1.0 + z)
+        assert cosmo.E_scalar(z) == float(cosmo.E(z))
+        assert cosmo.w_scalar(z) == float(cosmo.w(z))
+        omega_m_a = cosmo.Omega_m * a**-3.0 / max(float(cosmo.E(z)) ** 2, 1.0e-12)
+        assert cosmo.Omega_m_of_a_scalar(a) == pytest.approx(omega_m_a, rel=1e-14)
+        expected = -1.5 * (1.0 + float(cosmo.w(z)) * (1.0 - omega_m_a))
+        assert cosmo.dlnE_dlna_scalar(a) == pytest.approx(expected, rel=1e-14, abs=1e-15)
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import os
+
+import numpy as np
+
+from dataset_cache import CACHE_DIRNAME, load_csv_table, load_text_array
+
+
+def test_csv_table_cache_roundtrip(tmp_path) -> None:
+    src = tmp_path / "data.csv"
+    src.write_text("z,mu_obs,sigma_mu\n0.1,38.3,0.2\n0.5,42.2,0.15\n", encoding="utf-8")
+
+    first = load_csv_table(src)
+    assert (tmp_path / CACHE_DIRNAME).is_dir()
+    second = load_csv_table(src)
+    assert isinstance(second, np.memmap)
+    ref = np.genfromtxt(src, delimiter=",", names=True, dtype=float, encoding="utf-8")
+    for name in ref.dtype.names:
+        assert np.array_equal(first[name], ref[name])
+        assert np.array_equal(second[name], ref[name])
+
+
+def test_cache_invalidated_when_source_changes(tmp_path) -> None:
+    src = tmp_path / "cov.txt"
+    np.savetxt(src, np.eye(3))
+    assert np.array_equal(load_text_array(src), np.eye(3))
+
+    np.savetxt(src, 2.0 * np.eye(3))
+    os.utime(src, ns=(0, 0))
+    assert np.array_equal(load_text_array(src), 2.0 * np.eye(3))
+
+
+def test_parser_options_are_part_of_the_key(tmp_path) -> None:
+    src = tmp_path / "table.csv"
+    src.write_text("a,b\n1,2\n3,4\n", encoding="utf-8")
+    full = load_text_array(src, delimiter=",", skiprows=1)
+    first_col = load_text_array(src, delimiter=",", skiprows=1, usecols=(0,))
+    assert full.shape == (2, 2)
+    assert np.array_equal(first_col, [1.0, 3.0])
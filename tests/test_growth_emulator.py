@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import growth_emulator
+from core_physics import PsiTMGCosmology
+from growth_emulator import DEFAULT_BOUNDS, GrowthEmulator
+from perturbations import StructureFormation
+
+SMALL_BOUNDS = {
+    "Omega_m": (0.25, 0.35),
+    "w_0": (-1.2, -0.8),
+    "w_a": (-0.5, 0.5),
+    "H_0": (65.0, 75.0),
+}
+SMALL_CONFIG = {"bounds": SMALL_BOUNDS, "degrees": (8, 8, 8, 3), "z_max": 2.0}
+
+
+@pytest.fixture(scope="module")
+def emulator() -> GrowthEmulator:
+    return GrowthEmulator.train(**SMALL_CONFIG)
+
+
+def test_emulator_matches_growth_solver(emulator: GrowthEmulator) -> None:
+    """Emulated f*sigma8 and D must track `StructureFormation` inside the box."""
+    assert emulator.z_max >= 2.0
+    assert emulator.error_report["max_rel_error_fsigma8"] < 1.0e-4
+    assert emulator.error_report["max_rel_error_D"] < 1.0e-4
+
+    cosmo = PsiTMGCosmology(H_0=71.0, Omega_m=0.31, w_0=-0.95, w_a=0.2, sigma_8=0.8)
+    z = np.linspace(0.0, 2.0, 41)
+    params = [[cosmo.Omega_m, cosmo.w_0, cosmo.w_a, cosmo.H_0]]
+    structure = StructureFormation(cosmo)
+    np.testing.assert_allclose(emulator.fsigma8(z, params, [0.8])[0], structure.get_fsigma8(z), rtol=1.0e-4)
+    np.testing.assert_allclose(emulator.growth_factor(z, params)[0], structure.get_growth_factor(z), rtol=1.0e-4)
+
+
+def test_emulator_kernels_agree(emulator: GrowthEmulator) -> None:
+    x = np.random.default_rng(0).uniform(-1.0, 1.0, (16, 4))
+    args = (max(emulator.degrees), emulator.indices, emulator.weights)
+    np.testing.assert_allclose(
+        growth_emulator._sparse_chebyshev_numba(x, *args),
+        growth_emulator._sparse_chebyshev_numpy(x, *args),
+        rtol=1.0e-12,
+        atol=1.0e-12,
+    )
+
+
+def test_emulator_rejects_points_outside_box(emulator: GrowthEmulator) -> None:
+    inside = [0.3, -1.0, 0.0, 70.0]
+    outside = [0.3, -1.0, 1.0, 70.0]
+    assert emulator.covers([inside, outside]).tolist() == [True, False]
+    with pytest.raises(ValueError):
+        emulator.fsigma8([0.5], [outside], [0.8])
+    with pytest.raises(ValueError):
+        emulator.fsigma8([2.5], [inside], [0.8])
+
+
+def test_emulator_save_load_roundtrip(emulator: GrowthEmulator, tmp_path) -> None:
+    path = emulator.save(tmp_path / "emulator.npz")
+    loaded = GrowthEmulator.load(path)
+    params = [[0.28, -1.1, -0.3, 68.0], [0.33, -0.9, 0.4, 73.0]]
+    z = np.linspace(0.0, 1.5, 7)
+    np.testing.assert_array_equal(loaded.fsigma8(z, params, [0.8, 0.7]), emulator.fsigma8(z, params, [0.8, 0.7]))
+    assert loaded.error_report == emulator.error_report
+
+    # A cached file is reused without retraining.
+    assert GrowthEmulator.load_or_train(path=path, **SMALL_CONFIG).n_terms == emulator.n_terms
+    assert GrowthEmulator.config_tag(**SMALL_CONFIG) != GrowthEmulator.config_tag()
+    assert loaded.solver_version == growth_emulator.solver_version()
+
+
+def test_solver_change_invalidates_cached_emulator(emulator: GrowthEmulator, tmp_path, monkeypatch) -> None:
+    path = emulator.save(tmp_path / "emulator.npz")
+    tag = GrowthEmulator.config_tag(**SMALL_CONFIG)
+    retrained = []
+
+    def train(**config):
+        retrained.append(config)
+        return emulator
+
+    monkeypatch.setattr(growth_emulator, "solver_version", lambda: "edited-solver")
+    monkeypatch.setattr(GrowthEmulator, "train", staticmethod(train))
+    assert GrowthEmulator.config_tag(**SMALL_CONFIG) != tag
+    assert GrowthEmulator.load_or_train(path=path, **SMALL_CONFIG) is emulator
+    assert retrained == [SMALL_CONFIG]
+
+
+def test_default_bounds_match_sampler_prior() -> None:
+    run_mcmc = pytest.importorskip("run_mcmc")
+    for name, bounds in DEFAULT_BOUNDS.items():
+        assert bounds == run_mcmc.PRIOR_BOUNDS[name]
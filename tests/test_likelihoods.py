@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from core_physics import PsiTMGCosmology
+from likelihoods import LikelihoodEvaluator
+
+
+@pytest.fixture(scope="module")
+def like() -> LikelihoodEvaluator:
+    return LikelihoodEvaluator()
+
+
+def _theta_block() -> np.ndarray:
+    rng = np.random.default_rng(7)
+    n = 6
+    theta = np.column_stack(
+        [
+            rng.uniform(65.0, 78.0, n),
+            rng.uniform(0.2, 0.4, n),
+            rng.uniform(-1.3, -0.7, n),
+            rng.uniform(-0.8, 0.8, n),
+            rng.uniform(0.75, 0.9, n),
+        ]
+    )
+    theta[2, 1] = 1.2  # outside physical prior
+    return theta
+
+
+@pytest.mark.parametrize("use_rsd", [False, True])
+def test_batch_matches_scalar(like: LikelihoodEvaluator, use_rsd: bool) -> None:
+    """Batched lnL must reproduce the per-point path, including -inf rows."""
+    theta = _theta_block()
+    batch = like.compute_total_lnL_batch(theta, use_rsd=use_rsd)
+    scalar = np.array(
+        [like.compute_total_lnL(PsiTMGCosmology(*row), use_rsd=use_rsd) for row in theta]
+    )
+    assert batch.shape == (theta.shape[0],)
+    assert np.array_equal(np.isfinite(batch), np.isfinite(scalar))
+    finite = np.isfinite(scalar)
+    assert np.allclose(batch[finite], scalar[finite], rtol=1.0e-10, atol=1.0e-8)
+
+
+def test_batch_rejects_bad_shape(like: LikelihoodEvaluator) -> None:
+    with pytest.raises(ValueError):
+        like.compute_total_lnL_batch(np.zeros((3, 4)))
+
+
+def test_distance_cache_single_table_per_point() -> None:
+    """All probes of one parameter point share one cached master table."""
+    like = LikelihoodEvaluator(distance_cache_size=2)
+    cosmos = [PsiTMGCosmology(H_0=70.0, Omega_m=om, w_0=-1.0, w_a=0.0, sigma_8=0.8) for om in (0.28, 0.30, 0.32)]
+
+    like.compute_total_lnL(cosmos[0], use_rsd=False)
+    assert like.distance_cache_info()["misses"] == 1
+    like.compute_lnL_SNe(cosmos[0])
+    like.compute_lnL_CMB(cosmos[0])
+    info = like.distance_cache_info()
+    assert (info["hits"], info["misses"]) == (2, 1)
+
+    for cosmo in cosmos:
+        like.compute_total_lnL(cosmo, use_rsd=False)
+    assert like.distance_cache_info()["size"] == 2
+
+
+def test_master_table_cmb_distance_accuracy() -> None:
+    """The shared grid must resolve chi(z*) to well below the Planck R error."""
+    from scipy.integrate import quad
+
+    like = LikelihoodEvaluator()
+    cosmo = PsiTMGCosmology(H_0=70.0, Omega_m=0.3, w_0=-0.9, w_a=0.2, sigma_8=0.8)
+    table = like._distance_table(cosmo, like.z_star_cmb)
+    ref = quad(lambda z: 1.0 / cosmo.E(z), 0.0, like.z_star_cmb, limit=500, epsrel=1.0e-12)[0]
+    assert float(table.chi_spline(like.z_star_cmb)) == pytest.approx(ref, rel=1.0e-7)
+
+
+def test_quadrature_backend_matches_spline(like: LikelihoodEvaluator) -> None:
+    """Gauss-Legendre distances must agree with the spline path at every data redshift."""
+    quad_like = LikelihoodEvaluator(distance_backend="quadrature")
+    cosmo = PsiTMGCosmology(H_0=71.0, Omega_m=0.31, w_0=-0.95, w_a=-0.3, sigma_8=0.8)
+    spline_table = like._distance_table(cosmo, like.z_star_cmb)
+    quad_table = quad_like._distance_table(cosmo, like.z_star_cmb)
+
+    for z in (like._z_sne, like._z_bao, like.z_star_cmb):
+        assert np.allclose(quad_table.chi(z), spline_table.chi(z), rtol=5.0e-5, atol=0.0)
+    assert np.allclose(quad_table.e(like._z_bao), spline_table.e(like._z_bao), rtol=1.0e-9)
+
+    lnl_spline = like.compute_total_lnL(cosmo, use_rsd=False)
+    lnl_quad = quad_like.compute_total_lnL(cosmo, use_rsd=False)
+    assert lnl_quad == pytest.approx(lnl_spline, abs=1.0e-2)
+
+    theta = _theta_block()
+    batch = quad_like.compute_total_lnL_batch(theta, use_rsd=False)
+    scalar = np.array([quad_like.compute_total_lnL(PsiTMGCosmology(*row), use_rsd=False) for row in theta])
+    finite = np.isfinite(scalar)
+    assert np.array_equal(np.isfinite(batch), finite)
+    assert np.allclose(batch[finite], scalar[finite], rtol=1.0e-10, atol=1.0e-8)
+
+
+def test_numba_kernel_backend_matches_numpy(like: LikelihoodEvaluator) -> None:
+    """Fused compiled probes must agree with the NumPy path (or fall back to it)."""
+    from core_physics import NUMBA_AVAILABLE
+
+    fused = LikelihoodEvaluator(kernel_backend="numba")
+    assert fused.kernel_backend == ("numba" if NUMBA_AVAILABLE else "numpy")
+
+    cosmo = PsiTMGCosmology(H_0=69.0, Omega_m=0.29, w_0=-1.1, w_a=0.4, sigma_8=0.8)
+    for method in ("compute_lnL_SNe", "compute_lnL_BAO", "compute_lnL_CMB"):
+        assert getattr(fused, method)(cosmo) == pytest.approx(getattr(like, method)(cosmo), abs=1.0e-3)
+
+    theta = _theta_block()
+    batch = fused.compute_total_lnL_batch(theta, use_rsd=False)
+    ref = like.compute_total_lnL_batch(theta, use_rsd=False)
+    finite = np.isfinite(ref)
+    assert np.array_equal(np.isfinite(batch), finite)
+    assert np.allclose(batch[finite], ref[finite], atol=1.0e-2, rtol=0.0)
+
+
+def _write_sne_cov(like: LikelihoodEvaluator, path) -> np.ndarray:
+    n = like._z_sne.size
+    sigma2 = like._sigma_mu_sne**2 + like.sigma_sys_sne**2
+    dz = like._z_sne[:, np.newaxis] - like._z_sne[np.newaxis, :]
+    cov = np.diag(sigma2) + 0.002 * np.exp(-np.abs(dz) / 0.05)
+    np.save(path, cov)
+    assert cov.shape == (n, n)
+    return cov
+
+
+def test_sne_whitened_covariance(like: LikelihoodEvaluator, tmp_path) -> None:
+    """Whitened chi2 must equal r^T C^-1 r, and its offset-marginalized form the profile minimum."""
+    from scipy.linalg import cho_factor, cho_solve
+
+    cov_path = tmp_path / "sne_cov.npy"
+    cov = _write_sne_cov(like, cov_path)
+    plain = LikelihoodEvaluator(sne_cov_path=cov_path, sne_marginalize_offset=False)
+    marg = LikelihoodEvaluator(sne_cov_path=cov_path)
+
+    cosmo = PsiTMGCosmology(H_0=70.0, Omega_m=0.3, w_0=-1.0, w_a=0.0, sigma_8=0.8)
+    table = plain._distance_table(cosmo, like.z_star_cmb)
+    d_l = (1.0 + like._z_sne) * (299792.458 / cosmo.H_0) * table.chi(like._z_sne)
+    resid = like._mu_sne - (5.0 * np.log10(d_l) + 25.0)
+    chofac = cho_factor(cov, lower=True)
+    chi2_ref = float(resid @ cho_solve(chofac, resid))
+    assert plain.compute_lnL_SNe(cosmo) == pytest.approx(-0.5 * chi2_ref, rel=1.0e-9)
+
+    ones = np.ones_like(resid)
+    m_best = float(ones @ cho_solve(chofac, resid)) / float(ones @ cho_solve(chofac, ones))
+    shifted = resid - m_best
+    chi2_min = float(shifted @ cho_solve(chofac, shifted))
+    assert marg.compute_lnL_SNe(cosmo) == pytest.approx(-0.5 * chi2_min, rel=1.0e-9)
+
+    theta = _theta_block()
+    batch = marg.compute_total_lnL_batch(theta, use_rsd=False)
+    scalar = np.array([marg.compute_total_lnL(PsiTMGCosmology(*row), use_rsd=False) for row in theta])
+    finite = np.isfinite(scalar)
+    assert np.allclose(batch[finite], scalar[finite], rtol=1.0e-9)
+
+
+def test_growth_emulator_backend_matches_ode(like: LikelihoodEvaluator) -> None:
+    from growth_emulator import GrowthEmulator
+
+    bounds = {"Omega_m": (0.2, 0.4), "w_0": (-1.3, -0.7), "w_a": (-0.8, 0.8), "H_0": (65.0, 78.0)}
+    emulator = GrowthEmulator.train(bounds=bounds, degrees=(8, 8, 10, 3), z_max=2.0, validate=False)
+    emu = LikelihoodEvaluator(growth_backend="emulator", growth_emulator=emulator)
+    theta = _theta_block()
+    theta[0, 3] = 2.5  # outside the emulator box: ODE fallback
+
+    batch = emu.compute_total_lnL_batch(theta, use_sne=False, use_cmb=False, use_bao=False)
+    reference = like.compute_total_lnL_batch(theta, use_sne=False, use_cmb=False, use_bao=False)
+    assert np.array_equal(np.isfinite(batch), np.isfinite(reference))
+    finite = np.isfinite(reference)
+    np.testing.assert_allclose(batch[finite], reference[finite], rtol=0.0, atol=5.0e-3)
+    assert batch[0] == reference[0]
+
+    scalar = np.array([emu.compute_lnL_RSD(PsiTMGCosmology(*row)) for row in theta])
+    np.testing.assert_allclose(scalar[finite], batch[finite], rtol=1.0e-12)
+
+    with pytest.raises(ValueError):
+        LikelihoodEvaluator(growth_backend="table")
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from core_physics import PsiTMGCosmology, TabulatedEoS, w_of_a
+from perturbations import StructureFormation, solve_growth, solve_growth_many
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        (74.185, 0.226, -1.477, 0.446, 0.862),
+        (67.4, 0.315, -1.0, 0.0, 0.811),
+        (70.0, 0.35, -0.8, -1.5, 0.78),
+    ],
+)
+def test_fixed_step_growth_matches_adaptive_reference(params: tuple[float, ...]) -> None:
+    """The compiled RK4 path must agree with a tight LSODA solve."""
+    cosmo = PsiTMGCosmology(*params)
+    z = np.linspace(0.0, 3.0, 31)
+    fast = StructureFormation(cosmo)
+    reference = StructureFormation(cosmo, method="LSODA", rtol=1.0e-10, atol=1.0e-13)
+    np.testing.assert_allclose(fast.get_fsigma8(z), reference.get_fsigma8(z), rtol=1.0e-6)
+    np.testing.assert_allclose(fast.get_growth_factor(z), reference.get_growth_factor(z), rtol=1.0e-6)
+    assert fast.get_growth_factor(0.0) == pytest.approx(1.0)
+
+
+def test_fixed_step_growth_for_pluggable_eos() -> None:
+    """Non-CPL backgrounds use the tabulated RK4 path and the shared EoS kernels."""
+    a_tab = np.geomspace(1.0e-5, 1.0, 600)
+    tab = TabulatedEoS(a_tab, w_of_a(a_tab, -0.9, 0.5, "JBP"))
+    z = np.linspace(0.0, 3.0, 31)
+    for eos in ("JBP", tab):
+        cosmo = PsiTMGCosmology(70.0, 0.3, -0.9, 0.5, 0.8, eos=eos)
+        fast = StructureFormation(cosmo)
+        reference = StructureFormation(cosmo, method="LSODA", rtol=1.0e-10, atol=1.0e-13)
+        np.testing.assert_allclose(fast.get_fsigma8(z), reference.get_fsigma8(z), rtol=1.0e-6)
+        assert StructureFormation.batch([cosmo])[0]._cache is None
+
+    a_eval = np.linspace(0.01, 1.0, 40)
+    jbp = solve_growth(a_eval, 0.3, w_0=-0.9, w_a=0.5, eos_model="JBP")
+    np.testing.assert_allclose(solve_growth(a_eval, 0.3, eos_model=tab).delta, jbp.delta, rtol=1.0e-6)
+
+
+@pytest.mark.parametrize("backend", ["numba", "numpy"])
+def test_solve_growth_many_matches_scalar_solver(backend: str) -> None:
+    rng = np.random.default_rng(3)
+    n = 8
+    params = np.column_stack(
+        [
+            rng.uniform(0.15, 0.45, n),
+            rng.uniform(-1.8, -0.5, n),
+            rng.uniform(-2.0, 2.0, n),
+            rng.uniform(0.7, 0.9, n),
+        ]
+    )
+    h_0 = rng.uniform(62.0, 78.0, n)
+    table = solve_growth_many(params, H_0=h_0, backend=backend)
+    z = np.linspace(0.0, 2.0, 11)
+
+    expected = np.array(
+        [StructureFormation(PsiTMGCosmology(h_0[i], *params[i])).get_fsigma8(z) for i in range(n)]
+    )
+    assert table.fsigma8.shape == (n, table.lna_grid.size)
+    assert np.all(table.valid)
+    np.testing.assert_allclose(table.fsigma8_at(z), expected, rtol=1.0e-12)
+
+    structures = StructureFormation.batch([PsiTMGCosmology(h_0[i], *params[i]) for i in range(n)])
+    np.testing.assert_allclose([s.get_fsigma8(z) for s in structures], expected, rtol=1.0e-12)
+
+
+def test_growth_engine_matches_lcdm_growth_integral() -> None:
+    """Without radiation, LCDM growth is D(a) ~ E(a) * int_0^a da' / (a' E(a'))^3."""
+    from scipy.integrate import quad
+
+    from perturbations import GrowthEngine
+
+    omega_m = 0.3
+    a_eval = np.geomspace(1.0e-3, 1.0, 200)
+    solution = GrowthEngine().solve(a_eval, omega_m, rtol=1.0e-10, atol=1.0e-13).normalized()
+
+    def e_of_a(a: float) -> float:
+        return float(np.sqrt(omega_m * a**-3 + 1.0 - omega_m))
+
+    def heath(a: float) -> float:
+        return e_of_a(a) * quad(lambda x: 1.0 / (x * e_of_a(x)) ** 3, 0.0, a, epsabs=0.0, epsrel=1.0e-12)[0]
+
+    a_check = a_eval[100::20]
+    expected = np.array([heath(a) for a in a_check]) / heath(1.0)
+    np.testing.assert_allclose(np.interp(a_check, a_eval, solution.delta), expected, rtol=1.0e-5)
+
+
+def test_growth_engine_cache_and_mu_hook() -> None:
+    from perturbations import GrowthEngine
+
+    engine = GrowthEngine(cache_size=2)
+    a_eval = np.linspace(1.0e-3, 1.0, 50)
+    first = engine.solve(a_eval, 0.31, w_0=-0.9, w_a=0.2)
+    assert engine.solve(a_eval.copy(), 0.31, w_0=-0.9, w_a=0.2) is first
+    assert engine.cache_info()["hits"] == 1
+    assert a_eval.flags.writeable and not first.delta.flags.writeable
+
+    # mu = 1 reproduces GR; a custom mu is only cached with a key.
+    np.testing.assert_allclose(
+        engine.solve(a_eval, 0.31, w_0=-0.9, w_a=0.2, mu=lambda a, k: 1.0).delta, first.delta, rtol=1.0e-12
+    )
+    assert engine.cache_info()["size"] == 1
+
+    seen_k: list[float | None] = []
+
+    def mu(a: float, k: float | None) -> float:
+        seen_k.append(k)
+        return 1.0 + 0.1 * a
+
+    boosted = engine.solve(a_eval, 0.31, mu=mu, k=0.05, mu_key="linear-boost")
+    assert set(seen_k) == {0.05}
+    assert boosted.delta[-1] > engine.solve(a_eval, 0.31).delta[-1]
+    assert engine.solve(a_eval, 0.31, mu=mu, k=0.05, mu_key="linear-boost") is boosted
+    assert engine.cache_info()["size"] == 2
+
+    with pytest.raises(ValueError):
+        engine.solve(a_eval[::-1], 0.31)
+    with pytest.raises(ValueError):
+        engine.solve(a_eval, 0.31, eos_model="EDE")
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import mcgt.backends.ref_phase as ref_phase
+from mcgt.phase import PhaseParams, build_loglin_grid, phi_gr, phi_mcgt, phi_mcgt_batch
+
+SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "10_global_scan" / "eval_metrics_20_300.py"
+
+
+def _fake_reference(monkeypatch) -> list[tuple[float, float]]:
+    """Replace the LAL-backed reference by the analytic GR phase and record calls."""
+    calls: list[tuple[float, float]] = []
+
+    def fake(f_Hz, m1, m2, **_kwargs):
+        calls.append((m1, m2))
+        return phi_gr(np.asarray(f_Hz, dtype=float), PhaseParams(m1=m1, m2=m2, q0star=0.0, alpha=0.0))
+
+    monkeypatch.setattr(ref_phase, "compute_phi_ref", fake)
+    return calls
+
+
+def _table(n: int) -> pd.DataFrame:
+    rng = np.random.default_rng(3)
+    masses = np.array([[30.0, 25.0], [12.0, 8.0], [50.0, 40.0]])
+    pick = rng.integers(0, len(masses), n)
+    alpha = rng.uniform(0.0, 1.6, n)
+    alpha[:3] = [1.0, 1.0 + 1.0e-10, 0.0]
+    return pd.DataFrame(
+        {
+            "id": np.arange(n),
+            "m1": masses[pick, 0],
+            "m2": masses[pick, 1],
+            "q0star": rng.uniform(-0.05, 0.05, n),
+            "alpha": alpha,
+        }
+    )
+
+
+def test_phi_mcgt_batch_matches_row_loop(monkeypatch) -> None:
+    calls = _fake_reference(monkeypatch)
+    freqs = build_loglin_grid(10.0, 1000.0, 0.01)
+    table = _table(40)
+
+    batch = phi_mcgt_batch(freqs, table)
+    assert batch.shape == (40, freqs.size) and batch.dtype == np.float64
+    # One reference evaluation per distinct (m1, m2).
+    assert len(calls) == len(set(zip(table["m1"], table["m2"])))
+
+    expected = np.stack(
+        [phi_mcgt(freqs, row) for row in table[["m1", "m2", "q0star", "alpha"]].to_dict("records")]
+    )
+    np.testing.assert_array_equal(batch, expected)
+    np.testing.assert_array_equal(batch[:, 0], 0.0)
+
+    records = table[["m1", "m2", "q0star", "alpha"]].to_records(index=False)
+    np.testing.assert_array_equal(phi_mcgt_batch(freqs, records, fmin=20.0), phi_mcgt_batch(freqs, table, fmin=20.0))
+
+
+def test_eval_metrics_batch_matches_per_sample(monkeypatch) -> None:
+    _fake_reference(monkeypatch)
+    spec = importlib.util.spec_from_file_location("eval_metrics_20_300", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "compute_phi_ref", ref_phase.compute_phi_ref)
+
+    f_hz = build_loglin_grid(10.0, 1000.0, 0.01)
+    table = _table(24)
+    table.loc[5, "q0star"] = np.nan
+
+    batch = module.evaluate_batch(table, f_hz, module.WINDOW_DEFAULT)
+    single = [module.evaluate_sample(row, f_hz, module.WINDOW_DEFAULT) for _, row in table.iterrows()]
+    assert [r["status"] for r in batch] == [r["status"] for r in single]
+    assert batch[5]["status"] == "failed" and batch[5]["error_code"] == "NAN_IN_WINDOW"
+    for got, ref in zip(batch, single):
+        if ref["status"] != "ok":
+            continue
+        assert got["k"] == ref["k"] and got["n_20_300"] == ref["n_20_300"]
+        for key in ("mean_20_300", "p95_20_300", "max_20_300", "score"):
+            np.testing.assert_allclose(got[key], ref[key], rtol=1.0e-12)
+
+
+def test_phi_gr_batch_matches_pn_loop() -> None:
+    from mcgt.phase import _CPN, phi_gr_batch
+
+    freqs = build_loglin_grid(10.0, 2000.0, 0.01)
+    m1 = np.array([30.0, 8.0, 55.0])
+    m2 = np.array([25.0, 7.5, 12.0])
+    tc = np.array([0.0, 0.01, 0.2])
+    expected = []
+    for a, b, t in zip(m1, m2, tc):
+        v = (np.pi * (a + b) * 4.925490947e-6 * freqs) ** (1 / 3)
+        series = sum(c_k * v**k for k, c_k in _CPN.items())
+        expected.append(2 * np.pi * freqs * t - 0.3 - np.pi / 4 + 3 / (128 * a * b / (a + b) ** 2) * v**-5 * series)
+    expected = np.stack(expected)
+
+    for backend in ("numpy", "numba"):
+        out = phi_gr_batch(freqs, m1, m2, tc=tc, phi0=0.3, kernel_backend=backend)
+        assert out.shape == (3, freqs.size) and out.dtype == np.float64
+        np.testing.assert_allclose(out, expected, rtol=1.0e-13)
+        fast = phi_gr_batch(freqs, m1, m2, tc=tc, phi0=0.3, dtype=np.float32, kernel_backend=backend)
+        assert fast.dtype == np.float32
+        np.testing.assert_allclose(fast, expected, rtol=5.0e-6)
+
+    single = phi_gr(freqs, PhaseParams(m1=8.0, m2=7.5, q0star=0.0, alpha=0.0, phi0=0.3, tc=0.01))
+    np.testing.assert_allclose(single, expected[1], rtol=1.0e-13)
+    with pytest.raises(ValueError):
+        phi_gr_batch(freqs, m1, m2, dtype=np.float16)
+    with pytest.raises(ValueError):
+        phi_gr_batch(freqs, m1, m2, kernel_backend="cuda")
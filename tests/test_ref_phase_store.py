@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import numpy as np
+
+import mcgt.backends.ref_phase as ref_phase
+from mcgt.backends.ref_phase import ShardedPhaseStore
+
+
+def _rows(n: int, width: int, offset: int = 0) -> np.ndarray:
+    return np.arange(offset, offset + n, dtype=float)[:, None] + np.linspace(0.0, 1.0, width)
+
+
+def test_batch_put_and_lock_free_reads_across_instances(tmp_path) -> None:
+    writer = ShardedPhaseStore(str(tmp_path), 64, n_shards=4)
+    keys = [f"IMRPhenomD_m1-{m:.6f}_m2-10.000000" for m in range(200)]
+    writer.put_many(keys, _rows(200, 64))
+
+    # A second instance (another worker) sees the entries without taking a lock.
+    reader = ShardedPhaseStore(str(tmp_path), 64, n_shards=4)
+    for i in (0, 57, 199):
+        np.testing.assert_array_equal(reader.get(keys[i]), _rows(1, 64, i)[0])
+    assert reader.get("missing") is None
+
+    # Later appends become visible by re-reading only the index tail.
+    writer.put("late", np.full(64, -1.0))
+    np.testing.assert_array_equal(reader.get("late"), np.full(64, -1.0))
+    assert reader.hits == 4 and reader.misses == 1
+
+    # Digests ending in NUL bytes must survive the index round-trip.
+    nul_key = next(k for k in map(str, range(10_000)) if ShardedPhaseStore.digest(k).endswith(b"\0"))
+    writer.put(nul_key, np.zeros(64))
+    np.testing.assert_array_equal(reader.get(nul_key), np.zeros(64))
+    assert writer.info()["entries"] == 202
+    assert not list(tmp_path.glob("*.npz"))
+
+
+def test_quota_compaction_keeps_recently_used_entries(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(ref_phase, "STORE_TOUCH_INTERVAL", 0.0)
+    width = 16
+    store = ShardedPhaseStore(str(tmp_path), width, n_shards=1, quota_bytes=40 * 8 * width)
+    stale_reader = ShardedPhaseStore(str(tmp_path), width, n_shards=1)
+    for i in range(30):
+        store.put(f"k{i}", _rows(1, width, i)[0])
+    assert stale_reader.get("k3") is not None
+
+    # Reading k0 refreshes its LRU stamp; the next batch overflows the quota.
+    assert store.get("k0") is not None
+    store.put_many([f"n{i}" for i in range(15)], _rows(15, width, 100))
+
+    info = store.info()
+    assert info["compactions"] == 1
+    assert info["bytes"] <= store.quota_bytes
+    assert store.get("k0") is not None and store.get("n14") is not None
+    assert store.get("k1") is None
+    # The reader that mapped the old generation switches to the new one.
+    np.testing.assert_array_equal(stale_reader.get("n3"), _rows(1, width, 103)[0])
+    assert stale_reader.get("k1") is None
+
+
+def test_compute_phi_ref_persists_into_store(tmp_path, monkeypatch) -> None:
+    calls = []
+
+    def exact(f_Hz, m1, m2, approximant="IMRPhenomD"):
+        calls.append((m1, m2))
+        return m1 * np.log(f_Hz) + m2
+
+    monkeypatch.setattr(ref_phase, "_phi_ref_exact", exact)
+    monkeypatch.setattr(ref_phase, "_have_lal", True)
+    monkeypatch.setattr(ref_phase, "_memcache", type(ref_phase._memcache)())
+    f_Hz = np.geomspace(20.0, 300.0, 50)
+    cache_dir = str(tmp_path / "cache")
+
+    # A legacy one-file-per-pair entry is migrated on first read.
+    legacy = 12.0 * np.log(f_Hz) + 9.0
+    ref_phase._ensure_cache_dir(cache_dir)
+    legacy_path = tmp_path / "cache" / ref_phase._cache_key("IMRPhenomD", 12.0, 8.0, ref_phase._hash_fgrid(f_Hz))
+    np.savez(legacy_path, phi_on_grid=legacy)
+
+    phi = ref_phase.compute_phi_ref(f_Hz, 30.0, 20.0, cache_dir=cache_dir, scale_aware=False)
+    np.testing.assert_array_equal(phi, 30.0 * np.log(f_Hz) + 20.0)
+    np.testing.assert_array_equal(ref_phase.compute_phi_ref(f_Hz, 12.0, 8.0, cache_dir=cache_dir), legacy)
+    assert not legacy_path.exists()
+
+    ref_phase._memcache.clear()
+    ref_phase._stores.clear()
+    np.testing.assert_array_equal(ref_phase.compute_phi_ref(f_Hz, 30.0, 20.0, cache_dir=cache_dir), phi)
+    assert calls == [(30.0, 20.0)]
+
+    info = ref_phase.ref_cache_info(cache_dir)
+    assert info["n_files"] == 0 and info["stores"][0]["hits"] == 1
+    ref_phase.clear_ref_cache(cache_dir)
+    assert ref_phase.ref_cache_info(cache_dir)["stores"] == []
+
+
+def test_torn_index_write_is_truncated_and_bad_slots_skipped(tmp_path) -> None:
+    width = 8
+    store = ShardedPhaseStore(str(tmp_path), width, n_shards=1, quota_bytes=10 * 8 * width)
+    store.put_many([f"k{i}" for i in range(5)], _rows(5, width))
+    idx_path = tmp_path / "shard-00.0.idx"
+
+    # A writer killed mid-record leaves a partial index record behind.
+    with open(idx_path, "ab") as fh:
+        fh.write(b"\x07" * 10)
+    store.put("after", np.full(width, 2.0))
+    assert idx_path.stat().st_size % ref_phase.STORE_INDEX_DTYPE.itemsize == 0
+    fresh = ShardedPhaseStore(str(tmp_path), width, n_shards=1)
+    np.testing.assert_array_equal(fresh.get("after"), np.full(width, 2.0))
+    np.testing.assert_array_equal(fresh.get("k4"), _rows(1, width, 4)[0])
+
+    # Records pointing outside the data file are ignored by readers.
+    bogus = np.array([(ShardedPhaseStore.digest("bogus"), 10**6, 0.0)], dtype=ref_phase.STORE_INDEX_DTYPE)
+    with open(idx_path, "ab") as fh:
+        fh.write(bogus.tobytes())
+    assert ShardedPhaseStore(str(tmp_path), width, n_shards=1).get("bogus") is None
+
+    # Compaction still works once the shard overflows its quota.
+    store.put_many([f"n{i}" for i in range(6)], _rows(6, width, 100))
+    assert store.info()["compactions"] == 1
+    np.testing.assert_array_equal(store.get("n5"), _rows(1, width, 105)[0])
+
+
+def test_lock_free_read_ignores_torn_trailing_row(tmp_path) -> None:
+    width = 8
+    writer = ShardedPhaseStore(str(tmp_path), width, n_shards=1)
+    writer.put("a", np.full(width, 1.0))
+    reader = ShardedPhaseStore(str(tmp_path), width, n_shards=1)
+    np.testing.assert_array_equal(reader.get("a"), np.full(width, 1.0))
+
+    # Another worker is mid-append: the data file ends in a partial row.
+    writer.put("b", np.full(width, 2.0))
+    with open(tmp_path / "shard-00.0.dat", "ab") as fh:
+        fh.write(b"\0" * 24)
+    np.testing.assert_array_equal(reader.get("b"), np.full(width, 2.0))
+    fresh = ShardedPhaseStore(str(tmp_path), width, n_shards=1)
+    np.testing.assert_array_equal(fresh.get("b"), np.full(width, 2.0))
+
+    # The next append drops the partial row and keeps the slots aligned.
+    writer.put("c", np.full(width, 3.0))
+    np.testing.assert_array_equal(reader.get("c"), np.full(width, 3.0))
+
+
+def test_concurrent_legacy_migration_keeps_loaded_phase(tmp_path, monkeypatch) -> None:
+    def exact(f_Hz, m1, m2, approximant="IMRPhenomD"):
+        raise AssertionError("the legacy entry must not be recomputed")
+
+    monkeypatch.setattr(ref_phase, "_phi_ref_exact", exact)
+    monkeypatch.setattr(ref_phase, "_have_lal", True)
+    monkeypatch.setattr(ref_phase, "_memcache", type(ref_phase._memcache)())
+    f_Hz = np.geomspace(20.0, 300.0, 50)
+    cache_dir = str(tmp_path / "cache")
+    ref_phase._ensure_cache_dir(cache_dir)
+    legacy = 12.0 * np.log(f_Hz) + 9.0
+    legacy_path = tmp_path / "cache" / ref_phase._cache_key("IMRPhenomD", 12.0, 8.0, ref_phase._hash_fgrid(f_Hz))
+    np.savez(legacy_path, phi_on_grid=legacy)
+
+    # Another worker removes the legacy file between our read and our removal.
+    real_remove = ref_phase.os.remove
+
+    def racing_remove(path):
+        real_remove(path)
+        raise FileNotFoundError(path)
+
+    monkeypatch.setattr(ref_phase.os, "remove", racing_remove)
+    phi = ref_phase.compute_phi_ref(f_Hz, 12.0, 8.0, cache_dir=cache_dir)
+    np.testing.assert_array_equal(phi, legacy)
+    assert not legacy_path.exists()
+    ref_phase._stores.clear()
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import mcgt
+import mcgt.backends.ref_phase as ref_phase
+import mcgt.backends.surrogate_phase as surrogate_phase
+from mcgt.phase import build_loglin_grid, phi_gr_batch
+
+GRID_CSV = Path(__file__).resolve().parents[1] / "assets/zz-data/09_dark_energy_cpl/09_phases_imrphenom.csv"
+
+
+def _generator(f_Hz, m1, m2):
+    # Analytic stand-in for the LAL reference (same smoothness in the masses).
+    return phi_gr_batch(f_Hz, m1, m2, kernel_backend="numpy")[0]
+
+
+def _aligned(phi: np.ndarray) -> np.ndarray:
+    return phi - phi[..., :1]
+
+
+@pytest.fixture(scope="module")
+def surrogate():
+    f_Hz = np.asarray(pd.read_csv(GRID_CSV)["f_Hz"], dtype=float)
+    return surrogate_phase.build_surrogate(f_Hz, (5.0, 80.0), generator=_generator, n_nodes=12)
+
+
+def test_surrogate_reproduces_reference_within_budget(surrogate, tmp_path) -> None:
+    budget = surrogate.error_budget
+    assert budget["n_train"] == 78 and 0 < budget["n_basis"] <= 78
+    assert budget["validation_max_rad"] < 1.0e-3
+    assert budget["validation_p95_rad"] <= budget["validation_max_rad"]
+
+    rng = np.random.default_rng(11)
+    m1, m2 = rng.uniform(5.0, 80.0, 32), rng.uniform(5.0, 80.0, 32)
+    exact = _aligned(np.stack([_generator(surrogate.f_Hz, a, b) for a, b in zip(m1, m2)]))
+    batch = surrogate.evaluate_batch(m1, m2)
+    assert np.max(np.abs(batch - exact)) < 1.0e-3
+    np.testing.assert_allclose(surrogate(None, m1[3], m2[3]), batch[3], rtol=0.0, atol=1.0e-12)
+
+    # Any grid inside the training band goes through a cached spline of the basis.
+    f_win = build_loglin_grid(20.0, 300.0, 0.01)
+    got = surrogate(f_win, 31.0, 22.0)
+    np.testing.assert_allclose(_aligned(got), _aligned(_generator(f_win, 31.0, 22.0)), rtol=0.0, atol=1.0e-3)
+    with pytest.raises(ValueError):
+        surrogate(build_loglin_grid(5.0, 300.0, 0.01), 31.0, 22.0)
+    assert surrogate.covers(30.0, 30.0) and not surrogate.covers(100.0, 90.0)
+    # Only the validated component box is covered, whatever the chirp mass.
+    assert surrogate.covers(80.0, 5.0) and surrogate.covers(5.0, 5.0)
+    assert not surrogate.covers(300.0, 20.0) and not surrogate.covers(60.0, 4.0)
+    assert surrogate.m_bounds == pytest.approx((5.0, 80.0))
+
+    path = tmp_path / "sur.npz"
+    surrogate.save(str(path))
+    loaded = surrogate_phase.load_surrogate(str(path))
+    assert loaded.error_budget == budget
+    np.testing.assert_array_equal(loaded.evaluate_batch(m1, m2), batch)
+
+
+def test_compute_phi_ref_falls_back_to_surrogate(surrogate, tmp_path, monkeypatch) -> None:
+    assert {"ref_phase", "surrogate_phase"} <= set(mcgt.list_backends())
+
+    path = tmp_path / "sur.npz"
+    surrogate.save(str(path))
+    monkeypatch.setenv(surrogate_phase.SURROGATE_ENV, str(path))
+    monkeypatch.setattr(surrogate_phase, "_default", {})
+    monkeypatch.setattr(ref_phase, "_have_pyc", False)
+    monkeypatch.setattr(ref_phase, "_have_lal", False)
+    cache_dir = tmp_path / "cache"
+
+    f_Hz = surrogate.f_Hz
+    phi = ref_phase.compute_phi_ref(f_Hz, 30.0, 25.0, cache_dir=str(cache_dir))
+    np.testing.assert_array_equal(phi, surrogate(f_Hz, 30.0, 25.0))
+    # Approximate values never enter the exact-reference caches.
+    assert not list(cache_dir.iterdir())
+
+    with pytest.raises(RuntimeError, match="REF_BACKEND_MISSING"):
+        ref_phase.compute_phi_ref(f_Hz, 150.0, 120.0, cache_dir=str(cache_dir))
+
+
+def _taylor_f2(f_Hz, m1, m2, approximant="IMRPhenomD"):
+    # 2PN TaylorF2 phase: eta-dependent coefficients, exact (Mf, eta) scaling.
+    eta = m1 * m2 / (m1 + m2) ** 2
+    v = np.cbrt(np.pi * (m1 + m2) * ref_phase.MTSUN_S * np.asarray(f_Hz))
+    series = 1.0 + (3715 / 756 + 55 / 9 * eta) * v**2 - 16 * np.pi * v**3
+    series += (15293365 / 508032 + 27145 / 504 * eta + 3085 / 72 * eta**2) * v**4
+    return 3 / (128 * eta * v**5) * series
+
+
+def test_scale_aware_cache_meets_tolerance_and_reuses_tables(tmp_path, monkeypatch) -> None:
+    calls = []
+
+    def exact(f_Hz, m1, m2, approximant="IMRPhenomD"):
+        calls.append((m1, m2))
+        return _taylor_f2(f_Hz, m1, m2)
+
+    monkeypatch.setattr(ref_phase, "_phi_ref_exact", exact)
+    monkeypatch.setattr(ref_phase, "_have_lal", True)
+    cache = ref_phase.configure_scale_cache(tol=1.0e-2)
+    try:
+        f_Hz = np.asarray(pd.read_csv(GRID_CSV)["f_Hz"], dtype=float)
+        rng = np.random.default_rng(5)
+        m1, m2 = rng.uniform(5.0, 80.0, 600), rng.uniform(5.0, 80.0, 600)
+        err = [
+            np.max(np.abs(ref_phase.compute_phi_ref(f_Hz, a, b, scale_aware=True) - _aligned(_taylor_f2(f_Hz, a, b))))
+            for a, b in zip(m1, m2)
+        ]
+        assert max(err) <= cache.tol
+
+        info = ref_phase.scale_cache_info()
+        assert info["hits"] + info["misses"] == 600
+        assert info["hit_rate"] > 0.8
+        assert len(calls) == info["builds"] < 150
+        # Callers that do not opt in keep the exact, unaligned per-pair phases.
+        exact_phi = ref_phase.compute_phi_ref(f_Hz, 30.0, 25.0, cache_dir=str(tmp_path))
+        np.testing.assert_array_equal(exact_phi, _taylor_f2(f_Hz, 30.0, 25.0))
+        with pytest.raises(ValueError):
+            ref_phase.compute_phi_ref(f_Hz, 30.0, 25.0, scale_aware=True, cache_dir=str(tmp_path))
+        with pytest.raises(ValueError):
+            ref_phase.compute_phi_ref(f_Hz, 30.0, 25.0, scale_aware=True, force_recompute=True)
+        # A per-call tolerance replaces a cache built with another one.
+        ref_phase.compute_phi_ref(f_Hz, 30.0, 25.0, scale_aware=True, scale_tol=5.0e-3)
+        assert ref_phase._scale_cache.tol == 5.0e-3
+    finally:
+        ref_phase.configure_scale_cache(enabled=False)
+    assert ref_phase.scale_cache_info() == {}
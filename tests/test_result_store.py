@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pytest
+
+from result_store import ResultStore, code_version, params_digest
+
+
+def test_get_or_compute_roundtrip(tmp_path) -> None:
+    store = ResultStore(tmp_path)
+    calls = []
+
+    def compute() -> dict[str, np.ndarray]:
+        calls.append(1)
+        return {"delta": np.linspace(0.0, 1.0, 5), "r_s": 147.1}
+
+    params = {"omega_m": 0.3, "z_grid": np.arange(3.0)}
+    first = store.get_or_compute("growth", params, compute)
+    second = store.get_or_compute("growth", dict(params), compute)
+    assert len(calls) == 1
+    np.testing.assert_array_equal(second["delta"], first["delta"])
+    assert float(second["r_s"]) == 147.1
+    assert store.cache_info()["hits"] == 1
+
+    # Single arrays round-trip as `.npy`.
+    table = store.get_or_compute("table", {"n": 4}, lambda: np.eye(4))
+    assert store.entry_path("table", {"n": 4}).suffix == ".npy"
+    np.testing.assert_array_equal(table, np.eye(4))
+
+
+def test_params_digest_is_exact_and_order_independent() -> None:
+    assert params_digest({"a": 1.0, "b": [1, 2]}) == params_digest({"b": (1, 2), "a": np.float64(1.0)})
+    assert params_digest({"a": 0.1 + 0.2}) != params_digest({"a": 0.3})
+    assert params_digest({"x": np.zeros(3)}) != params_digest({"x": np.zeros(4)})
+    with pytest.raises(TypeError):
+        params_digest({"f": object()})
+
+
+def test_code_change_invalidates_entry(tmp_path) -> None:
+    source = tmp_path / "solver.py"
+    source.write_text("SCALE = 1\n", encoding="utf-8")
+    store = ResultStore(tmp_path / "store")
+    store.put("solver", {"k": 1}, np.ones(3), code=(source,))
+    assert store.get("solver", {"k": 1}, code=(source,)) is not None
+
+    old_version = code_version(source)
+    source.write_text("SCALE = 2\n", encoding="utf-8")
+    assert code_version(source) != old_version
+    assert store.get("solver", {"k": 1}, code=(source,)) is None
+
+    # Storing under the new version replaces the stale entry.
+    store.put("solver", {"k": 1}, 2.0 * np.ones(3), code=(source,))
+    assert store.cache_info()["entries"] == 1
+
+
+def test_quota_evicts_least_recently_used(tmp_path) -> None:
+    store = ResultStore(tmp_path, quota_bytes=13_000)
+    for i in range(3):
+        path = store.put("chunks", {"i": i}, np.full(500, float(i)))
+        os.utime(path, (1_000 + i, 1_000 + i))
+
+    # Reading entry 0 makes it the most recently used one.
+    assert store.get("chunks", {"i": 0}) is not None
+    store.put("chunks", {"i": 3}, np.full(500, 3.0))
+
+    assert store.cache_info()["bytes"] <= store.quota_bytes
+    assert store.get("chunks", {"i": 0}) is not None
+    assert store.get("chunks", {"i": 1}) is None
+    assert store.get("chunks", {"i": 3}) is not None
+
+
+def test_disabled_store_and_corrupt_entries(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("PSITMG_NO_RESULT_STORE", "1")
+    disabled = ResultStore(tmp_path)
+    assert disabled.put("x", {}, np.ones(2)) is None
+    assert disabled.get_or_compute("x", {}, lambda: np.ones(2)).tolist() == [1.0, 1.0]
+    monkeypatch.delenv("PSITMG_NO_RESULT_STORE")
+
+    store = ResultStore(tmp_path)
+    path = store.put("x", {}, np.ones(2))
+    path.write_bytes(b"not an array")
+    assert store.get("x", {}) is None
+    assert not path.exists()
+    assert not list(tmp_path.rglob("*.part"))
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+run_mcmc = pytest.importorskip("run_mcmc")
+
+
+def test_single_pass_matches_two_pass_reference():
+    theta = run_mcmc.THETA_BESTFIT_CPL
+    pipeline = run_mcmc.TriProbePipeline("cpl")
+    runtime = pipeline.runtime
+    omega_m, h_0, w_0, w_a, s_8 = run_mcmc._unpack_theta(theta, "cpl")
+    params = pipeline._params(h_0)
+
+    logp, chi2_tri, chi2_sn, chi2_bao = runtime["log_posterior"](
+        params,
+        omega_m,
+        w_0,
+        w_a,
+        runtime["sn_data"],
+        runtime["bao_data"],
+        run_mcmc.TRI_PROBE_SIGMA_SYS,
+        run_mcmc.TRI_PROBE_N_STEPS_INT,
+        "CPL",
+    )
+    chi2_rsd = pipeline.rsd_runtime["get_chi2_rsd"](
+        omega_m,
+        w_0,
+        w_a,
+        s_8 / math.sqrt(omega_m / 0.3),
+        h_0=h_0,
+        data_path=pipeline.rsd_runtime["rsd_data_path"],
+    )
+
+    breakdown = pipeline.breakdown(theta)
+    assert np.isfinite(logp)
+    assert breakdown["chi2_sn"] == pytest.approx(chi2_sn, rel=1e-12)
+    assert breakdown["chi2_bao"] == pytest.approx(chi2_bao, rel=1e-12)
+    assert breakdown["chi2_total"] == pytest.approx(chi2_tri + chi2_rsd, rel=1e-12)
+    assert pipeline.loglike(theta) == pytest.approx(-0.5 * (chi2_tri + chi2_rsd), rel=1e-12)
+
+
+def test_breakdown_is_cached_and_support_is_enforced():
+    pipeline = run_mcmc.TriProbePipeline("cpl")
+    theta = run_mcmc.THETA_BESTFIT_CPL.copy()
+    first = pipeline.breakdown(theta)
+    second = pipeline.breakdown(theta)
+    assert first == second
+    assert pipeline.n_evaluations == 1
+    assert pipeline.last_breakdown == first
+
+    outside = theta.copy()
+    outside[0] = 0.7
+    assert pipeline.loglike(outside) == -math.inf
+    assert np.isfinite(pipeline.breakdown(outside, enforce_support=False)["chi2_sn"])
+
+
+def test_make_backend_resume_keeps_stored_chain(tmp_path):
+    emcee = pytest.importorskip("emcee")
+    pytest.importorskip("h5py")
+    output = tmp_path / "chain.h5"
+    backend = run_mcmc.make_backend(output, 4, "chain", 2)
+    sampler = emcee.EnsembleSampler(4, 2, lambda x: -0.5 * float(x @ x), backend=backend)
+    sampler.run_mcmc(np.random.default_rng(0).normal(size=(4, 2)), 5)
+    run_mcmc.checkpoint(sampler, backend, output, ("a", "b"))
+
+    resumed = run_mcmc.make_backend(output, 4, "chain", 2, resume=True)
+    assert resumed.iteration == 5
+    with pytest.raises(ValueError):
+        run_mcmc.make_backend(output, 6, "chain", 2, resume=True)
+    assert run_mcmc.make_backend(output, 4, "chain", 2).iteration == 0
+
+
+def test_convergence_monitor_flags_converged_gaussian_chain(tmp_path):
+    emcee = pytest.importorskip("emcee")
+    np.random.seed(1)
+    sampler = emcee.EnsembleSampler(16, 2, lambda x: -0.5 * float(x @ x))
+    log_path = tmp_path / "convergence.csv"
+    monitor = run_mcmc.ConvergenceMonitor(("a", "b"), log_path=log_path, tau_rtol=0.1)
+
+    converged = False
+    for _ in sampler.sample(np.random.default_rng(1).normal(size=(16, 2)), iterations=6000):
+        if sampler.iteration % 250 == 0 and monitor.update(sampler):
+            converged = True
+            break
+
+    assert converged
+    assert sampler.iteration > run_mcmc.TAU_FACTOR * np.max(monitor.tau)
+    lines = log_path.read_text(encoding="utf-8").splitlines()
+    assert lines[0].startswith("iteration,tau_a,tau_b,tau_max")
+    assert len(lines) == len(monitor.history) + 1
+    _, burnin = run_mcmc.summarize_bestfit_from_chain(sampler, tau=monitor.tau)
+    assert burnin == int(np.ceil(run_mcmc.BURNIN_TAU_FACTOR * np.max(monitor.tau)))
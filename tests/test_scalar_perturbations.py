@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+import mcgt.scalar_perturbations as sp
+from mcgt.scalar_perturbations import _default_params, compute_delta_phi
+
+
+def test_stacked_and_parallel_delta_phi_match_mode_loop() -> None:
+    params = _default_params()
+    k_vals = np.logspace(-4, 1, 24)
+    a_vals = np.linspace(0.05, 1.0, 12)
+
+    reference = compute_delta_phi(k_vals, a_vals, params)
+    scale = np.max(np.abs(reference))
+    stacked = compute_delta_phi(k_vals, a_vals, params, stacked=True)
+    np.testing.assert_allclose(stacked, reference, rtol=0.0, atol=1.0e-6 * scale)
+
+    # Per-mode solves are independent, so splitting k over processes is exact.
+    parallel = compute_delta_phi(k_vals, a_vals, params, n_workers=2)
+    np.testing.assert_array_equal(parallel, reference)
+
+    with pytest.raises(ValueError):
+        compute_delta_phi(k_vals, a_vals, params, n_workers=0)
+
+
+def test_compiled_rhs_and_analytic_jacobian_match_kg_eq() -> None:
+    params = _default_params()
+    table = sp._background_table(0.05, 1.0, params)
+    k = 3.0e-3
+    consts = np.array(
+        [params.m_eff_const**2, params.m_phi**2, params.Phi0 * np.exp(-((k / params.k_split) ** 2)), params.a_eq]
+    )
+    y = np.array([1.0e-3, -2.0e-4])
+    for a in (0.05, 0.2, 0.73, 1.0):
+        ref = sp._kg_eq(a, y, k, params)
+        np.testing.assert_allclose(sp._kg_rhs_compiled(a, y, k, consts, *table), ref, rtol=1.0e-8)
+
+        jac = sp._kg_jac(a, y, k, params)
+        np.testing.assert_allclose(sp._kg_jac_compiled(a, y, k, consts, *table), jac, rtol=1.0e-8)
+        # The system is linear in y, so central differences are exact up to round-off.
+        fd = np.column_stack(
+            [(sp._kg_eq(a, y + step, k, params) - sp._kg_eq(a, y - step, k, params)) / 2.0 for step in np.eye(2)]
+        )
+        np.testing.assert_allclose(jac, fd, rtol=1.0e-6, atol=1.0e-12)
+
+
+def test_batch_sentinel_screen_matches_evaluate_sentinel() -> None:
+    rng = np.random.default_rng(7)
+    base = _default_params()
+    k_vals = np.array([1.0e-4, 1.0e-2, 1.0e-1])
+    a_vals = np.linspace(0.05, 1.0, 16)
+    samples = [
+        replace(
+            base,
+            phi0_init=float(rng.uniform(0.1, 2.0)),
+            a_char=float(10 ** rng.uniform(-3.0, 0.0)),
+            m_phi=float(10 ** rng.uniform(-36.0, -30.0)),
+            cs2_param=float(rng.uniform(0.0, 2.0)),
+            k0=float(10 ** rng.uniform(-3.0, 0.0)),
+        )
+        for _ in range(400)
+    ]
+    expected = [sp.evaluate_sentinel(k_vals, a_vals, p, check_delta_phi=False).accepted for p in samples]
+
+    screened = sp.screen_sentinel_batch(k_vals, a_vals, samples)
+    assert screened.dtype == bool
+    assert 0 < screened.sum() < len(samples)
+    np.testing.assert_array_equal(screened, expected)
+    assert sp.screen_sentinel(k_vals, a_vals, samples[0]) == expected[0]
+    assert sp.screen_sentinel_batch(k_vals, a_vals, []).shape == (0,)